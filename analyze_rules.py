@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""Lists the rules whose order matters in each normalization rule table
+
+    Every pair of rules in a table is checked for whether one rule
+    can create, destroy or resize a match of the other. Pairs that
+    can are written as the edges of a dependency graph to
+    rule_dependencies.csv; all other pairs can be applied in either
+    order, which is what compile_rules relies on when it moves rules
+    together to fuse them.
+
+    Usage: analyze_rules.py [TABLE ...]
+        TABLE is a rule table name, e.g. brand for rules/brand.csv.
+        All tables are analysed when none are given.
+"""
+
+import csv
+import os
+import sys
+
+from rule_engine import RULES_DIR, read_rules, dependency_graph
+
+
+def analyze_table(name, writer):
+    """Writes the dependency graph of a rule table and its summary"""
+    rules = read_rules(os.path.join(RULES_DIR, "%s.csv" % name))
+    edges = dependency_graph(rules)
+
+    for earlier, later, reason in edges:
+        writer.writerow([
+            name, earlier, later, reason,
+            rules[earlier - 1][1], rules[later - 1][1]
+        ])
+
+    pairs = len(rules) * (len(rules) - 1) // 2
+    reasons = {}
+
+    for edge in edges:
+        reasons[edge[2]] = reasons.get(edge[2], 0) + 1
+
+    print ("%s: %s rules, %s of %s pairs depend on their order %s" % (
+        name, len(rules), len(edges), pairs,
+        ", ".join(
+            "(%s %s)" % (count, reason)
+            for reason, count in sorted(reasons.items())
+        )
+    ))
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or sorted(
+        fileName[:-4] for fileName in os.listdir(RULES_DIR)
+        if fileName.endswith(".csv")
+    )
+
+    with open("rule_dependencies.csv", "w", encoding="utf-8",
+              newline="") as csvFile:
+        writer = csv.writer(csvFile, delimiter=",", quotechar='"',
+                            quoting=csv.QUOTE_ALL)
+        writer.writerow([
+            "ruleset", "earlier", "later", "reason", "earlier_pattern",
+            "later_pattern"
+        ])
+
+        for name in names:
+            analyze_table(name, writer)
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+
+"""Checks the normalizers give the same output as a reference
+
+    Each normalizer is run over real values from the DPD extract
+    files and synthetic values built from its rule table, once by
+    the reference and once by the candidate. By default the
+    reference is the candidate with every rule applied as its own
+    substitution, in order, as the original parse.py did; --legacy
+    runs the functions of another parse.py instead.
+
+    Differences are reported per normalizer with the input shrunk to
+    the shortest one that still differs and, for rule based
+    normalizers, the first rule at which the compiled passes stop
+    matching the rules applied one at a time. The time taken by each
+    side and the speedup are also reported. The exit status is 1 if
+    any output differs, and 2 if no real values are found in the
+    extract files, unless --synthetic-only is given.
+
+    Usage: check_equivalence.py [options] [NORMALIZER ...]
+        NORMALIZER is a function name, e.g. parseBrand. All rule
+        based normalizers are checked when none are given.
+"""
+
+import argparse
+import csv
+import importlib.util
+import io
+import os
+import random
+import sys
+import time
+import zipfile
+
+from rule_engine import REGEX, RuleSet, fused_kind, required_literal
+
+# Differences shown for each normalizer
+MAX_EXAMPLES = 5
+
+# Exit status when there are no extract files to take values from
+NO_REAL_VALUES = 2
+
+# Text placed between the fragments of synthetic values
+SEPARATORS = ["", " ", " ", "  ", ",", "(", ")", "-", "/", "."]
+
+
+def load_module(path, name):
+    """Imports a python file as a module under the given name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+def find_extracts(extractDir, parse):
+    """Finds the newest copy of each extract file and zip file
+
+    data_extraction.py saves each run's zip files in a dated folder, 
+    e.g. dpd_data_extracts/2017-02-20, and a zip file unchanged since 
+    an earlier run is only kept in that run's folder, so every folder 
+    below extractDir is searched.
+
+    Args:
+        extractDir: the folder holding the extract files, the zip 
+            files they are downloaded in, or dated folders of them
+        parse: the parse module naming the extract files
+
+    Returns:
+        Sorted list of paths of extract and zip files. Of files with 
+        the same name, only the one in the last folder by name, i.e. 
+        the newest dated folder, is given.
+
+    Raises:
+        None.
+    """
+
+    newest = {}
+
+    for folder, subFolders, fileNames in os.walk(extractDir):
+        for fileName in fileNames:
+            if fileName in parse.EXTRACT_TITLES or fileName.endswith(".zip"):
+                if fileName not in newest or folder > newest[fileName]:
+                    newest[fileName] = folder
+
+    return sorted(
+        os.path.join(folder, fileName) 
+        for fileName, folder in newest.items()
+    )
+
+def real_values(extractDir, names, parse, limit, seed):
+    """Collects the distinct values of each normalized extract column
+
+    Args:
+        extractDir: the folder holding the DPD extract files, the
+            zip files they are downloaded in, or dated folders of them
+        names: the normalizer names to collect values for
+        parse: the parse module mapping columns to normalizers
+        limit: the most values to keep for each normalizer
+        seed: the seed used to sample values above the limit
+
+    Returns:
+        Dictionary of sorted value lists by normalizer name.
+
+    Raises:
+        None.
+    """
+
+    values = {name: set() for name in names}
+
+    def add_values(fileName, ext):
+        normalizers = parse.COLUMN_NORMALIZERS[parse.EXTRACT_TITLES[fileName]]
+        columns = [
+            (i, normalizer) for i, normalizer in enumerate(normalizers)
+            if normalizer in values
+        ]
+
+        for line in csv.reader(ext, delimiter=",", quotechar='"'):
+            for i, normalizer in columns:
+                if i < len(line):
+                    values[normalizer].add(line[i])
+
+    # Extracts are read as text files or from the downloaded zip files
+    for path in find_extracts(extractDir, parse):
+        fileName = os.path.basename(path)
+
+        if fileName in parse.EXTRACT_TITLES:
+            with open(path, "r", encoding="latin-1") as ext:
+                add_values(fileName, ext)
+        elif fileName.endswith(".zip"):
+            with zipfile.ZipFile(path, "r") as archive:
+                for member in sorted(archive.namelist()):
+                    if member in parse.EXTRACT_TITLES:
+                        with archive.open(member) as ext:
+                            add_values(member, io.TextIOWrapper(
+                                ext, encoding="latin-1"
+                            ))
+
+    rng = random.Random(seed)
+    sampled = {}
+
+    for name, found in values.items():
+        found = sorted(found)
+
+        if len(found) > limit:
+            found = sorted(rng.sample(found, limit))
+
+        sampled[name] = found
+
+    return sampled
+
+def synthetic_values(ruleset, count, seed):
+    """Builds values from the text a rule set looks for and inserts
+
+    Args:
+        ruleset: the RuleSet of the normalizer
+        count: the number of values to build
+        seed: the seed for the random choices
+
+    Returns:
+        List of values, each a few rule texts in random case joined
+        by punctuation and spaces.
+
+    Raises:
+        None.
+    """
+
+    fragments = set()
+
+    for rule in ruleset.rules:
+        kind, text = fused_kind(rule)
+
+        if text is None and rule[0] == REGEX:
+            text = required_literal(rule[1])
+
+        for fragment in (text, rule[2]):
+            if fragment and "\\" not in fragment:
+                fragments.add(fragment)
+
+    if not fragments:
+        return []
+
+    fragments = sorted(fragments)
+    rng = random.Random(seed)
+    values = []
+
+    for i in range(count):
+        parts = []
+
+        for j in range(rng.randint(1, 5)):
+            fragment = rng.choice(fragments)
+            case = rng.random()
+
+            if case < 0.2:
+                fragment = fragment.upper()
+            elif case < 0.4:
+                fragment = fragment.lower()
+            elif case < 0.5:
+                fragment = fragment.title()
+
+            parts.append(fragment)
+            parts.append(rng.choice(SEPARATORS))
+
+        values.append("".join(parts).strip())
+
+    return values
+
+def run_normalizer(normalizer, values):
+    """Returns the outputs of normalizer for values and the time taken
+
+    Errors are recorded as outputs so they are reported as
+    differences rather than stopping the check.
+    """
+
+    outputs = []
+    clock = time.perf_counter
+    start = clock()
+
+    for value in values:
+        try:
+            outputs.append(normalizer(value))
+        except Exception as e:
+            outputs.append("<%s: %s>" % (type(e).__name__, e))
+
+    return outputs, clock() - start
+
+def call_normalizer(normalizer, value):
+    """Returns the output of normalizer for value, or its error"""
+    return run_normalizer(normalizer, [value])[0][0]
+
+def shrink(value, differs):
+    """Removes characters from value for as long as it still differs
+
+    Args:
+        value: an input the outputs differ for
+        differs: function that checks if the outputs differ for an
+            input
+
+    Returns:
+        The shortest input found that still differs.
+
+    Raises:
+        None.
+    """
+
+    chunk = max(len(value) // 2, 1)
+
+    while value:
+        i = 0
+        removed = False
+
+        while i < len(value):
+            candidate = value[:i] + value[i + chunk:]
+
+            if differs(candidate):
+                value = candidate
+                removed = True
+            else:
+                i += chunk
+
+        if not removed:
+            if chunk == 1:
+                break
+
+            chunk = max(chunk // 2, 1)
+
+    return value
+
+def ruleset_input(normalizer, ruleset, value):
+    """Returns the text a normalizer passes to its rule set"""
+    seen = []
+
+    def record(text):
+        seen.append(text)
+
+        return text
+
+    ruleset.apply = record
+
+    try:
+        call_normalizer(normalizer, value)
+    finally:
+        ruleset.reset_apply()
+
+    return seen[0] if seen else None
+
+def first_divergent_rule(ruleset, text):
+    """Finds the first rule at which the compiled passes go wrong
+
+    The passes compiled from the first n rules are compared to those
+    n rules applied one at a time, searching for the smallest n
+    where the two differ.
+
+    Args:
+        ruleset: the RuleSet to check
+        text: the text passed to the rule set
+
+    Returns:
+        The 1-based position of the rule, or None if the compiled
+        passes give the same result as the rules for text.
+
+    Raises:
+        None.
+    """
+
+    def differs(count):
+        prefix = RuleSet(ruleset.rules[:count])
+
+        return prefix.apply(text) != prefix.apply_sequential(text)
+
+    if not differs(len(ruleset.rules)):
+        return None
+
+    low, high = 1, len(ruleset.rules)
+
+    while low < high:
+        middle = (low + high) // 2
+
+        if differs(middle):
+            high = middle
+        else:
+            low = middle + 1
+
+    return low
+
+def reference_normalizer(name, legacy, candidate):
+    """Returns the reference function and how to run it
+
+    Returns:
+        Tuple of (normalizer, ruleset). ruleset is the candidate's
+        RuleSet to switch to sequential rules while the normalizer
+        runs, or None.
+    """
+
+    if legacy is not None:
+        return getattr(legacy, name), None
+
+    return getattr(candidate, name), candidate.RULESETS.get(name)
+
+def check_normalizer(name, values, legacy, candidate):
+    """Compares the reference and candidate output of one normalizer
+
+    Args:
+        name: the normalizer name
+        values: the values to normalize
+        legacy: the legacy module, or None to use sequential rules
+        candidate: the parse module to check
+
+    Returns:
+        True if every output was the same.
+
+    Raises:
+        None.
+    """
+
+    reference, sequentialRuleset = reference_normalizer(
+        name, legacy, candidate
+    )
+    normalizer = getattr(candidate, name)
+    ruleset = getattr(candidate, "RULESETS", {}).get(name)
+
+    def run_reference(inputs):
+        if sequentialRuleset is None:
+            return run_normalizer(reference, inputs)
+
+        sequentialRuleset.apply = sequentialRuleset.apply_sequential
+
+        try:
+            return run_normalizer(reference, inputs)
+        finally:
+            sequentialRuleset.reset_apply()
+
+    expected, referenceTime = run_reference(values)
+    actual, candidateTime = run_normalizer(normalizer, values)
+
+    differences = [
+        value for value, old, new in zip(values, expected, actual)
+        if old != new
+    ]
+
+    print ("%s %s values, %s differ, reference %.3fs, candidate %.3fs, "
+           "speedup x%.1f" % (
+               name.ljust(18), len(values), len(differences), referenceTime,
+               candidateTime, referenceTime / max(candidateTime, 1e-9)
+           ))
+
+    def differs(value):
+        return run_reference([value])[0][0] != call_normalizer(
+            normalizer, value
+        )
+
+    shown = set()
+
+    for value in differences:
+        if len(shown) == MAX_EXAMPLES:
+            break
+
+        shrunk = shrink(value, differs)
+
+        if shrunk in shown:
+            continue
+
+        shown.add(shrunk)
+
+        print ("    input     %r" % value)
+        print ("    shrunk to %r" % shrunk)
+        print ("    expected  %r" % run_reference([shrunk])[0][0])
+        print ("    got       %r" % call_normalizer(normalizer, shrunk))
+
+        if ruleset is not None:
+            text = ruleset_input(normalizer, ruleset, shrunk)
+            position = None
+
+            if text is not None:
+                position = first_divergent_rule(ruleset, text)
+
+            if position is None:
+                print ("    compiled passes match the rule table")
+            else:
+                kind, pattern, replacement = ruleset.rules[position - 1]
+                print ("    first differs at rule %s: %s %r -> %r" % (
+                    position, kind, pattern, replacement
+                ))
+
+    return not differences
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Checks the normalizers against a reference"
+    )
+    parser.add_argument(
+        "normalizers", nargs="*", metavar="NORMALIZER",
+        help="normalizers to check, e.g. parseBrand"
+    )
+    parser.add_argument(
+        "--legacy", metavar="PATH",
+        help="legacy parse.py to use as the reference"
+    )
+    parser.add_argument(
+        "--candidate", metavar="PATH",
+        help="parse.py to check, instead of the one in this folder"
+    )
+    parser.add_argument(
+        "--extracts", metavar="DIR", default="dpd_data_extracts",
+        help="folder of DPD extract files to take real values from"
+    )
+    parser.add_argument(
+        "--limit", type=int, default=5000,
+        help="most real values to check for each normalizer"
+    )
+    parser.add_argument(
+        "--synthetic", type=int, default=2000,
+        help="synthetic values to check for each normalizer"
+    )
+    parser.add_argument(
+        "--synthetic-only", action="store_true",
+        help="check synthetic values alone if no extracts are found"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.candidate is not None:
+        candidate = load_module(args.candidate, "candidate_parse")
+    else:
+        import parse as candidate
+
+    if args.legacy is not None:
+        legacy = load_module(args.legacy, "legacy_parse")
+    else:
+        legacy = None
+
+    names = args.normalizers or sorted(candidate.RULESETS)
+    values = real_values(args.extracts, names, candidate, args.limit,
+                         args.seed)
+
+    if not any(values.values()):
+        print ("No real values found in %s" % args.extracts)
+
+        if not args.synthetic_only:
+            sys.exit(NO_REAL_VALUES)
+
+    for name in names:
+        if name in candidate.RULESETS:
+            values[name].extend(synthetic_values(
+                candidate.RULESETS[name], args.synthetic, args.seed
+            ))
+
+    same = True
+
+    for name in names:
+        same = check_normalizer(name, values[name], legacy,
+                                candidate) and same
+
+    sys.exit(0 if same else 1)
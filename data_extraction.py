@@ -59,19 +59,76 @@
 """
 
 import codecs
-from urllib import robotparser, request
+import collections
+import io
+from urllib import robotparser
 import zipfile
 from unipath import Path
 import os
 import sys
 import datetime
-import math
 import csv
 import pymysql
 import configparser
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-from parse import parse_extract_entry
-from upload import upload_to_table
+from parse import (parse_chunk, enable_rule_profiling, 
+                   disable_rule_profiling, write_rule_profile, 
+                   enable_normalizer_cache, 
+                   disable_normalizer_cache, normalizer_cache_info, 
+                   enable_normalization_store, 
+                   disable_normalization_store, start_worker, parse_rows, 
+                   add_normalized_values, add_cache_counts, 
+                   COLUMN_NORMALIZERS)
+from download import load_download_state, save_download_state, download_zip
+from progress import ProgressReporter
+from upload import delete_rows, insert_rows
+
+# Extracts large enough to be worth splitting across worker processes
+CHUNKED_TITLES = ("comp", "drug", "ingred", "package")
+
+# Rows parsed, written and uploaded at a time
+CHUNK_ROWS = 5000
+
+# Chunks waiting for or being parsed by each worker process
+PENDING_CHUNKS_PER_WORKER = 2
+
+# Root URL to access all the zip files
+ROOT_URL = ("http://www.hc-sc.gc.ca/dhp-mps/alt_formats/zip/prodpharma/"
+            "databasdon/")
+
+
+class CountingReader(io.BufferedIOBase):
+    """Reads a binary file object, counting the bytes read from it
+
+    Used between an extract in its zip file and the text wrapper 
+    reading it, so progress can be shown from the bytes read 
+    instead of counting the lines of the file beforehand.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.position += len(data)
+
+        return data
+
+    def read1(self, size=-1):
+        data = self.raw.read1(size)
+        self.position += len(data)
+
+        return data
+
+    def close(self):
+        self.raw.close()
+        super().close()
 
 
 class FileDetails(object):
@@ -86,41 +143,44 @@ class FileDetails(object):
         else:
             name = "%s_%s.txt" % (title, suffix)
 
-        # Generate paths of extracted and parsed files
-        ePath = locs["eLoc"].child(name)
+        # Generate path of the zip file the extract is read from
+        if suffix == "":
+            zipName = "allfiles.zip"
+        else:
+            zipName = "allfiles_%s.zip" % suffix
+
+        zPath = locs["eLoc"].child(zipName)
 
         self.title = title
         self.name = name
-        self.ePath = ePath
+        self.zPath = zPath
 
 
-def file_len(fname):
-    """Calculates the number of lines in a file."""
-    with open(fname, encoding="latin-1") as f:
-        for i, l in enumerate(f):
-            pass
-    return i + 1
+def open_extract(file):
+    """Opens an extract file as text, straight from its zip file
 
-def progress_bar(title, curPos, start, stop):
-	"""Generates progress bar in console."""
+    Args:
+        file: the FileDetails of the extract file
 
-	# Normalize start, stop, curPos
-	curPos = (curPos - start) + 1
-	stop = (stop - start) + 1 
-	start = 1
+    Returns:
+        A text file object reading the extract from the zip file; 
+        the zip file is closed when the extract is. Its buffer is 
+        a CountingReader, so ext.buffer.position is the number of 
+        bytes of the extract read so far.
 
-	# Determine current progress
-	prog = 100.00 * (curPos / stop)
-	
-	if prog != 100:
-		progComp = "#" * math.floor(prog / 2)
-		progRem = " " * (50 - math.floor(prog / 2))
-		prog = "%.2f%%" % prog
-		print(("%s [%s%s] %s  \r" % (title, progComp, progRem, prog)), end='')
-		sys.stdout.flush()
-	else:
-		progComp = "#" * 50
-		print("%s [%s] Complete!" % (title, progComp))
+    Raises:
+        KeyError: the extract is not in the zip file.
+    """
+
+    with zipfile.ZipFile(file.zPath, "r") as archive:
+        member = archive.open(file.name)
+
+    return io.TextIOWrapper(CountingReader(member), encoding="latin-1")
+
+def extract_size(file):
+    """Returns the uncompressed size of an extract file in bytes"""
+    with zipfile.ZipFile(file.zPath, "r") as archive:
+        return archive.getinfo(file.name).file_size
 
 def get_permission(robotFile):
     """Checks the specified robot.txt file for access permission."""
@@ -235,9 +295,27 @@ def get_file_names(locs):
 
     return names
 
-def download_zips(locs, zipFiles):
-    # Root URL to access all the zip files
-    rootUrl = "http://www.hc-sc.gc.ca/dhp-mps/alt_formats/zip/prodpharma/databasdon/"
+def download_zips(locs, zipFiles, state, rootUrl=ROOT_URL):
+    """Downloads the zip files that have changed since the last run
+
+    Args:
+        locs: the extract and parsed file locations
+        zipFiles: the zip file and extract file details; the zip path 
+            of each extract file is set to the zip file to read it from
+        state: the details of the zip files from the last run, as 
+            loaded by load_download_state
+        rootUrl: the URL of the folder of zip files
+
+    Returns:
+        Tuple of (state, changed). state is the details of the zip 
+        files to save once they are uploaded, and changed the list of 
+        names of the zip files that are not the same as on the last 
+        run.
+
+    Raises:
+        urllib.error.HTTPError: the server answered with an error.
+        urllib.error.ContentTooShortError: a download was cut off.
+    """
 
     # User Agent details for the program
     userAgent = ("Study Buffalo Data Extraction "
@@ -248,147 +326,376 @@ def download_zips(locs, zipFiles):
     # Zips are saved to the extract location
     zipLoc = locs["eLoc"]
 
+    newState = {}
+    changed = []
+
     for zip in zipFiles:
         zipName = zip["name"]
 
         # Access and download the zip file
         print (("Downloading %s... " % zipName), end="")
 
-        # Creates zip path and name
-        hdFile = zipLoc.child(zipName)
+        details, zipChanged = download_zip(
+            rootUrl + zipName, zipLoc.child(zipName), scriptHeader, 
+            state.get(zipName)
+        )
 
-        # Create the zip url
-        url = rootUrl + zipName
-        
-        # Request to download file
-        req = request.Request(url, data=None, headers=scriptHeader)
+        # An unchanged zip may only be saved in an earlier run's folder
+        for file in zip["files"]:
+            file.zPath = Path(details["path"])
 
-        # Request the file and open a file to write the contents
-        with request.urlopen(req) as response, open(hdFile, 'wb') as file:
-            # Read the requested file from the website
-            webFile = response.read()
+        newState[zipName] = details
 
-            # Save the file
-            file.write(webFile)
-        
-        print ("Complete!")
+        if zipChanged:
+            changed.append(zipName)
+            print ("Complete!")
+        else:
+            print ("Unchanged.")
     
     print ("\n")
 
-def unzip_zips(locs, names):
-    # Set location to extract files to
-    eLoc = locs["eLoc"]
+    return newState, changed
 
-    # Open each zip file and extract the files
-    for zip in names:
-        zipName = zip["name"]
-        zipLoc = eLoc.child(zipName).absolute()
-    
-        # Unzip the zips
-        print (("Unzipping %s... " % zipName), end="")
-        archive = zipfile.ZipFile(zipLoc, 'r')
-        
-        # Cycles through all the files and extracts the data
-        for file in zip["files"]:
-            # Extracts the text file from the archive
-            archive.extract(file.name, path=eLoc.absolute())
-        
-        archive.close()
-        print ("Completed!")
+def read_chunks(ext):
+    """Reads the rows of an extract file in chunks
 
-    print ("\n")
+    Args:
+        ext: the extract file, opened with open_extract
 
-def parse_files(locs, names):
-    # Array that will collect all parsed extracts
-    parseArray = {
-        "comp": [],
-        "drug": [],
-        "form": [],
-        "ingred": [],
-        "package": [],
-        "pharm": [],
-        "route": [],
-        "schedule": [],
-        "status": [],
-        "ther": [],
-        "vet": []
-    }
-
-    # Cycles through each suffix
-    for zip in names:
-        for file in zip["files"]:
-            # File details
-            title = file.title
-            name = file.name
-            ePath = file.ePath
-
-            # Details for progress bar
-            length = file_len(ePath)
-            i = 1
-            temp = []
-            pbTitle = "Parsing %s" % name
-            pbTitle = pbTitle.ljust(23) # Pad  to align progress bars
-
-            # Open extracted file and parse it
-            with open(ePath, "r", encoding="latin-1") as ext:
-                # Treats text file as csv and converts lines to list
-                csvFile = csv.reader(ext, delimiter=",", quotechar='"', quoting=csv.QUOTE_ALL)
-
-                # Read each line of file & output array of parsed text
-                for line in csvFile:
-                    # Parse list
-                    parseArray[title].append(parse_extract_entry(name, line))
-
-                    # Display progress bar and increment counter
-                    progress_bar(pbTitle, i, 1, length)
-                    i = i + 1
-        
-        print ("")
-    
-    # Save parsed text to file
-    for key in parseArray:
-        pPath = locs["pLoc"].child("%s.txt" % key)
+    Yields:
+        Tuples of (rows, size), where rows is a list of up to 
+        CHUNK_ROWS rows and size is the number of bytes of the file 
+        read for them. The sizes add up to the size of the file.
+    """
+
+    chunk = []
+    position = 0
+
+    csvFile = csv.reader(ext, delimiter=",", quotechar='"',
+                         quoting=csv.QUOTE_ALL)
+
+    for line in csvFile:
+        chunk.append(line)
+
+        if len(chunk) == CHUNK_ROWS:
+            size = ext.buffer.position - position
+            position = ext.buffer.position
+
+            yield chunk, size
+            chunk = []
+
+    # The last chunk is given the rest of the file, including any 
+    # bytes read after its last row
+    yield chunk, ext.buffer.position - position
+
+def parse_serially(files):
+    """Parses the extract files one after another in this process
+
+    Args:
+        files: list of FileDetails of the extract files
+
+    Yields:
+        Tuples of (title, rows), where rows is the list of parsed 
+        rows of each chunk of each file, in file order.
+    """
+
+    for file in files:
+        # Progress is shown in bytes of the file read
+        progress = ProgressReporter("Parsing %s" % file.name, 
+                                    extract_size(file))
+        done = 0
+        rows = 0
+
+        with open_extract(file) as ext:
+            for chunk, size in read_chunks(ext):
+                parsed = parse_chunk(file.name, chunk)
+
+                done += size
+                rows += len(parsed)
+                progress.update(done, rows)
+
+                yield file.title, parsed
+
+        progress.finish(rows)
+
+def parse_concurrently(executor, files, window):
+    """Parses the extract files at the same time, largest first
+
+    The large extracts are sent to the worker processes in chunks, 
+    the titles with the most data first, so the longest work starts 
+    straight away. At most window chunks are waiting to be parsed or 
+    collected at a time, so the memory used does not grow with the 
+    size of the extracts. While the oldest chunk is still being 
+    parsed, the small extracts are parsed in this process, so they 
+    never wait behind the large ones.
+
+    Args:
+        executor: the ProcessPoolExecutor of the parse workers
+        files: list of FileDetails of the extract files
+        window: the most chunks to have sent to the workers at once
+
+    Yields:
+        Tuples of (title, rows), where rows is the ParsedTable of a 
+        chunk parsed by a worker or the list of parsed rows of a 
+        chunk of a small extract. The rows of each title are given in 
+        file order.
+    """
+
+    sizes = {file.name: extract_size(file) for file in files}
+    titleSizes = {}
+
+    for file in files:
+        titleSizes[file.title] = (
+            titleSizes.get(file.title, 0) + sizes[file.name]
+        )
+
+    # The files of a title keep their order, so its rows do too
+    large = sorted(
+        (file for file in files if file.title in CHUNKED_TITLES), 
+        key=lambda file: -titleSizes[file.title]
+    )
+    small = [file for file in files if file.title not in CHUNKED_TITLES]
+
+    # Progress is shown in bytes of the extracts parsed
+    progress = ProgressReporter("Parsing extracts", sum(sizes.values()))
+    done = 0
+    rows = 0
+
+    def large_chunks():
+        for file in large:
+            with open_extract(file) as ext:
+                for chunk, size in read_chunks(ext):
+                    yield file, chunk, size
+
+    chunks = large_chunks()
+    pending = collections.deque()
+
+    def send_chunks():
+        while len(pending) < window:
+            try:
+                file, chunk, size = next(chunks)
+            except StopIteration:
+                return
+
+            pending.append((
+                file.title, executor.submit(parse_rows, file.name, chunk), 
+                size
+            ))
+
+    send_chunks()
+
+    while pending or small:
+        # Parse a small extract while the workers are busy
+        if small and (not pending or not pending[0][1].done()):
+            file = small.pop(0)
+            with open_extract(file) as ext:
+                for chunk, size in read_chunks(ext):
+                    parsed = parse_chunk(file.name, chunk)
+
+                    done += size
+                    rows += len(parsed)
+                    progress.update(done, rows)
+
+                    yield file.title, parsed
+
+            continue
+
+        title, future, size = pending.popleft()
+        parsed, added, counts = future.result()
+
+        add_normalized_values(added)
+        add_cache_counts(counts)
+        send_chunks()
+
+        done += size
+        rows += len(parsed)
+        progress.update(done, rows)
+
+        yield title, parsed
+
+    progress.finish()
+
+def save_parsed(locs, batches, cursor=None):
+    """Writes parsed rows to file and uploads them as they are parsed
+
+    Each title is written to its own .txt file in the parsed file 
+    location and, if a database cursor is given, the old rows of its 
+    table are deleted and the new rows inserted a chunk at a time. 
+    Nothing is committed, so the old rows are kept unless the caller 
+    commits once every batch has been saved.
+
+    Args:
+        locs: the extract and parsed file locations
+        batches: iterable of (title, rows) tuples, where rows is a 
+            ParsedTable or list of parsed rows; encoded columns are 
+            only decoded here, as the rows are written and uploaded
+        cursor: optional cursor of the database to upload to
+
+    Returns:
+        Dictionary of the number of rows saved for each title.
+
+    Raises:
+        None.
+    """
+
+    pFiles = {}
+    csvWriters = {}
+    counts = {}
+
+    try:
+        for title in COLUMN_NORMALIZERS:
+            pPath = locs["pLoc"].child("%s.txt" % title)
+            pFiles[title] = open(pPath, "w", encoding="utf-8", newline="")
 
-        with open(pPath, 'w', newline="") as pFile:
             # Create writer to convert list to text
-            csvWriter = csv.writer(pFile, delimiter=",", quotechar='"', quoting=csv.QUOTE_ALL)
-
-            # Writer all lines to file
-            print ("Saving parsed %s entries to file... " % key, end="")
-            
-            # TO FIX - NOT WRITING TO FILE, BUT IS COLLECTING DATA
-            csvWriter.writerows(parseArray[key])
-                
-            print ("Complete!")
-    
-    print ("")
+            csvWriters[title] = csv.writer(
+                pFiles[title], delimiter=",", quotechar='"', 
+                quoting=csv.QUOTE_ALL
+            )
+            counts[title] = 0
+
+            if cursor is not None:
+                delete_rows(cursor, title)
+
+        for title, rows in batches:
+            csvWriters[title].writerows(rows)
+
+            if cursor is not None and rows:
+                insert_rows(cursor, title, rows)
+
+            counts[title] += len(rows)
+    finally:
+        for pFile in pFiles.values():
+            pFile.close()
+
+    return counts
+
+def parse_files(locs, names, profileRules=False, cacheNormalizers=True,
+                storePath=None, workers=None, cursor=None):
+    """Parses the extract files, saving and uploading the parsed data
+
+    The parsed rows are written to file and uploaded as each chunk 
+    is parsed, rather than collected for all the files first.
+
+    Args:
+        locs: the extract and parsed file locations
+        names: the zip file and extract file details
+        profileRules: if True, records the matches and run time of 
+            every normalization rule, and of each normalizer without 
+            a rule table as a whole, and saves them, slowest first, 
+            to rule_profile.csv in the parsed file location
+        cacheNormalizers: if True, caches the normalized value of 
+            repeated column values while parsing
+        storePath: optional SQLite file of values normalized in 
+            earlier runs; only values not in the store are normalized
+        workers: the number of worker processes that parse the large 
+            extracts in chunks; defaults to the number of CPUs. With 
+            one worker, or when profiling rules, every file is 
+            parsed in this process.
+        cursor: optional cursor of the database to upload the parsed 
+            rows to
+
+    Returns:
+        Dictionary of the number of rows parsed for each title.
+
+    Raises:
+        None.
+    """
+
+    if profileRules:
+        enable_rule_profiling()
+
+    if storePath is not None:
+        enable_normalization_store(storePath)
+
+    if cacheNormalizers:
+        enable_normalizer_cache()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    files = [file for zip in names for file in zip["files"]]
+
+    # Rule profiles are only recorded in this process. Workers are 
+    # spawned rather than forked so they never share the store's 
+    # database connection.
+    if workers > 1 and profileRules:
+        print ("Note - rules are only profiled in this process, so every "
+               "file is parsed without worker processes\n")
+
+    if workers > 1 and not profileRules:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, 
+            mp_context=multiprocessing.get_context("spawn"), 
+            initializer=start_worker, 
+            initargs=(
+                str(storePath) if storePath is not None else None, 
+                cacheNormalizers
+            )
+        )
+
+        batches = parse_concurrently(
+            executor, files, workers * PENDING_CHUNKS_PER_WORKER
+        )
+    else:
+        executor = None
+        batches = parse_serially(files)
 
-    # Delete the extracted text files
-    for zip in names:
-        for file in zip["files"]:
-            # File details
-            name = file.name
-            ePath = file.ePath
+    try:
+        counts = save_parsed(locs, batches, cursor)
 
-            # Delete the specified file
-            print (("Deleting %s... " % name), end="")
+        print ("")
 
-            os.remove(ePath)
+        for title, count in counts.items():
+            print ("Saved %s parsed %s entries" % (count, title))
 
-            print ("Complete!")
+        print ("")
 
-    print ("\n")
+        # Report how much repeated work the caches saved
+        if cacheNormalizers:
+            print ("Normalizer cache hit rates:")
 
-    return parseArray
+            for name, info in normalizer_cache_info().items():
+                calls = info.hits + info.misses
 
-def upload_data(loc, data):
-    """Uploads parsed files to the database."""
-    #List of database tables
-    tableList = [
-        "comp", "drug", "form", "ingred", "package", "pharm", "route", 
-        "schedule", "status", "ther", "vet",
-    ]
+                if calls:
+                    print ("    %s %.1f%% (%s of %s)" 
+                           % (name.ljust(18), 100.0 * info.hits / calls, 
+                              info.hits, calls))
+
+            print ("")
+
+        # Save the rule statistics
+        if profileRules:
+            print ("Saving normalization rule profile... ", end="")
+
+            write_rule_profile(locs["pLoc"].child("rule_profile.csv"))
+
+            print ("Complete!\n")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+        # Unwrap the normalizers even if saving failed, so later 
+        # normalization in this process runs without them
+        if cacheNormalizers:
+            disable_normalizer_cache()
 
+        # Save the newly normalized values for the next run
+        if storePath is not None:
+            print ("Saving normalized values to store... ", end="")
+
+            disable_normalization_store()
+
+            print ("Complete!\n")
+
+        if profileRules:
+            disable_rule_profiling()
+
+    return counts
+
+def connect_database(loc):
+    """Connects to the database the parsed data is uploaded to."""
     # Obtain database credentials
     cLoc = loc["root"].parent.child("config", "python_config.cfg").absolute()
     
@@ -405,75 +712,91 @@ def upload_data(loc, data):
     print ("Connecting to database... ", end="")
     
     conn = pymysql.connect(host, user, pw, db)
-    cursor = conn.cursor()
 
     print ("Complete!\n")
-    
-    # Uploads data to each table
-    for tableName in tableList:
-        print (("Uploading to '%s' table... " % tableName), end="")
-
-        upload_to_table(cursor, tableName, data[tableName])
-
-        print ("Complete!")
-        
-        # PROGRESS BAR SOMEWHERE IN HERE?
-        
-    # Close connection to database
-    conn.close()
 
-    print("\n")
+    return conn
     
 
 
-print ("\nHEALTH CANADA DRUG PRODUCT DATABASE DATA EXTRACTION TOOL")
-print ("--------------------------------------------------------")
-print ("Created by Joshua Torrance, 2017-Feb-20\n\n")
+if __name__ == "__main__":
+    print ("\nHEALTH CANADA DRUG PRODUCT DATABASE DATA EXTRACTION TOOL")
+    print ("--------------------------------------------------------")
+    print ("Created by Joshua Torrance, 2017-Feb-20\n\n")
 
-# Get permission to access the Health Canada website
-print ("CHECKING FOR PERMISSION TO RUN")
-print ("------------------------------")
+    # Get permission to access the Health Canada website
+    print ("CHECKING FOR PERMISSION TO RUN")
+    print ("------------------------------")
 
-permission = get_permission("http://www.hc-sc.gc.ca/robots.txt")
+    permission = get_permission("http://www.hc-sc.gc.ca/robots.txt")
 
-# Downloads zip files
-if permission:
-    print ("CREATE APPLICATION FOLDERS AND FILE DETAILS")
-    print ("----------------------------------------------")
+    # Downloads zip files
+    if permission:
+        print ("CREATE APPLICATION FOLDERS AND FILE DETAILS")
+        print ("----------------------------------------------")
 
-    # Create the extract folders and save the paths
-    locs = create_extract_folders()
+        # Create the extract folders and save the paths
+        locs = create_extract_folders()
 
-    # Create a list of all file names, locations, and other details
-    names = get_file_names(locs)
+        # Create a list of all file names, locations, and other details
+        names = get_file_names(locs)
 
 
-    # Download the zip files from the website
-    print ("DOWNLOADING DATA EXTRACTIONS ZIP FILES")
-    print ("--------------------------------------")
+        # Download the zip files from the website
+        print ("DOWNLOADING DATA EXTRACTIONS ZIP FILES")
+        print ("--------------------------------------")
 
-    download_zips(locs, names)
+        statePath = locs["root"].child("download_state.json")
+        state, changed = download_zips(
+            locs, names, load_download_state(statePath)
+        )
 
+        # The tables hold the rows of every zip file, so the extracts 
+        # are only parsed again if one of them has changed. --force 
+        # parses and uploads them anyway.
+        if not changed and "--force" not in sys.argv:
+            print ("No extract files have changed since the last run.\n")
+            print (
+                "Health Canada Drug Product Database Extraction Tool "
+                "Finished!\n"
+            )
+            sys.exit(0)
 
-    # Extract the data extracts from the zip files
-    print ("UNZIPPING FILES")
-    print ("-------------------------------")
 
-    unzip_zips(locs, names)
+        # Parse the data extracts and upload them as they are parsed
+        print ("PARSING AND UPLOADING FILES")
+        print ("---------------------------")
 
+        conn = connect_database(locs)
 
-    # Parse the data extracts and return the data
-    print ("PARSING FILES")
-    print ("-------------")
+        # The number of parse workers can be set with --workers=N
+        workers = None
 
-    parsedData = parse_files(locs, names)
+        for arg in sys.argv[1:]:
+            if arg.startswith("--workers="):
+                workers = int(arg[len("--workers="):])
 
+        try:
+            parse_files(
+                locs, names, profileRules="--profile-rules" in sys.argv, 
+                storePath=locs["root"].child("normalization_store.db"), 
+                workers=workers, cursor=conn.cursor()
+            )
+        except BaseException:
+            # The old data is kept if any file fails to parse or the 
+            # run is interrupted
+            conn.rollback()
+            conn.close()
+            raise
 
-    # Upload the parsed files to the database
-    print ("UPLOADING PARSED DATA")
-    print ("---------------------")
+        # The uploads are only kept once every file has been parsed
+        conn.commit()
+        conn.close()
 
-    upload_data(locs, parsedData)
+        # Only remembered once uploaded, so a failed run is retried
+        save_download_state(statePath, state)
 
 
-    print ("Health Canada Drug Product Database Extraction Tool Finished!\n")
+        print (
+            "Health Canada Drug Product Database Extraction Tool Finished!\n"
+        )
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+from urllib import error, request
+
+# Bytes of a zip file read and written at a time when downloading
+DOWNLOAD_BLOCK = 1024 * 1024
+
+
+def load_download_state(path):
+    """Loads the details of the zip files downloaded on the last run
+
+    Args:
+        path: the JSON file the details are saved in
+
+    Returns:
+        Dictionary of the ETag, Last-Modified date, SHA-256 hash and 
+        saved path of each zip file by name; empty if there is no 
+        file yet.
+
+    Raises:
+        None.
+    """
+
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, "r", encoding="utf-8") as stateFile:
+        return json.load(stateFile)
+
+def save_download_state(path, state):
+    """Saves the details of the downloaded zip files for the next run"""
+    with open(path, "w", encoding="utf-8") as stateFile:
+        json.dump(state, stateFile, indent=4, sort_keys=True)
+
+def download_zip(url, path, headers, previous=None):
+    """Downloads a zip file unless it is unchanged since the last run
+
+    If the zip file from the last run is still saved, its ETag and 
+    Last-Modified date are sent with the request so the server can 
+    answer 304 Not Modified instead of sending it again. A file sent 
+    anyway is compared to the last one by its SHA-256 hash.
+
+    The file is downloaded to a .part file next to path and only 
+    moved to path once it is complete, so an interrupted download 
+    never leaves a partial zip file where the last run's file was.
+
+    Args:
+        url: the URL of the zip file
+        path: the path to save the downloaded zip file to
+        headers: dictionary of headers to send with the request
+        previous: optional details of the zip file from the last run, 
+            as returned by this function
+
+    Returns:
+        Tuple of (details, changed). details is a dictionary of the 
+        etag, lastModified, sha256 and path of the zip file; path is 
+        the file from the last run if the zip file was not sent 
+        again or was the same as the last one. changed is False if 
+        the zip file is the same as on the last run.
+
+    Raises:
+        urllib.error.HTTPError: the server answered with an error.
+        urllib.error.ContentTooShortError: the connection was closed 
+            before the whole file was received.
+    """
+
+    path = str(path)
+    partPath = "%s.part" % path
+    headers = dict(headers)
+
+    # Conditional requests are only useful if the last file is kept
+    if previous is not None and not os.path.exists(previous["path"]):
+        previous = None
+
+    if previous is not None:
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+
+        if previous.get("lastModified"):
+            headers["If-Modified-Since"] = previous["lastModified"]
+
+    req = request.Request(url, data=None, headers=headers)
+    sha256 = hashlib.sha256()
+
+    try:
+        # Request the file and write it as it is received
+        with request.urlopen(req) as response, open(partPath, "wb") as file:
+            size = 0
+
+            for block in iter(lambda: response.read(DOWNLOAD_BLOCK), b""):
+                sha256.update(block)
+                file.write(block)
+                size += len(block)
+
+            # A connection closed early ends the file without an error
+            length = response.headers.get("Content-Length")
+
+            if length is not None and size < int(length):
+                raise error.ContentTooShortError(
+                    "Downloaded %s of %s bytes of %s" % (size, length, url), 
+                    None
+                )
+
+            details = {
+                "etag": response.headers.get("ETag"),
+                "lastModified": response.headers.get("Last-Modified"),
+                "sha256": sha256.hexdigest(),
+                "path": path
+            }
+    except error.HTTPError as e:
+        if e.code == 304 and previous is not None:
+            return previous, False
+
+        raise
+    except BaseException:
+        if os.path.exists(partPath):
+            os.remove(partPath)
+
+        raise
+
+    if previous is not None and previous["sha256"] == details["sha256"]:
+        # Keep the file from the last run rather than a second copy
+        os.remove(partPath)
+        details["path"] = previous["path"]
+
+        return details, False
+
+    os.replace(partPath, path)
+
+    return details, True
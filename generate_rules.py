@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+"""Generates a Python module for each compiled normalization rule set
+
+    Each rule set's passes are written out by generate_source as a
+    module of straight line code, saved in rules/.cache under the
+    rule set's digest. load_ruleset then applies the rules with that
+    module, until the rule table or the compiler changes and the
+    module no longer matches.
+
+    A module is only saved if it gives the same output as the rules
+    applied one at a time, as the original parse.py did, for the
+    values in the DPD extract files and synthetic values built from
+    the rule table. The time taken by the compiled passes and by the
+    generated module is also reported. The exit status is 1 if any
+    module was not saved, and 2 if no real values are found in the
+    extract files, unless --synthetic-only is given.
+
+    Usage: generate_rules.py [options] [TABLE ...]
+        TABLE is a rule table name, e.g. brand for rules/brand.csv.
+        All tables are generated when none are given.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from check_equivalence import (NO_REAL_VALUES, real_values,
+                               synthetic_values)
+from rule_engine import (CACHE_DIR, RULES_DIR, generate_source,
+                         generated_path, load_generated, load_ruleset,
+                         temporary_path)
+
+
+def ruleset_values(ruleset, realValues, count, seed):
+    """Returns the inputs to check a generated module with
+
+    The rule sets are given the column values after they have been
+    put in title or lower case, so each value is checked as given
+    and in both cases.
+    """
+
+    values = list(realValues) + synthetic_values(ruleset, count, seed)
+    checked = set()
+
+    for value in values:
+        checked.update((value, value.title(), value.lower()))
+
+    return sorted(checked)
+
+def time_function(function, values):
+    """Returns the seconds function takes to run over values"""
+    clock = time.perf_counter
+    start = clock()
+
+    for value in values:
+        function(value)
+
+    return clock() - start
+
+def generate_ruleset(ruleset, values):
+    """Generates, checks and saves the module of one rule set
+
+    Args:
+        ruleset: the RuleSet to generate the module for
+        values: the values to check the module with
+
+    Returns:
+        True if the module gave the same output as the rules and was
+        kept.
+
+    Raises:
+        None.
+    """
+
+    # Time the compiled passes, not an older generated module
+    ruleset.generated = None
+    ruleset.reset_apply()
+
+    path = generated_path(ruleset)
+
+    if not os.path.exists(CACHE_DIR):
+        os.makedirs(CACHE_DIR)
+
+    # The module is only moved into place once it has been checked,
+    # so load_ruleset never imports a partly written or wrong module
+    temporary = temporary_path(path)
+
+    with open(temporary, "w", encoding="utf-8") as moduleFile:
+        moduleFile.write(generate_source(ruleset))
+
+    generated = load_generated(ruleset, temporary)
+    differences = [
+        value for value in values
+        if generated(value) != ruleset.apply_sequential(value)
+    ]
+
+    passesTime = time_function(ruleset.apply, values)
+    generatedTime = time_function(generated, values)
+
+    print ("%s %s values, %s differ, passes %.3fs, generated %.3fs, "
+           "speedup x%.1f" % (
+               ruleset.name.ljust(14), len(values), len(differences),
+               passesTime, generatedTime,
+               passesTime / max(generatedTime, 1e-9)
+           ))
+
+    for value in differences[:5]:
+        print ("    input     %r" % value)
+        print ("    expected  %r" % ruleset.apply_sequential(value))
+        print ("    got       %r" % generated(value))
+
+    if differences:
+        os.remove(temporary)
+
+        return False
+
+    os.replace(temporary, path)
+
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generates a module for each normalization rule set"
+    )
+    parser.add_argument(
+        "tables", nargs="*", metavar="TABLE",
+        help="rule tables to generate, e.g. brand"
+    )
+    parser.add_argument(
+        "--extracts", metavar="DIR", default="dpd_data_extracts",
+        help="folder of DPD extract files to take real values from"
+    )
+    parser.add_argument(
+        "--limit", type=int, default=5000,
+        help="most real values to check for each rule set"
+    )
+    parser.add_argument(
+        "--synthetic", type=int, default=2000,
+        help="synthetic values to check for each rule set"
+    )
+    parser.add_argument(
+        "--synthetic-only", action="store_true",
+        help="check synthetic values alone if no extracts are found"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import parse
+
+    # Rule table name of each normalizer's rule set
+    normalizers = {
+        ruleset.name: normalizer
+        for normalizer, ruleset in parse.RULESETS.items()
+    }
+
+    tables = args.tables or sorted(
+        fileName[:-4] for fileName in os.listdir(RULES_DIR)
+        if fileName.endswith(".csv")
+    )
+
+    realValues = real_values(
+        args.extracts, list(normalizers.values()), parse, args.limit,
+        args.seed
+    )
+
+    if not any(realValues.values()):
+        print ("No real values found in %s" % args.extracts)
+
+        if not args.synthetic_only:
+            sys.exit(NO_REAL_VALUES)
+
+    saved = True
+
+    for name in tables:
+        ruleset = load_ruleset(name)
+        values = ruleset_values(
+            ruleset, realValues.get(normalizers.get(name), []),
+            args.synthetic, args.seed
+        )
+
+        saved = generate_ruleset(ruleset, values) and saved
+
+    sys.exit(0 if saved else 1)
@@ -0,0 +1,176 @@
+import functools
+import os
+import sqlite3
+
+
+class NormalizationStore(object):
+    """Remembers normalized column values between runs
+
+    Values are stored in an SQLite database keyed by normalizer
+    name, normalizer digest and raw text. The digest changes with the
+    rules of the normalizer, so values normalized by older rules are
+    never returned and are removed when the normalizer is next used.
+    Only the values normalized since the store was last saved are
+    held in memory; stored values are looked up in the database.
+
+    A read-only store, as used by parse worker processes, looks up
+    values but leaves saving them to the store that opened the
+    database for writing.
+    """
+
+    def __init__(self, path, readOnly=False):
+        self.readOnly = readOnly
+
+        if readOnly:
+            # Imported here as urllib.request is slow to import
+            from urllib.request import pathname2url
+
+            uri = "file:%s?mode=ro" % pathname2url(os.path.abspath(path))
+            self.conn = sqlite3.connect(uri, uri=True)
+        else:
+            self.conn = sqlite3.connect(str(path))
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS normalized ("
+                "normalizer TEXT NOT NULL, digest TEXT NOT NULL, "
+                "raw TEXT NOT NULL, normalized TEXT NOT NULL, "
+                "PRIMARY KEY (normalizer, digest, raw)) WITHOUT ROWID"
+            )
+
+        self.digests = {}
+        self.added = {}
+
+    def prepare(self, name, digest):
+        """Removes the stored values of older versions of a normalizer
+
+        Args:
+            name: the normalizer name, e.g. "parseBrand"
+            digest: the digest of the normalizer's current rules
+
+        Returns:
+            Dictionary of the values normalized since the store was
+            last saved, by raw text, which starts empty.
+
+        Raises:
+            None.
+        """
+
+        # Values normalized by other versions of the rules are stale.
+        # Committing straight away leaves the database unlocked for
+        # read-only stores in other processes.
+        if not self.readOnly:
+            self.conn.execute(
+                "DELETE FROM normalized "
+                "WHERE normalizer = ? AND digest != ?",
+                (name, digest)
+            )
+            self.conn.commit()
+
+        self.digests[name] = digest
+        self.added[name] = {}
+
+        return self.added[name]
+
+    def wrap(self, name, digest, normalizer):
+        """Returns normalizer with stored values looked up first
+
+        Stored values are looked up in the database one at a time,
+        rather than all being held in memory; put a cache in front of
+        the returned function for values that repeat.
+
+        Args:
+            name: the normalizer name
+            digest: the digest of the normalizer's current rules
+            normalizer: the function that normalizes a raw value
+
+        Returns:
+            Function that returns the stored value for text, or
+            normalizes text and records the result for saving.
+
+        Raises:
+            None.
+        """
+
+        added = self.prepare(name, digest)
+        execute = self.conn.execute
+        query = (
+            "SELECT normalized FROM normalized "
+            "WHERE normalizer = ? AND digest = ? AND raw = ?"
+        )
+
+        @functools.wraps(normalizer)
+        def lookup(text):
+            try:
+                return added[text]
+            except KeyError:
+                pass
+
+            row = execute(query, (name, digest, text)).fetchone()
+
+            if row is not None:
+                return row[0]
+
+            result = added[text] = normalizer(text)
+
+            return result
+
+        return lookup
+
+    def take_added(self):
+        """Returns the values normalized since the last call
+
+        Returns:
+            List of (normalizer, digest, raw, normalized) tuples,
+            which are then forgotten so they are only returned once.
+
+        Raises:
+            None.
+        """
+
+        taken = []
+
+        for name, added in self.added.items():
+            digest = self.digests[name]
+            taken.extend(
+                (name, digest, raw, normalized)
+                for raw, normalized in added.items()
+            )
+            added.clear()
+
+        return taken
+
+    def add(self, rows):
+        """Records values normalized elsewhere, e.g. by a worker process
+
+        Args:
+            rows: list of (normalizer, digest, raw, normalized) tuples
+                from take_added; rows for normalizers or digests not
+                prepared in this store are ignored
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        for name, digest, raw, normalized in rows:
+            if self.digests.get(name) == digest:
+                self.added[name][raw] = normalized
+
+    def save(self):
+        """Writes the newly normalized values to the database."""
+        if self.readOnly:
+            return
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO normalized "
+            "(normalizer, digest, raw, normalized) VALUES (?, ?, ?, ?)",
+            self.take_added()
+        )
+
+        self.conn.commit()
+
+    def close(self):
+        """Saves any new values and closes the database."""
+        self.save()
+        self.conn.close()
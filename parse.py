@@ -1,3060 +1,639 @@
-import re
-
-def parse_extract_entry(file, line):
-    """Takes a list of strings improves standardization & readability
+import collections
+import functools
+import time
+
+from rule_engine import LazyRuleSet
+
+# Rule sets are loaded when a normalizer first uses them, so tools 
+# that only need a few normalizers do not load the rest
+AHFS_RULESET = LazyRuleSet("ahfs")
+BRAND_RULESET = LazyRuleSet("brand")
+COMPANY_NAME_RULESET = LazyRuleSet("company_name")
+DESCRIPTOR_RULESET = LazyRuleSet("descriptor")
+INGREDIENT_RULESET = LazyRuleSet("ingredient")
+PRODUCT_RULESET = LazyRuleSet("product")
+ROUTE_RULESET = LazyRuleSet("route")
+STANDARD_RULESET = LazyRuleSet("standard")
+STREET_RULESET = LazyRuleSet("street")
+SUITE_RULESET = LazyRuleSet("suite")
+UNIT_RULESET = LazyRuleSet("unit")
+UPC_RULESET = LazyRuleSet("upc")
+
+# Rule sets by the normalizer that applies them
+RULESETS = {
+    "parseAHFS": AHFS_RULESET,
+    "parseBrand": BRAND_RULESET,
+    "parseCompanyName": COMPANY_NAME_RULESET,
+    "parseDescriptor": DESCRIPTOR_RULESET,
+    "parseIngredient": INGREDIENT_RULESET,
+    "parseProduct": PRODUCT_RULESET,
+    "parseRoute": ROUTE_RULESET,
+    "parseStandard": STANDARD_RULESET,
+    "parseStreet": STREET_RULESET,
+    "parseSuite": SUITE_RULESET,
+    "parseUnit": UNIT_RULESET,
+    "parseUPC": UPC_RULESET,
+}
+
+# Most recently used results kept for each cached normalizer. Low 
+# cardinality columns fit entirely; the free text columns keep 
+# their most common values.
+NORMALIZER_CACHE_SIZES = {
+    "parseAHFS": 4096,
+    "parseBrand": 65536,
+    "parseCompanyName": 16384,
+    "parseCompanyType": 256,
+    "parseDate": 16384,
+    "parseDescriptor": 65536,
+    "parseIngredient": 65536,
+    "parseProduct": 256,
+    "parseRoute": 1024,
+    "parseStandard": 1024,
+    "parseStreet": 16384,
+    "parseSuite": 4096,
+    "parseUnit": 4096,
+}
+
+# Hits and misses of a normalizer cache, added up across processes
+CacheCounts = collections.namedtuple("CacheCounts", ["hits", "misses"])
+
+# Normalizers with their rules written in the function rather than 
+# in a rule table; enable_rule_profiling times them as a whole
+FUNCTION_NORMALIZERS = [
+    "parseCompanyType", "parseDate", "parseDIN", "parseDosage"
+]
+
+# Calls, changed values and seconds of each function normalizer, and 
+# the wrappers recording them, while rule profiling is enabled
+function_stats = {}
+function_profilers = {}
+
+# Cache hits and misses of worker processes, by normalizer name, and 
+# in a worker the counts already returned by take_cache_counts
+worker_cache_counts = {}
+taken_cache_counts = {}
+
+# Store of normalized values kept between runs, if one is open
+normalization_store = None
+
+# Row transforms from get_row_transform, by extract file name. Cleared 
+# whenever the normalizers are wrapped or unwrapped.
+row_transforms = {}
+
+# Normalizer for each column of each extract, by extract title. 
+# Columns without a normalizer are passed through unchanged.
+COLUMN_NORMALIZERS = {
+    "comp": [
+        None, None, None, "parseCompanyName", "parseCompanyType", None, 
+        None, None, str.title, "parseSuite", "parseStreet", str.title, 
+        str.title, str.title, None, str.title
+    ],
+    "drug": [
+        None, "parseProduct", str.title, "parseDIN", "parseBrand", 
+        "parseDescriptor", None, str.title, str.title, "parseDate", 
+        str.title
+    ],
+    "form": [None, None, str.lower],
+    "ingred": [
+        None, None, "parseIngredient", None, None, "parseUnit", None, 
+        "parseDosage", None, "parseUnit", None
+    ],
+    "package": [
+        None, "parseUPC", "parseUnit", "parseUnit", "parseDosage", 
+        "parseDescriptor"
+    ],
+    "pharm": [None, "parseStandard"],
+    "route": [None, None, "parseRoute"],
+    "schedule": [None, None],
+    "status": [None, None, str.title, "parseDate"],
+    "ther": [None, None, str.lower, None, "parseAHFS"],
+    "vet": [None, str.lower, str.lower],
+}
+
+# Columns of the extracts parsed by worker processes, by extract title, 
+# with few distinct values. These are dictionary encoded in the chunks 
+# the workers send back. Columns with many distinct values in a chunk 
+# (e.g. drug_code) are left out, as encoding them makes chunks bigger.
+DICTIONARY_COLUMNS = {
+    # company_type, the three address flags, province, country
+    "comp": [4, 5, 6, 7, 12, 13],
+    # product_categorization, class, pediatric_flag, number_of_ais
+    "drug": [1, 2, 6, 8],
+    # ingredient_supplied_ind, strength_unit, strength_type, 
+    # dosage_value, base, dosage_unit
+    "ingred": [3, 5, 6, 7, 8, 9],
+    # package_size_unit, package_type
+    "package": [2, 3],
+}
+
+# Extract title for each extract file name
+EXTRACT_TITLES = {
+    "%s%s.txt" % (title, suffix): title
+    for title in COLUMN_NORMALIZERS for suffix in ("", "_ia", "_ap")
+}
+
+def get_row_transform(file):
+    """Returns a function that parses the rows of an extract file
+    
+    The normalizers are looked up once, when the function is 
+    created, and the function is kept for later calls. Enabling or 
+    disabling a cache, the store or rule profiling creates it again.
     
     Args:
-        file: the name of the file the list was extracted from
-        line: the list of strings to be parsed
+        file: the name of the extract file, e.g. "drug_ap.txt"
     
     Returns:
-        Returns list of parsed strings
+        Function that takes a list of strings from the file and 
+        returns the list of parsed strings.
         
     Raises:
         None.
     """
     
-    output = ""
+    if file in row_transforms:
+        return row_transforms[file]
     
-    if file == "comp.txt" or file == "comp_ia.txt" or file == "comp_ap.txt":
-        drugCode = line[0]
-        mfrCode = line[1]
-        compCode = line[2]
-        compName = parseCompanyName(line[3])
-        compType = parseCompanyType(line[4])
-        mailFlag = line[5]
-        billFlag = line[6]
-        notifFlag = line[7]
-        addressFlag = line[8].title()
-        suite = parseSuite(line[9])
-        street = parseStreet(line[10])
-        city = line[11].title()
-        province = line[12].title()
-        country = line[13].title()
-        postal = line[14]
-        poBox = line[15].title()
+    if file not in EXTRACT_TITLES:
+        print("Error - %s not found" % file)
         
-        output = [
-            drugCode, mfrCode, compCode, compName, compType, mailFlag, 
-            billFlag, notifFlag, addressFlag, suite, street, city, province, 
-            country, postal, poBox
-        ]
+        return lambda line: ""
     
-    elif file == "drug.txt" or file == "drug_ia.txt" or file == "drug_ap.txt":
-        drugCode = line[0]
-        product = parseProduct(line[1])
-        prodClass = line[2].title()
-        din = parseDIN(line[3])
-        brandName = parseBrand(line[4])
-        descriptor = parseDescriptor(line[5])
-        pedFlag = line[6]
-        accessionNum = line[7].title()
-        numAIS = line[8].title()
-        lastUpdate = parseDate(line[9])
-        aiNum = line[10].title()
-        
-        output = [drugCode, product, prodClass, din, brandName, descriptor, 
-                  pedFlag, accessionNum, numAIS, lastUpdate, aiNum
-        ]
-        
-    elif file == "form.txt" or  file == "form_ia.txt" or  file == "form_ap.txt":
-        drugCode = line[0]
-        formCode = line[1]
-        form = line[2].lower()
-        
-        output = [drugCode, formCode, form]
+    module = globals()
+    normalizers = COLUMN_NORMALIZERS[EXTRACT_TITLES[file]]
+    width = len(normalizers)
     
-    elif file == "ingred.txt" or  file == "ingred_ia.txt" or  file == "ingred_ap.txt":
-        drugCode = line[0]
-        ingredientCode = line[1]
-        ingredient = parseIngredient(line[2])
-        ingredientSupplied = line[3]
-        strength = line[4]
-        strengthUnit = parseUnit(line[5])
-        strengthType = line[6]
-        dosageValue = parseDosage(line[7])
-        base = line[8]
-        dosageUnit = parseUnit(line[9])
-        notes = line[10]
-        
-        output = [drugCode, ingredientCode, ingredient, ingredientSupplied, 
-                  strength, strengthUnit, strengthType, dosageValue, base, 
-                  dosageUnit, notes
-        ]
+    # Only columns with a normalizer cost a call per row
+    columns = [
+        (i, module[normalizer] if isinstance(normalizer, str) else normalizer)
+        for i, normalizer in enumerate(normalizers) if normalizer is not None
+    ]
+    
+    def transform(line):
+        output = line[:width]
         
-    elif file == "package.txt" or file == "package_ia.txt" or  file == "package_ap.txt":
-        drugCode = line[0]
-        upc = parseUPC(line[1])
-        packageUnit = parseUnit(line[2])
-        packageType = parseUnit(line[3])
-        packageSize = parseDosage(line[4])
-        info = parseDescriptor(line[5])
+        for i, normalizer in columns:
+            output[i] = normalizer(output[i])
         
-        output = [drugCode, upc, packageUnit, packageType, packageSize, info]
+        return output
     
-    elif file == "pharm.txt" or  file == "pharm_ia.txt" or  file == "pharm_ap.txt":
-        drugCode = line[0]
-        pharmStand = parseStandard(line[1])
-        
-        output = [drugCode, pharmStand]
+    row_transforms[file] = transform
     
-    elif file == "route.txt" or  file == "route_ia.txt" or  file == "route_ap.txt":
-        drugCode = line[0]
-        routeCode = line[1]
-        route = parseRoute(line[2])
-        
-        output = [drugCode, routeCode, route]
+    return transform
+
+def parse_extract_columns(title, columns):
+    """Parses whole columns of an extract file at once
     
-    elif file == "schedule.txt" or  file == "schedule_ia.txt" or  file == "schedule_ap.txt":
-        drugCode = line[0]
-        schedule = line[1]
-        
-        output = [drugCode, schedule]
+    Each distinct value of a column is normalized only once and the 
+    result is mapped back to every row holding that value. Columns 
+    without a normalizer are copied as is.
     
-    elif file == "status.txt" or  file == "status_ia.txt" or  file == "status_ap.txt":
-        drugCode = line[0]
-        statusFlag = line[1]
-        status = line[2].title()
-        historyDate = parseDate(line[3])
-        
-        output = [drugCode, statusFlag, status, historyDate]
+    Args:
+        title: the extract title (e.g. "drug") or file name (e.g. 
+            "drug_ap.txt")
+        columns: list of columns, each a list of the strings in that 
+            column of the file
     
-    elif file == "ther.txt" or  file == "ther_ia.txt" or  file == "ther_ap.txt":
-        drugCode = line[0]
-        atcNum = line[1]
-        atc = line[2].lower()
-        ahfsNum = line[3]
-        ahfs = parseAHFS(line[4])
+    Returns:
+        List of parsed columns, in the same order as the columns of 
+        parse_extract_entry's output.
         
-        output = [drugCode, atcNum, atc, ahfsNum, ahfs]
+    Raises:
+        KeyError: the title is not a known extract.
+    """
     
-    elif file == "vet.txt" or  file == "vet_ia.txt" or  file == "vet_ap.txt":
-        drugCode = line[0]
-        species = line[1].lower()
-        subSpecies = line[2].lower()
-        
-        output = [drugCode, species, subSpecies]
+    title = EXTRACT_TITLES.get(title, title)
+    module = globals()
+    output = []
     
-    else:
-        print("Error - %s not found" % file)
+    for normalizer, column in zip(COLUMN_NORMALIZERS[title], columns):
+        if normalizer is None:
+            output.append(list(column))
+            continue
+        
+        if isinstance(normalizer, str):
+            normalizer = module[normalizer]
         
+        values = {value: normalizer(value) for value in set(column)}
+        output.append([values[value] for value in column])
+    
     return output
 
-
-def parseAHFS(text):
-    """Formats the AHFS category for the drug product."""
-
-    text = text.title()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"\bAlfa\b", "Alpha", text)
-    text = re.sub(r"\bAntiarrythmics\b", "Antiarrhythmics", text)
-    text = re.sub(r"\bAntiimflammatory\b", "Antiinflammatory", text)
-    text = re.sub(r"\bCns\b", "CNS", text)
-    text = re.sub(r"\bComt\b", "COMT", text)
-    text = re.sub(r"\bEent\b", "EENT", text)
-    text = re.sub(r"\bFribic\b", "Fibric", text)
-    text = re.sub(r"\bGaba\b", "GABA", text)
-    text = re.sub(r"\bGi\b", "GI", text)
-    text = re.sub(r"\bHcv\b", "HCV", text)
-    text = re.sub(r"\bHiv\b", "HIV", text)
-    text = re.sub(r"\bHmg-Coa\b", "HMG-CoA", text)
-    text = re.sub(r"\bHt3\b", "HT3", text)
-    text = re.sub(r"\bIi\b", "II", text)
-    text = re.sub(r"\bIii\b", "III", text)
-    text = re.sub(r"\bIv\b", "IV", text)
-    text = re.sub(r"\bNonergot-Derivative\b", "Non-Ergot Derivative", text)
-    text = re.sub(r"\bSglt2\b", "SGLT2", text)
-    
-    #String Replacements        text = text.replace("", "")
+def parse_extract_entry(file, line):
+    """Takes a list of strings improves standardization & readability
     
+    Args:
+        file: the name of the file the list was extracted from
+        line: the list of strings to be parsed
     
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
+    Returns:
+        Returns list of parsed strings
+        
+    Raises:
+        None.
+    """
     
-    return text
-
-def parseBrand(text):
-    """Formats drug product brand name."""
+    return get_row_transform(file)(line)
 
-    text = text.title()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Space Parenthesis, Commas, %
-    text = re.sub(r"a\(", "a (", text)
-    text = re.sub(r"b\(", "b (", text)
-    text = re.sub(r"c\(", "c (", text)
-    text = re.sub(r"d\(", "d (", text)
-    text = re.sub(r"e\(", "e (", text)
-    text = re.sub(r"f\(", "f (", text)
-    text = re.sub(r"g\(", "g (", text)
-    text = re.sub(r"h\(", "h (", text)
-    text = re.sub(r"i\(", "i (", text)
-    text = re.sub(r"j\(", "j (", text)
-    text = re.sub(r"k\(", "k (", text)
-    text = re.sub(r"l\(", "l (", text)
-    text = re.sub(r"m\(", "m (", text)
-    text = re.sub(r"n\(", "n (", text)
-    text = re.sub(r"o\(", "o (", text)
-    text = re.sub(r"p\(", "p (", text)
-    text = re.sub(r"q\(", "q (", text)
-    text = re.sub(r"r\(", "r (", text)
-    text = re.sub(r"s\(", "s (", text)
-    text = re.sub(r"t\(", "t (", text)
-    text = re.sub(r"u\(", "u (", text)
-    text = re.sub(r"v\(", "v (", text)
-    text = re.sub(r"w\(", "w (", text)
-    text = re.sub(r"x\(", "x (", text)
-    text = re.sub(r"y\(", "y (", text)
-    text = re.sub(r"z\(", "z (", text)
-    text = re.sub(r"0\(", "0 (", text)
-    text = re.sub(r"1\(", "1 (", text)
-    text = re.sub(r"2\(", "2 (", text)
-    text = re.sub(r"3\(", "3 (", text)
-    text = re.sub(r"4\(", "4 (", text)
-    text = re.sub(r"5\(", "5 (", text)
-    text = re.sub(r"6\(", "6 (", text)
-    text = re.sub(r"7\(", "7 (", text)
-    text = re.sub(r"8\(", "8 (", text)
-    text = re.sub(r"9\(", "9 (", text)
-    text = re.sub(r"\%\(", "% (", text)
-    text = re.sub(r"\s*-\(\b", " (", text)
-    text = re.sub(r"\)-", ") -", text)
-    text = re.sub(r"\.\(\b", ". (", text)
-    
-    text = re.sub(r"\)A", ") A", text)
-    text = re.sub(r"\)B", ") B", text)
-    text = re.sub(r"\)C", ") C", text)
-    text = re.sub(r"\)D", ") D", text)
-    text = re.sub(r"\)E", ") E", text)
-    text = re.sub(r"\)F", ") F", text)
-    text = re.sub(r"\)G", ") G", text)
-    text = re.sub(r"\)H", ") H", text)
-    text = re.sub(r"\)I", ") I", text)
-    text = re.sub(r"\)J", ") J", text)
-    text = re.sub(r"\)K", ") K", text)
-    text = re.sub(r"\)L", ") L", text)
-    text = re.sub(r"\)M", ") M", text)
-    text = re.sub(r"\)N", ") N", text)
-    text = re.sub(r"\)O", ") O", text)
-    text = re.sub(r"\)P", ") P", text)
-    text = re.sub(r"\)Q", ") Q", text)
-    text = re.sub(r"\)R", ") R", text)
-    text = re.sub(r"\)S", ") S", text)
-    text = re.sub(r"\)T", ") T", text)
-    text = re.sub(r"\)U", ") U", text)
-    text = re.sub(r"\)V", ") V", text)
-    text = re.sub(r"\)W", ") W", text)
-    text = re.sub(r"\)X", ") X", text)
-    text = re.sub(r"\)Y", ") Y", text)
-    text = re.sub(r"\)Z", ") Z", text)
-    text = re.sub(r"\)0", ") 0", text)
-    text = re.sub(r"\)1", ") 1", text)
-    text = re.sub(r"\)2", ") 2", text)
-    text = re.sub(r"\)3", ") 3", text)
-    text = re.sub(r"\)4", ") 4", text)
-    text = re.sub(r"\)5", ") 5", text)
-    text = re.sub(r"\)6", ") 6", text)
-    text = re.sub(r"\)7", ") 7", text)
-    text = re.sub(r"\)8", ") 8", text)
-    text = re.sub(r"\)9", ") 9", text)
-    
-    text = re.sub(r",A", ", A", text)
-    text = re.sub(r",B", ", B", text)
-    text = re.sub(r",C", ", C", text)
-    text = re.sub(r",D", ", D", text)
-    text = re.sub(r",E", ", E", text)
-    text = re.sub(r",F", ", F", text)
-    text = re.sub(r",G", ", G", text)
-    text = re.sub(r",H", ", H", text)
-    text = re.sub(r",I", ", I", text)
-    text = re.sub(r",J", ", J", text)
-    text = re.sub(r",K", ", K", text)
-    text = re.sub(r",L", ", L", text)
-    text = re.sub(r",M", ", M", text)
-    text = re.sub(r",N", ", N", text)
-    text = re.sub(r",O", ", O", text)
-    text = re.sub(r",P", ", P", text)
-    text = re.sub(r",Q", ", Q", text)
-    text = re.sub(r",R", ", R", text)
-    text = re.sub(r",S", ", S", text)
-    text = re.sub(r",T", ", T", text)
-    text = re.sub(r",U", ", U", text)
-    text = re.sub(r",V", ", V", text)
-    text = re.sub(r",W", ", W", text)
-    text = re.sub(r",X", ", X", text)
-    text = re.sub(r",Y", ", Y", text)
-    text = re.sub(r",Z", ", Z", text)
-    text = re.sub(r",0", ", 0", text)
-    text = re.sub(r",1", ", 1", text)
-    text = re.sub(r",2", ", 2", text)
-    text = re.sub(r",3", ", 3", text)
-    text = re.sub(r",4", ", 4", text)
-    text = re.sub(r",5", ", 5", text)
-    text = re.sub(r",6", ", 6", text)
-    text = re.sub(r",7", ", 7", text)
-    text = re.sub(r",8", ", 8", text)
-    text = re.sub(r",9", ", 9", text)
-    
-    text = re.sub(r"\%A", "% A", text)
-    text = re.sub(r"\%B", "% B", text)
-    text = re.sub(r"\%C", "% C", text)
-    text = re.sub(r"\%D", "% D", text)
-    text = re.sub(r"\%E", "% E", text)
-    text = re.sub(r"\%F", "% F", text)
-    text = re.sub(r"\%G", "% G", text)
-    text = re.sub(r"\%H", "% H", text)
-    text = re.sub(r"\%I", "% I", text)
-    text = re.sub(r"\%J", "% J", text)
-    text = re.sub(r"\%K", "% K", text)
-    text = re.sub(r"\%L", "% L", text)
-    text = re.sub(r"\%M", "% M", text)
-    text = re.sub(r"\%N", "% N", text)
-    text = re.sub(r"\%O", "% O", text)
-    text = re.sub(r"\%P", "% P", text)
-    text = re.sub(r"\%Q", "% Q", text)
-    text = re.sub(r"\%R", "% R", text)
-    text = re.sub(r"\%S", "% S", text)
-    text = re.sub(r"\%T", "% T", text)
-    text = re.sub(r"\%U", "% U", text)
-    text = re.sub(r"\%V", "% V", text)
-    text = re.sub(r"\%W", "% W", text)
-    text = re.sub(r"\%X", "% X", text)
-    text = re.sub(r"\%Y", "% Y", text)
-    text = re.sub(r"\%Z", "% Z", text)
-    text = re.sub(r"\%0", "% 0", text)
-    text = re.sub(r"\%1", "% 1", text)
-    text = re.sub(r"\%2", "% 2", text)
-    text = re.sub(r"\%3", "% 3", text)
-    text = re.sub(r"\%4", "% 4", text)
-    text = re.sub(r"\%5", "% 5", text)
-    text = re.sub(r"\%6", "% 6", text)
-    text = re.sub(r"\%7", "% 7", text)
-    text = re.sub(r"\%8", "% 8", text)
-    text = re.sub(r"\%9", "% 9", text)
-    
+def enable_normalizer_cache(sizes=None):
+    """Puts a bounded LRU cache in front of each normalizer
     
+    Args:
+        sizes: optional dictionary of cache sizes by normalizer name, 
+            overriding NORMALIZER_CACHE_SIZES
     
-    #Homeopathy Dilutions
-    text = text.replace("D1(2-6 8 10 12 15 20 30)", "(1-6D, 8D, 10D, 12D, 15D, 20D, 30D)")
-    text = text.replace("D(1-3)", "(1-3D)")
-    text = text.replace("D2 (3-6, 8, 10, 12, 15, 20, 30)", "(2-6D, 8D, 10D, 12D, 15D, 20D, 30D)")
-    text = text.replace("D3(D4D6D10D15D20D30)", "(3D, 4D, 6D, 15D, 20D, 30D)")
-    text = text.replace("D3 (4 6 10 20 30)", "(3D, 4D, 6D, 10D, 20D, 30D)")
-    text = text.replace("D3(D4 D6 D10 D15 D20 D30)", "(3D, 4D, 6D, 15D, 20D, 30D)")
-    text = text.replace("D3(D4 D5 D6)", "(3D, 4D, 6D)")
-    text = text.replace("D3-C1000", "3D-1000C")
-    text = text.replace("D4, 5, 6, 8, 10, 12, 15, 20, 30", "4D, 5D, 6D, 8D, 10D, 12D, 15D, 20D, 30D")
-    text = text.replace("D4, 5, 6, 8, 10, 12, 15", "4D, 5D, 6D, 8D, 10D, 12D, 15D")
-    text = text.replace("D4-D200", "4D-200D")
-    text = text.replace("D(6 8 10 12 20 30) -Liq", "(6D, 8D, 10D, 12D, 20D, 30D) - Liquid")
-    text = text.replace("D6 (D8 10 12 15 20 30)", "(6D, 8D, 10D, 12D, 15D, 20D, 30D)")
-    text = text.replace("D6-D200", "(6D-200D)")
-    text = text.replace("D8 (D10 D12 D15 D20 D30)", "8D, 10D, 12D, 15D, 20D, 30D)")
-    text = text.replace("10D, 30D, 200D, 1000/", "10D, 30D, 200D, 1000D/")
-    text = text.replace("D10-D200", "10D-200D")
-    text = text.replace("D12-D200", "D12-D200")
-    text = text.replace("D15, 30D", "15D, 30D")
-    text = text.replace("1, 2, 3, 6, 9X..Cm", "1X, 2X, 3X, 6X, 9X... CM")
-    text = text.replace("1, 2, 3, 6X..Cm", "1X, 2X, 3X, 6X... CM")
-    text = text.replace("1, 2, 3X..Cm", "1X, 2X, 3X... CM")
-    text = text.replace("1, 2X..Cm", "1X, 2X... CM")
-    text = text.replace("3, 6, 9, 12X..Cm", "3X, 6X, 9X, 12X... CM")
-    text = text.replace("-3, 6, 9X.Cm", " - 3X, 6X, 9X, 6X... CM")
-    text = text.replace("-3, 6, 9X..Cm", " - 3X, 6X, 9X, 6X... CM")
-    text = text.replace("6, 9, 12X..Cm", "6X, 9X, 12X... CM")
-    text = text.replace("3, 6X..Cm", "3X, 6X... CM")
-    text = text.replace("-6, 9X..Cm", " - 6X, 9X... CM")
-    text = text.replace("C6-C1000", "6C-1000C")
-    
-    #Unit Conversions
-    text = re.sub(r"0Ch\b", "0C", text)
-    text = re.sub(r"1Ch\b", "1C", text)
-    text = re.sub(r"2Ch\b", "2C", text)
-    text = re.sub(r"3Ch\b", "3C", text)
-    text = re.sub(r"4Ch\b", "4C", text)
-    text = re.sub(r"5Ch\b", "5C", text)
-    text = re.sub(r"6Ch\b", "6C", text)
-    text = re.sub(r"7Ch\b", "7C", text)
-    text = re.sub(r"8Ch\b", "8C", text)
-    text = re.sub(r"9Ch\b", "9C", text)
-    
-    text = re.sub(r"0 Ch\b", "0C", text)
-    text = re.sub(r"1 Ch\b", "1C", text)
-    text = re.sub(r"2 Ch\b", "2C", text)
-    text = re.sub(r"3 Ch\b", "3C", text)
-    text = re.sub(r"4 Ch\b", "4C", text)
-    text = re.sub(r"5 Ch\b", "5C", text)
-    text = re.sub(r"6 Ch\b", "6C", text)
-    text = re.sub(r"7 Ch\b", "7C", text)
-    text = re.sub(r"8 Ch\b", "8C", text)
-    text = re.sub(r"9 Ch\b", "9C", text)
-    
-    text = re.sub(r"0Cm\b", "0 cm", text)
-    text = re.sub(r"1Cm\b", "1 cm", text)
-    text = re.sub(r"2Cm\b", "2 cm", text)
-    text = re.sub(r"3Cm\b", "3 cm", text)
-    text = re.sub(r"4Cm\b", "4 cm", text)
-    text = re.sub(r"5Cm\b", "5 cm", text)
-    text = re.sub(r"6Cm\b", "6 cm", text)
-    text = re.sub(r"7Cm\b", "7 cm", text)
-    text = re.sub(r"8Cm\b", "8 cm", text)
-    text = re.sub(r"9Cm\b", "9 cm", text)
-    
-    text = re.sub(r"0 Cm\b", "0 cm", text)
-    text = re.sub(r"1 Cm\b", "1 cm", text)
-    text = re.sub(r"2 Cm\b", "2 cm", text)
-    text = re.sub(r"3 Cm\b", "3 cm", text)
-    text = re.sub(r"4 Cm\b", "4 cm", text)
-    text = re.sub(r"5 Cm\b", "5 cm", text)
-    text = re.sub(r"6 Cm\b", "6 cm", text)
-    text = re.sub(r"7 Cm\b", "7 cm", text)
-    text = re.sub(r"8 Cm\b", "8 cm", text)
-    text = re.sub(r"9 Cm\b", "9 cm", text)
-    
-    text = re.sub(r"/Cm\b", "/cm", text)
-    
-    text = re.sub(r"0Dh\b", "0D", text)
-    text = re.sub(r"1Dh\b", "1D", text)
-    text = re.sub(r"2Dh\b", "2D", text)
-    text = re.sub(r"3Dh\b", "3D", text)
-    text = re.sub(r"4Dh\b", "4D", text)
-    text = re.sub(r"5Dh\b", "5D", text)
-    text = re.sub(r"6Dh\b", "6D", text)
-    text = re.sub(r"7Dh\b", "7D", text)
-    text = re.sub(r"8Dh\b", "8D", text)
-    text = re.sub(r"9Dh\b", "9D", text)
-    
-    text = re.sub(r"0 Dh\b", "0D", text)
-    text = re.sub(r"1 Dh\b", "1D", text)
-    text = re.sub(r"2 Dh\b", "2D", text)
-    text = re.sub(r"3 Dh\b", "3D", text)
-    text = re.sub(r"4 Dh\b", "4D", text)
-    text = re.sub(r"5 Dh\b", "5D", text)
-    text = re.sub(r"6 Dh\b", "6D", text)
-    text = re.sub(r"7 Dh\b", "7D", text)
-    text = re.sub(r"8 Dh\b", "8D", text)
-    text = re.sub(r"9 Dh\b", "9D", text)
-    
-    text = re.sub(r"0G\b", "0 g", text)
-    text = re.sub(r"1G\b", "1 g", text)
-    text = re.sub(r"2G\b", "2 g", text)
-    text = re.sub(r"3G\b", "3 g", text)
-    text = re.sub(r"4G\b", "4 g", text)
-    text = re.sub(r"5G\b", "5 g", text)
-    text = re.sub(r"6G\b", "6 g", text)
-    text = re.sub(r"7G\b", "7 g", text)
-    text = re.sub(r"8G\b", "8 g", text)
-    text = re.sub(r"9G\b", "9 g", text)
-    
-    text = re.sub(r"0 G\b", "0 g", text)
-    text = re.sub(r"1 G\b", "1 g", text)
-    text = re.sub(r"2 G\b", "2 g", text)
-    text = re.sub(r"3 G\b", "3 g", text)
-    text = re.sub(r"4 G\b", "4 g", text)
-    text = re.sub(r"5 G\b", "5 g", text)
-    text = re.sub(r"6 G\b", "6 g", text)
-    text = re.sub(r"7 G\b", "7 g", text)
-    text = re.sub(r"8 G\b", "8 g", text)
-    text = re.sub(r"9 G\b", "9 g", text)
-    
-    text = re.sub(r"/G\b", "/g", text)
-    
-    text = re.sub(r"0Gm\b", "0 g", text)
-    text = re.sub(r"1Gm\b", "1 g", text)
-    text = re.sub(r"2Gm\b", "2 g", text)
-    text = re.sub(r"3Gm\b", "3 g", text)
-    text = re.sub(r"4Gm\b", "4 g", text)
-    text = re.sub(r"5Gm\b", "5 g", text)
-    text = re.sub(r"6Gm\b", "6 g", text)
-    text = re.sub(r"7Gm\b", "7 g", text)
-    text = re.sub(r"8Gm\b", "8 g", text)
-    text = re.sub(r"9Gm\b", "9 g", text)
-    
-    text = re.sub(r"0 Gm\b", "0 g", text)
-    text = re.sub(r"1 Gm\b", "1 g", text)
-    text = re.sub(r"2 Gm\b", "2 g", text)
-    text = re.sub(r"3 Gm\b", "3 g", text)
-    text = re.sub(r"4 Gm\b", "4 g", text)
-    text = re.sub(r"5 Gm\b", "5 g", text)
-    text = re.sub(r"6 Gm\b", "6 g", text)
-    text = re.sub(r"7 Gm\b", "7 g", text)
-    text = re.sub(r"8 Gm\b", "8 g", text)
-    text = re.sub(r"9 Gm\b", "9 g", text)
-    
-    text = re.sub(r"/Gm\b", "/g", text)
-    
-    text = re.sub(r"0Iu\b", "0 IU", text)
-    text = re.sub(r"1Iu\b", "1 IU", text)
-    text = re.sub(r"2Iu\b", "2 IU", text)
-    text = re.sub(r"3Iu\b", "3 IU", text)
-    text = re.sub(r"4Iu\b", "4 IU", text)
-    text = re.sub(r"5Iu\b", "5 IU", text)
-    text = re.sub(r"6Iu\b", "6 IU", text)
-    text = re.sub(r"7Iu\b", "7 IU", text)
-    text = re.sub(r"8Iu\b", "8 IU", text)
-    text = re.sub(r"9Iu\b", "9 IU", text)
-    
-    text = re.sub(r"0 Iu\b", "0 IU", text)
-    text = re.sub(r"1 Iu\b", "1 IU", text)
-    text = re.sub(r"2 Iu\b", "2 IU", text)
-    text = re.sub(r"3 Iu\b", "3 IU", text)
-    text = re.sub(r"4 Iu\b", "4 IU", text)
-    text = re.sub(r"5 Iu\b", "5 IU", text)
-    text = re.sub(r"6 Iu\b", "6 IU", text)
-    text = re.sub(r"7 Iu\b", "7 IU", text)
-    text = re.sub(r"8 Iu\b", "8 IU", text)
-    text = re.sub(r"9 Iu\b", "9 IU", text)
-    
-    text = re.sub(r"\bIu\b", "IU", text)
-    text = re.sub(r"\bI.U.\b", "IU", text)
-    text = re.sub(r"\bI.U.\b", "IU", text)
-    
-    text = re.sub(r"0I\.U\.\b", "0 IU", text)
-    text = re.sub(r"1I\.U\.\b", "1 IU", text)
-    text = re.sub(r"2I\.U\.\b", "2 IU", text)
-    text = re.sub(r"3I\.U\.\b", "3 IU", text)
-    text = re.sub(r"4I\.U\.\b", "4 IU", text)
-    text = re.sub(r"5I\.U\.\b", "5 IU", text)
-    text = re.sub(r"6I\.U\.\b", "6 IU", text)
-    text = re.sub(r"7I\.U\.\b", "7 IU", text)
-    text = re.sub(r"8I\.U\.\b", "8 IU", text)
-    text = re.sub(r"9I\.U\.\b", "9 IU", text)
-    
-    text = re.sub(r"0 I\.U\.\b", "0 IU", text)
-    text = re.sub(r"1 I\.U\.\b", "1 IU", text)
-    text = re.sub(r"2 I\.U\.\b", "2 IU", text)
-    text = re.sub(r"3 I\.U\.\b", "3 IU", text)
-    text = re.sub(r"4 I\.U\.\b", "4 IU", text)
-    text = re.sub(r"5 I\.U\.\b", "5 IU", text)
-    text = re.sub(r"6 I\.U\.\b", "6 IU", text)
-    text = re.sub(r"7 I\.U\.\b", "7 IU", text)
-    text = re.sub(r"8 I\.U\.\b", "8 IU", text)
-    text = re.sub(r"9 I\.U\.\b", "9 IU", text)
-    
-    text = re.sub(r"0Mcg\b", "0 mcg", text)
-    text = re.sub(r"1Mcg\b", "1 mcg", text)
-    text = re.sub(r"2Mcg\b", "2 mcg", text)
-    text = re.sub(r"3Mcg\b", "3 mcg", text)
-    text = re.sub(r"4Mcg\b", "4 mcg", text)
-    text = re.sub(r"5Mcg\b", "5 mcg", text)
-    text = re.sub(r"6Mcg\b", "6 mcg", text)
-    text = re.sub(r"7Mcg\b", "7 mcg", text)
-    text = re.sub(r"8Mcg\b", "8 mcg", text)
-    text = re.sub(r"9Mcg\b", "9 mcg", text)
-    
-    text = re.sub(r"0 Mcg\b", "0 mcg", text)
-    text = re.sub(r"1 Mcg\b", "1 mcg", text)
-    text = re.sub(r"2 Mcg\b", "2 mcg", text)
-    text = re.sub(r"3 Mcg\b", "3 mcg", text)
-    text = re.sub(r"4 Mcg\b", "4 mcg", text)
-    text = re.sub(r"5 Mcg\b", "5 mcg", text)
-    text = re.sub(r"6 Mcg\b", "6 mcg", text)
-    text = re.sub(r"7 Mcg\b", "7 mcg", text)
-    text = re.sub(r"8 Mcg\b", "8 mcg", text)
-    text = re.sub(r"9 Mcg\b", "9 mcg", text)
-    
-    text = re.sub(r"0Meq\b", "0 mEq", text)
-    text = re.sub(r"1Meq\b", "1 mEq", text)
-    text = re.sub(r"2Meq\b", "2 mEq", text)
-    text = re.sub(r"3Meq\b", "3 mEq", text)
-    text = re.sub(r"4Meq\b", "4 mEq", text)
-    text = re.sub(r"5Meq\b", "5 mEq", text)
-    text = re.sub(r"6Meq\b", "6 mEq", text)
-    text = re.sub(r"7Meq\b", "7 mEq", text)
-    text = re.sub(r"8Meq\b", "8 mEq", text)
-    text = re.sub(r"9Meq\b", "9 mEq", text)
-    
-    text = re.sub(r"0 Meq\b", "0 mEq", text)
-    text = re.sub(r"1 Meq\b", "1 mEq", text)
-    text = re.sub(r"2 Meq\b", "2 mEq", text)
-    text = re.sub(r"3 Meq\b", "3 mEq", text)
-    text = re.sub(r"4 Meq\b", "4 mEq", text)
-    text = re.sub(r"5 Meq\b", "5 mEq", text)
-    text = re.sub(r"6 Meq\b", "6 mEq", text)
-    text = re.sub(r"7 Meq\b", "7 mEq", text)
-    text = re.sub(r"8 Meq\b", "8 mEq", text)
-    text = re.sub(r"9 Meq\b", "9 mEq", text)
-    
-    text = re.sub(r"\bMeq\b", "mEq", text)
-    
-    text = re.sub(r"0Mg\b", "0 mg", text)
-    text = re.sub(r"1Mg\b", "1 mg", text)
-    text = re.sub(r"2Mg\b", "2 mg", text)
-    text = re.sub(r"3Mg\b", "3 mg", text)
-    text = re.sub(r"4Mg\b", "4 mg", text)
-    text = re.sub(r"5Mg\b", "5 mg", text)
-    text = re.sub(r"6Mg\b", "6 mg", text)
-    text = re.sub(r"7Mg\b", "7 mg", text)
-    text = re.sub(r"8Mg\b", "8 mg", text)
-    text = re.sub(r"9Mg\b", "9 mg", text)
-    
-    text = re.sub(r"0 Mg\b", "0 mg", text)
-    text = re.sub(r"1 Mg\b", "1 mg", text)
-    text = re.sub(r"2 Mg\b", "2 mg", text)
-    text = re.sub(r"3 Mg\b", "3 mg", text)
-    text = re.sub(r"4 Mg\b", "4 mg", text)
-    text = re.sub(r"5 Mg\b", "5 mg", text)
-    text = re.sub(r"6 Mg\b", "6 mg", text)
-    text = re.sub(r"7 Mg\b", "7 mg", text)
-    text = re.sub(r"8 Mg\b", "8 mg", text)
-    text = re.sub(r"9 Mg\b", "9 mg", text)
-    
-    text = re.sub(r"/Mg\b", "/mg", text)
-    
-    text = re.sub(r"0Ml\b", "0 mL", text)
-    text = re.sub(r"1Ml\b", "1 mL", text)
-    text = re.sub(r"2Ml\b", "2 mL", text)
-    text = re.sub(r"3Ml\b", "3 mL", text)
-    text = re.sub(r"4Ml\b", "4 mL", text)
-    text = re.sub(r"5Ml\b", "5 mL", text)
-    text = re.sub(r"6Ml\b", "6 mL", text)
-    text = re.sub(r"7Ml\b", "7 mL", text)
-    text = re.sub(r"8Ml\b", "8 mL", text)
-    text = re.sub(r"9Ml\b", "9 mL", text)
-    
-    text = re.sub(r"0 Ml\b", "0 mL", text)
-    text = re.sub(r"1 Ml\b", "1 mL", text)
-    text = re.sub(r"2 Ml\b", "2 mL", text)
-    text = re.sub(r"3 Ml\b", "3 mL", text)
-    text = re.sub(r"4 Ml\b", "4 mL", text)
-    text = re.sub(r"5 Ml\b", "5 mL", text)
-    text = re.sub(r"6 Ml\b", "6 mL", text)
-    text = re.sub(r"7 Ml\b", "7 mL", text)
-    text = re.sub(r"8 Ml\b", "8 mL", text)
-    text = re.sub(r"9 Ml\b", "9 mL", text)
-    
-    text = re.sub(r"/Ml\b", "/mL", text)
-    
-    text = re.sub(r"0Mmol\b", "0 mmol", text)
-    text = re.sub(r"1Mmol\b", "1 mmol", text)
-    text = re.sub(r"2Mmol\b", "2 mmol", text)
-    text = re.sub(r"3Mmol\b", "3 mmol", text)
-    text = re.sub(r"4Mmol\b", "4 mmol", text)
-    text = re.sub(r"5Mmol\b", "5 mmol", text)
-    text = re.sub(r"6Mmol\b", "6 mmol", text)
-    text = re.sub(r"7Mmol\b", "7 mmol", text)
-    text = re.sub(r"8Mmol\b", "8 mmol", text)
-    text = re.sub(r"9Mmol\b", "9 mmol", text)
-    
-    text = re.sub(r"0 Mmol\b", "0 mmol", text)
-    text = re.sub(r"1 Mmol\b", "1 mmol", text)
-    text = re.sub(r"2 Mmol\b", "2 mmol", text)
-    text = re.sub(r"3 Mmol\b", "3 mmol", text)
-    text = re.sub(r"4 Mmol\b", "4 mmol", text)
-    text = re.sub(r"5 Mmol\b", "5 mmol", text)
-    text = re.sub(r"6 Mmol\b", "6 mmol", text)
-    text = re.sub(r"7 Mmol\b", "7 mmol", text)
-    text = re.sub(r"8 Mmol\b", "8 mmol", text)
-    text = re.sub(r"9 Mmol\b", "9 mmol", text)
-    
-    text = re.sub(r"0Mmols\b", "0 mmol", text)
-    text = re.sub(r"1Mmols\b", "1 mmol", text)
-    text = re.sub(r"2Mmols\b", "2 mmol", text)
-    text = re.sub(r"3Mmols\b", "3 mmol", text)
-    text = re.sub(r"4Mmols\b", "4 mmol", text)
-    text = re.sub(r"5Mmols\b", "5 mmol", text)
-    text = re.sub(r"6Mmols\b", "6 mmol", text)
-    text = re.sub(r"7Mmols\b", "7 mmol", text)
-    text = re.sub(r"8Mmols\b", "8 mmol", text)
-    text = re.sub(r"9Mmols\b", "9 mmol", text)
-    
-    text = re.sub(r"0 Mmols\b", "0 mmol", text)
-    text = re.sub(r"1 Mmols\b", "1 mmol", text)
-    text = re.sub(r"2 Mmols\b", "2 mmol", text)
-    text = re.sub(r"3 Mmols\b", "3 mmol", text)
-    text = re.sub(r"4 Mmols\b", "4 mmol", text)
-    text = re.sub(r"5 Mmols\b", "5 mmol", text)
-    text = re.sub(r"6 Mmols\b", "6 mmol", text)
-    text = re.sub(r"7 Mmols\b", "7 mmol", text)
-    text = re.sub(r"8 Mmols\b", "8 mmol", text)
-    text = re.sub(r"9 Mmols\b", "9 mmol", text)
-    
-    text = re.sub(r"0Ui\b", "0 UI", text)
-    text = re.sub(r"1Ui\b", "1 UI", text)
-    text = re.sub(r"2Ui\b", "2 UI", text)
-    text = re.sub(r"3Ui\b", "3 UI", text)
-    text = re.sub(r"4Ui\b", "4 UI", text)
-    text = re.sub(r"5Ui\b", "5 UI", text)
-    text = re.sub(r"6Ui\b", "6 UI", text)
-    text = re.sub(r"7Ui\b", "7 UI", text)
-    text = re.sub(r"8Ui\b", "8 UI", text)
-    text = re.sub(r"9Ui\b", "9 UI", text)
-    
-    text = re.sub(r"0 Ui\b", "0 UI", text)
-    text = re.sub(r"1 Ui\b", "1 UI", text)
-    text = re.sub(r"2 Ui\b", "2 UI", text)
-    text = re.sub(r"3 Ui\b", "3 UI", text)
-    text = re.sub(r"4 Ui\b", "4 UI", text)
-    text = re.sub(r"5 Ui\b", "5 UI", text)
-    text = re.sub(r"6 Ui\b", "6 UI", text)
-    text = re.sub(r"7 Ui\b", "7 UI", text)
-    text = re.sub(r"8 Ui\b", "8 UI", text)
-    text = re.sub(r"9 Ui\b", "9 UI", text)
-    
-    text = re.sub(r"0U\.I\.\b", "0 UI", text)
-    text = re.sub(r"1U\.I\.\b", "1 UI", text)
-    text = re.sub(r"2U\.I\.\b", "2 UI", text)
-    text = re.sub(r"3U\.I\.\b", "3 UI", text)
-    text = re.sub(r"4U\.I\.\b", "4 UI", text)
-    text = re.sub(r"5U\.I\.\b", "5 UI", text)
-    text = re.sub(r"6U\.I\.\b", "6 UI", text)
-    text = re.sub(r"7U\.I\.\b", "7 UI", text)
-    text = re.sub(r"8U\.I\.\b", "8 UI", text)
-    text = re.sub(r"9U\.I\.\b", "9 UI", text)
-    
-    text = re.sub(r"0 U\.I\.\b", "0 UI", text)
-    text = re.sub(r"1 U\.I\.\b", "1 UI", text)
-    text = re.sub(r"2 U\.I\.\b", "2 UI", text)
-    text = re.sub(r"3 U\.I\.\b", "3 UI", text)
-    text = re.sub(r"4 U\.I\.\b", "4 UI", text)
-    text = re.sub(r"5 U\.I\.\b", "5 UI", text)
-    text = re.sub(r"6 U\.I\.\b", "6 UI", text)
-    text = re.sub(r"7 U\.I\.\b", "7 UI", text)
-    text = re.sub(r"8 U\.I\.\b", "8 UI", text)
-    text = re.sub(r"9 U\.I\.\b", "9 UI", text)
-    
-    text = re.sub(r"0Units\b", "0 units", text)
-    text = re.sub(r"1Units\b", "1 units", text)
-    text = re.sub(r"2Units\b", "2 units", text)
-    text = re.sub(r"3Units\b", "3 units", text)
-    text = re.sub(r"4Units\b", "4 units", text)
-    text = re.sub(r"5Units\b", "5 units", text)
-    text = re.sub(r"6Units\b", "6 units", text)
-    text = re.sub(r"7Units\b", "7 units", text)
-    text = re.sub(r"8Units\b", "8 units", text)
-    text = re.sub(r"9Units\b", "9 units", text)
-    
-    text = re.sub(r"0 Units\b", "0 units", text)
-    text = re.sub(r"1 Units\b", "1 units", text)
-    text = re.sub(r"2 Units\b", "2 units", text)
-    text = re.sub(r"3 Units\b", "3 units", text)
-    text = re.sub(r"4 Units\b", "4 units", text)
-    text = re.sub(r"5 Units\b", "5 units", text)
-    text = re.sub(r"6 Units\b", "6 units", text)
-    text = re.sub(r"7 Units\b", "7 units", text)
-    text = re.sub(r"8 Units\b", "8 units", text)
-    text = re.sub(r"9 Units\b", "9 units", text)
-    
-    text = re.sub(r"0Unit\b", "0 unit", text)
-    text = re.sub(r"1Unit\b", "1 unit", text)
-    text = re.sub(r"2Unit\b", "2 unit", text)
-    text = re.sub(r"3Unit\b", "3 unit", text)
-    text = re.sub(r"4Unit\b", "4 unit", text)
-    text = re.sub(r"5Unit\b", "5 unit", text)
-    text = re.sub(r"6Unit\b", "6 unit", text)
-    text = re.sub(r"7Unit\b", "7 unit", text)
-    text = re.sub(r"8Unit\b", "8 unit", text)
-    text = re.sub(r"9Unit\b", "9 unit", text)
-    
-    text = re.sub(r"0 Unit\b", "0 unit", text)
-    text = re.sub(r"1 Unit\b", "1 unit", text)
-    text = re.sub(r"2 Unit\b", "2 unit", text)
-    text = re.sub(r"3 Unit\b", "3 unit", text)
-    text = re.sub(r"4 Unit\b", "4 unit", text)
-    text = re.sub(r"5 Unit\b", "5 unit", text)
-    text = re.sub(r"6 Unit\b", "6 unit", text)
-    text = re.sub(r"7 Unit\b", "7 unit", text)
-    text = re.sub(r"8 Unit\b", "8 unit", text)
-    text = re.sub(r"9 Unit\b", "9 unit", text)
-    
-    
-    
-    #Regex Pass
-    #0
-    text = re.sub(r"'S\b", "'s", text)
-    text = re.sub(r"\.\.b", ".", text)
-    text = re.sub(r"\b2in1\b", "2-In-1", text)
-    
-    #A
-    text = re.sub(r"\bAas\b", "AAS", text)
-    text = re.sub(r"\bAbc\b", "ABC", text)
-    text = re.sub(r"\bAccuspray\b", "AccuSpray", text)
-    text = re.sub(r"\bAcd\b", "ACD", text)
-    text = re.sub(r"\bAci\b", "ACI", text)
-    text = re.sub(r"\bAcnecare\b", "AcneCare", text)
-    text = re.sub(r"\bAco\b", "ACI", text)
-    text = re.sub(r"\bAcp\b", "ACP", text)
-    text = re.sub(r"\bAcr\b", "ACR", text)
-    text = re.sub(r"\bActh\b", "ACTH", text)
-    text = re.sub(r"\bAdc\b", "ADC", text)
-    text = re.sub(r"\bAdd-Vantag\b", "ADD-Vantage", text)
-    text = re.sub(r"\bAdd-Vantage\b", "ADD-Vantage", text)
-    text = re.sub(r"\bAdditionne\b", u"Additionn\u00E9", text)
-    text = re.sub(r"\bAdn\b", "ADN", text)
-    text = re.sub(r"\bAdr\b", "ADR", text)
-    text = re.sub(r"\bAdv\b", "ADV", text)
-    text = re.sub(r"\bAer\b", "Aerosol", text)
-    text = re.sub(r"\bAes\b", "AES", text)
-    text = re.sub(r"\bAf\b", "AF", text)
-    text = re.sub(r"\bAgaricus Musc\b", "Agaricus Muscarius", text)
-    text = re.sub(r"\bAgy\b", "AGY", text)
-    text = re.sub(r"\bAha\b", "AHA", text)
-    text = re.sub(r"\bAhp\b", "AHP", text)
-    text = re.sub(r"\bAj\b", "AJ", text)
-    text = re.sub(r"\bAk\b", "AK", text)
-    text = re.sub(r"\bAlc\.Free\b", "Alcohol Free", text)
-    text = re.sub(r"\bAlene\b", u"Al\u00EAne", text)
-    text = re.sub(r"\bAllday\b", "All Day", text)
-    text = re.sub(r"\bAm\b", "AM", text)
-    text = re.sub(r"\bAmantidine\b", "Amantadine", text)
-    text = re.sub(r"\bAmb\b", "AMB", text)
-    text = re.sub(r"\bAmd\b", "AMD", text)
-    text = re.sub(r"\bAmf\b", "AMF", text)
-    text = re.sub(r"\bAmo\b", "AMO", text)
-    text = re.sub(r"\bAnilin \b", "Aniline", text)
-    text = re.sub(r"\bAnti-Dandruff Shamp\b", "Anti-Dandruff Shampoo", text)
-    text = re.sub(r"\bAnti\-Persp\b", "Anti-Perspirant", text)
-    text = re.sub(r"\bAntibact\b", "Antibacterial", text)
-    text = re.sub(r"\bAntih\b", "Antihistamine", text)
-    text = re.sub(r"\bAntimicrob\b", "Antimicrobial", text)
-    text = re.sub(r"\bAntip\b", "Antiperspirant", text)
-    text = re.sub(r"\bAntipers\.\b", "Antiperspirant", text)
-    text = re.sub(r"\bAntipers\b", "Antiperspirant", text)
-    text = re.sub(r"\bAntipersp\.\b", "Antiperspirant", text)
-    text = re.sub(r"\bAntipersp\b", "Antiperspirant", text)
-    text = re.sub(r"\bAntisept\.\b", "Antiseptic", text)
-    text = re.sub(r"\bAntisept\b", "Antiseptic", text)
-    text = re.sub(r"\bAnywear\b", "AnyWear", text)
-    text = re.sub(r"\bAo\b", "AO", text)
-    text = re.sub(r"\bAp\b", "AP", text)
-    text = re.sub(r"\bApap\b", "APAP", text)
-    text = re.sub(r"\bApf\b", "APF", text)
-    text = re.sub(r"\bApl\b", "APL", text)
-    text = re.sub(r"\bApres\b", u"Apr\u00E8s", text)
-    text = re.sub(r"\bAq\b", "AQ", text)
-    text = re.sub(r"\bAr\b", "AR", text)
-    text = re.sub(r"\bArd\b", "ARD", text)
-    text = re.sub(r"\bAreosol\b", "Aerosol", text)
-    text = re.sub(r"\bArome\b", u"Ar\u00F4me", text)
-    text = re.sub(r"\bAsa\b", "ASA", text)
-    text = re.sub(r"\bAsm\b", "ASM", text)
-    text = re.sub(r"\bAsp\b", "ASP", text)
-    text = re.sub(r"\bAst\b", "AST", text)
-    text = re.sub(r"\bAstr\.\b", "Astringent", text)
-    text = re.sub(r"\bAstr\b", "Astringent", text)
-    text = re.sub(r"\bAtten\b", "Attenuated", text)
-    text = re.sub(r"\bAtx\b", "ATX", text)
-    text = re.sub(r"\bAvc\b", "AVC", text)
-    text = re.sub(r"\bAvotriplex\b", "AvoTriplex", text)
-    text = re.sub(r"\bAvs\b", "AVS", text)
-    text = re.sub(r"\bAzt\b", "AZT", text)
-    
-    #B
-    text = re.sub(r"\bB-Carot\b", "Beta-Carotene", text)
-    text = re.sub(r"\bB\.P\.\b", "BP", text)
-    text = re.sub(r"\bBac\b", "BAC", text)
-    text = re.sub(r"\bBacitraycin\b", "Bacitracin", text)
-    text = re.sub(r"\bBanana Bt\.\s*", "Banana Boat ", text)
-    text = re.sub(r"\bBanana Bt\b", "Banana Boat", text)
-    text = re.sub(r"\bBatonnet\b", u"B\u00E2tonnet", text)
-    text = re.sub(r"\bBau\b", "BAU", text)
-    text = re.sub(r"\bBbcz\b", "BBCZ", text)
-    text = re.sub(r"\bBb\b", "BB", text)
-    text = re.sub(r"\bBbj\b", "BBJ", text)
-    text = re.sub(r"\bBblgum\b", "Bubblegum", text)
-    text = re.sub(r"\bBbq\b", "BBQ", text)
-    text = re.sub(r"\bBc\b", "BC", text)
-    text = re.sub(r"\bBc-I\b", "BCI", text)
-    text = re.sub(r"\bBcaa\b", "BCAA", text)
-    text = re.sub(r"\bBcg\b", "BCG", text)
-    text = re.sub(r"\bBci\b", "BCI", text)
-    text = re.sub(r"\bBd\b", "BD", text)
-    text = re.sub(r"\bBeaute\b", u"Beaut\u00E9", text)
-    text = re.sub(r"\bBebe\b", u"B\u00E9b\u00E9", text)
-    text = re.sub(r"\bBelladona\b", "Belladonna", text)
-    text = re.sub(r"\bBethleem\b", u"Bethl\u00E9em", text)
-    text = re.sub(r"\bBha\b", "BHA", text)
-    text = re.sub(r"\bBid\b", "BID", text)
-    text = re.sub(r"\bBioflavanoids\b", "Bioflavonoids", text)
-    text = re.sub(r"\bBiosan\b", "BioSan", text)
-    text = re.sub(r"\bBioson\b", "BioSON", text)
-    text = re.sub(r"\bBl\b", "BL", text)
-    text = re.sub(r"\bBle\b", u"Bl\u00E9", text)
-    text = re.sub(r"\bBmr\b", "BMR", text)
-    text = re.sub(r"\bBnp\b", "BNP", text)
-    text = re.sub(r"\bBnph\b", "BNPH", text)
-    text = re.sub(r"\bBnrp\b", "BNRP", text)
-    text = re.sub(r"\bBotanipure\b", "BotaniPure", text)
-    text = re.sub(r"\bBott\b", "Bottle", text)
-    text = re.sub(r"\bBp\b", "BP", text)
-    text = re.sub(r"\bBpc\b", "BPC", text)
-    text = re.sub(r"\bBpo\b", "BPO", text)
-    text = re.sub(r"\bBpur\b", "BPUR", text)
-    text = re.sub(r"\bBrf\b", "BRF", text)
-    text = re.sub(r"\bBruyere\b", u"Bruy\u00E8re", text)
-    text = re.sub(r"\bBss\b", "BSS", text)
-    text = re.sub(r"\bBt\b", "BT", text)
-    text = re.sub(r"\bBtc\b", "BTC", text)
-    text = re.sub(r"\bBuspar\b", "BuSpar", text)
-    text = re.sub(r"\bBvs\b", "BVS", text)
-    text = re.sub(r"\bByk\b", "BYK", text)
-    text = re.sub(r"\bBzk\b", "BZK", text)
-    
-    #C
-    text = re.sub(r"\bCa\sAsc\.", "Calcium Ascorbate", text)
-    text = re.sub(r"\bCaf\b", "Caffeine", text)
-    text = re.sub(r"\bCalsan\b", "CalSan", text)
-    text = re.sub(r"\bCan'T\b", "Can't", text)
-    text = re.sub(r"\bCap\b", "Capsule", text)
-    text = re.sub(r"\bCapd\b", "CAPD", text)
-    text = re.sub(r"\bCappucino\b", "Cappuccino", text)
-    text = re.sub(r"\bCareconcepts\b", "CareConcepts", text)
-    text = re.sub(r"\bCatetherization\b", "Catheterization", text)
-    text = re.sub(r"\bCathet\b", "Catheter", text)
-    text = re.sub(r"\bCavicide\b", "CaviCide", text)
-    text = re.sub(r"\bCaviwipes\b", "CaviWipes", text)
-    text = re.sub(r"\bCb\b", "CB", text)
-    text = re.sub(r"\bCblock\b", "CBlock", text)
-    text = re.sub(r"\bCc\b", "CC", text)
-    text = re.sub(r"\bCcc\b", "CCC", text)
-    text = re.sub(r"\bCd\b", "CD", text)
-    text = re.sub(r"\bCeenu\b", "CeeNu", text)
-    text = re.sub(r"\bCellcept\b", "CellCept", text)
-    text = re.sub(r"\bCellsparc\b", "CellSparc", text)
-    text = re.sub(r"\bCentauree\b", u"Centaur\u00E9e", text)
-    text = re.sub(r"\bCerave\b", "CeraVe", text)
-    text = re.sub(r"\bCf\b", "CF", text)
-    text = re.sub(r"\bChapfix\b", "CHAPFIX", text)
-    text = re.sub(r"\bChapstick\b", "ChapStick", text)
-    text = re.sub(r"\bCharco Caps\b", "CharcoCaps", text)
-    text = re.sub(r"\bChel\b", "Chelate", text)
-    text = re.sub(r"\bChewab\b", "Chewable", text)
-    text = re.sub(r"\bCeo\b", "CEO", text)
-    text = re.sub(r"\bCh\b", "CH", text)
-    text = re.sub(r"\bCh-P\b", "CH-P", text)
-    text = re.sub(r"\bChataignier\b", u"Ch\u00E2taignier", text)
-    text = re.sub(r"\bChene\b", u"Ch\u00EAne", text)
-    text = re.sub(r"\bChevrefeuille\b", u"Ch\u00E8vrefeuille", text)
-    text = re.sub(r"\bChg\b", "CHG", text)
-    text = re.sub(r"\bChicoree\b", u"Chicor\u00E9e", text)
-    text = re.sub(r"\bChlor\b", "Chloride", text)
-    text = re.sub(r"\bChlorhexidene\b", "Chlorhexidine", text)
-    text = re.sub(r"\bChlorhexiderm\b", "ChlorhexiDerm", text)
-    text = re.sub(r"\bChlortripolon\b", "Chlor-Tripolon", text)
-    text = re.sub(r"\bChocolated\b", "Chocolate", text)
-    text = re.sub(r"\bChromemate\b", "ChromeMate", text)
-    text = re.sub(r"\bChs\b", "CHS", text)
-    text = re.sub(r"\bChx\b", "CHX", text)
-    text = re.sub(r"\bCip\b", "CIP", text)
-    text = re.sub(r"\bCit\b", "Citrate", text)
-    text = re.sub(r"\bClaires\b", "Claire's", text)
-    text = re.sub(r"\bCleanwell\b", "CleanWell", text)
-    text = re.sub(r"\bClearlax\b", "ClearLax", text)
-    text = re.sub(r"\bClearlysheer\b", "ClearlySheer", text)
-    text = re.sub(r"\bClematite\b", u"Cl\u00E9matite", text)
-    text = re.sub(r"\bClenziderm\b", "CLENZIderm", text)
-    text = re.sub(r"\bClicksan\b", "ClickSan", text)
-    text = re.sub(r"\bClippercare\b", "Clipper-Care", text)
-    text = re.sub(r"\bClinishield\b", "CliniShield", text)
-    text = re.sub(r"\bClinoleic\b", "ClinOleic", text)
-    text = re.sub(r"\bClnr\.\b", "Cleaner", text)
-    text = re.sub(r"\bClnr\b", "Cleaner", text)
-    text = re.sub(r"\bCmi\b", "CMI", text)
-    text = re.sub(r"\bCmp\b", "CMP", text)
-    text = re.sub(r"\bCmpk\b", "CCMPK", text)
-    text = re.sub(r"\bCmplx\b", "Complex", text)
-    text = re.sub(r"\bCnd\b", "CND", text)
-    text = re.sub(r"\bCns\b", "CNS", text)
-    text = re.sub(r"\bCo-Enzyme\b", "Coenzyme", text)
-    text = re.sub(r"\bCoactifed\b", "CoActifed", text)
-    text = re.sub(r"\bCold&Flu\b", "Cold & Flu", text)
-    text = re.sub(r"\bColdspor\b", "ColdSpor", text)
-    text = re.sub(r"\bColore\b", u"Color\u00E9", text)
-    text = re.sub(r"\bColormoist\b", "ColorMoist", text)
-    text = re.sub(r"\bColorstay\b", "ColorStay", text)
-    text = re.sub(r"\bCompostium\b", "Compositum", text)
-    text = re.sub(r"\bCompublend\b", "CompuBlend", text)
-    text = re.sub(r"\bConcent\b", "Conentrated", text)
-    text = re.sub(r"\bConcentr\.\b", "Concentrate", text)
-    text = re.sub(r"\bConcentr\b", "Concentrate", text)
-    text = re.sub(r"\bCond\.Shampoo\b", "Conditioner Shampoo", text)
-    text = re.sub(r"\bContinous\b", "Continuous", text)
-    text = re.sub(r"\bCooldry\b", "CoolDry", text)
-    text = re.sub(r"\bCoolzone\b", "CoolZone", text)
-    text = re.sub(r"\bCopperclear\b", "CopperClear", text)
-    text = re.sub(r"\bCoppercure\b", "CopperCure", text)
-    text = re.sub(r"\bCoramatic\b", "Cormatic", text)
-    text = re.sub(r"\bCoughgels\b", "CoughGels", text)
-    text = re.sub(r"\bCover Girl\b", "CoverGirl", text)
-    text = re.sub(r"\bCovergirl\b", "CoverGirl", text)
-    text = re.sub(r"\bCoverup\b", "Cover Up", text)
-    text = re.sub(r"\bCowash\b", "Co-Wash", text)
-    text = re.sub(r"\bCpa\b", "CPA", text)
-    text = re.sub(r"\bCpc\b", "CPC", text)
-    text = re.sub(r"\bCpd\b", "CPD", text)
-    text = re.sub(r"\bCpda\b", "CPDA", text)
-    text = re.sub(r"\bCq\b", "CQ", text)
-    text = re.sub(r"\bCr\b", "CR", text)
-    text = re.sub(r"\bCrb\b", "CRB", text)
-    text = re.sub(r"\bCrc\b", "CRC", text)
-    text = re.sub(r"\bCrdplex\b", "CRD-Plex", text)
-    text = re.sub(r"\bCrm\b", "Cream", text)
-    text = re.sub(r"\bCrmy\b", "Creamy", text)
-    text = re.sub(r"\bCsd\b", "CSD", text)
-    text = re.sub(r"\bCsg\b", "CSG", text)
-    text = re.sub(r"\bCsp\b", "CSP", text)
-    text = re.sub(r"\bCstforce\b", "CSTForce", text)
-    text = re.sub(r"\bCtp\b", "CTP", text)
-    text = re.sub(r"\bCtr\b", "CTR", text)
-    text = re.sub(r"\bCv\b", "CV", text)
-    text = re.sub(r"\bCvp\b", "CVP", text)
-    text = re.sub(r"\bCw\b", "CW", text)
-    text = re.sub(r"\bCx\b", "CX", text)
-    text = re.sub(r"\bCxp\b", "CXP", text)
-    text = re.sub(r"\bCyberderm\b", "CyberDerm", text)
+    Returns:
+        None.
+        
+    Raises:
+        None.
+    """
     
-    #D
-    text = re.sub(r"\bD30\b", "30D", text)
-    text = re.sub(r"\bD\.Cide\b", "D-Cide", text)
-    text = re.sub(r"\bDa\b", "DA", text)
-    text = re.sub(r"\bDaa\b", "DAA", text)
-    text = re.sub(r"\bDaunoxome\b", "DaunoXome", text)
-    text = re.sub(r"\bDayquil\b", "DayQuil", text)
-    text = re.sub(r"\bDb\b", "DB", text)
-    text = re.sub(r"\bDbl\b", "DBL", text)
-    text = re.sub(r"\bDc\b", "DC", text)
-    text = re.sub(r"\bDcn\b", "DCN", text)
-    text = re.sub(r"\bDco\b", "DCO", text)
-    text = re.sub(r"\bDct\b", "DCT", text)
-    text = re.sub(r"\bDd\b", "DD", text)
-    text = re.sub(r"\bDdavp\b", "DDAVP", text)
-    text = re.sub(r"\bDdf\b", "DDF", text)
-    text = re.sub(r"\bDdm\b", "DDM", text)
-    text = re.sub(r"\bDdq\b", "DDQ", text)
-    text = re.sub(r"\bDecollete\b", u"D\u00E9collet\u00E9", text)
-    text = re.sub(r"\bDecong\.\b", "Decongestant", text)
-    text = re.sub(r"\bDecong\b", "Decongestant", text)
-    text = re.sub(r"\bDefenseur\b", u"D\u00E9fenseur", text)
-    text = re.sub(r"\bDentachlor\b", "DentaChlor", text)
-    text = re.sub(r"\bDeod\.\b", "Deodorant", text)
-    text = re.sub(r"\bDeod\b", "Deodorant", text)
-    text = re.sub(r"\bDeodor\b", "Deodorant", text)
-    text = re.sub(r"\bDeomist\b", "DeoMist", text)
-    text = re.sub(r"\bDermacontrol\b", "DermaControl", text)
-    text = re.sub(r"\bDermgel\b", "DermGel", text)
-    text = re.sub(r"\bDepocyt\b", "DepoCyt", text)
-    text = re.sub(r"\bDermasept\b", "DermaSept", text)
-    text = re.sub(r"\bDermaseptic\b", "DermaSeptic", text)
-    text = re.sub(r"\bDermashield\b", "DermaShield", text)
-    text = re.sub(r"\bDermaspf\b", "DermaSPF", text)
-    text = re.sub(r"\bDermaveen\b", "DermaVeen", text)
-    text = re.sub(r"\bDermazinc\b", "DermaZinc", text)
-    text = re.sub(r"\bDermotic\b", "DermOtic", text)
-    text = re.sub(r"\bDermsafe\b", "DermSafe", text)
-    text = re.sub(r"\bDesens\b", "Desensitization", text)
-    text = re.sub(r"\bDesodorisant\b", u"D\u00E9sodorisant", text)
-    text = re.sub(r"\bDesodorisante\b", u"D\u00E8sodorisante", text)
-    text = re.sub(r"\bDesalterant\b", u"D\u00E9salt\u00E9rant", text)
-    text = re.sub(r"\bDeterg\b", "Detergent", text)
-    text = re.sub(r"\bDetergen\b", "Detergent", text)
-    text = re.sub(r"\bDex\b", "Dextrose", text)
-    text = re.sub(r"\bDexiron\b", "DexIron", text)
-    text = re.sub(r"\bDf\b", "DF", text)
-    text = re.sub(r"\bDfc\b", "DFC", text)
-    text = re.sub(r"\bDh\b", "DH", text)
-    text = re.sub(r"\bDhe\b", "DHE", text)
-    text = re.sub(r"\bDhs\b", "DHS", text)
-    text = re.sub(r"\bDhy\b", "DHY", text)
-    text = re.sub(r"\bDiamicron Mr\b", "Diamicron MR", text)
-    text = re.sub(r"\bDigiclean\b", "DigiClean", text)
-    text = re.sub(r"\bDigifab\b", "DigiFab", text)
-    text = re.sub(r"\bDigisan\b", "DigiSan", text)
-    text = re.sub(r"\bDiorlift\b", "DiorLift", text)
-    text = re.sub(r"\bDiorlight\b", "DiorLight", text)
-    text = re.sub(r"\bDiphenhyd\b", "Diphenhydramine", text)
-    text = re.sub(r"\bDisc\.Fade\b", "Discoloration Fade", text)
-    text = re.sub(r"\bDisin\.\b", "Disinfectant", text)
-    text = re.sub(r"\bDisin\b", "Disinfectant", text)
-    text = re.sub(r"\bDisinf\.\b", "Disinfectant", text)
-    text = re.sub(r"\bDisinf\b", "Disinfectant", text)
-    text = re.sub(r"\bDisinfec\b", "Disinfectant", text)
-    text = re.sub(r"\bDiuretique\b", u"Diur\u00E9tique", text)
-    text = re.sub(r"\bDkny\b", "DKNY", text)
-    text = re.sub(r"\bDm\b", "DM", text)
-    text = re.sub(r"\bDml\b", "DML", text)
-    text = re.sub(r"\bDn\b", "DN", text)
-    text = re.sub(r"\bDnage\b", "DNAge", text)
-    text = re.sub(r"\bDng\b", "DNG", text)
-    text = re.sub(r"\bDos\b", "DOS", text)
-    text = re.sub(r"\bDp\b", "DP", text)
-    text = re.sub(r"\bDpc\b", "DPC", text)
-    text = re.sub(r"\bDpa\b", "DPA", text)
-    text = re.sub(r"\bDpe\b", "DPE", text)
-    text = re.sub(r"\bDpr\b", "DPR", text)
-    text = re.sub(r"\bDps\b", "DPS", text)
-    text = re.sub(r"\bDpt\b", "DPT", text)
-    text = re.sub(r"\bDr.Scholl\'s\b", "Dr. Scholl's", text)
-    text = re.sub(r"\bDrc\b", "DRC", text)
-    text = re.sub(r"\bDrx\b", "DRX", text)
-    text = re.sub(r"\bDs\b", "DS", text)
-    text = re.sub(r"\bDso\b", "DSO", text)
-    text = re.sub(r"\bDt\b", "DT", text)
-    text = re.sub(r"\bDtc\b", "DTC", text)
-    text = re.sub(r"\bDte\b", "DTE", text)
-    text = re.sub(r"\bDtic\b", "DTIC", text)
-    text = re.sub(r"\bDtpa\b", "DTPA", text)
-    text = re.sub(r"\bDtx\b", "DTX", text)
-    text = re.sub(r"\bDualquat\b", "Dual-Quat", text)
-    text = re.sub(r"\bDulcocomfort\b", "DulcoComfort", text)
-    text = re.sub(r"\bDuofilm\b", "DuoFilm", text)
-    text = re.sub(r"\bDuotrav\b", "DuoTrav", text)
-    text = re.sub(r"\bDupont\b", "DuPont", text)
-    text = re.sub(r"\bDuraprep\b", "DuraPrep", text)
-    text = re.sub(r"\bDurascreen\b", "DuraScreen", text)
-    text = re.sub(r"\bDurr\b", u"D\u00FCRR", text)
-    text = re.sub(r"\bDv\b", "DV", text)
-    text = re.sub(r"\bDvm\b", "DVM", text)
+    cacheSizes = dict(NORMALIZER_CACHE_SIZES)
+    cacheSizes.update(sizes or {})
+    module = globals()
     
-    #E
-    text = re.sub(r"\bEam\b", "EAM", text)
-    text = re.sub(r"\bEarthpals\b", "EarthPals", text)
-    text = re.sub(r"\bEasotic\b", "EasOtic", text)
-    text = re.sub(r"\bEasymelt\b", "EasyMelt", text)
-    text = re.sub(r"\bEc\b", "EC", text)
-    text = re.sub(r"\bEcc\b", "ECC", text)
-    text = re.sub(r"\bEchinacee\b", u"\u00C9chinac\u00E9e", text)
-    text = re.sub(r"\bEchoclean\b", "EchoClean", text)
-    text = re.sub(r"\bEclat\b", u"\u00C9clat", text)
-    text = re.sub(r"\bEcocare\b", "EcoCare", text)
-    text = re.sub(r"\bEcogent\b", "ECOgent", text)
-    text = re.sub(r"\bEcoulement\b", u"\u00C9coulement", text)
-    text = re.sub(r"\bEcp\b", "ECP", text)
-    text = re.sub(r"\bEcs\b", "ECS", text)
-    text = re.sub(r"\bEct\b", "ECT", text)
-    text = re.sub(r"\bEcz\b", "ECZ", text)
-    text = re.sub(r"\bEczemacare\b", "EczemaCare", text)
-    text = re.sub(r"\bEdd\b", "EDD", text)
-    text = re.sub(r"\bEddi\b", "EDDI", text)
-    text = re.sub(r"\bEe\b", "EE", text)
-    text = re.sub(r"\bEes\b", "EES", text)
-    text = re.sub(r"\bElectrolyt Pour Dialy\b", u"\u000C9lectrolytes pour Dialyse", text)
-    text = re.sub(r"\bElectroylte\b", "Electrolyte", text)
-    text = re.sub(r"\bElevee\b", u"\u00C9lev\u00E9e", text)
-    text = re.sub(r"\bElx\b", "Elixir", text)
-    text = re.sub(r"\bEltamd\b", "EltaMD", text)
-    text = re.sub(r"\bEml\b", "EML", text)
-    text = re.sub(r"\bEmolient\b", "Emollient", text)
-    text = re.sub(r"\bEmycin\b", "E-Mycin", text)
-    text = re.sub(r"\bEnchante\b", u"Enchant\u00E9", text)
-    text = re.sub(r"\bEnf.Spf\b", "Enfants SPF", text)
-    text = re.sub(r"\bEno\b", "ENO", text)
-    text = re.sub(r"\bEnterovu\b", "Entero VU", text)
-    text = re.sub(r"\bEntieres\b", u"Enti\u00E8res", text)
-    text = re.sub(r"\bEnvironize\b", "EnviroNize", text)
-    text = re.sub(r"\bEo\b", "EO", text)
-    text = re.sub(r"\bEpd\b", "Epidural", text)
-    text = re.sub(r"\bEpicare\b", "EpiCare", text)
-    text = re.sub(r"\bEpidri\b", "EpiDri", text)
-    text = re.sub(r"\bEpin\b", "Epinephrine", text)
-    text = re.sub(r"\bEpineph\b", "Epinephrine", text)
-    text = re.sub(r"\bEpipen\b", "EpiPen", text)
-    text = re.sub(r"\bEpisoft\b", "EpiSoft", text)
-    text = re.sub(r"\bEpithetial\b", "Epithelial", text)
-    text = re.sub(r"\bEq\b", "EQ", text)
-    text = re.sub(r"\bEquilibre\b", u"\u00C9quilibre", text)
-    text = re.sub(r"\bEr\b", "ER", text)
-    text = re.sub(r"\bEryped\b", "EryPed", text)
-    text = re.sub(r"\bErysol\b", "Ery-Sol", text)
-    text = re.sub(r"\bErythromycine\b", u"\u00C9rythromycine", text)
-    text = re.sub(r"\bEs\b", "ES", text)
-    text = re.sub(r"\bEss\b", "ESS", text)
-    text = re.sub(r"\bEstee Lauder\b", u"Est\u00E9e Lauder", text)
-    text = re.sub(r"\bEst'Ro\b", "Estro", text)
-    text = re.sub(r"\bEstrogel\b", "EstroGel", text)
-    text = re.sub(r"\bEstroplan\b", "EstroPLAN", text)
-    text = re.sub(r"\bEv\b", "EV", text)
-    text = re.sub(r"\bEvc\b", "EVC", text)
-    text = re.sub(r"\bEven\.Primrose\b", "Evening Primrose", text)
-    text = re.sub(r"\bEverday\b", "Everyday", text)
-    text = re.sub(r"\bEvt\b", "EVT", text)
-    text = re.sub(r"\bEw\b", "EW", text)
-    text = re.sub(r"\bEyewish\b", "Eyewash", text)
-    text = re.sub(r"\bExposees\b", u"Expos\u00E9es", text)
-    text = re.sub(r"\bExsept\b", "ExSept", text)
-    text = re.sub(r"\bExt\.Stren\.Night\b", "Extra Strength Night", text)
-    text = re.sub(r"\bExt Str\b", "Extra Strength", text)
-    text = re.sub(r"\bEz\b", "EZ", text)
+    # The new caches start from no hits or misses
+    worker_cache_counts.clear()
+    taken_cache_counts.clear()
+    row_transforms.clear()
     
-    #F
-    text = re.sub(r"\bFacilite\b", u"Facilit\u00E9", text)
-    text = re.sub(r"\bFastmelt\b", "FastMelt", text)
-    text = re.sub(r"\bFastab\b", "FasTab", text)
-    text = re.sub(r"\bFc\b", "FC", text)
-    text = re.sub(r"\bFcc\b", "FCC", text)
-    text = re.sub(r"\bFct\b", "FCT", text)
-    text = re.sub(r"\bFd\b", "FD", text)
-    text = re.sub(r"\bFemhrt\b", "FemHRT", text)
-    text = re.sub(r"\bFerinsol\b", "Fer-In-Sol", text)
-    text = re.sub(r"\bFermete\b", u"Fermet\u00E9", text)
-    text = re.sub(r"\bFerroforte\b", "FerroForte", text)
-    text = re.sub(r"\bFiebings\b", "Fiebing's", text)
-    text = re.sub(r"\bFirmalift\b", "FirmaLift", text)
-    text = re.sub(r"\bFitwipes\b", "FitWipes", text)
-    text = re.sub(r"\bFl\b", "FL", text)
-    text = re.sub(r"\bFlexacreme\b", u"Flexacr\u00E8me", text)
-    text = re.sub(r"\bFlexpen\b", "FlexPen", text)
-    text = re.sub(r"\bFlextouch\b", "FlexTouch", text)
-    text = re.sub(r"\bFlinstones\b", "Flintstones", text)
-    text = re.sub(r"\bFlulaval\b", "FluLaval", text)
-    text = re.sub(r"\bFlv\b", "Flavour", text)
-    text = re.sub(r"\bFm\b", "FM", text)
-    text = re.sub(r"\bFml\b", "FML", text)
-    text = re.sub(r"\bFletan\b", u"Fl\u00E9tan", text)
-    text = re.sub(r"\bFmla\b", "FMLA", text)
-    text = re.sub(r"\bFmx\b", "FMX", text)
-    text = re.sub(r"\bFng\b", "FNG", text)
-    text = re.sub(r"\bFor Inh\b", "for Inhalation", text)
-    text = re.sub(r"\bFormual\b", "Formula", text)
-    text = re.sub(r"\bFoundat\.\s", "Foundation ", text)
-    text = re.sub(r"\bFp\b", "FP", text)
-    text = re.sub(r"\bFps\b", "FPS", text)
-    text = re.sub(r"\bFraiche\b", u"Fra\u00EEche", text)
-    text = re.sub(r"\bFraicheur\b", u"Fra\u00EEcheur", text)
-    text = re.sub(r"\bFreamine\b", "FreAmine", text)
-    text = re.sub(r"\bFreee\b", "Free", text)
-    text = re.sub(r"\bFsgqt\b", "FSGQT", text)
-    text = re.sub(r"\bFshp\b", "FSHP", text)
-    text = re.sub(r"\bFsme\b", "FSME", text)
-    text = re.sub(r"\bFtp\b", "FTP", text)
-    text = re.sub(r"\bFutur E\b", "Futur-E", text)
-    text = re.sub(r"\bFuture E\b", "Futur-E", text)
-    text = re.sub(r"\bFv\b", "FV", text)
-    text = re.sub(r"\bFw\b", "FW", text)
-    text = re.sub(r"\bFxt\b", "FXT", text)
-    text = re.sub(r"\bFxaiu\b", "Factor Xa IU", text)
-    text = re.sub(r"\bFy\b", "FY", text)
+    for name, size in cacheSizes.items():
+        normalizer = module[name]
+        
+        if hasattr(normalizer, "cache_info"):
+            normalizer = normalizer.__wrapped__
+        
+        module[name] = functools.lru_cache(maxsize=size)(normalizer)
+
+def disable_normalizer_cache():
+    """Removes the LRU caches added by enable_normalizer_cache"""
+    module = globals()
+    row_transforms.clear()
     
-    #G
-    text = re.sub(r"\bGamastan\b", "GamaSTAN", text)
-    text = re.sub(r"\bGastrocalm\b", "GastroCalm", text)
-    text = re.sub(r"\bGastrogard\b", "GastroGard", text)
-    text = re.sub(r"\bGc\b", "GC", text)
-    text = re.sub(r"\bGd\b", "GD", text)
-    text = re.sub(r"\bGdu\b", "GDU", text)
-    text = re.sub(r"\bGenbact\b", "GenBact", text)
-    text = re.sub(r"\bGermwise\b", "GermWise", text)
-    text = re.sub(r"\bGermx\b", "Germ-X", text)
-    text = re.sub(r"\bGermxtra\b", "GermXtra", text)
-    text = re.sub(r"\bGilette\b", "Gillette", text)
-    text = re.sub(r"\bGingermint\b", "Ginger Mint", text)
-    text = re.sub(r"\bGiseng\b", "Ginseng", text)
-    text = re.sub(r"\bGl\b", "GL", text)
-    text = re.sub(r"\bGla\b", "GLA", text)
-    text = re.sub(r"\bGlsf\b", "GLSF", text)
-    text = re.sub(r"\bGlucagen\b", "GlucaGen", text)
-    text = re.sub(r"\bGluconorm\b", "GlucoNorm", text)
-    text = re.sub(r"\bGlymed\b", "GlyMed", text)
-    text = re.sub(r"\bGm\b", "GM", text)
-    text = re.sub(r"\bGms\b", "GMS", text)
-    text = re.sub(r"\bGnc\b", "GNC", text)
-    text = re.sub(r"\bGolytely\b", "GoLYTELY", text)
-    text = re.sub(r"\bGq\b", "GQ", text)
-    text = re.sub(r"\bGran\b", "Granule", text)
-    text = re.sub(r"\bGrf\b", "GRF", text)
-    text = re.sub(r"\bGsf\b", "GSF", text)
-    text = re.sub(r"\bGtf\b", "GTF", text)
-    text = re.sub(r"\bGvx\b", "GVX", text)
-    text = re.sub(r"\bGynecure\b", "GyneCure", text)
+    for name in NORMALIZER_CACHE_SIZES:
+        if hasattr(module[name], "cache_info"):
+            module[name] = module[name].__wrapped__
+
+def normalizer_cache_info():
+    """Returns the hits and misses of each normalizer cache
     
-    #H
-    text = re.sub(r"\bHalees\b", u"H\u00E2l\u00E9es", text)
-    text = re.sub(r"\bHandclens\b", "HandClens", text)
-    text = re.sub(r"\bHandfresh\b", "HandFresh", text)
-    text = re.sub(r"\bHbv\b", "HBV", text)
-    text = re.sub(r"\bHc\b", "HC", text)
-    text = re.sub(r"\bHcl\b", "HCl", text)
-    text = re.sub(r"\bHct\b", "HCT", text)
-    text = re.sub(r"\bHctz\b", "HCTZ", text)
-    text = re.sub(r"\bHd\b", "HD", text)
-    text = re.sub(r"\bHdr\b", "HDR", text)
-    text = re.sub(r"\bHdx\b", "HDX", text)
-    text = re.sub(r"\bHea\b", "HEA", text)
-    text = re.sub(r"\bHealthguard\b", "Health Guard", text)
-    text = re.sub(r"\bHeliantheme\b", u"H\u00E9lianth\u00E8me", text)
-    text = re.sub(r"\bHemacart\b", "HemaCart", text)
-    text = re.sub(r"\bHemaperoxy\b", "HemaPeroxy", text)
-    text = re.sub(r"\bHepagam\b", "HepaGam", text)
-    text = re.sub(r"\bHexam Ids\b", "HEXAM IDS", text)
-    text = re.sub(r"\bHfe\b", "HFE", text)
-    text = re.sub(r"\bHf\b", "HF", text)
-    text = re.sub(r"\bHfa\b", "HFA", text)
-    text = re.sub(r"\bHfs\b", "HFS", text)
-    text = re.sub(r"\bHh\b", "HH", text)
-    text = re.sub(r"\bHhr\b", "HHR", text)
-    text = re.sub(r"\bHibtiter\b", "HibTITER", text)
-    text = re.sub(r"\bHki\b", "HKI", text)
-    text = re.sub(r"\bHld\b", "HLD", text)
-    text = re.sub(r"\bHlip\b", "HLIP", text)
-    text = re.sub(r"\bHlu\b", "HLU", text)
-    text = re.sub(r"\bHm\b", "HM", text)
-    text = re.sub(r"\bHma\b", "HMA", text)
-    text = re.sub(r"\bHms\b", "HMS", text)
-    text = re.sub(r"\bHmts\b", "HMTS", text)
-    text = re.sub(r"\bHns\b", "HNS", text)
-    text = re.sub(r"\bHoa\b", "HOA", text)
-    text = re.sub(r"\bHp\b", "HP", text)
-    text = re.sub(r"\bHp1\b", "HP1", text)
-    text = re.sub(r"\bHp2\b", "HP2", text)
-    text = re.sub(r"\bHp3\b", "HP3", text)
-    text = re.sub(r"\bHp4\b", "HP4", text)
-    text = re.sub(r"\bHp5\b", "HP5", text)
-    text = re.sub(r"\bHp6\b", "HP6", text)
-    text = re.sub(r"\bHp7\b", "HP7", text)
-    text = re.sub(r"\bHp8\b", "HP8", text)
-    text = re.sub(r"\bHp9\b", "HP9", text)
-    text = re.sub(r"\bHpg\b", "HPG", text)
-    text = re.sub(r"\bHpb\b", "HPD", text)
-    text = re.sub(r"\bHpm\b", "HPM", text)
-    text = re.sub(r"\bHpnp\b", "HPNP", text)
-    text = re.sub(r"\bHptp\b", "HPTP", text)
-    text = re.sub(r"\bHpv\b", "HPV", text)
-    text = re.sub(r"\bHq\b", "HQ", text)
-    text = re.sub(r"\bHrf\b", "HRF", text)
-    text = re.sub(r"\bHs\b", "HS", text)
-    text = re.sub(r"\bHsa\b", "HSA", text)
-    text = re.sub(r"\bHsd\b", "HSD", text)
-    text = re.sub(r"\bHsn\b", "HSN", text)
-    text = re.sub(r"\bHthm\b", "HTHM", text)
-    text = re.sub(r"\bHthy\b", "HTHY", text)
-    text = re.sub(r"\bHtyp\b", "HTYP", text)
-    text = re.sub(r"\bHv\b", "HV", text)
-    text = re.sub(r"\bHvac\b", "HVAC", text)
-    text = re.sub(r"\bHvp\b", "HVP", text)
-    text = re.sub(r"\bHwd\b", "HWD", text)
-    text = re.sub(r"\bHx\b", "HX", text)
-    text = re.sub(r"\bHx2\b", "HX2", text)
-    text = re.sub(r"\bHy\b", "HY", text)
-    text = re.sub(r"\bHydraction\b", "HydrAction", text)
-    text = re.sub(r"\bHydrafresh\b", "HydraFresh", text)
-    text = re.sub(r"\bHydrat\.Matifiant\b", "Hydratant Matifiant", text)
-    text = re.sub(r"\bHydratee\b", u"Hydrat\u00E9e", text)
-    text = re.sub(r"\bHydrodiuril\b", "HydroDIURIL", text)
-    text = re.sub(r"\bHydromorph\.Ir\b", "Hydromorph IR", text)
-    text = re.sub(r"\bHygienique\b", u"Hygi\u00E9nique", text)
-    text = re.sub(r"\bHyosciamus\b", "Hyoscyamus", text)
-    text = re.sub(r"\bHyp\b", "HYP", text)
-    text = re.sub(r"\bHyperab\b", "HyperRAB", text)
-    text = re.sub(r"\bHyperrab\b", "HyperRAB", text)
-    text = re.sub(r"\bHyperhep\b", "HyperHEP", text)
-    text = re.sub(r"\bHyperrho\b", "HyperRHO", text)
-    text = re.sub(r"\bHypertet\b", "HyperTET", text)
-    text = re.sub(r"\bHypokit\b", "HypoKit", text)
-    text = re.sub(r"\bHypotears\b", "HypoTears", text)
+    Returns:
+        Dictionary of CacheCounts by normalizer name, of the caches 
+        of this process and of the worker processes added with 
+        add_cache_counts.
+        
+    Raises:
+        None.
+    """
     
-    #I
-    text = re.sub(r"\bIa\b", "IA", text)
-    text = re.sub(r"\bIar\b", "IAR", text)
-    text = re.sub(r"\bIc\b", "IC", text)
-    text = re.sub(r"\bIcaps\b", "ICAPS", text)
-    text = re.sub(r"\bIcb\b", "ICB", text)
-    text = re.sub(r"\bIcd\b", "ICD", text)
-    text = re.sub(r"\bIch\b", "ICH", text)
-    text = re.sub(r"\bIdc\b", "IDC", text)
-    text = re.sub(r"\bIdm\b", "IDM", text)
-    text = re.sub(r"\bIfb\b", "IFB", text)
-    text = re.sub(r"\bIgivnex\b", "IGIVnex", text)
-    text = re.sub(r"\bIi\b", "II", text)
-    text = re.sub(r"\bIii\b", "III", text)
-    text = re.sub(r"\bIm\b", "IM", text)
-    text = re.sub(r"\bImgrd\b", "IMGRD", text)
-    text = re.sub(r"\bImmucyst\b", "ImmuCyst", text)
-    text = re.sub(r"\bInc\.\b", "Inc.", text)
-    text = re.sub(r"\bInc\s", "Inc. ", text)
-    text = re.sub(r"\bInf\b", "INF", text)
-    text = re.sub(r"\bInh\.\b", "Inhalation", text)
-    text = re.sub(r"\bInh\b", "Inhalation", text)
-    text = re.sub(r"\bInomax\b", "INOmax", text)
-    text = re.sub(r"\bInj\.\b", "Injection", text)
-    text = re.sub(r"\bInj\b", "Injection", text)
-    text = re.sub(r"\bInjec.\b", "Injection", text)
-    text = re.sub(r"\bInjec\b", "Injection", text)
-    text = re.sub(r"\bInstacool\b", "InstaCool", text)
-    text = re.sub(r"\bInt\b", "INT", text)
-    text = re.sub(r"\bIntol\.Soc\.\s", u"Intol\u00E9rant Solaire ", text)
-    text = re.sub(r"\bIntol\.Solaire\.\s", u"Intol\u00E9rance Solaire ", text)
-    text = re.sub(r"\bIntoler\.Sol\.\s", u"Intol\u00E9rant Solaire ", text)
-    text = re.sub(r"\bIntolerantes\b", u"Intol\u00E9rantes ", text)
-    text = re.sub(r"\bIp\b", "IP", text)
-    text = re.sub(r"\bIpf\b", "IPF", text)
-    text = re.sub(r"\bIpg\b", "IPG", text)
-    text = re.sub(r"\bIprical\b", "IpriCal", text)
-    text = re.sub(r"\bIpu\b", "IPU", text)
-    text = re.sub(r"\bIpv\b", "IPV", text)
-    text = re.sub(r"\bIr\b", "IR", text)
-    text = re.sub(r"\bIrigation\b", "Irrigation", text)
-    text = re.sub(r"\bIsoflo\b", "IsoFlo", text)
-    text = re.sub(r"\bIsohex\b", "IsoHex", text)
-    text = re.sub(r"\bIsy\b", "ISY", text)
-    text = re.sub(r"\bIUWith\b", "IU with", text)
-    text = re.sub(r"\bIv\b", "IV", text)
-    text = re.sub(r"\bIvr\b", "IVR", text)
+    module = globals()
+    counts = {}
     
-    #J
-    text = re.sub(r"\bJaa\b", "JAA", text)
-    text = re.sub(r"\bJcb\b", "JCB", text)
-    text = re.sub(r"\bJfl\b", "JFL", text)
-    text = re.sub(r"\bJnt-Nix\b", "JNT-NIX", text)
-    text = re.sub(r"\bJohnson And John\.\b", "Johnson & Johnson ", text)
-    text = re.sub(r"\bJohnson And Johnson \b", "Johnson & Johnson ", text)
-    text = re.sub(r"\bJs\b", "JS", text)
+    for name in NORMALIZER_CACHE_SIZES:
+        if hasattr(module[name], "cache_info"):
+            info = module[name].cache_info()
+            hits, misses = worker_cache_counts.get(name, (0, 0))
+            counts[name] = CacheCounts(info.hits + hits, info.misses + misses)
     
-    #K
-    text = re.sub(r"\bKayquat\b", "KayQuat", text)
-    text = re.sub(r"\bKbi\b", "KBI", text)
-    text = re.sub(r"\bKcl\b", "KCl", text)
-    text = re.sub(r"\bKds\b", "KDS", text)
-    text = re.sub(r"\bKennelsol\b", "KennelSol", text)
-    text = re.sub(r"/Kg\b", "/kg", text)
-    text = re.sub(r"\bKidsport\b", "KidSport", text)
-    text = re.sub(r"\bKinesys\b", "KINeSYS", text)
-    text = re.sub(r"\bKiu\b", "KIU", text)
-    text = re.sub(r"\bKlb\b", "KLB", text)
-    text = re.sub(r"\bKmg\b", "KMG", text)
-    text = re.sub(r"\bKms\b", "KMS", text)
-    text = re.sub(r"\bKneerelief\b", "KneeRelief", text)
-    text = re.sub(r"\bKt\b", "KT", text)
-    text = re.sub(r"\bKwikpen\b", "KwikPen", text)
+    return counts
 
-    #L
-    text = re.sub(r"\bL'Oreal\b", u"L'Or\u00E9al", text)
-    text = re.sub(r"\bLabetolol\b", "Labetalol", text)
-    text = re.sub(r"\bLacticare\b", "LactiCare", text)
-    text = re.sub(r"\bLactozyme\b", "LactoZYME", text)
-    text = re.sub(r"\bLanacort\b", "LanaCort", text)
-    text = re.sub(r"\bLancome\b", u"Lanc\u00F4me", text)
-    text = re.sub(r"\bLassars\b", "Lassar's", text)
-    text = re.sub(r"\bLauripure\b", "LauriPure", text)
-    text = re.sub(r"\bLaxaclear\b", "LaxaClear", text)
-    text = re.sub(r"\bLaxamed\b", "LaxaMed", text)
-    text = re.sub(r"\bLc\b", "LC", text)
-    text = re.sub(r"\bLcp\b", "LCP", text)
-    text = re.sub(r"\bLd\b", "LD", text)
-    text = re.sub(r"\bLecithine\b", u"L\u00E9cithine", text)
-    text = re.sub(r"\bLegere\b", u"L\u00E9g\u00E8re", text)
-    text = re.sub(r"\bLevamisolephosphate\b", "Levamisole Phosphate", text)
-    text = re.sub(r"\bLevothryoxine\b", "Levothyroxine", text)
-    text = re.sub(r"\bLf\b", "LF", text)
-    text = re.sub(r"\bLg\b", "LG", text)
-    text = re.sub(r"\bLgb\b", "LGB", text)
-    text = re.sub(r"\bLgplex\b", "LGPlex", text)
-    text = re.sub(r"\bLh\b", "LH", text)
-    text = re.sub(r"\bLifepak\b", "LifePak", text)
-    text = re.sub(r"\bLiftactiv\b", "LiftActiv", text)
-    text = re.sub(r"\bLiftactivpro\b", "LiftActiv Pro", text)
-    text = re.sub(r"\bLincomed\b", "LincoMed", text)
-    text = re.sub(r"\bLipbalm\b", "Lip Balm", text)
-    text = re.sub(r"\bLipcare\b", "Lip Care", text)
-    text = re.sub(r"\bLipgloss\b", "Lip Gloss", text)
-    text = re.sub(r"\bLiplights\b", "Lip Lights", text)
-    text = re.sub(r"\bLiq\.\b", "Liquid", text)
-    text = re.sub(r"\bLiq\b", "Liquid", text)
-    text = re.sub(r"\bLiqud\b", "Liquid", text)
-    text = re.sub(r"\bLiquical\b", "LiquiCal", text)
-    text = re.sub(r"\bLiquicaps\b", "LiquiCaps", text)
-    text = re.sub(r"\bLisnopril\b", "Lisinopril", text)
-    text = re.sub(r"\bLkb\b", "LKB", text)
-    text = re.sub(r"\bLl\b", "LL", text)
-    text = re.sub(r"\bLmd\b", "LMD", text)
-    text = re.sub(r"\bLmp\b", "LMP", text)
-    text = re.sub(r"\bLoz\.\b", "Lozenge", text)
-    text = re.sub(r"\bLoz\b", "Lozenge", text)
-    text = re.sub(r"\bLpcc\b", "LPCC", text)
-    text = re.sub(r"\bLph\b", "LPH", text)
-    text = re.sub(r"\bLphag\b", "LpH ag", text)
-    text = re.sub(r"\bLphplex\b", "LPHPLEX", text)
-    text = re.sub(r"\bLq\b", "LQ", text)
-    text = re.sub(r"\bLsp\b", "LSP", text)
-    text = re.sub(r"\bLta\b", "LTA", text)
-    text = re.sub(r"\bLv\b", "LV", text)
-    text = re.sub(r"\bLymerix\b", "LYMErix", text)
-    text = re.sub(r"\bLytar\b", "LyTar", text)
-    text = re.sub(r"\bLyteprep\b", "LytePrep", text)
-    text = re.sub(r"\bLzr\b", "LZR", text)
+def take_cache_counts():
+    """Returns the cache hits and misses since the last call
     
-    #M
-    text = re.sub(r"\bMaa\b", "MAA", text)
-    text = re.sub(r"\bMabcampath\b", "MabCampath", text)
-    text = re.sub(r"\bMadacide\b", "MadaCide", text)
-    text = re.sub(r"\bMadacylinder\b", "MadaCylinder", text)
-    text = re.sub(r"\bMadecassol\b", u"Mad\u00E9cassol", text)
-    text = re.sub(r"\bMalacetic\b", "MalAcetic", text)
-    text = re.sub(r"\bMarronnier\b", "Marronier", text)
-    text = re.sub(r"\bMaxicide\b", "MaxiCide", text)
-    text = re.sub(r"\bMaxiwipe\b", "MaxiWipe", text)
-    text = re.sub(r"\bMcblooms\b", "McBlooms", text)
-    text = re.sub(r"\bMcd\b", "MCD", text)
-    text = re.sub(r"\bMcneil\b", "McNeil", text)
-    text = re.sub(r"\bMd\b", "MD", text)
-    text = re.sub(r"\bMdc\b", "MDC", text)
-    text = re.sub(r"\bMdga\b", "MDGA", text)
-    text = re.sub(r"\bMdp\b", "MDP", text)
-    text = re.sub(r"\bMe:Ex\b", "ME:EX", text)
-    text = re.sub(r"\bMedicamente\b", u"M\u00E9dicament\u00E9", text)
-    text = re.sub(r"\bMedicamenteux\b", u"M\u00E9dicamenteux", text)
-    text = re.sub(r"\bMedipro\b", "MediPro", text)
-    text = re.sub(r"\bMedpro\b", "MedPro", text)
-    text = re.sub(r"\bMegavites\b", "MegaVites", text)
-    text = re.sub(r"\bMelisse\b", u"M\u00E9lisse", text)
-    text = re.sub(r"\bMeleze\b", u"M\u00E9l\u00E8ze", text)
-    text = re.sub(r"\bMens\b", "Men's", text)
-    text = re.sub(r"\bMep\b", "MEP", text)
-    text = re.sub(r"\bMepivicaine\b", "Mepivacaine", text)
-    text = re.sub(r"\bMerril's\b", "Merrill's", text)
-    text = re.sub(r"\bMetricide\b", "MetriCide", text)
-    text = re.sub(r"\bMetriguard\b", "MetriGuard", text)
-    text = re.sub(r"\bMetriwipes\b", "MetriWipes", text)
-    text = re.sub(r"\bMetrocream\b", "MetroCream", text)
-    text = re.sub(r"\bMetrogel\b", "MetroGel", text)
-    text = re.sub(r"\bMetrolotion\b", "MetroLotion", text)
-    text = re.sub(r"\bMga\b", "MGA", text)
-    text = re.sub(r"\bMgk\b", "MGK", text)
-    text = re.sub(r"\bMhb\b", "MHB", text)
-    text = re.sub(r"\bMh\b", "MH", text)
-    text = re.sub(r"\bMicroclean\b", "MicroClean", text)
-    text = re.sub(r"\bMicroquat\b", "MicroQuat", text)
-    text = re.sub(r"\bMicrosept\b", "MicroSept", text)
-    text = re.sub(r"\bMiel Euc\b", "Miel et Eucalyptus", text)
-    text = re.sub(r"\bMiel-Eucal\b", "Miel-Eucalyptus", text)
-    text = re.sub(r"\bMinerale\b", u"Min\u00E9rale", text)
-    text = re.sub(r"\bMinestrin\b", "MinEstrin", text)
-    text = re.sub(r"\bMiu\b", " Million IU", text)
-    text = re.sub(r"\bMkmen\b", "MKMen", text)
-    text = re.sub(r"\bMlc\b", "MLC", text)
-    text = re.sub(r"\bMne\b", "MNE", text)
-    text = re.sub(r"\bMnps\b", "MNPS", text)
-    text = re.sub(r"\bModeree\b", u"Mod\u00E9r\u00E9e", text)
-    text = re.sub(r"\bMoru-Viraten\b", "MoRu-Viraten", text)
-    text = re.sub(r"\bMoisturiz\.Spray\b", "Moisturizing Spray", text)
-    text = re.sub(r"\bMoisturiz\.\s", "Moisturizing ", text)
-    text = re.sub(r"\bMoiturizer\b", "Moisturizer", text)
-    text = re.sub(r"\bMoisturshade\b", "MoisturShade", text)
-    text = re.sub(r"\bMolyb\b", "Molybdenum", text)
-    text = re.sub(r"\bMonox\b", "Monoxide", text)
-    text = re.sub(r"\bMotrimax\b", "MotriMax", text)
-    text = re.sub(r"\bMouthrinse\b", "Mouth Rinse", text)
-    text = re.sub(r"\bMoviprep\b", "MoviPrep", text)
-    text = re.sub(r"\bMp\b", "MP", text)
-    text = re.sub(r"\bMpa\b", "MPA", text)
-    text = re.sub(r"\bMpd\b", "MPD", text)
-    text = re.sub(r"\bMpf\b", "MPF", text)
-    text = re.sub(r"\bMq\b", "MQ", text)
-    text = re.sub(r"\bMrv\b", "MRV", text)
-    text = re.sub(r"\bMs\s\b", "MS ", text)
-    text = re.sub(r"\bMsc\b", "MSC", text)
-    text = re.sub(r"\bMtb\b", "MTB", text)
-    text = re.sub(r"\bMte\b", "MTE", text)
-    text = re.sub(r"\bMtx\b", "MTX", text)
-    text = re.sub(r"\bMul\b", "MUL", text)
-    text = re.sub(r"\bMulti Purpose\b", "Multi-Purpose", text)
-    text = re.sub(r"\bMulti.Vitamin\b", "Multivitamin", text)
-    text = re.sub(r"\bMultihance\b", "MultiHance", text)
-    text = re.sub(r"\bMultitech\b", "MultiTech", text)
-    text = re.sub(r"\bMultivim\b", "Multi-Vim", text)
-    text = re.sub(r"\bMultivit.Et\b", "Multivitamine et", text)
-    text = re.sub(r"\bMultivitaimin\b", "Multivitamin", text)
-    text = re.sub(r"\bMups\b", "MUPS", text)
-    text = re.sub(r"\bMv\b", "MV", text)
-    text = re.sub(r"\bMvc\b", "MVC", text)
-    text = re.sub(r"\bMvd\b", "MVD", text)
-    text = re.sub(r"\bMwh\b", "Mouth Wash", text)
-    text = re.sub(r"\bMycozyme\b", "MycoZyme", text)
+    Used by worker processes to return their cache counts with each 
+    chunk, to pass to add_cache_counts.
+    """
     
-    #N
-    text = re.sub(r"\bNabc\b", "NABC", text)
-    text = re.sub(r"\bNaci\b", "NaCl", text)
-    text = re.sub(r"\bNacl\b", "NaCl", text)
-    text = re.sub(r"\bNas-Spr\b", "Nasal Spray", text)
-    text = re.sub(r"\bNat.Source\b", "Natural Source", text)
-    text = re.sub(r"\bNaturalyte\b", "NaturaLyte", text)
-    text = re.sub(r"\bNatureluxe\b", "NatureLuxe", text)
-    text = re.sub(r"\bNaylors\b", "Naylor's", text)
-    text = re.sub(r"\bNc\b", "NC", text)
-    text = re.sub(r"\bNd\b", "ND", text)
-    text = re.sub(r"\bNdc\b", "NDC", text)
-    text = re.sub(r"\bNdd\b", "NDD", text)
-    text = re.sub(r"\bNeggram\b", "NegGram", text)
-    text = re.sub(r"\bNeisvac\b", "NeisVac", text)
-    text = re.sub(r"\bNeo\sCitran\b", "NeoCitran", text)
-    text = re.sub(r"\bNeocitran\b", "NeoCitran", text)
-    text = re.sub(r"\bNeomed\b", "NeoMed", text)
-    text = re.sub(r"\bNeooxytet\b", "NeoOxytet", text)
-    text = re.sub(r"\bNeostrata\b", "NeoStrata", text)
-    text = re.sub(r"\bNeosynalar\b", "Neo-Synalar", text)
-    text = re.sub(r"\bNephramine\b", "NephrAmine", text)
-    text = re.sub(r"\bNer\b", "NER", text)
-    text = re.sub(r"\bNervosite\b", u"Nervosit\u00E9", text)
-    text = re.sub(r"\bNeutralite\b", "NeutraLite", text)
-    text = re.sub(r"\bNeutraquat\b", "NeutraQuat", text)
-    text = re.sub(r"\bNexgard\b", "NexGard", text)
-    text = re.sub(r"\bNexha\b", "NexHA", text)
-    text = re.sub(r"\bNf\b", "NF", text)
-    text = re.sub(r"\bNl\b", "NL", text)
-    text = re.sub(r"\bNkat\b", "NKAT", text)
-    text = re.sub(r"\bNiachrom\b", "NiaCHROM", text)
-    text = re.sub(r"\bNiastase\b", "NiaStase", text)
-    text = re.sub(r"\bNidagel\b", "NidaGel", text)
-    text = re.sub(r"\bNondrowsy\b", "Non-Drowsy", text)
-    text = re.sub(r"\bNorlevo\b", "NorLevo", text)
-    text = re.sub(r"\bNourifusion\b", "NouriFusion", text)
-    text = re.sub(r"\bNovomix\b", "NovoMix", text)
-    text = re.sub(r"\bNovorapid\b", "NovoRapid", text)
-    text = re.sub(r"\bNph\b", "NPH", text)
-    text = re.sub(r"\bNr\b", "NR", text)
-    text = re.sub(r"\bNrg\b", "NRG", text)
-    text = re.sub(r"\bNro\b", "NRO", text)
-    text = re.sub(r"\bNt-Ox\b", "NT-OX", text)
-    text = re.sub(r"\bNtb\b", "NTB", text)
-    text = re.sub(r"\bNtd\b", "NTD", text)
-    text = re.sub(r"\bNto\b", "NTO", text)
-    text = re.sub(r"\bNuderm\b", "NuDerm", text)
-    text = re.sub(r"\bNugen\b", "NuGen", text)
-    text = re.sub(r"\bNusal\b", "NuSal", text)
-    text = re.sub(r"\bNuspin\b", "NuSpin", text)
-    text = re.sub(r"\bNutrasweet\b", "NutraSweet", text)
-    text = re.sub(r"\bNutrimen\b", "NutriMen", text)
-    text = re.sub(r"\bNutrimenc\b", "NutriMenC", text)
-    text = re.sub(r"\bNutrimin\sC\b", "NutriMinC", text)
-    text = re.sub(r"\bNutriminc\b", "NutriMenC", text)
-    text = re.sub(r"\bNutrisel\b", "NutriSel", text)
-    text = re.sub(r"\bNuvaring\b", "NuvaRing", text)
-    text = re.sub(r"\bNvw\b", "NVW", text)
-    text = re.sub(r"\bNw\b", "NW", text)
-    text = re.sub(r"\bNws\b", "NWS", text)
-    text = re.sub(r"\bNx\b", "NX", text)
-    text = re.sub(r"\bNxstage\b", "NxStage", text)
-    text = re.sub(r"\bNyquil\b", "NyQuil", text)
+    counts = {}
     
-    #O
-    text = re.sub(r"\bOc\b", "OC", text)
-    text = re.sub(r"\bOcl\b", "OCL", text)
-    text = re.sub(r"\bOctreoscan\b", "OctreoScan", text)
-    text = re.sub(r"\bOcuclear\b", "OcuClear", text)
-    text = re.sub(r"\bOdf\b", "ODF", text)
-    text = re.sub(r"\bOdoban\b", "OdoBan", text)
-    text = re.sub(r"\bOdt\b", "ODT", text)
-    text = re.sub(r"\bOj\b", "OJ", text)
-    text = re.sub(r"\bOilfree\b", "Oil-Free", text)
-    text = re.sub(r"\bOint\b", "Ointment", text)
-    text = re.sub(r"\bOkt\b", "OKT", text)
-    text = re.sub(r"\bOncotice\b", "OncoTICE", text)
-    text = re.sub(r"\bOnesource\b", "OneSource", text)
-    text = re.sub(r"\bOnt\.\b", "Ointment", text)
-    text = re.sub(r"\bOnt\b", "Ointment", text)
-    text = re.sub(r"\bOo-Cide\b", "OO-Cide", text)
-    text = re.sub(r"\bOpht\.\b", "Ophthalmic", text)
-    text = re.sub(r"\bOpht\b", "Ophthalmic", text)
-    text = re.sub(r"\bOphtalmic\b", "Ophthalmic", text)
-    text = re.sub(r"\bOpticlear\b", "OptiClear", text)
-    text = re.sub(r"\bOptiset\b", "OptiSet", text)
-    text = re.sub(r"\bOragel\b", "Orajel", text)
-    text = re.sub(r"\bOra-Septic\b", "Oraseptic", text)
-    text = re.sub(r"\bOrl\b", "Oral", text)
-    text = re.sub(r"\bOraverse\b", "OraVerse", text)
-    text = re.sub(r"\bOrchic Subst\b", "Orchic Substance", text)
-    text = re.sub(r"\bOrfenace\b", "OrfenAce", text)
-    text = re.sub(r"\bOros\b", "OROS", text)
-    text = re.sub(r"\bOsg\b", "OSG", text)
-    text = re.sub(r"\bOsteosense\b", "OsteoSense", text)
-    text = re.sub(r"\bOsteoshield\b", "OsteoShield", text)
-    text = re.sub(r"\bOsx\b", "OSX", text)
-    text = re.sub(r"\bOtc\b", "OTC", text)
-    text = re.sub(r"\bOvugel\b", "OvuGel", text)
-    text = re.sub(r"\bOxidiziing\b", "Oxidizing", text)
-    text = re.sub(r"\bOxl\b", "OXL", text)
-    text = re.sub(r"\bOxt\b", "OXT", text)
-    text = re.sub(r"\bOxycontin\b", "OxyContin", text)
-    text = re.sub(r"\bOxycantha\b", "Oxyacantha", text)
-    text = re.sub(r"\bOxyneo\b", "OxyNEO", text)
+    for name, info in normalizer_cache_info().items():
+        hits, misses = taken_cache_counts.get(name, (0, 0))
+        counts[name] = (info.hits - hits, info.misses - misses)
+        taken_cache_counts[name] = (info.hits, info.misses)
     
-    #P
-    text = re.sub(r"\bPaa\b", "PAA", text)
-    text = re.sub(r"\bPaba\b", "PABA", text)
-    text = re.sub(r"\bPainex\b", "PainEX", text)
-    text = re.sub(r"\bPancreatine\b", u"Pancr\u00E9atine", text)
-    text = re.sub(r"\bPanoxyl\b", "PanOxyl", text)
-    text = re.sub(r"\bParegorique\b", u"Par\u00E9gorique", text)
-    text = re.sub(r"\bParksidepro\b", "Parkside Pro", text)
-    text = re.sub(r"\bPb\b", "PB", text)
-    text = re.sub(r"\bPce\b", "PCE", text)
-    text = re.sub(r"\bPck\b", "Pack", text)
-    text = re.sub(r"\bPcl\b", "PCL", text)
-    text = re.sub(r"\bPcmx\b", "PCMX", text)
-    text = re.sub(r"\bPd\b", "PD", text)
-    text = re.sub(r"\bPdcare\b", "pdCARE", text)
-    text = re.sub(r"\bPe\b", "PE", text)
-    text = re.sub(r"\bPeche\b", u"P\u000EAche", text)
-    text = re.sub(r"\bPediatrivite\b", "Pediatri Vite", text)
-    text = re.sub(r"\bPedvaxhib\b", "PedvaxHIB", text)
-    text = re.sub(r"\bPefection\b", "Perfection", text)
-    text = re.sub(r"\bPenaqua\b", "PenAqua", text)
-    text = re.sub(r"\bPenicilline\b", u"P\u00E9nicilline", text)
-    text = re.sub(r"\bPenpro\b", "PenPro", text)
-    text = re.sub(r"\bPepins\b", u"P\u00E9pins", text)
-    text = re.sub(r"\bPerfecte\b", "Perfect", text)
-    text = re.sub(r"\bPerineale\b", u"P\u00E9rin\u00E9ale", text)
-    text = re.sub(r"\bPeriogard\b", "PerioGard", text)
-    text = re.sub(r"\bPeriolimel\b", "PeriOLIMEL", text)
-    text = re.sub(r"\bPerou\b", u"P\u00E9rou", text)
-    text = re.sub(r"\bPeroxcide\b", "PEROXcide", text)
-    text = re.sub(r"\bPetrole\b", u"P\u00E9trole", text)
-    text = re.sub(r"\bPf\b", "PF", text)
-    text = re.sub(r"\bPfan\b", "PFan", text)
-    text = re.sub(r"\bPfs\b", "PFS", text)
-    text = re.sub(r"\bPg\b", "PG", text)
-    text = re.sub(r"\bPh\b", "pH", text)
-    text = re.sub(r"\bPhaze\b", "pHaze", text)
-    text = re.sub(r"\bPhd\b", "PhD", text)
-    text = re.sub(r"\bPhenolique\b", u"Ph\u00E9nolique", text)
-    text = re.sub(r"\bPhisoderm\b", "PHisoDerm", text)
-    text = re.sub(r"\bPhosph\b", "Phosphate", text)
-    text = re.sub(r"\bPhotoderm\b", "PhotoDerm", text)
-    text = re.sub(r"\bPhs\b", "PHS", text)
-    text = re.sub(r"\bPhytocollagen\b", "Phyto-Collagen", text)
-    text = re.sub(r"\bPhytopure\b", "PhytoPure", text)
-    text = re.sub(r"\bPhytorub\b", "PhytoRUB", text)
-    text = re.sub(r"\bPk\b", "PK", text)
-    text = re.sub(r"\bPlas\+Sd\b", "PLAS+SD", text)
-    text = re.sub(r"\bPlasmalyte\b", "Plasma-Lyte", text)
-    text = re.sub(r"\bPls\b", "PLS", text)
-    text = re.sub(r"\bPlusnormal\b", "Plus Normal", text)
-    text = re.sub(r"\bPmf\b", "PMF", text)
-    text = re.sub(r"\bPmg\b", "PMG", text)
-    text = re.sub(r"\bPml\b", "PML", text)
-    text = re.sub(r"\bPms\b", "PMS", text)
-    text = re.sub(r"\bPMS-Fluox\b", "PMS-Fluoxetine", text)
-    text = re.sub(r"\bPmsg\b", "PMSG", text)
-    text = re.sub(r"\bPmt\b", "PMT", text)
-    text = re.sub(r"\bPnp\b", "PNP", text)
-    text = re.sub(r"\bPolylax\b", "PolyLax", text)
-    text = re.sub(r"\bPotas\b", "Potassium", text)
-    text = re.sub(r"\bPotass\b", "Potassium", text)
-    text = re.sub(r"\bPotensulf\b", "PotenSulf", text)
-    text = re.sub(r"\bPoudree\b", u"Pourd\u00E9e", text)
-    text = re.sub(r"\bPpd\b", "PPD", text)
-    text = re.sub(r"\bPpp\b", "PPP", text)
-    text = re.sub(r"\bPq\b", "PQ", text)
-    text = re.sub(r"\bPrednisocort\b", "Prednicort", text)
-    text = re.sub(r"\bPreempt\b", "PREempt", text)
-    text = re.sub(r"\bPregvit\b", "PregVit", text)
-    text = re.sub(r"\bPremelange\b", u"Pr\u00E9m\u00E9lang\u00E9", text)
-    text = re.sub(r"\bPremenstruelle\b", u"Pr\u00E9menstruelle", text)
-    text = re.sub(r"\bPreserv\b", "Preservative", text)
-    text = re.sub(r"\bPrevital\b", "PreVital", text)
-    text = re.sub(r"\bPrismasol\b", "PrismaSol", text)
-    text = re.sub(r"\bProclearz\b", "ProClearz", text)
-    text = re.sub(r"\bProeven\b", "ProEVEN", text)
-    text = re.sub(r"\bProgresif\b", "Progressif", text)
-    text = re.sub(r"\bProhance\b", "ProHance", text)
-    text = re.sub(r"\bProheart\b", "ProHeart", text)
-    text = re.sub(r"\bProhex\b", "ProHex", text)
-    text = re.sub(r"\bProlongee\b", u"Prolong\u00E9e", text)
-    text = re.sub(r"\bPromed\b", "ProMed", text)
-    text = re.sub(r"\bPropen\b", "ProPen", text)
-    text = re.sub(r"\bPropoflo\b", "PropoFlo", text)
-    text = re.sub(r"\bProquad\b", "ProQuad", text)
-    text = re.sub(r"\bProseb\b", "ProSeb", text)
-    text = re.sub(r"\bProsom\b", "ProSom", text)
-    text = re.sub(r"\bProspray\b", "ProSpray", text)
-    text = re.sub(r"\bProstascint\b", "ProstaScint", text)
-    text = re.sub(r"\bProzinc\b", "ProZinc", text)
-    text = re.sub(r"\bPrt\b", "PRT", text)
-    text = re.sub(r"\bPse\b", "PSE", text)
-    text = re.sub(r"\bPsoricare\b", "Psori-Care", text)
-    text = re.sub(r"\bPst\b", "PST", text)
-    text = re.sub(r"\bPteroyssinus\b", "Pteronyssinus", text)
-    text = re.sub(r"\bPtm\b", "PTM", text)
-    text = re.sub(r"\bPureflow\b", "PureFlow", text)
-    text = re.sub(r"\bPurel\b", "Purell", text)
-    text = re.sub(r"\bPurklenz\b", "PurKlenz", text)
-    text = re.sub(r"\bPurmist\b", "PurMist", text)
-    text = re.sub(r"\bPuremoist\b", "PureMoist", text)
-    text = re.sub(r"\bPv\b", "PV", text)
-    text = re.sub(r"\bPva\b", "PVA", text)
-    text = re.sub(r"\bPvf\b", "PVF", text)
-    text = re.sub(r"\bPvl\b", "PVL", text)
-    text = re.sub(r"\bPvp\b", "PVP", text)
-    text = re.sub(r"\bPwd\b", "Powder", text)
-    text = re.sub(r"\bPwr\.\b", "Powder", text)
-    text = re.sub(r"\bPwr\b", "Powder", text)
-    text = re.sub(r"\bPws\.\b", "PWS", text)
-    text = re.sub(r"\bPws\b", "PWS", text)
-    text = re.sub(r"\bPyp\b", "PYP", text)
+    return counts
+
+def add_cache_counts(counts):
+    """Adds the cache counts from take_cache_counts in a worker"""
+    for name, (hits, misses) in counts.items():
+        totalHits, totalMisses = worker_cache_counts.get(name, (0, 0))
+        worker_cache_counts[name] = (totalHits + hits, totalMisses + misses)
+
+def normalizer_digest(name):
+    """Returns a digest that changes whenever a normalizer changes
     
-    #Q
-    text = re.sub(r"\bQ-10\b", "Q10", text)
-    text = re.sub(r"\bQb\b", "QB", text)
-    text = re.sub(r"\bQd\b", "QD", text)
-    text = re.sub(r"\bQfs\b", "QFS", text)
-    text = re.sub(r"\bQuartermate\b", "QuarterMate", text)
-    text = re.sub(r"\bQx\b", "QX", text)
+    Args:
+        name: the normalizer name, e.g. "parseBrand"
     
-    #R
-    text = re.sub(r"\bRabavert\b", "RabAvert", text)
-    text = re.sub(r"\bRbc\b", "RBC", text)
-    text = re.sub(r"\bRbv\b", "RBV", text)
-    text = re.sub(r"\bRbx\b", "RBX", text)
-    text = re.sub(r"\bRc\b", "RC", text)
-    text = re.sub(r"\bRdf\b", "RDF", text)
-    text = re.sub(r"\bRdn\b", "RDN", text)
-    text = re.sub(r"\bRdt\b", "RDT", text)
-    text = re.sub(r"\bReactives\b", u"R\u00E9actives", text)
-    text = re.sub(r"\bReadybath\b", "ReadyBath", text)
-    text = re.sub(r"\bReadycleanse\b", "ReadyCleanse", text)
-    text = re.sub(r"\bRefacto\b", "ReFacto", text)
-    text = re.sub(r"\bReg\b", "Regular", text)
-    text = re.sub(r"\bRenamin\b", "RenAmin", text)
-    text = re.sub(r"\bRenergie\b", u"R\u00E9nergie", text)
-    text = re.sub(r"\bReopro\b", "ReoPro", text)
-    text = re.sub(r"\bReparateur\b", u"R\u00E9parateur", text)
-    text = re.sub(r"\bResichlor\b", "ResiChlor", text)
-    text = re.sub(r"\bResparate\b", "RESPeRATE", text)
-    text = re.sub(r"\bRespigam\b", "RespiGam", text)
-    text = re.sub(r"\bRestoralax\b", "RestoraLAX", text)
-    text = re.sub(r"\bRetructurante\b", "Restructurante", text)
-    text = re.sub(r"\bRevitalens\b", "RevitaLens", text)
-    text = re.sub(r"\bRelyon\b", "RelyOn", text)
-    text = re.sub(r"\bRf\b", "RF", text)
-    text = re.sub(r"\bRhm\b", "RHM", text)
-    text = re.sub(r"\bRhodendron\b", "Rhododendron", text)
-    text = re.sub(r"\bRiastap\b", "RiaSTAP", text)
-    text = re.sub(r"\bRhs\b", "RHS", text)
-    text = re.sub(r"\bRincage\b", u"Rin\u00E7age", text)
-    text = re.sub(r"\bRlf\b", "Relief", text)
-    text = re.sub(r"\bRo41\b", "RO41", text)
-    text = re.sub(r"\bRo95\b", "RO95", text)
-    text = re.sub(r"\bRoezit\b", "RoEzIt", text)
-    text = re.sub(r"\bRogundifolia\b", "Rotundifolia", text)
-    text = re.sub(r"\bRpd\b", "RPD", text)
-    text = re.sub(r"\bRt-Pa\b", "rt-PA", text)
-    text = re.sub(r"\bRtu\b", "RTU", text)
-    text = re.sub(r"\bRv\b", "RV", text)
-    text = re.sub(r"\bRz2\b", "RZ2", text)
+    Returns:
+        Hex digest of the normalizer function's source and, for 
+        normalizers with rule tables, the digest of the rule set. 
+        Changes elsewhere in this module leave the digest as it is.
+        
+    Raises:
+        None.
+    """
     
-    #S
-    text = re.sub(r"-S\.Cer\b", " - Saveur Cerise", text)
-    text = re.sub(r"-S\.Cerise\b", " - Saveur Cerise", text)
-    text = re.sub(r"\bSab\b", "SAB", text)
-    text = re.sub(r"\bSak\b", "SAK", text)
-    text = re.sub(r"\bSagm\b", "SAGM", text)
-    text = re.sub(r"\bSalycilic\b", "Salicylic", text)
-    text = re.sub(r"\bSanibet\b", "SaniBet", text)
-    text = re.sub(r"\bSanidate\b", "SaniDate", text)
-    text = re.sub(r"\bSanifilm\b", "SaniFilm", text)
-    text = re.sub(r"\bSaniscrubz\b", "Sani-Scrubz", text)
-    text = re.sub(r"\bSanitiser\b", "Sanitizer", text)
-    text = re.sub(r"\bSaniwipes\b", "Sani-Wipes", text)
-    text = re.sub(r"\bSar\b", "SAR", text)
-    text = re.sub(r"\bSas\b", "SAS", text)
-    text = re.sub(r"\bSb\b", "SB", text)
-    text = re.sub(r"\bSbs\b", "SBS", text)
-    text = re.sub(r"\bSc\b", "SC", text)
-    text = re.sub(r"\bScen\b", "Scent", text)
-    text = re.sub(r"\bSch\b", "SCH", text)
-    text = re.sub(r"\bScrubcare\b", "Scrub Care", text)
-    text = re.sub(r"\bScs\b", "SCS", text)
-    text = re.sub(r"\bSct\b", "SCT", text)
-    text = re.sub(r"\bSd\b", "SD", text)
-    text = re.sub(r"\bSdf\b", "SDF", text)
-    text = re.sub(r"\bSdz\b", "SDZ", text)
-    text = re.sub(r"\bSebalyt\b", "SebaLyt", text)
-    text = re.sub(r"\bSecurewhite\b", "SecureWhite", text)
-    text = re.sub(r"\bSedatif\b", u"S\u00E9datif", text)
-    text = re.sub(r"\bSelectbag\b", "SelectBag", text)
-    text = re.sub(r"\bSens\.Skin\b", "Sensitive Skin", text)
-    text = re.sub(r"\bSeranad\b", "Seranade", text)
-    text = re.sub(r"\bSensitiv\b", "Sensitive", text)
-    text = re.sub(r"\bSeptefx\b", "SEPTeFX", text)
-    text = re.sub(r"\bServicemaster\b", "ServiceMaster", text)
-    text = re.sub(r"\bSeve\b", u"S\u00E8ve", text)
-    text = re.sub(r"\bSevoflo\b", "SevoFlo", text)
-    text = re.sub(r"\bSf\b", "SF", text)
-    text = re.sub(r"\bSfhf\b", "SFHF", text)
-    text = re.sub(r"\bShamp\b", "Shampoo", text)
-    text = re.sub(r"\bSheersatin\b", "Sheer Satin", text)
-    text = re.sub(r"\bSherbert\b", "Sherbet", text)
-    text = re.sub(r"\bShisedo\b", "Shiseido", text)
-    text = re.sub(r"\bShiseiso\b", "Shiseido", text)
-    text = re.sub(r"\bShp\b", "Shampoo", text)
-    text = re.sub(r"\bSimplexx\b", "SimpleXx", text)
-    text = re.sub(r"\bSiltrax\b", "SilTrax", text)
-    text = re.sub(r"\bSinufrin\b", "SinuFrin", text)
-    text = re.sub(r"\bSkinborn\b", "SkinBorn", text)
-    text = re.sub(r"\bSkinceuticals\b", "SkinCeuticals", text)
-    text = re.sub(r"\bSkinsimple\b", "SkinSimple", text)
-    text = re.sub(r"\bSkintint\b", "Skin Tint", text)
-    text = re.sub(r"\bSkintypes\b", "Skin Types", text)
-    text = re.sub(r"\bSkinwipe\b", "Skin Wipe", text)
-    text = re.sub(r"\bSlb\b", "SLB", text)
-    text = re.sub(r"\bSleepaid\b", "Sleep-Aid", text)
-    text = re.sub(r"\bSlm\b", "SLM", text)
-    text = re.sub(r"\bSlt\b", "SLT", text)
-    text = re.sub(r"\bSltn\b", "Solution", text)
-    text = re.sub(r"\bSmartshield\b", "SmartShield", text)
-    text = re.sub(r"\bSmofkabiven\b", "SmofKabiven", text)
-    text = re.sub(r"\bSmoflipid\b", "SMOFlipid", text)
-    text = re.sub(r"\bSmts\b", "SMTS", text)
-    text = re.sub(r"\bSnh\b", "SNH", text)
-    text = re.sub(r"\bSnblk\b", "Sunblock", text)
-    text = re.sub(r"\bSns\b", "SNS", text)
-    text = re.sub(r"\bSod\sChlor\b", "Sodium Chloride", text)
-    text = re.sub(r"\bSoftcide\b", "SoftCIDE", text)
-    text = re.sub(r"\bSol Inhalation\b", "Solution for Inhalation", text)
-    text = re.sub(r"\bSolns\b", "Solutions", text)
-    text = re.sub(r"\bSolumedrol\b", "Solu-Medrol", text)
-    text = re.sub(r"\bSolunet\b", "SoluNet", text)
-    text = re.sub(r"\bSomavit\b", "SomaVit", text)
-    text = re.sub(r"\bSonovue\b", "SonoVue", text)
-    text = re.sub(r"\bSos\b", "SOS", text)
-    text = re.sub(r"\bSp\b", "SP", text)
-    text = re.sub(r"\bSpd\b", "SPD", text)
-    text = re.sub(r"\bSpecial Enf\b", "Special Enfant", text)
-    text = re.sub(r"\bSpeciale\b", u"Sp\u00E9ciale", text)
-    text = re.sub(r"\bSpf\b", "SPF", text)
-    text = re.sub(r"\bSpf1", "SPF 1", text)
-    text = re.sub(r"\bSpf2", "SPF 2", text)
-    text = re.sub(r"\bSpf3", "SPF 3", text)
-    text = re.sub(r"\bSpf4", "SPF 4", text)
-    text = re.sub(r"\bSpf5", "SPF 5", text)
-    text = re.sub(r"\bSpf6", "SPF 6", text)
-    text = re.sub(r"\bSpg\b", "Sponge", text)
-    text = re.sub(r"\bSportgel\b", "SportGel", text)
-    text = re.sub(r"\bSpr\b", "Spray", text)
-    text = re.sub(r"\bSpraygel\b", "SprayGel", text)
-    text = re.sub(r"\bSprt\sSunsc\b", "Sport Sunscreen", text)
-    text = re.sub(r"\bSps\b", "SPS", text)
-    text = re.sub(r"\bSq\b", "SQ", text)
-    text = re.sub(r"\bSqcm\b", "Sq. cm", text)
-    text = re.sub(r"\bSr\b", "SR", text)
-    text = re.sub(r"\bSrc\b", "SRC", text)
-    text = re.sub(r"\bSrs\b", "SRS", text)
-    text = re.sub(r"\bSrt\b", "SRT", text)
-    text = re.sub(r"\bSsd\b", "SSD", text)
-    text = re.sub(r"\bSsmo\b", "SSMO", text)
-    text = re.sub(r"\bSt.John\'s\b", "St. John's", text)
-    text = re.sub(r"\bStayclear\b", "StayClear", text)
-    text = re.sub(r"\bStbc\b", "STBC", text)
-    text = re.sub(r"\bStc\b", "STC", text)
-    text = re.sub(r"\bStcc\b", "STCC", text)
-    text = re.sub(r"\bSteritears\b", "SteriTears", text)
-    text = re.sub(r"\bStf\b", "STF", text)
-    text = re.sub(r"\bStgth\b", "Strength", text)
-    text = re.sub(r"\bStievaa\b", "Stieva-A", text)
-    text = re.sub(r"\bStk\.\b", "Stick", text)
-    text = re.sub(r"\bStk\b", "Stick", text)
-    text = re.sub(r"\bStp\b", "Strip", text)
-    text = re.sub(r"\bStressease\b", "StressEase", text)
-    text = re.sub(r"\bStressmates\b", "StressMates", text)
-    text = re.sub(r"\bStrivectin\b", "StriVectin", text)
-    text = re.sub(r"\bSucc\b", "Succinate", text)
-    text = re.sub(r"\bSucromate\b", "SucroMate", text)
-    text = re.sub(r"\bSug\sFr\b", "Sugar Free", text)
-    text = re.sub(r"\bSugarfree\b", "Sugar Free", text)
-    text = re.sub(r"\bSuger\b", "Sugar", text)
-    text = re.sub(r"\bSunb\b", "Sunblock", text)
-    text = re.sub(r"\bSunbl\.\b", "Sunblock", text)
-    text = re.sub(r"\bSunbl\b", "Sunblock", text)
-    text = re.sub(r"\bSunblk\b", "Sunblock", text)
-    text = re.sub(r"\bSunbalance\b", "SunBalance", text)
-    text = re.sub(r"\bSunguard\b", "SunGuard", text)
-    text = re.sub(r"\bSunprotect\b", "Sun PROTECT", text)
-    text = re.sub(r"\bSunsc\b", "Sunscreen", text)
-    text = re.sub(r"\bSunx\b", "SunX", text)
-    text = re.sub(r"\bSunzone\b", "SunZone", text)
-    text = re.sub(r"\bSuperlustrous\b", "Super Lustrous", text)
-    text = re.sub(r"\bSuperieur\b", u"Sup\u00E9rieur", text)
-    text = re.sub(r"\bSuperwash\b", "SuperWash", text)
-    text = re.sub(r"\bSuplement\b", "Supplement", text)
-    text = re.sub(r"\bSupp\.\b", "Suppository", text)
-    text = re.sub(r"\bSupp\b", "Suppository", text)
-    text = re.sub(r"\bSupplemen\b", "Supplement", text)
-    text = re.sub(r"\bSuppo H\b", "Suppo-H", text)
-    text = re.sub(r"\bSut\b", "SUT", text)
-    text = re.sub(r"\bSw\b", "SW", text)
-    text = re.sub(r"\bSwisstec\b", "SwissTEC", text)
-    text = re.sub(r"\bSx\b", "SX", text)
-    text = re.sub(r"\bSyr\.\b", "Syr", text)
-    text = re.sub(r"\bSyrvet\b", "SyrVet", text)
-    text = re.sub(r"\bSysteme\b", u"Syst\u00E8me", text)
+    import hashlib
+    import inspect
     
-    #T
-    text = re.sub(r"\bTab\b", "Tablet", text)
-    text = re.sub(r"\bTachosil\b", "TachoSil", text)
-    text = re.sub(r"\bTactupump\b", "TactuPump", text)
-    text = re.sub(r"\bTamoxifene\b", u"Tamoxif\u0038ne", text)
-    text = re.sub(r"\bTan.Lot\b", "Tanning Lotion", text)
-    text = re.sub(r"\bTaptop\b", "TapTop", text)
-    text = re.sub(r"\bTastefree\b", "Taste Free", text)
-    text = re.sub(r"\bTb\b", "TB", text)
-    text = re.sub(r"\bTbe\b", "TBE", text)
-    text = re.sub(r"\bTbs\b", "Tablets", text)
-    text = re.sub(r"\bTbx\b", "TBX", text)
-    text = re.sub(r"\bTct\b", "TCT", text)
-    text = re.sub(r"\bTe\b", "TE", text)
-    text = re.sub(r"\bTeccare\b", "TECcare", text)
-    text = re.sub(r"\bTechnekow\b", "TechneKow", text)
-    text = re.sub(r"\bTechnescan\b", "TechneScan", text)
-    text = re.sub(r"\bTerrasport\b", "TerraSport", text)
-    text = re.sub(r"\bTetralean\b", "TetraLean", text)
-    text = re.sub(r"\bTfs\b", "TFS", text)
-    text = re.sub(r"\bTgi\b", "TGI", text)
-    text = re.sub(r"\bThc\b", "THC", text)
-    text = re.sub(r"\bTherapatch\b", "TheraPatch", text)
-    text = re.sub(r"\bTheratears\b", "TheraTears", text)
-    text = re.sub(r"\bThyroblock\b", "Thyro-Block", text)
-    text = re.sub(r"\bTilcomed\b", "TilcoMed", text)
-    text = re.sub(r"\bTimed Rele\b", "Time Release", text)
-    text = re.sub(r"\bTk\b", "TK", text)
-    text = re.sub(r"\bTlc\b", "TLC", text)
-    text = re.sub(r"\bTlm\b", "TLM", text)
-    text = re.sub(r"\bTlns\b", "TLNS", text)
-    text = re.sub(r"\bTm\b", "TM", text)
-    text = re.sub(r"\bTma\b", "TMA", text)
-    text = re.sub(r"\bTms\b", "TMS", text)
-    text = re.sub(r"\bTmps\b", "TMPS", text)
-    text = re.sub(r"\bTnkase\b", "TNKase", text)
-    text = re.sub(r"\bTnt\b", "TNT", text)
-    text = re.sub(r"\bTobradex\b", "TobraDex", text)
-    text = re.sub(r"\bTocophr\b", "Tocopherol", text)
-    text = re.sub(r"\bToiletwand\b", "ToiletWand", text)
-    text = re.sub(r"\bTomo Cat\b", "Tomocat", text)
-    text = re.sub(r"\bToothpast\b", "Toothpaste", text)
-    text = re.sub(r"\bToothtpaste\b", "Toothpaste", text)
-    text = re.sub(r"\bTop\b", "Topical", text)
-    text = re.sub(r"\bTowlettes\b", "Towelettes", text)
-    text = re.sub(r"\bTpc\b", "TPC", text)
-    text = re.sub(r"\bTpgs\b", "TPGS", text)
-    text = re.sub(r"\bTpt\b", "Toothpaste", text)
-    text = re.sub(r"\bTpn\b", "TPN", text)
-    text = re.sub(r"\bTpr\b", "TPR", text)
-    text = re.sub(r"\bTrb\b", "TRB", text)
-    text = re.sub(r"\bTr\b", "TR", text)
-    text = re.sub(r"\bTrd\b", "TRD", text)
-    text = re.sub(r"\bTrh\b", "TRH", text)
-    text = re.sub(r"\bTreksafe\b", "TrekSafe", text)
-    text = re.sub(r"\bTrimax\b", "TriMax", text)
-    text = re.sub(r"\bTrl\b", "TRL", text)
-    text = re.sub(r"\bTrs\b", "TRS", text)
-    text = re.sub(r"\bTruechem\b", "TrueChem", text)
-    text = re.sub(r"\bTruscient\b", "TruScient", text)
-    text = re.sub(r"\bTres\b", u"Tr\u00E8s", text)
-    text = re.sub(r"\bTrublend\b", "TruBlend", text)
-    text = re.sub(r"\bTs\b", "TS", text)
-    text = re.sub(r"\bTz\b", "TZ", text)
+    digest = hashlib.sha1()
     
-    #U
-    text = re.sub(r"\bUddergold\b", "UDDERgold", text)
+    # Any cache or store in front of the normalizer is skipped
+    normalizer = inspect.unwrap(globals()[name])
+    digest.update(inspect.getsource(normalizer).encode("utf-8"))
     
-    text = re.sub(r"\bUdv\b", "UDV", text)
-    text = re.sub(r"\bUf\b", "UF", text)
-    text = re.sub(r"\bUha\b", "UHA", text)
-    text = re.sub(r"\bUl\b", "UL", text)
-    text = re.sub(r"\bUltr\b", "Ultra", text)
-    text = re.sub(r"\bUltraclear\b", "UltraClear", text)
-    text = re.sub(r"\bUltradex\b", "UltraDEX", text)
-    text = re.sub(r"\bUltramop\b", "UltraMOP", text)
-    text = re.sub(r"\bUltrasan\b", "UltraSan", text)
-    text = re.sub(r"\bUltratag\b", "UltraTag", text)
-    text = re.sub(r"\bUngt\.\b", "Ointment", text)
-    text = re.sub(r"\bUngt\b", "Ointment", text)
-    text = re.sub(r"\bUsp\b", "USP", text)
-    text = re.sub(r"\bUv\b", "UV", text)
-    text = re.sub(r"\bUva\b", "UVA", text)
-    text = re.sub(r"\bUvb\b", "UVB", text)
-    text = re.sub(r"\bUvguard\b", "UV Guard", text)
-    text = re.sub(r"\bUvscreen\b", "UVscreen", text)
+    if name in RULESETS:
+        digest.update(RULESETS[name].digest.encode("ascii"))
     
-    #V
-    text = re.sub(r"\bVag\b", "Vaginal", text)
-    text = re.sub(r"\bVarizig\b", "VariZIG", text)
-    text = re.sub(r"\bVernalgrass\b", "Vernal Grass", text)
-    text = re.sub(r"\bVepesid\b", "VePesid", text)
-    text = re.sub(r"\bVh\b", "VH", text)
-    text = re.sub(r"\bVh\b", "VH", text)
-    text = re.sub(r"\bVineger\b", "Vinegar", text)
-    text = re.sub(r"\bVionex\b", "VioNex", text)
-    text = re.sub(r"\bVionexus\b", "VioNexus", text)
-    text = re.sub(r"\bVirga Auria\b", "Virga Aurea", text)
-    text = re.sub(r"\bVisorbin\b", "Vi-Sorbin", text)
-    text = re.sub(r"\bVit\.C\b", "Vitamin C", text)
-    text = re.sub(r"\bVit\.E\b", "Vitamin E", text)
-    text = re.sub(r"\bVit\.D\b", "Vitamin D", text)
-    text = re.sub(r"\bVit\.Premix\b", "Vitamin Premix", text)
-    text = re.sub(r"\bVitaflex\b", "VitaFlex", text)
-    text = re.sub(r"\bVitalife\b", "VitaLife", text)
-    text = re.sub(r"\bVitazing\b", "VitaZing", text)
-    text = re.sub(r"\bVibravenos\b", u"Vibraven\u00F6s", text)
-    text = re.sub(r"\bVibravet\b", "VibraVet", text)
-    text = re.sub(r"\bVitaminee\b", "Vitamine", text)
-    text = re.sub(r"\bVitamune\b", "VitaMune", text)
-    text = re.sub(r"\bVitathion\b", "Vita-Thion", text)
-    text = re.sub(r"\bVk\b", "VK", text)
-    text = re.sub(r"\bVl\b", "VL", text)
-    text = re.sub(r"\bVms\b", "VMS", text)
-    text = re.sub(r"\bVmw\b", "VMW", text)
-    text = re.sub(r"\bVosol\b", "VoSol", text)
-    text = re.sub(r"\bVpriv\b", "VPRIV", text)
-    text = re.sub(r"\bVr\b", "VR", text)
-    text = re.sub(r"\bVtb\b", "VTB", text)
+    return digest.hexdigest()
 
-    #W
-    text = re.sub(r"\bW\.Sun\b", "with Sun", text)
-    text = re.sub(r"\bWaf\b", "Wafer", text)
-    text = re.sub(r"\bWaterbabies\b", "WaterBABIES", text)
-    text = re.sub(r"\bWb\b", "WB", text)
-    text = re.sub(r"\bWetjet\b", "WetJet", text)
-    text = re.sub(r"\bWfi\b", "WFI", text)
-    text = re.sub(r"\bWinrho\b", "WinRho", text)
-    text = re.sub(r"\bWintermint\b", "Winter Mint", text)
-    text = re.sub(r"\bWms\b", "WMS", text)
-    text = re.sub(r"\bWomens\b", "Women's", text)
-    text = re.sub(r"\bWoodburys\b", "Woodbury's", text)
-    text = re.sub(r"\bWp\b", "WP", text)
+def enable_normalization_store(path, readOnly=False):
+    """Looks up normalizer results in a store kept between runs
     
-    #X
-    text = re.sub(r"\bXc\b", "XC", text)
-    text = re.sub(r"\bXd\b", "XD", text)
-    text = re.sub(r"\bXl\b", "XL", text)
-    text = re.sub(r"\bXm\b", "XM", text)
-    text = re.sub(r"\bXp\b", "XP", text)
-    text = re.sub(r"\bXr\b", "XR", text)
-    text = re.sub(r"\bXrt\b", "XRT", text)
-    text = re.sub(r"\bXs\b", "XS", text)
-    text = re.sub(r"\bXylifresh\b", "XyliFresh", text)
-    text = re.sub(r"\bXx\b", "XX", text)
+    Values seen in an earlier run are returned from the store 
+    instead of being normalized again. Call this before 
+    enable_normalizer_cache so the caches sit in front of the store.
     
-    #Y
-    text = re.sub(r"\bYf\b", "YF", text)
+    Args:
+        path: the SQLite database file of the store
+        readOnly: if True, the store is only read and new values 
+            must be collected with take_normalized_values
     
-    #Z
-    text = re.sub(r"\bZeromold\b", "ZeroMold", text)
-    text = re.sub(r"\bZme\b", "ZME", text)
-    text = re.sub(r"\bZnp\b", "ZNP", text)
-    text = re.sub(r"\bZp\b", "ZP", text)
-    text = re.sub(r"\bZzzquil\b", "ZzzQuil", text)
+    Returns:
+        None.
+        
+    Raises:
+        None.
+    """
     
+    global normalization_store
     
+    from normalization_store import NormalizationStore
     
-    #String Replacements
-    #0
-    text = text.replace("1,2,And 4", "1, 2, and 4")
-    text = text.replace("24.%", "24")
-    text = text.replace("90 mg/Src", "SRC 90 mg")
-    text = text.replace("2 (Eq) mmol", "2 (mEq) mmol")
-    text = text.replace("4 (Eq) mmol", "4 (mEq) mmol")
-    text = text.replace("4.5Million IUMl", "4.5 Million IU/mL")
-    text = text.replace("-For Dry Skn", " - For Dry Skin")
-    text = text.replace("-For Oily Sk", " - For Oily Skin")
-    text = text.replace("-Normal Skin", " - Normal Skin")
-    text = text.replace("( Shades", "(Shades")
+    if normalization_store is not None:
+        disable_normalization_store()
     
+    normalization_store = NormalizationStore(path, readOnly=readOnly)
+    module = globals()
+    row_transforms.clear()
     
-    #A
-    text = text.replace("A.C.&", "A.C. &")
-    text = text.replace("A.F.Anacin", "A.F. Anacin")
-    text = text.replace("A La", u"\u00C0 La")
-    text = text.replace("Ac&C", "AC&C")
-    text = text.replace("Ac And C", "AC and C")
-    text = text.replace("Ac Quat Nr", "AC-Quat NR")
-    text = text.replace("Aclear ", "A-Clear ")
-    text = text.replace("Acnomel Acnee", "Acnomel Acne")
-    text = text.replace("Actacel", "ACTacel")
-    text = text.replace("Actichrom", "ActiChrom")
-    text = text.replace("Adeks", "ADEKs")
-    text = text.replace("Aerobex", "AeroBex")
-    text = text.replace("Aerrane", "AErrane")
-    text = text.replace("Agentquat", "Agent Quat")
-    text = text.replace("Airlife", "AirLife")
-    text = text.replace("Akileine", u"Akil\u00E9ine")
-    text = text.replace("Alcis", "ALCiS")
-    text = text.replace("Alnox", "ALnox")
-    text = text.replace("Alphanine", "AlphaNine")
-    text = text.replace("Ambisome", "AmBisome")
-    text = text.replace("Anased", "AnaSed")
-    text = text.replace("Androgel", "AndroGel")
-    text = text.replace("Anmien", "An Mien")
-    text = text.replace("Antartic", "Antarctic")
-    text = text.replace("Anthelcide Eq", "Anthelcide EQ")
-    text = text.replace("Anti Sudorifique", "Antisudorifique")
-    text = text.replace("Anti-Pers.Deodorant.-", "Anti-Perspirant Deodorant - ")
-    text = text.replace("Antibacterial.Foam.Cleanser", "Antibacterial Foam Cleanser")
-    text = text.replace(u"Antibacterial\u00E9rien", u"Antibact\u00E9rien")
-    text = text.replace(u"Antibacterial\u00E9rienne", u"Antibact\u00E9rienne")
-    text = text.replace("Antimicrobial.Skin Cleans.", "Antimicrobial Skin Cleanser")
-    text = text.replace("Antiperspirant.-DeodorantFor Feet", "Antiperspirant Deodorant for Feet")
-    text = text.replace("AntiperspirantDeod.Stick", "Antiperspirant Deodorant Stick")
-    text = text.replace("AntiperspirantClassic", "Antiperspirant Classic")
-    text = text.replace("AntiperspirantRoll", "Antiperspirant Roll")
-    text = text.replace("AntiperspirantSuper", "Antiperspirant Super")
-    text = text.replace("AntiperspirantWild Br.", "Antiperspirant Wild Breeze")
-    text = text.replace("Antiperspirant Stk", "Antiperspirant Stick")
-    text = text.replace("Antitranspirant", "Anti-Transpirant")
-    text = text.replace("Aosept", "AOSept")
-    text = text.replace("AQ.Nasal Spray", "AQ Nasal Spray")
-    text = text.replace("Aquasport", "AquaSport")
-    text = text.replace("Argentum Met. Praep.", "Argentum Metallicum Praep.")
-    text = text.replace("Argentum Met.Praep.D", "Argentum Metallicum Praep. D")
-    text = text.replace("Arthricare", "ArthriCare")
-    text = text.replace("Assainissuer", "Assainisseur")
-    text = text.replace("Astring.", "Astringent")
-    text = text.replace("Aureo Sp", "Aureo S-P")
-    text = text.replace("Autochlorhex", "AutoChlorHex")
-    text = text.replace("Auth.Skin", "Authentic Skin")
-    text = text.replace("Axsept", "AxSept")
-    text = text.replace("Axsym", "AxSYM")
-    text = text.replace("Azasite", "AzaSite")
+    for name in NORMALIZER_CACHE_SIZES:
+        module[name] = normalization_store.wrap(
+            name, normalizer_digest(name), module[name]
+        )
+
+def disable_normalization_store():
+    """Saves new values to the store and stops using it"""
+    global normalization_store
     
-    #B
-    text = text.replace("Babys", "Baby's")
-    text = text.replace("Balancing Mois.", "Balancing Moisturizer")
-    text = text.replace("Balea", u"Bal\u00E9a")
-    text = text.replace("Bbg.FL.", "Bubblegum Flavour")
-    text = text.replace("Bebes", u"B\u00E9b\u00E9s")
-    text = text.replace("Barocat ", "Baro-Cat ")
-    text = text.replace("Beech/Hetre", u"Beech/Hu\u00EAtre")
-    text = text.replace("Benejoint", "BeneJoint")
-    text = text.replace("Benrex", "Ben-Rex")
-    text = text.replace("Beta Caro&Zn", "Beta-Carotene & Zinc")
-    text = text.replace("Beta-Ce Cap", "Beta-CE Cap")
-    text = text.replace("Beauticontrol", "BeautiControl")
-    text = text.replace("Benzaclin", "BenzaClin")
-    text = text.replace("Benzoinspray", "Benzoin Spray")
-    text = text.replace("Bicart", "BiCart")
-    text = text.replace("Bicavera", "BicaVera")
-    text = text.replace("Bicnu", "BiCNU")
-    text = text.replace("Biocalth", "BioCalth")
-    text = text.replace("Biocleanz", "BioCleanz")
-    text = text.replace("Biocure", "BioCure")
-    text = text.replace("Biokids", "BioKIDS")
-    text = text.replace("Biolav", "BioLav")
-    text = text.replace("Biomers", "BioMERS")
-    text = text.replace("Biomycin", "Bio-Mycin")
-    text = text.replace("Biore ", u"Bior\u00E9 ")
-    text = text.replace("Biosculpt", "BioSculpt")
-    text = text.replace("Biosentry", "BioSentry")
-    text = text.replace("Bioquat", "BioQuat")
-    text = text.replace("Biostrath", "Bio-Strath")
-    text = text.replace("Biosurf", "BioSURF")
-    text = text.replace("Biotext", "BioTEXT")
-    text = text.replace("Biovac", "BioVac")
-    text = text.replace("Blg-X", "BLG-X")
-    text = text.replace("Blu Kote Dr Naylors", "Dr. Naylor Blu-Kote")
-    text = text.replace("Bodyglide", "Body Glide")
-    text = text.replace("Bodypruf", "BodyPruf")
-    text = text.replace("Boumatic", "BouMatic")
-    text = text.replace("Br.Calcium", "from Calcium")
-    text = text.replace("Brewers", "Brewer's")
-    text = text.replace("Bronz.Hydratante", "Bronzante Hydratante")
-    text = text.replace("Buckleys", "Buckley's")
-    text = text.replace("Butterscotch And Fr.FL.", "Butterscotch and Fruit Flavour")
+    if normalization_store is None:
+        return
     
-    #C
-    text = text.replace("C.Doroon", "C. Doroon")
-    text = text.replace("C, E&Zn&Se", "C, E & Zn & Se")
-    text = text.replace(u"Caffeine\u00E9", u"Caf\u00E9ine")
-    text = text.replace("Calcimax", "CalciMax")
-    text = text.replace("Calfspan", "CalfSpan")
-    text = text.replace("Calmax", "CalMax")
-    text = text.replace("Calplus", "Cal-Plus")
-    text = text.replace("Camocare", "CamoCare")
-    text = text.replace("Canesoral", "CanesOral")
-    text = text.replace("Canscreen", "Can Screen")
-    text = text.replace("Carbonate:10D", "Carbonate: 10D")
-    text = text.replace("Carotene,Vitamin C,E", "Carotene, Vitamin C, E")
-    text = text.replace("Carnea.Flos", "Carnea flos")
-    text = text.replace("Chew.Multi.Vit.& Min.Tablet W B Carot", "Chewable Multivitamin & Mineral Tablet with Beta-Carotene")
-    text = text.replace("Chew.Multiple Vits.With", "Chewable Multiple Vitamins with")
-    text = text.replace("Chew.Multiple Vit.Complete Form.", "Chewable Multiple Vitamins Complex Formulation")
-    text = text.replace("Chew.Multivit.Complete", "Chewable Multivitamin Complete")
-    text = text.replace("Child.Chew.Multiv.Multim.W.Iron", "Child Chewable Multivitamin Multimineral with Iron")
-    text = text.replace("Child.Chew.Multivit.Multimin.Regular", "Child Chewable Multivitamin Multimineral Regular")
-    text = text.replace("Child.Sunblock.Lot", "Child Sunblock Lotion")
-    text = text.replace("Childrens", "Children's")
-    text = text.replace("Ciblee", u"Cibl\u00E9e")
-    text = text.replace("Cleans.Pads", "Cleansing Pads")
-    text = text.replace("Clindamycin Injection SDZ", "SDZ-Clindamycin Injection")
-    text = text.replace("Cln&Clr", "Clean & Clear")
-    text = text.replace("Cln.And Clr.", "Clean & Clear")
-    text = text.replace("Cln And Clr.", "Clean & Clear ")
-    text = text.replace("Clr AntiperspirantBaby Fr.SC.", "Clear Antiperspirant Baby Fresh Scent")
-    text = text.replace("co.Croquable ", " Croquable ")
-    text = text.replace("Coen.Q10W.Vitamin C And E Beta-Car.Se Cu Zn Mn", "Coenzyme Q10 with Vitamin C and E, Beta-Carotene, Selenium, Copper, Zinc, Manganese")
-    text = text.replace("Com.PK.Vaginal", "Complete Pack Vaginal")
-    text = text.replace("Comfortab", "ComforTAB")
-    text = text.replace("Comp.- Tablet", u"Comprim\u00E9 - Tablet")
-    text = text.replace("Compact Sunsc.Ref.", "Compact Sunscreen Refill ")
-    text = text.replace("Comprimes", u"Comprim\u00E9s")
-    text = text.replace("Comprime", u"Comprim\u00E9")
-    text = text.replace("Concentrate-3", "Concentrate - 3")
-    text = text.replace("Conentrate", "Concentrate")
-    text = text.replace(u"Concentrate\u00E9", u"Concentr\u00E9")
-    text = text.replace("CoverGirl Clar.", "CoverGirl Clarifying")
-    text = text.replace("CoverGirl Clarif ", "CoverGirl Clarifying ")
-    text = text.replace(u"CR\u00E8", u"Cr\u00E8")
-    text = text.replace(u"CR\u00E9me", u"Cr\u00E8me")
-    text = text.replace("-Creamy Nat. .5%", "- Creamy Natural 0.5%")
+    module = globals()
+    row_transforms.clear()
     
+    for name in NORMALIZER_CACHE_SIZES:
+        module[name] = getattr(module[name], "__wrapped__", module[name])
     
-    #D
-    text = text.replace("D'Acetamin ", u"D'Ac\u00E9taminoph\u00E8ne ")
-    text = text.replace("D'Acetaminophene", u"D'Ac\u00E9taminoph\u00E8ne")
-    text = text.replace(u"D'Ac\u00E9taminoph\u00E8ne 80 mg/mL Enf", u"D'Ac\u00E9taminoph\u00E8ne 80 mg/mL Enfants")
-    text = text.replace("D.Pteronyssinus", "D. Pteroyssinus")
-    text = text.replace("Dc&R", "DC&R")
-    text = text.replace("Decongest+Expect", "Decongestant+Expectorant")
-    text = text.replace("Decongestionnant", u"D\u00E9congestionnant")
-    text = text.replace(u"D\u00E9fintion", u"D\u00E9finition")
-    text = text.replace("Degraissant", u"D\u00E9graissant")
-    text = text.replace("DeodorantSupersport", "Deodorant Super Sport")
-    text = text.replace("Deodoriz.", "Deodorizing")
-    text = text.replace("DeodorizingConc", "Deodorizing Concentrated")
-    text = text.replace("Des.A. ", "Des Odor A ")
-    text = text.replace("Desodor.", "Des Odor")
-    text = text.replace(u"D\u00E9sinfentant", u"D\u00E9sinfectant")
-    text = text.replace("Desinfectant", u"D\u00E9sinfectant")
-    text = text.replace("Dessechement", u"Dess\u00E8chement")
-    text = text.replace("Dextrose.Low Ca Low Mg", "Dextrose Low Calcium Low Magnesium")
-    text = text.replace("Dextrose.Low Calow Mg", "Dextrose Low Calcium Low Magnesium")
-    text = text.replace("Dext.Low Mg", "Dextrose Low Magnesium")
-    text = text.replace("Dexamethasone Sodium Phosphate Injection SDZ", "SDZ Dexamethasone Sodium Phosphate Injection")
-    text = text.replace("Diazepam Injection SDZ", "SDZ Diazepam Injection")
-    text = text.replace("Disinfect./Clean.", "Disinfectant/Cleaner")
-    text = text.replace("Disinfect.Conc.", "Disinfectant Concentrate")
-    text = text.replace("Disinfectant Clr Liquid", "Disinfectant Cleaner Liquid")
-    text = text.replace("DisinfectantCleaner", "Disinfectant Cleanser")
-    text = text.replace("DisinfectantHand &Ang.", "Disinfectant Hand & Ang.")
-    text = text.replace(u"Dmv\u00E9t", u"DMV\u00E9t")
-    text = text.replace("Dobutamine Injection SDZ", "SDZ Dobutamine Injection")
-    text = text.replace("Duree", u"Dur\u00E9e")
-    text = text.replace(u"D\u00FCRR", u"D\u00FCrr")
+    normalization_store.close()
+    normalization_store = None
+
+def take_normalized_values():
+    """Returns the values added to the store since the last call"""
+    if normalization_store is None:
+        return []
     
-    #E
-    text = text.replace("Ecran", u"\u00C9cran")
-    text = text.replace("Electrlytes", "Electrolytes")
-    text = text.replace("Elixir.Nat.Fin. Compact Ss.RF", "Elixir Natural Finish Compact Sunscreen Refill")
-    text = text.replace("Eucalyp.FL", "Eucalyptus Flavour")
-    text = text.replace("Expector.Ex.St.Syr", "Expectorant Extra Strength Syrup")
-    text = text.replace("Ext.Strength.Caplet", "Extra Strength Caplet")
-    text = text.replace("Extra Extra", "Extra-Extra")
-    text = text.replace("Extra Str.Toothp.", "Extra Strength Toothpaste")
+    return normalization_store.take_added()
+
+def add_normalized_values(rows):
+    """Adds values from take_normalized_values to the store"""
+    if normalization_store is not None:
+        normalization_store.add(rows)
+
+def start_worker(storePath=None, cacheNormalizers=True):
+    """Prepares the normalizers of a parse worker process
     
-    #F
-    text = text.replace("Fantastick", "Fantastic")
-    text = text.replace("Faces Sens.Skin", "Faces Sensitive Skin")
-    text = text.replace("Fentanyl Citrate Injection SDZ", "SDZ Fentanyl Citrate Injection")
-    text = text.replace("Flav.Lozenge", "Flavoured Lozenge")
-    text = text.replace("Flav.Tablet", "Flavour Tablet")
-    text = text.replace("Flavanoids", "Flavonoids")
-    text = text.replace("Fluconazole Injection SDZ", "SDZ Fluconazole Injection")
-    text = text.replace("Flumazenil Injection SDZ", "SDZ Flumazenil Injection")
-    text = text.replace("Flumist", "FluMist")
-    text = text.replace("Footworks", "Foot Works")
-    text = text.replace("Formula A.L.-", "Formula A.L. - ")
-    text = text.replace("Formula A.R.-", "Formula A.L. - ")
-    text = text.replace("Fortifed", "Fortified")
-    text = text.replace("Foundat.SPF", "Foundation SPF")
-    text = text.replace("Furosemide Injection SDZ", "SDZ Furosemide Injection")
-    text = text.replace("Furosemide Special SDZ", "SDZ Furosemide Special")
+    Args:
+        storePath: optional SQLite file of the normalization store, 
+            which the worker only reads
+        cacheNormalizers: if True, caches the normalized value of 
+            repeated column values in the worker
     
-    #G
-    text = text.replace("G.Mix.", "Gas Mixture")
-    text = text.replace("G.M.", "Gas Mixture")
-    text = text.replace("Gas Rel.Liquid.", "Gas Relief Liquid")
-    text = text.replace("Gas Rel. Tablet", "Gas Relief Tablet")
-    text = text.replace("Gelee", u"Gel\u00E8e")
-    text = text.replace("Gen.Pur.Neutral", "General Purpose Neutral")
-    text = text.replace("Gliclazide Mr", "Gliclazide MR")
-    text = text.replace("Granisetron Hydrochloride Injection SDZ", "SDZ Granisetron Hydrochloride Injection")
-    text = text.replace("Graphite:10D", "Graphite: 10D")
+    Returns:
+        None.
+        
+    Raises:
+        None.
+    """
     
-    #H
-    text = text.replace("H.E.L.P.Bicel", "H.E.L.P. BicEl")
-    text = text.replace("Hemosyn", "HemoSYN")
-    text = text.replace("Hemodialsis", "Hemodialysis")
-    text = text.replace("Hemodiaylsis", "Hemodialysis")
-    text = text.replace("High Pot.B", "High Potency B")
-    text = text.replace("Hobon Dr ", "Hobon DR ")
-    text = text.replace("Hobon Dri ", "Hobon DRI ")
-    text = text.replace("Honey-Lem. Menth.", "Honey-Lemon, Menthol")
-    text = text.replace("Hydrat.Prot.Quot.N", u"Hydratant Prot\u00E8ge Quotidien ")
-    text = text.replace("Hydratant Prot Quot", u"Hydratant Prot\u00E8ge Quotidien ")
-    text = text.replace("Hydro-Satin.SPF", "Satin SPF")
-    text = text.replace("Hyocyamus", "Hyoscyamus")
+    if storePath is not None:
+        enable_normalization_store(storePath, readOnly=True)
     
-    #I
-    text = text.replace("Injectable Sus.- ", "Injectable Suspension - ")
-    text = text.replace("Injection.- IM ", "Injection - IM ")
-    text = text.replace("Injection.Sus-", "Injection Suspension - ")
-    text = text.replace("InjectionW.Elec.W.25%Dex", "Injection with Electrolytes with 25% Dextrose")
-    text = text.replace("InjectionW.Elecw.25%Dex", "Injection with Electrolytes with 25% Dextrose")
-    text = text.replace("Injection,Minerals", "Injection, Minerals")
-    text = text.replace("InjectionSc", "Injection SC")
-    text = text.replace("InjectionUsp", "Injection USP")
-    text = text.replace("Insect Repell.With Sunscrn.", "Insect Repellent with Sunscreen")
-    text = text.replace("Invis.Blem.Treat.Regular.", " Invisible Blemish Treatment Regular")
+    if cacheNormalizers:
+        enable_normalizer_cache()
+
+def parse_chunk(file, rows):
+    """Parses a chunk of rows of an extract file
     
-    #J
-    text = text.replace("Jun.Complet A.Fer", "Junior Complete A Fer")
+    Args:
+        file: the name of the extract file, e.g. "drug_ap.txt"
+        rows: list of rows, each a list of strings
     
-    #K
-    text = text.replace("Ketamine Hydrochloride Injection SDZ", "SDZ Ketamine Hydrochloride Injection")
-    text = text.replace("Kids'Sunscreen", "Kids Sunscreen")
-    text = text.replace("Koate-HP Unj", "Koate-HP Injection")
+    Returns:
+        List of the parsed rows in the order given.
+        
+    Raises:
+        None.
+    """
     
-    #L
-    text = text.replace("L.D.M", "Liquid Delivery Medium")
-    text = text.replace("Laneige", "La Neige")
-    text = text.replace("Laryngobis Enf", "Laryngobis ENF")
-    text = text.replace("Lax.Sm.Tex.-Sugar Free", "Laxative Smooth Texture - Sugar Free")
-    text = text.replace("Laxatif De Sene", u"Laxatif De S\u00E9n\u00E9")
-    text = text.replace("Lemon Germ Cln", "Lemon Germ Cleaner")
-    text = text.replace("Levres", u"L\u00E8vres")
-    text = text.replace("Linbuspirone", "Lin-Buspirone")
-    text = text.replace("Linmegestrol", "Lin-Megestrol")
-    text = text.replace("Lip&Eye", "Lip & Eye")
-    text = text.replace("Lip Balmer", "Lip Balm")
-    text = text.replace("Lipcolor", "Lip Color")
-    text = text.replace("Lot.Longue Dur.Pour Enf.", u"Lotion Longue Dur\u00E9e Pour Enfant ")
-    text = text.replace("Lotionsolaire", "Lotion Solaire")
-    text = text.replace("Lumiere", u"Lumi\u00E8re")
+    return list(map(get_row_transform(file), rows))
+
+def parse_rows(file, rows):
+    """Parses a chunk of rows of an extract file in a worker process
     
-    #M
-    text = text.replace("M.G.M", "Medical Gas Mixture")
-    text = text.replace("M.O.S.- 10", "M.O.S. - 10")
-    text = text.replace("M.O.S.- 20", "M.O.S. - 20")
-    text = text.replace("M.O.S.- 30", "M.O.S. - 30")
-    text = text.replace("M.O.S.- 40", "M.O.S. - 40")
-    text = text.replace("M.O.S.- 50", "M.O.S. - 50")
-    text = text.replace("M.O.S.- 60", "M.O.S. - 60")
-    text = text.replace("Med.Antidand.Hair & Scalp Cond.Orig", "Medicated Antidandruff Hair & Scalp Conditioner Original")
-    text = text.replace("Meropenem For Injection SDZ", "SDZ Meropenem For Injection")
-    text = text.replace("Midazolam Injection SDZ", "SDZ Midazolam Injection")
-    text = text.replace("Million I.U./mL", " Million IU/mL")
-    text = text.replace("Min.For", "Minerals for")
-    text = text.replace("Moist.S.C.", "Moisturizing Sun Care ")
-    text = text.replace("Moist.Suncare", "Moisturizing Sun Care ")
-    text = text.replace("Moist. Sunb Lot", "Moisturizing Sunblock Lotion")
-    text = text.replace("Moist. Sunblock Lot.", "Moisturizing Sunblock Lotion")
-    text = text.replace("Morphine Sulfate Injection SDZ", "SDZ Morphine Sulfate Injection")
-    text = text.replace("Mult.Vit&Min Comp.For Child.With Ca", "Multivitamin & Minerals Tablet for children with Calcium")
+    Args:
+        file: the name of the extract file, e.g. "drug_ap.txt"
+        rows: list of rows, each a list of strings
     
-    #N
-    text = text.replace("N-M.Bioflav.Rose ", "Non-Medicinal Bioflavonoids Rose ")
-    text = text.replace("N.S.Colloidal", "N.S. Colloidal")
-    text = text.replace("Naloxone Hydrochloride Injection SDZ Preservative Free", "SDZ Naloxone Hydrochloride Injection Preservative Free")
-    text = text.replace("Nas Phys.Soln", "Nasal Solution")
-    text = text.replace("Nat. Finish Comp.Ssrf ", "Natural Finish Compact Sunscreen Refill")
-    text = text.replace("Nat.F. Comp S.S RF.", "Natural Finish Compact Sunscreen Refill ")
-    text = text.replace("Nat.Fin. Compact Ss.RF. ", "Natural Finish Compact Sunscreen Refill")
-    text = text.replace("Nat.Fin.Compact Ss.RF.", "Natural Finish Compact Sunscreen Refill ")
-    text = text.replace("Nat.Srce.Vit.", "Natural Source Vitamin")
-    text = text.replace("Nebules P.F.", "Nebules PF ")
-    text = text.replace("Neostigmine Methylsulfate Injection SDZ", "SDZ Neostigmine Methylsulfate Injection")
-    text = text.replace("Nightime", "Nighttime")
-    text = text.replace("Non-Med.Odorless", "Non-Medicinal Odorless")
-    text = text.replace("Nubears", "NuBears")
+    Returns:
+        Tuple of (parsed, added, counts). parsed is a ParsedTable of 
+        the rows from parse_chunk, with the DICTIONARY_COLUMNS of the 
+        extract dictionary encoded, so it is smaller to send back. 
+        added is the values newly normalized for the store, to pass 
+        to add_normalized_values, and counts the worker's cache hits 
+        and misses for the chunk, to pass to add_cache_counts.
+        
+    Raises:
+        KeyError: the file is not a known extract.
+    """
     
-    #O
-    text = text.replace("O-F Tan.Mist", "Oil-Free Tanning Mist")
-    text = text.replace("Oatmeal&M.O.B.T.-Powder", "Oatmeal & M.O.B.T. Powder")
-    text = text.replace("Ocn.Brz., Frag.Free, Aloe Vera, SC, Frsh", "Ocean Breeze, Fragrance Free, Aloe Vera, Scented, Fresh")
-    text = text.replace("Onestep", "One-Step")
-    text = text.replace("Orig.Texture/W.Sugar/Unflav.", "Original Texture/With Sugar/Unflavoured")
+    from parsed_table import ParsedTable
     
-    #P
-    text = text.replace("Past.Antisep.", "Pastille Antiseptiques")
-    text = text.replace("Past.Antisept.", "Pastille Antiseptiques")
-    text = text.replace("Past.Antiseptic.", "Pastille Antiseptique")
-    text = text.replace("Peaux Cl/Sens./Enf.", "Peaux Sensitive Enfant")
-    text = text.replace("Pediatrique", u"P\u00E9diatrique")
-    text = text.replace("Peglyte", "PegLyte")
-    text = text.replace("Perennnial", "Perennial")
-    text = text.replace("Perit.Dial.Sol.", "Peritoneal Dialysis Solution with ")
-    text = text.replace("Perit.Dial.Soln W.", "Peritoneal Dialysis Solution with ")
-    text = text.replace("Perit.Dial.Soln.W.", "Peritoneal Dialysis Solution with ")
-    text = text.replace("Periton.Dial.Soln. W.", "Peritoneal Dialysis Solution with ")
-    text = text.replace("Periton.Dial.Soln.W.", "Peritoneal Dialysis Solution with ")
-    text = text.replace("Peroxiclear", "PeroxiClear")
-    text = text.replace("pH. Eur.", "Ph. Eur.")
-    text = text.replace("Pocketpaks", "PocketPaks")
-    text = text.replace("Pressee", u"Press\u00E9e")
-    text = text.replace("Pr.And Pain Rel.W.Ibupr.", "Pressure Relief and Pain Relief with Ibuprofen")
-    text = text.replace("Proc Pen La ", "Proc Pen LA ")
-    text = text.replace("Processionnare", "Processionnaire")
-    text = text.replace("Prof. Epithel Med. Antidandruff Shampoo", "Professional Epithelial Medicated Antidandruff Shampoo")
-    text = text.replace("Prot.SPF", "Protection SPF")
-    text = text.replace("Protect.SPF", "Protect SPF")
-    text = text.replace("Pseudoephed.HCl", "Pseudoephedrine    HCl")
-    text = text.replace("Purete", u"Puret\u00E9")
+    title = EXTRACT_TITLES[file]
+    parsed = ParsedTable(len(COLUMN_NORMALIZERS[title]), 
+                         DICTIONARY_COLUMNS.get(title, ()))
     
-    #Q
+    parsed.extend(parse_chunk(file, rows))
     
-    #R
+    return parsed, take_normalized_values(), take_cache_counts()
+
+def profile_function(name, normalizer):
+    """Returns normalizer wrapped to record its calls and time
     
-    text = text.replace("Regular.Scent", "Regular Scent")
-    text = text.replace("Regular,Sport,Musk", "Regular, Sport, Musk")
-    text = text.replace("Regular.Str.Cold Medic. ", "Regular Strength Cold Medicine ")
-    text = text.replace("Regulateur", u"R\u00E9gulateur")
-    text = text.replace("Regulier", u"R\u00E9gulier")
-    text = text.replace(u"R\u00E9guliern", u"R\u00E9gulier")
-    text = text.replace("Revitalift", "RevitaLift")
-    text = text.replace("Rocuronium Bromide Injection SDZ", "SDZ Rocuronium Bromide Injection")
-    text = text.replace("Rosmarinus Off.", "Rosmarinus Officinalis ")
-    text = text.replace("Rosemary,Pomegranate", "Rosemary, Pomegranate")
+    Args:
+        name: the normalizer name, e.g. "parseDate"
+        normalizer: the function that normalizes a raw value
     
-    #S
-    text = text.replace("-S.Menthe", " - Saveur Menthe")
-    text = text.replace("-S.Miel Et Eucalypt.", " - Saveur Miel et Eucalyptus")
-    text = text.replace("S.C. S.B. WP", "Sunscreen Sunblock with Preservative")
-    text = text.replace("S.S. Skin-Caring S.S. Wp.", "Sunscreen Skin-Caring Sunscreen with Preservative")
-    text = text.replace("scalptherapie", u"scalpth\u00E9rapie")
-    text = text.replace("Seche", u"S\u00E8che")
-    text = text.replace("Securite", u"S\u00E9curit\u00E9")
-    text = text.replace("Sens. Sk. Sun BL. Wp.", "Sensitive Skin Sunblock with Preservative ")
-    text = text.replace("Serenad Lot", "Serenade Lotion")
-    text = text.replace("Sft.Spring", "Soft Sprint")
-    text = text.replace("Shiseido Elixir.Pre-Makeup", "Shiseido Elixir Pre-Makeup")
-    text = text.replace("Single Dose )", "Single Dose)")
-    text = text.replace("Sinutab N.D.Regular", "Nighttime Daytime Regular")
-    text = text.replace("Sinutab N.T.", "Sinutab Nighttime")
-    text = text.replace("Sinutab ND", "Sinutab Daytime Nighttime")
-    text = text.replace("Sinutab PE ND", "Sinutab PE Daytime Nighttime")
-    text = text.replace("Sk.Pr.B.Lot ", "Skin Protection Lotion ")
-    text = text.replace("Skin Balanc.Mois", "Skin Balancing Moisturizer")
-    text = text.replace("Skin-Caring S.S. WP", "Skin-Caring Sunscreen with Preservative")
-    text = text.replace("Smooth Text./Sugar Free/Or.F", "Smooth Texture/Sugar Free/Original Flavour")
-    text = text.replace("Smooth&Moist ", "Smooth & Moist ")
-    text = text.replace("Soft&Dri", "Soft & Dri")
-    text = text.replace("Solostar", "SoloSTAR")
-    text = text.replace("Soln.Ac.Clean.Bar Acne Treat.", "Solution  Acne Cleansing Bar Acne Treatment")
-    text = text.replace("Soltn", "Solution")
-    text = text.replace("Soluton", "Solution")
-    text = text.replace("Soothacaine", "Sooth-A-Caine")
-    text = text.replace(u"SP\u00E9cial", u"Sp\u00E9cial")
+    Returns:
+        Function that calls normalizer, adding the call, whether it 
+        changed the value and the time taken to function_stats.
+        
+    Raises:
+        None.
+    """
     
-    text = text.replace("Spect.Sunscr.Lot", "Spectrum Sunscreen Lotion")
-    text = text.replace("Spf.Fps", "SPF/FPS")
-    text = text.replace("Standardardized", "Standardized")
-    text = text.replace("Std.- 100%", "Std. - 100%")
+    stats = function_stats[name] = [0, 0, 0.0]
+    clock = time.perf_counter
     
-    text = text.replace("Steriliz.&Disinfect. Soln", "Sterilizing and Disinfecting Solution")
-    text = text.replace("Stop.Anti", "Stop - Anti")
-    text = text.replace("Strawberry FL.Tabs", "Strawberry Flavour Tablets")
-    text = text.replace("Suncomfort", "SunComfort")
-    text = text.replace("Suncreen", "Sunscreen")
-    text = text.replace("Sunscreenoil", "Sunscreen Oil")
-    text = text.replace("Suncreeen", "Sunscreen")
-    text = text.replace("Sunlotion", "Sun Lotion")
-    text = text.replace("Sup.Mult.Vit&Min Chew Tablet.", "Supplement Multivitamin & Mineral Chewable Tablet")
-    text = text.replace("Suppress Cough Syr W.Cod.Diphen.HCl Amm.Chl.", "Suppress Cough Syrup with Codeine Diphenhydramine HCl Ammonium Chloride")
+    @functools.wraps(normalizer)
+    def profiled(text):
+        start = clock()
+        result = normalizer(text)
+        
+        stats[2] += clock() - start
+        stats[0] += 1
+        
+        if result != text:
+            stats[1] += 1
+        
+        return result
     
-    #T
-    text = text.replace("Tan.Oil W.Ext.Sunscreen", "Tanning Oil with Extra Sunscreen")
-    text = text.replace("Tanning Lotion For Facespf8", "Tanning Lotion for Face SPF 8")
-    text = text.replace("Tanning Lotion For Spf8-Lt Glow ", "Tanning Lotion SPF 8 Light Glow")
-    text = text.replace("Tandempk.Vaginal", "Tandem Pack Vaginal")
-    text = text.replace("Teintee", u"Teint\u00E9e")
-    text = text.replace(" Th ", " TH ")
-    text = text.replace("Therapeutique", u"Th\u00E9rapeutique")
-    text = text.replace("Time Rel Mult Vit And Min Tablet", "Timed Release Multi Vitamin and Mineral Tablet")
-    text = text.replace("Time Rel Vit C Tablet", "Timed Release Vitamin C tablet")
-    text = text.replace("Timed Rel Swiss One Multivi W/HVP Chelate Min", "Timed Release Swiss One Multivitamin w/HVP Chelated Minerals")
-    text = text.replace("Travas.", "Travasol")
-    text = text.replace(u"TR\u00E8", u"Tr\u00E8")
-    text = text.replace("Trop.C.And A.Tan Gel W.Ex.S.S.4Spf", "Tropic Vitamin C and A tanning Gel with Extra Sunscreen SPF 4")
+    return profiled
+
+def enable_rule_profiling():
+    """Starts recording matches and time for every normalizer rule
     
-    #U
-    text = text.replace("Ultrapen La", "Ultrapen LA")
+    The rules of the FUNCTION_NORMALIZERS are recorded as a whole, 
+    per function. Call this before enable_normalization_store and 
+    enable_normalizer_cache, so only the values they do not already 
+    hold are recorded, as with the rule tables.
+    """
     
-    #V
-    text = text.replace("V.Dry", "Very Dry")
-    text = text.replace("Vacc Live Att Freez", "Vaccine Live Attenuated Freeze")
-    text = text.replace("Vaseline Br.Der.FMLA UV Dly.Def.H.B.Lotspf15", "Vaseline Brand FMLA UV Daily Defining Hand & Body Lotion SPF 15")
-    text = text.replace("Vaseline Br.INT.Care Broad Spectrum SB.SPF 15", "Vaseline Brand Intensive Care Broad Spectrum Sunblock SPF 15")
-    text = text.replace("Vaseline Brand INT", "Vaseline Brand Intensive")
-    text = text.replace("Vaseline Brand Intens ", "Vaseline Brand Intensive ")
-    text = text.replace("Vaseline Brnd Intensv ", "Vaseline Brand Intensive ")
-    text = text.replace("Vit.And Min.", "Vitamins and Minerals")
-    text = text.replace("Vit.FMX", "Vitamin FMX")
-    text = text.replace("Vit.Pmx", "Vitamin Premix")
-    text = text.replace("Vit.Plus", "Vitamin Plus")
-    text = text.replace("Vit B-Complex, Vit C, Cu & Mo", "Vitamin B-Complex, Vitamin C, Copper & Molybdenum")
-    text = text.replace("Vitadvance", "VitAdvance")
-    text = text.replace("Vibright", "ViBright")
+    for ruleset in RULESETS.values():
+        ruleset.enable_profiling()
     
-    #W
-    text = text.replace("W.Beta Carotene", "with Beta-Carotene")
-    text = text.replace("W.Beta-Car.And", "with Beta-Carotene and")
-    text = text.replace("W.Cod.", "with Codeine")
-    text = text.replace("W.Iron", "with Iron")
-    text = text.replace("W.Moist.Aloe V.Gel", "with Moisturizing Aloe Vera Gel")
-    text = text.replace("W.Naf", "with NaF")
-    text = text.replace("W.Niacinam.Beta Car.And Min.", "with Niacinamide Beta-Carotene and Minerals")
-    text = text.replace("W.Solid", "Wide Solid")
-    text = text.replace("W/Ss.SPF", "with Sunscreen SPF 4")
-    text = text.replace("Waterp.Sport Lot.", "Waterproof Sport Lotion ")
-    text = text.replace("Wht. Toothpaste Sens.Teeth-Fresh Mint", "Whitening Toothpaste Sensitive Teeth - Fresh Mint")
-    text = text.replace("With A,D,C", "with A, D, C")
+    module = globals()
+    row_transforms.clear()
     
-    #X
-    text = text.replace("Xylocaine Mpf", "Xylocaine-MPF")
+    for name in FUNCTION_NORMALIZERS:
+        if name not in function_profilers:
+            function_profilers[name] = profile_function(name, module[name])
+            module[name] = function_profilers[name]
+
+def disable_rule_profiling():
+    """Stops recording matches and time for every normalizer rule"""
+    for ruleset in RULESETS.values():
+        ruleset.disable_profiling()
     
-    #Y
-    text = text.replace("Yeast&Liver", "Yeast & Liver")
+    module = globals()
+    row_transforms.clear()
     
-    #Z
+    for name, profiler in list(function_profilers.items()):
+        if module[name] is profiler:
+            module[name] = profiler.__wrapped__
+        
+        del function_profilers[name]
+
+def rule_profile():
+    """Returns the recorded rule statistics, slowest rules first
     
-    #Removes any extra spaces
-    text = re.sub(r"\s{2,}", " ", text)
+    The FUNCTION_NORMALIZERS each have one row, of kind "function", 
+    with hits and matches counting the calls that changed the value.
+    """
     
+    rows = []
+
+    for normalizer, ruleset in RULESETS.items():
+        for row in ruleset.profile():
+            row["normalizer"] = normalizer
+            rows.append(row)
+
+    for normalizer, (calls, changed, seconds) in function_stats.items():
+        rows.append({
+            "normalizer": normalizer,
+            "ruleset": "",
+            "position": "",
+            "kind": "function",
+            "pattern": "",
+            "replacement": "",
+            "calls": calls,
+            "hits": changed,
+            "matches": changed,
+            "seconds": seconds,
+        })
+
+    rows.sort(key=lambda row: (-row["seconds"], -row["hits"]))
+
+    return rows
+
+def write_rule_profile(path):
+    """Saves the recorded rule statistics as a .csv or .json report
     
-    '''
-    \u00E8 è
-    \u00E9 é
-    \u00C8 È
-    \u00C9 É
+    Args:
+        path: the report file; a .json extension writes JSON, any 
+            other extension writes CSV
     
-    REGEX
-    text = re.sub(r"\b\b", "", text)
+    Returns:
+        None.
+        
+    Raises:
+        None.
+    """
     
-    STRING
-    text = text.replace("", "")
+    import csv
+    import json
     
-    HOMEOPATHY
-    text = text.replace("", "")
-    '''
+    rows = rule_profile()
+    fields = [
+        "normalizer", "ruleset", "position", "kind", "pattern", 
+        "replacement", "calls", "hits", "matches", "seconds"
+    ]
     
+    if str(path).lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as report:
+            json.dump(rows, report, indent=2, ensure_ascii=False)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as report:
+            csvWriter = csv.DictWriter(
+                report, fields, delimiter=",", quotechar='"', 
+                quoting=csv.QUOTE_ALL
+            )
+            csvWriter.writeheader()
+            csvWriter.writerows(rows)
+
+
+def parseAHFS(text):
+    """Formats the AHFS category for the drug product."""
+
+    text = text.title()
+    text = AHFS_RULESET.apply(text)
+
+    return text
+
+def parseBrand(text):
+    """Formats drug product brand name."""
+
+    text = text.title()
+    text = BRAND_RULESET.apply(text)
+
     return text
 
 def parseCompanyName(text):
     """Formats company names."""
-    
+
     text = text.title()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    #0
-    text = re.sub(r"'S\b", "'s", text)
-    
-    #A
-    text = re.sub(r"\bAa\b", "AA", text)
-    text = re.sub(r"\bAb\b", "AB", text)
-    text = re.sub(r"\bAbbvie\b", "AbbVie", text)
-    text = re.sub(r"\bAbc\b", "ABC", text)
-    text = re.sub(r"\bAccudial\b", "AccuDial", text)
-    text = re.sub(r"\bAdm\b", "ADM", text)
-    text = re.sub(r"\bAfd\b", "AFD", text)
-    text = re.sub(r"\bAg\b", "AG", text)
-    text = re.sub(r"\bAgp\b", "AGP", text)
-    text = re.sub(r"\bAhs\b", "AHS", text)
-    text = re.sub(r"\bAkpharma\b", "AkPharma", text)
-    text = re.sub(r"\bAlcis\b", "ALCiS", text)
-    text = re.sub(r"\bAlda\b", "ALDA", text)
-    text = re.sub(r"\bAlk\b", "ALK", text)
-    text = re.sub(r"\bALK Abello\b", "ALK-Abello", text)
-    text = re.sub(r"\bAltimed\b", "AltiMed", text)
-    text = re.sub(r"\bAmag\b", "AMAG", text)
-    text = re.sub(r"\bAmg\b", "AMG", text)
-    text = re.sub(r"\bAmo\b", "AMO", text)
-    text = re.sub(r"\bAmorepacific\b", "AmorePacific", text)
-    text = re.sub(r"\bAms\b", "AMS", text)
-    text = re.sub(r"\bApa\b", "APA", text)
-    text = re.sub(r"\bApm\b", "APM", text)
-    text = re.sub(r"\bApopharma\b", "ApoPharma", text)
-    text = re.sub(r"\bAps\b", "ApS", text)
-    text = re.sub(r"\bAquaelectronik\b", "AQUAelectronik", text)
-    text = re.sub(r"\bAriad\b", "ARIAD", text)
-    text = re.sub(r"\bArivac\b", "AriVac", text)
-    text = re.sub(r"\bArjohuntleigh\b", "ArjoHuntleigh", text)
-    text = re.sub(r"\bAsa\b", "ASA", text)
-    text = re.sub(r"\bAsd\b", "ASD", text)
-    text = re.sub(r"\bAst\b", "AST", text)
-    text = re.sub(r"\bAtl\b", "ATL", text)
-    text = re.sub(r"\bAstrazeneca\b", "AstraZeneca", text)
-    text = re.sub(r"\bAxsys\b", "AxSys", text)
-    text = re.sub(r"\bA\.L\.\s", "A&L ", text)
-    
-    #B
-    text = re.sub(r"\bBbj\b", "BBJ", text)
-    text = re.sub(r"\bBct\b", "BCT", text)
-    text = re.sub(r"\bBdh\b", "BDH", text)
-    text = re.sub(r"\bBeaute\b", u"Beaut\u00E9", text)
-    text = re.sub(r"\bBeauticontrol\b", "BeautiControl", text)    
-    text = re.sub(r"\bBgp\b", "BGP", text)
-    text = re.sub(r"\bBioadvantex\b", "BioAdvantex", text)
-    text = re.sub(r"\bBiocalth\b", "BioCalth", text)
-    text = re.sub(r"\bBiomarin\b", "BioMarin", text)
-    text = re.sub(r"\bBiomedic\b", "BioMedic", text)
-    text = re.sub(r"\bBiosafe\b", "BioSafe", text)
-    text = re.sub(r"\bBiosav\b", "Bio Sav", text)
-    text = re.sub(r"\bBiosyent\b", "BioSyent", text)
-    text = re.sub(r"\bBiotime\b", "BioTime", text)
-    text = re.sub(r"\bBlairex Laboratories, Inc\b", "Blairex Laboratories Inc", text)
-    text = re.sub(r"\bBles\b", "BLES ", text)
-    text = re.sub(r"\bBmg\b", "BMG", text)
-    text = re.sub(r"\bBodyglide\b", "Body Glide", text)
-    text = re.sub(r"\bBtg\b", "BTG", text)
-    text = re.sub(r"\bBv\b", "B.V.", text)
-    
-    #C
-    text = re.sub(r"\bCanadna\b", "Canada", text)
-    text = re.sub(r"\bCarefusion\b", "CareFusion", text)
-    text = re.sub(r"\bCc\b", "CC", text)
-    text = re.sub(r"\bCca\b", "CCA", text)
-    text = re.sub(r"\bCdmv\b", "CDMV", text)
-    text = re.sub(r"\bCentrico\(", "Centrico (", text)
-    text = re.sub(r"\bCes\b", "CES", text)
-    text = re.sub(r"\bChildrens\b", "Children's", text)
-    text = re.sub(r"\bChx\b", "CHX", text)
-    text = re.sub(r"\bCmi\b", "CMI", text)
-    text = re.sub(r"\bCo(\.|\b)", "Co.", text)
-    text = re.sub(r"\bComestics\b", "Cosmetics", text)
-    text = re.sub(r"\bConfortmedic\b", u"ConfortM\u00E9dic", text)
-    text = re.sub(r"\bConvatec\b", "ConvaTec", text)
-    text = re.sub(r"\bCoopersurgical\b", "CooperSurgical", text)
-    text = re.sub(r"\bCoopervision\b", "CooperVision", text)
-    text = re.sub(r"\bCosmeceutechs\b", "CosmeceuTechs", text)
-    text = re.sub(r"\bCosmederme\b", u"Cosm\u00E9derme", text)
-    text = re.sub(r"\bCrc\b", "CRC", text)
-    text = re.sub(r"\bCrls\b", "CRLS", text)
-    text = re.sub(r"\bCsl\b", "CSL", text)
-    
-    #D
-    text = re.sub(r"\bD'Estrees\b", u"D'Estr\u00E9es", text)
-    text = re.sub(r"\bDelaval\b", "DeLaval", text)
-    text = re.sub(r"\bDesheli\b", "DeSheli", text)
-    text = re.sub(r"\bDeutchland\b", "Deutschland", text)
-    text = re.sub(r"\bDioptic\b", "DIOPTIC", text)
-    text = re.sub(r"\bDist(\.|\b)", "Dist.", text)
-    text = re.sub(r"\bDistibution\b", "Distribution", text)
-    text = re.sub(r"\bDiv(\.|\b)", "Division", text)
-    text = re.sub(r"\bDmvet\b", u"DMVu00E9t", text)
-    text = re.sub(r"\bDraximage\b", "DraxImage", text)
-    text = re.sub(r"\bDraxis\b", "DRAXIS", text)
-    text = re.sub(r"\bDrc\b", "DRC", text)
-    text = re.sub(r"\bDse\b", "DSE", text)
-    text = re.sub(r"\bDtr\b", "DTR", text)
-    text = re.sub(r"\bDupont\b", "DuPont", text)
-    text = re.sub(r"\bDurr\b", "D\u00FCrr", text)
-    text = re.sub(r"\bDusa\b", "DUSA", text)
-    
-    #E
-    text = re.sub(r"\bEca\b", "ECA", text)
-    text = re.sub(r"\bEhf\b", "ehf", text)
-    text = re.sub(r"\bEhn\b", "EHN", text)
-    text = re.sub(r"\bEkr\b", "EKR", text)
-    text = re.sub(r"\bElevage\b", u"\u00C9levage", text)
-    text = re.sub(r"\bEmea\b", "EMEA", text)
-    text = re.sub(r"\bEmd\b", "EMD", text)
-    text = re.sub(r"\bEmebko\b", "EMebKo", text)
-    text = re.sub(r"\bEmrn\b", "EMRN", text)
-    text = re.sub(r"\bEngarde\b", "En Garde", text)
-    text = re.sub(r"\bEnr(\.|\b)", "ENR", text)
-    text = re.sub(r"\bEnvironmentalsolutions\b", "Environmental Solutions", text)
-    text = re.sub(r"\bEnviroway\b", "EnviroWay", text)
-    text = re.sub(r"\bEnvirox\b", "EnvirOx", text)
-    text = re.sub(r"\bEquipement\b", u"\u00C9quipement", text)
-    text = re.sub(r"\bErfa\b", "ERFA", text)
-    text = re.sub(r"\bEsba\b", "ESBA", text)
-    text = re.sub(r"\bEtre\b", u"\u00CAtre", text)
-    text = re.sub(r"\bEusa\b", "EUSA", text)
-    
-    #F
-    text = re.sub(r"\bFederee\b", u"f\u00E9d\u00E9r\u00E9e", text)
-    text = re.sub(r"\bFoodscience\b", "FoodScience", text)
-    text = re.sub(r"\bFoto\b", "FOTO", text)
-    text = re.sub(r"\bFur\b", u"f\u00FCr", text)
-    
-    #G
-    text = re.sub(r"\bG.H.Wood\b", "G.H. Wood", text)
-    text = re.sub(r"\bG.M.B.H.\b", "GmbH", text)
-    text = re.sub(r"\bGaspro\b", "Gas Pro", text)
-    text = re.sub(r"\bGc\b", "GC", text)
-    text = re.sub(r"\bGea\b", "GEA", text)
-    text = re.sub(r"\bGenderm\b", "GenDerm", text)
-    text = re.sub(r"\bGenmed\b", "GenMed", text)
-    text = re.sub(r"\bGernetic Int\b", "Gernetic International", text)
-    text = re.sub(r"\bGes M.B.H.\b", "GmbH", text)
-    text = re.sub(r"\bGfr\b", "GFR", text)
-    text = re.sub(r"\bGfs\b", "GFS", text)
-    text = re.sub(r"\bGh\b", "GH", text)
-    text = re.sub(r"\bGhbh\b", "GmbH", text)
-    text = re.sub(r"\bGk\b", "GK", text)
-    text = re.sub(r"\bGlaxosmithkline\b", "GlaxoSmithKline", text)
-    text = re.sub(r"\bGloprofessional\b", "GloProfessional", text)
-    text = re.sub(r"\bGlymed\b", "GlyMed", text)
-    text = re.sub(r"\bGmbh\b", "GmbH", text)
-    text = re.sub(r"\bGmd\b", "GMD", text)
-    text = re.sub(r"\bGms\b", "GMS", text)
-    text = re.sub(r"\bGrise\b", u"Gris\u00E9", text)
-    text = re.sub(r"\bGw\b", "GW", text)
-    
-    #H
-    text = re.sub(r"\bHansamed\b", "HANSAmed", text)
-    text = re.sub(r"\bHdc\b", "HDC", text)
-    text = re.sub(r"\bHealthcomm\b", "HealthComm", text)
-    text = re.sub(r"\bHerbscience\b", "HerbScience", text)
-    text = re.sub(r"\bHealthsystem\b", "HealthSystem", text)
-    text = re.sub(r"\bHipra\b", "HIPRA", text)
-    text = re.sub(r"\bHlth\b", "Health", text)
-    text = re.sub(r"\bHollisterstier\b", "HollisterStier", text)
-    text = re.sub(r"\bHra\b", "HRA", text)
-    text = re.sub(r"\bHvs\b", "HVS", text)
-    text = re.sub(r"\bHvl\b", "HVL", text)
-    
-    #I
-    text = re.sub(r"\bIaf\b", "IAF", text)
-    text = text.replace("Iamat (Inter Assoc Medic Assist Travel)", "International Association for Medical Assistance to Travellers")
-    text = re.sub(r"\bIcn\b", "ICN", text)
-    text = re.sub(r"\bIcpbio\b", "ICPbio", text)
-    text = re.sub(r"\bImclone\b", "ImClone", text)
-    text = re.sub(r"\bInc(\.|\b)", "Inc.", text)
-    text = re.sub(r"\bInc\.,Division\b", "Inc., Division", text)
-    text = re.sub(r"\bIncorporated\b", "Inc.", text)
-    text = re.sub(r"\bIncorporées\b", "Inc.", text)
-    text = re.sub(r"\bInfirst\b", "infirst", text)
-    text = re.sub(r"\bInh\b", "INH", text)
-    text = re.sub(r"\bInnovatech\b", "InnovaTech", text)
-    text = re.sub(r"\bInsite\b", "InSite", text)
-    text = re.sub(r"\bInt$", "International", text)
-    text = re.sub(r"\bInt'L\b", "International", text)
-    text = re.sub(r"\bInternationalmanufacturing\b", "International Manufacturing", text)
-    text = re.sub(r"\bInterparfums\b", "Inter Parfums", text)
-    text = re.sub(r"\bIntracare\b", "IntraCare", text)
-    text = re.sub(r"\bItw\b", "ITW", text)
-    text = re.sub(r"\bIvc\b", "IVC", text)
-    
-    #J
-    text = re.sub(r"\bJamp\b", "JAMP", text)
-    text = re.sub(r"\bJfl\b", "JFL", text)
-    text = re.sub(r"\bJcp\b", "JCP", text)
-    text = re.sub(r"\bJd\b", "JD", text)
-    text = re.sub(r"\bJempak\b", "JemPak", text)
-    text = re.sub(r"\bJohnsondiversey\b", "JohnsonDiversey", text)
-    
-    #K
-    text = re.sub(r"\bKiehls\b", "Kiehl's", text)
-    text = re.sub(r"\bKik\b", "KIK", text)
-    text = re.sub(r"\bKindercare\b", "KinderCare", text)
-    text = re.sub(r"\bKinesys\b", "KINeSYS", text)
-    text = re.sub(r"\bKg\b", "KG", text)
-    text = re.sub(r"\bKpss\b", "KPSS", text)
-    text = re.sub(r"\bKsl\b", "KSL", text)
-    text = re.sub(r"\bKv\b", "KV", text)
-    text = re.sub(r"\bKvg\b", "KVG", text)
-    
-    #L
-    text = text.replace(u"Lt\u00E9e", "Ltee")
-    text = text.replace(u"Limit\u00E9e", "Ltd")
-    
-    text = re.sub(r"\bL\sOreal\b", u"L'Or\u00E9al", text)
-    text = re.sub(r"\bL\.Hebert\b", u"L. H\u00E9bert", text)
-    text = re.sub(r"\bLacorium\b", "LaCorium", text)
-    text = re.sub(r"\bLancome\b", u"Lanc\u00F4me", text)
-    text = re.sub(r"\bLectec\b", "LecTec", text)
-    text = re.sub(r"\bLeo Desilets\b", u"L\u00E9o D\u00E9silets", text)
-    text = re.sub(r"\bLifeforce\b", "Life Force", text)
-    text = re.sub(r"\bLimited(\.|\b)", "Ltd.", text)
-    text = re.sub(r"\bLtda\b", "Ltda.", text)
-    text = re.sub(r"\bLimitee\b",  u"Lt\u00E9e.", text)
-    text = re.sub(r"\bLlc\b", "LLC", text)
-    text = re.sub(r"\bLousal\b", "LouSal", text)
-    text = re.sub(r"\bLp\b", "LP", text)
-    text = re.sub(r"\bLrc\b", "LRC", text)
-    text = re.sub(r"\bLtd(\.|\b)", "Ltd.", text)
-    text = re.sub(r"\bLtee(\.|\b)", u"Lt\u00E9e.", text)
-    
-    #M
-    text = re.sub(r"\bMaco\b", "MACO", text)
-    text = re.sub(r"\bMacromed\b", "MacroMed", text)
-    text = re.sub(r"\bMaggas\b", "MagGas", text)
-    text = re.sub(r"\bMaurer\b", u"M\u00E4urer", text)
-    text = re.sub(r"\bMcblooms\b", "McBlooms", text)
-    text = re.sub(r"\bMccuaig\b", "McCuaig", text)
-    text = re.sub(r"\bMcgaw\b", "McGraw", text)
-    text = re.sub(r"\bMcgillivray\b", "McGillivray", text)
-    text = re.sub(r"\bMcguff\b", "McGuff", text)
-    text = re.sub(r"\bMckay\b", "McKay", text)
-    text = re.sub(r"\bMcm\b", "MCM", text)
-    text = re.sub(r"\bMcnamara\b", "McNamara", text)
-    text = re.sub(r"\bMcneil\b", "McNeil", text)
-    text = re.sub(r"\bMczand\b", "McZand", text)
-    text = re.sub(r"\bMda\b", "MDA", text)
-    text = re.sub(r"\bMdt\b", "MDT", text)
-    text = re.sub(r"\bMediherb\b", "MediHerb", text)
-    text = re.sub(r"\bMegalab\b", u"M\u00E9galab", text)
-    text = re.sub(r"\bMfg(\.|\b)", "Inc.", text)
-    text = re.sub(r"\bMgi\b", "MGI", text)
-    text = re.sub(r"\bMkr\b", "MKR", text)
-    text = re.sub(r"\bMmdc\b", "MMDC", text)
-    text = re.sub(r"\bMolnlycke\b", u"M\u00F6lnlycke", text)
-    text = re.sub(r"\bMp\b", "MP", text)
-    text = re.sub(r"\bMtc\b", "MTC", text)
-    
-    #N
-    text = re.sub(r"\bNch\b", "NCH", text)
-    text = re.sub(r"\bNeilmed\b", "NeilMed", text)
-    text = re.sub(r"\bNeochem\b", "NeoChem", text)
-    text = re.sub(r"\bNexmed\b", "NexMed", text)
-    text = re.sub(r"\bNf\b", "NF", text)
-    text = re.sub(r"\bNorac\b", "NORAC", text)
-    text = re.sub(r"\bNpr\b", "NPR", text)
-    text = re.sub(r"\bNse\b", "NSE", text)
-    text = re.sub(r"\bNt\b", "NT", text)
-    text = re.sub(r"\bNutramed\b", "NutraMed", text)
-    text = re.sub(r"\bNutri-Cology\b", "NutriCology", text)
-    text = re.sub(r"\bNutricorp\b", "NutriCorp", text)
-    text = re.sub(r"\bNutrimedika\b", "NutriMedika", text)
-    text = re.sub(r"\bNutritech\b", "Nutri-Tech", text)
-    text = re.sub(r"\bNutrivention\b", "NutriVention", text)
-    text = re.sub(r"\bNxstage\b", "NxStage", text)
-    text = re.sub(r"\bNyc\b", "NYC", text)
-    text = re.sub(r"\bNypower\b", "NyPower", text)
-    
-    #O
-    text = re.sub(r"\bOhso\b", "OhSo", text)
-    text = re.sub(r"\bOlehenriksen\b", "Ole Henriksen", text)
-    text = re.sub(r"\bOmnichem\b", "OmniChem", text)
-    text = re.sub(r"\bOnt\b", "ONT", text)
-    text = re.sub(r"\bOralabs\b", "OraLabs", text)
-    text = re.sub(r"\bOrapharma\b", "OraPharma", text)
-    text = re.sub(r"\bOsterreichisches\b", u"\u00D6sterreichisches", text)
-    text = re.sub(r"\bOtc\b", "OTC", text)
-    text = re.sub(r"\bOxibrite\b", "Oxi Brite", text)
-    text = re.sub(r"\bOxis\b", "OXIS", text)
-    
-    #P
-    text = re.sub(r"\bPangeo\b", "PanGeo", text)
-    text = re.sub(r"\bPaxvax\b", "PaxVax", text)
-    text = re.sub(r"\bPb\b", "PB", text)
-    text = re.sub(r"\bPdt\b", "PDT", text)
-    text = re.sub(r"\bPediavera\b", "PediaVera", text)
-    text = re.sub(r"\bPepin\b", u"P\u00E9pin", text)
-    text = re.sub(r"\bPeroxychem\b", "PeroxyChem", text)
-    text = re.sub(r"\bPge\b", "PGE", text)
-    text = re.sub(r"\bPharmacetical\b", "Pharmaceutical", text)
-    text = re.sub(r"\bPharmanutrients\b", "PharmaNutrients", text)
-    text = re.sub(r"\bPhotomedex\b", "PhotoMedex", text)
-    text = re.sub(r"\bPj\b", "PJ", text)
-    text = re.sub(r"\bPnp\b", "PNP", text)
-    text = re.sub(r"\bPns\b", "PNS", text)
-    text = re.sub(r"\bPortionpac\b", "PortionPac", text)
-    text = re.sub(r"\bPreffered\b", "Preferred", text)
-    text = re.sub(r"\bPrevimed\b", u"Pr\u00E9viMed", text)
-    text = re.sub(r"\bProlab\b", "ProLab", text)
-    text = re.sub(r"\bPrometic\b", "ProMetic", text)
-    text = re.sub(r"\bProresp\b", "ProResp", text)
-    text = re.sub(r"\bProrestore\b", "ProRestore", text)
-    text = re.sub(r"\bPtc\b", "PTC", text)
-    text = re.sub(r"\bPti\b", "PTI", text)
-    text = re.sub(r"\bPurklenz\b", "PurKlenz", text)
-    
-    #Q
-    text = re.sub(r"\bQuali-Tech\b", "QualiTech", text)
-    
-    #R
-    text = text.replace("Res.Found.For Microb.Dis.Osaka", "Research Foundation for Microbial Diseases of Osaka")
-    
-    text = re.sub(r"\bRejudicare\b", "RejudiCare", text)
-    text = re.sub(r"\bRespircare\b", "RespirCare", text)
-    text = re.sub(r"\bRgr\b", "RGR", text)
-    text = re.sub(r"\bRhoxalpharma\b", "RhoxalPharma", text)
-    text = re.sub(r"\bRl\b", "RL", text)
-    text = re.sub(r"\bRmc\b", "RMC", text)
-    text = re.sub(r"\bRts\b", "RTS", text)
-    
-    #S
-    text = re.sub(r"\bS.P.A.\b", "S.p.A.", text)
-    text = re.sub(r"\bSa\b", "SA", text)
-    text = re.sub(r"\bSanfacon\b", u"Sanfa\u00E7on", text)
-    text = re.sub(r"\bSanteplus\b", u"Sant\u00E9 Plus", text)
-    text = re.sub(r"\bSas\b", "SAS", text)
-    text = re.sub(r"\bSbs\b", "SBS", text)
-    text = re.sub(r"\bSca\b", "SCA", text)
-    text = re.sub(r"\bSchulke\b", u"Sch\u00FClke", text)
-    text = re.sub(r"\bScs\b", "SCS", text)
-    text = re.sub(r"\bSecurite\b", u"S\u00E9curit\u00E9", text)
-    text = re.sub(r"\bServicemaster\b", "ServiceMaster", text)
-    text = re.sub(r"\bShinpharma\b", "ShinPharma", text)
-    text = re.sub(r"\bSk\b", "SK", text)
-    text = re.sub(r"\bSkinceuticals\b", "SkinCeuticals", text)
-    text = re.sub(r"\bSkinscience\b", "SkinScience", text)
-    text = re.sub(r"\bSkyepharma\b", "SkyePharma", text)
-    text = re.sub(r"\bSmartshield\b", "SmartShield", text)
-    text = re.sub(r"\bSmithkline\b", "SmithKline", text)
-    text = re.sub(r"\bSmiths\b", "Smith's", text)
-    text = re.sub(r"\bSmordins\b", "Smordin's", text)
-    text = re.sub(r"\bSnugz\b", "SnugZ", text)
-    text = re.sub(r"\bSociete\b", u"Soci\u00E9t\u00E9", text)
-    text = re.sub(r"\bSoulutions\b", "Solutions", text)
-    text = re.sub(r"\bSrl\b", "SRL", text)
-    text = re.sub(r"\bSpa\b", "S.p.A.", text)
-    text = re.sub(r"\bSpectropharm\b", "SpectroPharm", text)
-    text = re.sub(r"\bSunopta\b", "SunOpta", text)
-    text = re.sub(r"\bSsl\b", "SSL", text)
-    text = re.sub(r"\bStb\b", "STB", text)
-    text = re.sub(r"\bStcc\b", "STCC", text)
-    text = re.sub(r"\bSterimax\b", "SteriMax", text)
-    text = re.sub(r"\bStp\b", "STP", text)
-    text = re.sub(r"\bStrivectin\b", "StriVectin", text)
-    text = re.sub(r"\bSubsid\b", "Subsidiary", text)
-    text = re.sub(r"\bSubsidary\b", "Subsidiary", text)
-    text = re.sub(r"\bSubsidery\b", "Subsidiary", text)
-    text = re.sub(r"\bSunforce\b", "SunForce", text)
-    text = re.sub(r"\bSynthese\b", u"Synth\u00E8se", text)
-    text = re.sub(r"\bSyrvet\b", "SyrVet", text)
-    
-    #T
-    text = re.sub(r"\bTaberco\b", "TaberCo", text)
-    text = re.sub(r"\bTaropharma\b", "TaroPharma", text)
-    text = re.sub(r"\bTechnologies,LLC\b", "Technologies, LLC", text)
-    text = re.sub(r"\bTheralab\b", "TheraLab", text)
-    text = re.sub(r"\bTp\b", "TP", text)
-    text = re.sub(r"\bTqm\b", "TQM", text)
-    text = re.sub(r"\bTruclean\b", "TruClean", text)
-    
-    #U
-    text = re.sub(r"\bUl\b", "UL", text)
-    text = re.sub(r"\bUlc\b", " ULC", text)
-    text = re.sub(r"\bUnifirst\b", "UniFirst", text)
-    text = re.sub(r"\bUas\b", "UAS", text)
-    text = re.sub(r"\bUcb\b", "UCB", text)
-    text = re.sub(r"\bUs\b", "US", text)
-    text = re.sub(r"\bUsa\b", "USA", text)
-    text = re.sub(r"\bUk\b", "UK", text)
-    
-    #V
-    text = re.sub(r"\bViiv\b", "ViiV", text)
-    text = re.sub(r"\bViratek\b", "ViraTek", text)
-    text = re.sub(r"\bViropharma\b", "ViroPharma", text)
-    text = re.sub(r"\bVitalaire\b", "VitalAire", text)
-    text = re.sub(r"\bVpi\b", "VPI", text)
-    
-    #W
-    text = re.sub(r"\bWex\b", "WEX", text)
-    text = re.sub(r"\bWn\b", "WN", text)
-    text = re.sub(r"\bWy\b", "WY", text)
-    
-    #X
-    
-    #Y
-    text = re.sub(r"\bYsl\b", "YSL", text)
-    
-    #Z
-    text = re.sub(r"\bZhejiangh\b", "Zhejiang", text)
-    text = re.sub(r"\bZlb\b", "ZLB", text)
-    
-    
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
+    text = COMPANY_NAME_RULESET.apply(text)
 
     return text
 
@@ -3090,1083 +669,8 @@ def parseDescriptor(text):
     """Formats drug entry descriptior information."""
 
     text = text.lower()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Space Parenthesis, Commas, %
-    text = re.sub(r"a\(", "a (", text)
-    text = re.sub(r"b\(", "b (", text)
-    text = re.sub(r"c\(", "c (", text)
-    text = re.sub(r"d\(", "d (", text)
-    text = re.sub(r"e\(", "e (", text)
-    text = re.sub(r"f\(", "f (", text)
-    text = re.sub(r"g\(", "g (", text)
-    text = re.sub(r"G\(", "G (", text)
-    text = re.sub(r"h\(", "h (", text)
-    text = re.sub(r"i\(", "i (", text)
-    text = re.sub(r"j\(", "j (", text)
-    text = re.sub(r"k\(", "k (", text)
-    text = re.sub(r"l\(", "l (", text)
-    text = re.sub(r"m\(", "m (", text)
-    text = re.sub(r"n\(", "n (", text)
-    text = re.sub(r"o\(", "o (", text)
-    text = re.sub(r"p\(", "p (", text)
-    text = re.sub(r"q\(", "q (", text)
-    text = re.sub(r"r\(", "r (", text)
-    text = re.sub(r"s\(", "s (", text)
-    text = re.sub(r"t\(", "t (", text)
-    text = re.sub(r"u\(", "u (", text)
-    text = re.sub(r"v\(", "v (", text)
-    text = re.sub(r"w\(", "w (", text)
-    text = re.sub(r"x\(", "x (", text)
-    text = re.sub(r"y\(", "y (", text)
-    text = re.sub(r"z\(", "z (", text)
-    text = re.sub(r"0\(", "0 (", text)
-    text = re.sub(r"1\(", "1 (", text)
-    text = re.sub(r"2\(", "2 (", text)
-    text = re.sub(r"3\(", "3 (", text)
-    text = re.sub(r"4\(", "4 (", text)
-    text = re.sub(r"5\(", "5 (", text)
-    text = re.sub(r"6\(", "6 (", text)
-    text = re.sub(r"7\(", "7 (", text)
-    text = re.sub(r"8\(", "8 (", text)
-    text = re.sub(r"9\(", "9 (", text)
-    text = re.sub(r"\%\(", "% (", text)
-    text = re.sub(r"\s*-\(\b", " (", text)
-    text = re.sub(r"\)-", ") -", text)
-    text = re.sub(r"\.\(\b", ". (", text)
-    
-    text = re.sub(r"\)a", ") a", text)
-    text = re.sub(r"\)b", ") b", text)
-    text = re.sub(r"\)c", ") c", text)
-    text = re.sub(r"\)d", ") d", text)
-    text = re.sub(r"\)e", ") e", text)
-    text = re.sub(r"\)f", ") f", text)
-    text = re.sub(r"\)g", ") g", text)
-    text = re.sub(r"\)h", ") h", text)
-    text = re.sub(r"\)i", ") i", text)
-    text = re.sub(r"\)j", ") j", text)
-    text = re.sub(r"\)k", ") k", text)
-    text = re.sub(r"\)l", ") l", text)
-    text = re.sub(r"\)m", ") m", text)
-    text = re.sub(r"\)n", ") n", text)
-    text = re.sub(r"\)o", ") o", text)
-    text = re.sub(r"\)p", ") p", text)
-    text = re.sub(r"\)q", ") q", text)
-    text = re.sub(r"\)r", ") r", text)
-    text = re.sub(r"\)s", ") s", text)
-    text = re.sub(r"\)t", ") t", text)
-    text = re.sub(r"\)u", ") u", text)
-    text = re.sub(r"\)v", ") v", text)
-    text = re.sub(r"\)w", ") w", text)
-    text = re.sub(r"\)x", ") x", text)
-    text = re.sub(r"\)y", ") y", text)
-    text = re.sub(r"\)z", ") z", text)
-    text = re.sub(r"\)0", ") 0", text)
-    text = re.sub(r"\)1", ") 1", text)
-    text = re.sub(r"\)2", ") 2", text)
-    text = re.sub(r"\)3", ") 3", text)
-    text = re.sub(r"\)4", ") 4", text)
-    text = re.sub(r"\)5", ") 5", text)
-    text = re.sub(r"\)6", ") 6", text)
-    text = re.sub(r"\)7", ") 7", text)
-    text = re.sub(r"\)8", ") 8", text)
-    text = re.sub(r"\)9", ") 9", text)
-    
-    text = re.sub(r",a", ", a", text)
-    text = re.sub(r",b", ", b", text)
-    text = re.sub(r",c", ", c", text)
-    text = re.sub(r",d", ", d", text)
-    text = re.sub(r",e", ", e", text)
-    text = re.sub(r",f", ", f", text)
-    text = re.sub(r",g", ", g", text)
-    text = re.sub(r",h", ", h", text)
-    text = re.sub(r",i", ", i", text)
-    text = re.sub(r",j", ", j", text)
-    text = re.sub(r",k", ", k", text)
-    text = re.sub(r",l", ", l", text)
-    text = re.sub(r",m", ", m", text)
-    text = re.sub(r",n", ", n", text)
-    text = re.sub(r",o", ", o", text)
-    text = re.sub(r",p", ", p", text)
-    text = re.sub(r",q", ", q", text)
-    text = re.sub(r",r", ", r", text)
-    text = re.sub(r",s", ", s", text)
-    text = re.sub(r",t", ", t", text)
-    text = re.sub(r",u", ", u", text)
-    text = re.sub(r",v", ", v", text)
-    text = re.sub(r",w", ", w", text)
-    text = re.sub(r",x", ", x", text)
-    text = re.sub(r",y", ", y", text)
-    text = re.sub(r",z", ", z", text)
-    text = re.sub(r",1", ", 1", text)
-    text = re.sub(r",2", ", 2", text)
-    text = re.sub(r",3", ", 3", text)
-    text = re.sub(r",4", ", 4", text)
-    text = re.sub(r",5", ", 5", text)
-    text = re.sub(r",6", ", 6", text)
-    text = re.sub(r",7", ", 7", text)
-    text = re.sub(r",8", ", 8", text)
-    text = re.sub(r",9", ", 9", text)
-    
-    text = re.sub(r"\%a", "% a", text)
-    text = re.sub(r"\%b", "% b", text)
-    text = re.sub(r"\%c", "% c", text)
-    text = re.sub(r"\%d", "% d", text)
-    text = re.sub(r"\%e", "% e", text)
-    text = re.sub(r"\%f", "% f", text)
-    text = re.sub(r"\%g", "% g", text)
-    text = re.sub(r"\%h", "% h", text)
-    text = re.sub(r"\%i", "% i", text)
-    text = re.sub(r"\%j", "% j", text)
-    text = re.sub(r"\%k", "% k", text)
-    text = re.sub(r"\%l", "% l", text)
-    text = re.sub(r"\%m", "% m", text)
-    text = re.sub(r"\%n", "% n", text)
-    text = re.sub(r"\%o", "% o", text)
-    text = re.sub(r"\%p", "% p", text)
-    text = re.sub(r"\%q", "% q", text)
-    text = re.sub(r"\%r", "% r", text)
-    text = re.sub(r"\%s", "% s", text)
-    text = re.sub(r"\%t", "% t", text)
-    text = re.sub(r"\%u", "% u", text)
-    text = re.sub(r"\%v", "% v", text)
-    text = re.sub(r"\%w", "% w", text)
-    text = re.sub(r"\%x", "% x", text)
-    text = re.sub(r"\%y", "% y", text)
-    text = re.sub(r"\%z", "% z", text)
-    text = re.sub(r"\%0", "% 0", text)
-    text = re.sub(r"\%1", "% 1", text)
-    text = re.sub(r"\%2", "% 2", text)
-    text = re.sub(r"\%3", "% 3", text)
-    text = re.sub(r"\%4", "% 4", text)
-    text = re.sub(r"\%5", "% 5", text)
-    text = re.sub(r"\%6", "% 6", text)
-    text = re.sub(r"\%7", "% 7", text)
-    text = re.sub(r"\%8", "% 8", text)
-    text = re.sub(r"\%9", "% 9", text)
-    
-    
-    
-    #"x" replacements
-    text = re.sub(r"0x0", "0 x 0", text)
-    text = re.sub(r"0x1", "0 x 1", text)
-    text = re.sub(r"0x2", "0 x 2", text)
-    text = re.sub(r"0x3", "0 x 3", text)
-    text = re.sub(r"0x4", "0 x 4", text)
-    text = re.sub(r"0x5", "0 x 5", text)
-    text = re.sub(r"0x6", "0 x 6", text)
-    text = re.sub(r"0x7", "0 x 7", text)
-    text = re.sub(r"0x8", "0 x 8", text)
-    text = re.sub(r"0x9", "0 x 9", text)
-    
-    text = re.sub(r"1x0", "1 x 0", text)
-    text = re.sub(r"1x1", "1 x 1", text)
-    text = re.sub(r"1x2", "1 x 2", text)
-    text = re.sub(r"1x3", "1 x 3", text)
-    text = re.sub(r"1x4", "1 x 4", text)
-    text = re.sub(r"1x5", "1 x 5", text)
-    text = re.sub(r"1x6", "1 x 6", text)
-    text = re.sub(r"1x7", "1 x 7", text)
-    text = re.sub(r"1x8", "1 x 8", text)
-    text = re.sub(r"1x9", "1 x 9", text)
-    
-    text = re.sub(r"2x0", "2 x 0", text)
-    text = re.sub(r"2x1", "2 x 1", text)
-    text = re.sub(r"2x2", "2 x 2", text)
-    text = re.sub(r"2x3", "2 x 3", text)
-    text = re.sub(r"2x4", "2 x 4", text)
-    text = re.sub(r"2x5", "2 x 5", text)
-    text = re.sub(r"2x6", "2 x 6", text)
-    text = re.sub(r"2x7", "2 x 7", text)
-    text = re.sub(r"2x8", "2 x 8", text)
-    text = re.sub(r"2x9", "2 x 9", text)
-    
-    text = re.sub(r"3x0", "3 x 0", text)
-    text = re.sub(r"3x1", "3 x 1", text)
-    text = re.sub(r"3x2", "3 x 2", text)
-    text = re.sub(r"3x3", "3 x 3", text)
-    text = re.sub(r"3x4", "3 x 4", text)
-    text = re.sub(r"3x5", "3 x 5", text)
-    text = re.sub(r"3x6", "3 x 6", text)
-    text = re.sub(r"3x7", "3 x 7", text)
-    text = re.sub(r"3x8", "3 x 8", text)
-    text = re.sub(r"3x9", "3 x 9", text)
-    
-    text = re.sub(r"4x0", "4 x 0", text)
-    text = re.sub(r"4x1", "4 x 1", text)
-    text = re.sub(r"4x2", "4 x 2", text)
-    text = re.sub(r"4x3", "4 x 3", text)
-    text = re.sub(r"4x4", "4 x 4", text)
-    text = re.sub(r"4x5", "4 x 5", text)
-    text = re.sub(r"4x6", "4 x 6", text)
-    text = re.sub(r"4x7", "4 x 7", text)
-    text = re.sub(r"4x8", "4 x 8", text)
-    text = re.sub(r"4x9", "4 x 9", text)
-    
-    text = re.sub(r"5x0", "5 x 0", text)
-    text = re.sub(r"5x1", "5 x 1", text)
-    text = re.sub(r"5x2", "5 x 2", text)
-    text = re.sub(r"5x3", "5 x 3", text)
-    text = re.sub(r"5x4", "5 x 4", text)
-    text = re.sub(r"5x5", "5 x 5", text)
-    text = re.sub(r"5x6", "5 x 6", text)
-    text = re.sub(r"5x7", "5 x 7", text)
-    text = re.sub(r"5x8", "5 x 8", text)
-    text = re.sub(r"5x9", "5 x 9", text)
-    
-    text = re.sub(r"6x0", "6 x 0", text)
-    text = re.sub(r"6x1", "6 x 1", text)
-    text = re.sub(r"6x2", "6 x 2", text)
-    text = re.sub(r"6x3", "6 x 3", text)
-    text = re.sub(r"6x4", "6 x 4", text)
-    text = re.sub(r"6x5", "6 x 5", text)
-    text = re.sub(r"6x6", "6 x 6", text)
-    text = re.sub(r"6x7", "6 x 7", text)
-    text = re.sub(r"6x8", "6 x 8", text)
-    text = re.sub(r"6x9", "6 x 9", text)
-    
-    text = re.sub(r"1x0", "7 x 0", text)
-    text = re.sub(r"1x1", "7 x 1", text)
-    text = re.sub(r"1x2", "7 x 2", text)
-    text = re.sub(r"1x3", "7 x 3", text)
-    text = re.sub(r"1x4", "7 x 4", text)
-    text = re.sub(r"1x5", "7 x 5", text)
-    text = re.sub(r"1x6", "7 x 6", text)
-    text = re.sub(r"1x7", "7 x 7", text)
-    text = re.sub(r"1x8", "7 x 8", text)
-    text = re.sub(r"1x9", "7 x 9", text)
-    
-    text = re.sub(r"8x0", "8 x 0", text)
-    text = re.sub(r"8x1", "8 x 1", text)
-    text = re.sub(r"8x2", "8 x 2", text)
-    text = re.sub(r"8x3", "8 x 3", text)
-    text = re.sub(r"8x4", "8 x 4", text)
-    text = re.sub(r"8x5", "8 x 5", text)
-    text = re.sub(r"8x6", "8 x 6", text)
-    text = re.sub(r"8x7", "8 x 7", text)
-    text = re.sub(r"8x8", "8 x 8", text)
-    text = re.sub(r"8x9", "8 x 9", text)
-    
-    text = re.sub(r"9x0", "9 x 0", text)
-    text = re.sub(r"9x1", "9 x 1", text)
-    text = re.sub(r"9x2", "9 x 2", text)
-    text = re.sub(r"9x3", "9 x 3", text)
-    text = re.sub(r"9x4", "9 x 4", text)
-    text = re.sub(r"9x5", "9 x 5", text)
-    text = re.sub(r"9x6", "9 x 6", text)
-    text = re.sub(r"9x7", "9 x 7", text)
-    text = re.sub(r"9x8", "9 x 8", text)
-    text = re.sub(r"9x9", "9 x 9", text)
-    
-    text = re.sub(r"gx0", "g x 0", text)
-    text = re.sub(r"gx1", "g x 1", text)
-    text = re.sub(r"gx2", "g x 2", text)
-    text = re.sub(r"gx3", "g x 3", text)
-    text = re.sub(r"gx4", "g x 4", text)
-    text = re.sub(r"gx5", "g x 5", text)
-    text = re.sub(r"gx6", "g x 6", text)
-    text = re.sub(r"gx7", "g x 7", text)
-    text = re.sub(r"gx8", "g x 8", text)
-    text = re.sub(r"gx9", "g x 9", text)
-    
-    text = re.sub(r"gmx0", "g x 0", text)
-    text = re.sub(r"gmx1", "g x 1", text)
-    text = re.sub(r"gmx2", "g x 2", text)
-    text = re.sub(r"gmx3", "g x 3", text)
-    text = re.sub(r"gmx4", "g x 4", text)
-    text = re.sub(r"gmx5", "g x 5", text)
-    text = re.sub(r"gmx6", "g x 6", text)
-    text = re.sub(r"gmx7", "g x 7", text)
-    text = re.sub(r"gmx8", "g x 8", text)
-    text = re.sub(r"gmx9", "g x 9", text)
-    
-    text = re.sub(r"mlx0", "mL x 0", text)
-    text = re.sub(r"mlx1", "mL x 1", text)
-    text = re.sub(r"mlx2", "mL x 2", text)
-    text = re.sub(r"mlx3", "mL x 3", text)
-    text = re.sub(r"mlx4", "mL x 4", text)
-    text = re.sub(r"mlx5", "mL x 5", text)
-    text = re.sub(r"mlx6", "mL x 6", text)
-    text = re.sub(r"mlx7", "mL x 7", text)
-    text = re.sub(r"mlx8", "mL x 8", text)
-    text = re.sub(r"mlx9", "mL x 9", text)
-    
-    text = re.sub(r"xvial\b", " x vial", text)
-    
-    
-    
-    #Unit Conversions and Spacing
-    #BAU
-    text = re.sub(r"\bbau\b", "BAU", text)
-    text = re.sub(r"0bau\b", "0 BAU", text)
-    text = re.sub(r"1bau\b", "1 BAU", text)
-    text = re.sub(r"2bau\b", "2 BAU", text)
-    text = re.sub(r"3bau\b", "3 BAU", text)
-    text = re.sub(r"4bau\b", "4 BAU", text)
-    text = re.sub(r"5bau\b", "5 BAU", text)
-    text = re.sub(r"6bau\b", "6 BAU", text)
-    text = re.sub(r"7bau\b", "7 BAU", text)
-    text = re.sub(r"8bau\b", "8 BAU", text)
-    text = re.sub(r"9bau\b", "9 BAU", text)
-    
-    #CC
-    text = re.sub(r"\bcc\b", "CC", text)
-    
-    text = re.sub(r"0cc\b", "0 CC", text)
-    text = re.sub(r"1cc\b", "1 CC", text)
-    text = re.sub(r"2cc\b", "2 CC", text)
-    text = re.sub(r"3cc\b", "3 CC", text)
-    text = re.sub(r"4cc\b", "4 CC", text)
-    text = re.sub(r"5cc\b", "5 CC", text)
-    text = re.sub(r"6cc\b", "6 CC", text)
-    text = re.sub(r"7cc\b", "7 CC", text)
-    text = re.sub(r"8cc\b", "8 CC", text)
-    text = re.sub(r"9cc\b", "9 CC", text)
-    
-    #cartridge
-    
-    text = re.sub(r"\bcart(\.|\b)", "cartridge", text)
-    text = re.sub(r"\bcartr\b", "cartridge", text)
-    
-    text = re.sub(r"0cart\b", "0 cartridges", text)
-    text = re.sub(r"1cart\b", "1 cartridge", text)
-    text = re.sub(r"2cart\b", "2 cartridges", text)
-    text = re.sub(r"3cart\b", "3 cartridges", text)
-    text = re.sub(r"4cart\b", "4 cartridges", text)
-    text = re.sub(r"5cart\b", "5 cartridges", text)
-    text = re.sub(r"6cart\b", "6 cartridges", text)
-    text = re.sub(r"7cart\b", "7 cartridges", text)
-    text = re.sub(r"8cart\b", "8 cartridges", text)
-    text = re.sub(r"9cart\b", "9 cartridges", text)
-    text = re.sub(r"0cartr\b", "0 cartridges", text)
-    text = re.sub(r"1cartr\b", "1 cartridge", text)
-    text = re.sub(r"2cartr\b", "2 cartridges", text)
-    text = re.sub(r"3cartr\b", "3 cartridges", text)
-    text = re.sub(r"4cartr\b", "4 cartridges", text)
-    text = re.sub(r"5cartr\b", "5 cartridges", text)
-    text = re.sub(r"6cartr\b", "6 cartridges", text)
-    text = re.sub(r"7cartr\b", "7 cartridges", text)
-    text = re.sub(r"8cartr\b", "8 cartridges", text)
-    text = re.sub(r"9cartr\b", "9 cartridges", text)
-    
-    #C
-    text = re.sub(r"0ch\b", "0C", text)
-    text = re.sub(r"1ch\b", "1C", text)
-    text = re.sub(r"2ch\b", "2C", text)
-    text = re.sub(r"3ch\b", "3C", text)
-    text = re.sub(r"4ch\b", "4C", text)
-    text = re.sub(r"5ch\b", "5C", text)
-    text = re.sub(r"6ch\b", "6C", text)
-    text = re.sub(r"7ch\b", "7C", text)
-    text = re.sub(r"8ch\b", "8C", text)
-    text = re.sub(r"9ch\b", "9C", text)
-    text = re.sub(r"0 ch\b", "0C", text)
-    text = re.sub(r"1 ch\b", "1C", text)
-    text = re.sub(r"2 ch\b", "2C", text)
-    text = re.sub(r"3 ch\b", "3C", text)
-    text = re.sub(r"4 ch\b", "4C", text)
-    text = re.sub(r"5 ch\b", "5C", text)
-    text = re.sub(r"6 ch\b", "6C", text)
-    text = re.sub(r"7 ch\b", "7C", text)
-    text = re.sub(r"8 ch\b", "8C", text)
-    text = re.sub(r"9 ch\b", "9C", text)
-    
-    #cm
-    text = re.sub(r"0cm\b", "0 cm", text)
-    text = re.sub(r"1cm\b", "1 cm", text)
-    text = re.sub(r"2cm\b", "2 cm", text)
-    text = re.sub(r"3cm\b", "3 cm", text)
-    text = re.sub(r"4cm\b", "4 cm", text)
-    text = re.sub(r"5cm\b", "5 cm", text)
-    text = re.sub(r"6cm\b", "6 cm", text)
-    text = re.sub(r"7cm\b", "7 cm", text)
-    text = re.sub(r"8cm\b", "8 cm", text)
-    text = re.sub(r"9cm\b", "9 cm", text)
-    
-    #D
-    text = re.sub(r"0dh\b", "0D", text)
-    text = re.sub(r"1dh\b", "1D", text)
-    text = re.sub(r"2dh\b", "2D", text)
-    text = re.sub(r"3dh\b", "3D", text)
-    text = re.sub(r"4dh\b", "4D", text)
-    text = re.sub(r"5dh\b", "5D", text)
-    text = re.sub(r"6dh\b", "6D", text)
-    text = re.sub(r"7dh\b", "7D", text)
-    text = re.sub(r"8dh\b", "8D", text)
-    text = re.sub(r"9dh\b", "9D", text)
-    text = re.sub(r"0 dh\b", "0D", text)
-    text = re.sub(r"1 dh\b", "1D", text)
-    text = re.sub(r"2 dh\b", "2D", text)
-    text = re.sub(r"3 dh\b", "3D", text)
-    text = re.sub(r"4 dh\b", "4D", text)
-    text = re.sub(r"5 dh\b", "5D", text)
-    text = re.sub(r"6 dh\b", "6D", text)
-    text = re.sub(r"7 dh\b", "7D", text)
-    text = re.sub(r"8 dh\b", "8D", text)
-    text = re.sub(r"9 dh\b", "9D", text)
-    
-    #each
-    text = re.sub(r"\bea\b", "each", text)
-    
-    text = re.sub(r"0ea\b", "0 each", text)
-    text = re.sub(r"1ea\b", "1 each", text)
-    text = re.sub(r"2ea\b", "2 each", text)
-    text = re.sub(r"3ea\b", "3 each", text)
-    text = re.sub(r"4ea\b", "4 each", text)
-    text = re.sub(r"5ea\b", "5 each", text)
-    text = re.sub(r"6ea\b", "6 each", text)
-    text = re.sub(r"7ea\b", "7 each", text)
-    text = re.sub(r"8ea\b", "8 each", text)
-    text = re.sub(r"9ea\b", "9 each", text)
-    
-    #g
-    text = re.sub(r"\bgm\b", "g", text)
-    text = re.sub(r"\bgram\b", "g", text)
-    text = re.sub(r"\bgramme\b", "g", text)
-    text = re.sub(r"\bgrammes\b", "g", text)
-    
-    text = re.sub(r"0g\b", "0 g", text)
-    text = re.sub(r"1g\b", "1 g", text)
-    text = re.sub(r"2g\b", "2 g", text)
-    text = re.sub(r"3g\b", "3 g", text)
-    text = re.sub(r"4g\b", "4 g", text)
-    text = re.sub(r"5g\b", "5 g", text)
-    text = re.sub(r"6g\b", "6 g", text)
-    text = re.sub(r"7g\b", "7 g", text)
-    text = re.sub(r"8g\b", "8 g", text)
-    text = re.sub(r"9g\b", "9 g", text)
-    text = re.sub(r"0gm\b", "0 g", text)
-    text = re.sub(r"1gm\b", "1 g", text)
-    text = re.sub(r"2gm\b", "2 g", text)
-    text = re.sub(r"3gm\b", "3 g", text)
-    text = re.sub(r"4gm\b", "4 g", text)
-    text = re.sub(r"5gm\b", "5 g", text)
-    text = re.sub(r"6gm\b", "6 g", text)
-    text = re.sub(r"7gm\b", "7 g", text)
-    text = re.sub(r"8gm\b", "8 g", text)
-    text = re.sub(r"9gm\b", "9 g", text)
-    text = re.sub(r"0gram\b", "0 g", text)
-    text = re.sub(r"1gram\b", "1 g", text)
-    text = re.sub(r"2gram\b", "2 g", text)
-    text = re.sub(r"3gram\b", "3 g", text)
-    text = re.sub(r"4gram\b", "4 g", text)
-    text = re.sub(r"5gram\b", "5 g", text)
-    text = re.sub(r"6gram\b", "6 g", text)
-    text = re.sub(r"7gram\b", "7 g", text)
-    text = re.sub(r"8gram\b", "8 g", text)
-    text = re.sub(r"9gram\b", "9 g", text)
-    
-    #fl. oz.
-    text = re.sub(r"\bfl(\.|\b)", "fl.", text)
-    text = re.sub(r"\bfloz(\.|\b)", "fl. oz.", text)
-    text = re.sub(r"\bfl\.oz\.", "fl. oz.", text)
-    
-    text = re.sub(r"0fl(\.|\b)", "0 fl.", text)
-    text = re.sub(r"1fl(\.|\b)", "1 fl.", text)
-    text = re.sub(r"2fl(\.|\b)", "2 fl.", text)
-    text = re.sub(r"3fl(\.|\b)", "3 fl.", text)
-    text = re.sub(r"4fl(\.|\b)", "4 fl.", text)
-    text = re.sub(r"5fl(\.|\b)", "5 fl.", text)
-    text = re.sub(r"6fl(\.|\b)", "6 fl.", text)
-    text = re.sub(r"7fl(\.|\b)", "7 fl.", text)
-    text = re.sub(r"8fl(\.|\b)", "8 fl.", text)
-    text = re.sub(r"9fl(\.|\b)", "9 fl.", text)
-    
-    #gal.
-    text = re.sub(r"\bgal(\.|\b)", "gal.", text)
-    text = re.sub(r"\bgallons\b", "gal.", text)
-    
-    text = re.sub(r"0gal(\.|\b)", "0 gal.", text)
-    text = re.sub(r"1gal(\.|\b)", "1 gal.", text)
-    text = re.sub(r"2gal(\.|\b)", "2 gal.", text)
-    text = re.sub(r"3gal(\.|\b)", "3 gal.", text)
-    text = re.sub(r"4gal(\.|\b)", "4 gal.", text)
-    text = re.sub(r"5gal(\.|\b)", "5 gal.", text)
-    text = re.sub(r"6gal(\.|\b)", "6 gal.", text)
-    text = re.sub(r"7gal(\.|\b)", "7 gal.", text)
-    text = re.sub(r"8gal(\.|\b)", "8 gal.", text)
-    text = re.sub(r"9gal(\.|\b)", "9 gal.", text)
-    text = re.sub(r"0gals(\.|\b)", "0 gal.", text)
-    text = re.sub(r"1gals(\.|\b)", "1 gal.", text)
-    text = re.sub(r"2gals(\.|\b)", "2 gal.", text)
-    text = re.sub(r"3gals(\.|\b)", "3 gal.", text)
-    text = re.sub(r"4gals(\.|\b)", "4 gal.", text)
-    text = re.sub(r"5gals(\.|\b)", "5 gal.", text)
-    text = re.sub(r"6gals(\.|\b)", "6 gal.", text)
-    text = re.sub(r"7gals(\.|\b)", "7 gal.", text)
-    text = re.sub(r"8gals(\.|\b)", "8 gal.", text)
-    text = re.sub(r"9gals(\.|\b)", "9 gal.", text)
-    text = re.sub(r"0gallon(\.|\b)", "0 gal.", text)
-    text = re.sub(r"1gallon(\.|\b)", "0 gal.", text)
-    text = re.sub(r"5gallon(\.|\b)", "5 gal.", text)
-    
-    #IU
-    text = re.sub(r"\biu\b", "IU", text)
-    text = re.sub(r"0iu\b", "0 IU", text)
-    text = re.sub(r"1iu\b", "1 IU", text)
-    text = re.sub(r"2iu\b", "2 IU", text)
-    text = re.sub(r"3iu\b", "3 IU", text)
-    text = re.sub(r"4iu\b", "4 IU", text)
-    text = re.sub(r"5iu\b", "5 IU", text)
-    text = re.sub(r"6iu\b", "6 IU", text)
-    text = re.sub(r"7iu\b", "7 IU", text)
-    text = re.sub(r"8iu\b", "8 IU", text)
-    text = re.sub(r"9iu\b", "9 IU", text)
-    text = re.sub(r"\bi\.u\.", "IU", text)
-    text = re.sub(r"0i\.u\.", "0 IU", text)
-    text = re.sub(r"1i\.u\.", "1 IU", text)
-    text = re.sub(r"2i\.u\.", "2 IU", text)
-    text = re.sub(r"3i\.u\.", "3 IU", text)
-    text = re.sub(r"4i\.u\.", "4 IU", text)
-    text = re.sub(r"5i\.u\.", "5 IU", text)
-    text = re.sub(r"6i\.u\.", "6 IU", text)
-    text = re.sub(r"7i\.u\.", "7 IU", text)
-    text = re.sub(r"8i\.u\.", "8 IU", text)
-    text = re.sub(r"9i\.u\.", "9 IU", text)
-    
-    #kg
-    text = re.sub(r"0kg\b", "0 kg", text)
-    text = re.sub(r"1kg\b", "1 kg", text)
-    text = re.sub(r"2kg\b", "2 kg", text)
-    text = re.sub(r"3kg\b", "3 kg", text)
-    text = re.sub(r"4kg\b", "4 kg", text)
-    text = re.sub(r"5kg\b", "5 kg", text)
-    text = re.sub(r"6kg\b", "6 kg", text)
-    text = re.sub(r"7kg\b", "7 kg", text)
-    text = re.sub(r"8kg\b", "8 kg", text)
-    text = re.sub(r"9kg\b", "9 kg", text)
-    
-    #L
-    text = re.sub(r"\bl\b", "L", text)
-    text = re.sub(r"\bltrs\b", "L", text)
-    
-    text = re.sub(r"0l\b", "0 L", text)
-    text = re.sub(r"1l\b", "1 L", text)
-    text = re.sub(r"2l\b", "2 L", text)
-    text = re.sub(r"3l\b", "3 L", text)
-    text = re.sub(r"4l\b", "4 L", text)
-    text = re.sub(r"5l\b", "5 L", text)
-    text = re.sub(r"6l\b", "6 L", text)
-    text = re.sub(r"7l\b", "7 L", text)
-    text = re.sub(r"8l\b", "8 L", text)
-    text = re.sub(r"9l\b", "9 L", text)
-    
-    text = re.sub(r"3litre\b", "3 L", text)
-    
-    text = re.sub(r"4litres\b", "4 L", text)
-    
-    #lbs.
-    text = re.sub(r"\blbs(\.|\b)", "0 lbs.", text)
-    text = re.sub(r"\blb(\.|\b)", "0 lbs.", text)
-    
-    text = re.sub(r"0lb(\.|\b)", "0 lbs.", text)
-    text = re.sub(r"1lb(\.|\b)", "1 lbs.", text)
-    text = re.sub(r"2lb(\.|\b)", "2 lbs.", text)
-    text = re.sub(r"3lb(\.|\b)", "3 lbs.", text)
-    text = re.sub(r"4lb(\.|\b)", "4 lbs.", text)
-    text = re.sub(r"5lb(\.|\b)", "5 lbs.", text)
-    text = re.sub(r"6lb(\.|\b)", "6 lbs.", text)
-    text = re.sub(r"7lb(\.|\b)", "7 lbs.", text)
-    text = re.sub(r"8lb(\.|\b)", "8 lbs.", text)
-    text = re.sub(r"9lb(\.|\b)", "9 lbs.", text)
-    text = re.sub(r"0lbs(\.|\b)", "0 lbs.", text)
-    text = re.sub(r"1lbs(\.|\b)", "1 lbs.", text)
-    text = re.sub(r"2lbs(\.|\b)", "2 lbs.", text)
-    text = re.sub(r"3lbs(\.|\b)", "3 lbs.", text)
-    text = re.sub(r"4lbs(\.|\b)", "4 lbs.", text)
-    text = re.sub(r"5lbs(\.|\b)", "5 lbs.", text)
-    text = re.sub(r"6lbs(\.|\b)", "6 lbs.", text)
-    text = re.sub(r"7lbs(\.|\b)", "7 lbs.", text)
-    text = re.sub(r"8lbs(\.|\b)", "8 lbs.", text)
-    text = re.sub(r"9lbs(\.|\b)", "9 lbs.", text)
-    
-    #mcg
-    text = re.sub(r"0mcg\b", "0 mcg", text)
-    text = re.sub(r"1mcg\b", "1 mcg", text)
-    text = re.sub(r"2mcg\b", "2 mcg", text)
-    text = re.sub(r"3mcg\b", "3 mcg", text)
-    text = re.sub(r"4mcg\b", "4 mcg", text)
-    text = re.sub(r"5mcg\b", "5 mcg", text)
-    text = re.sub(r"6mcg\b", "6 mcg", text)
-    text = re.sub(r"7mcg\b", "7 mcg", text)
-    text = re.sub(r"8mcg\b", "8 mcg", text)
-    text = re.sub(r"9mcg\b", "9 mcg", text)
-    
-    #mEq
-    text = re.sub(r"\bmeq\b", "mEq", text)
-    text = re.sub(r"0meq\b", "0 mEq", text)
-    text = re.sub(r"1meq\b", "1 mEq", text)
-    text = re.sub(r"2meq\b", "2 mEq", text)
-    text = re.sub(r"3meq\b", "3 mEq", text)
-    text = re.sub(r"4meq\b", "4 mEq", text)
-    text = re.sub(r"5meq\b", "5 mEq", text)
-    text = re.sub(r"6meq\b", "6 mEq", text)
-    text = re.sub(r"7meq\b", "7 mEq", text)
-    text = re.sub(r"8meq\b", "8 mEq", text)
-    text = re.sub(r"9meq\b", "9 mEq", text)
-    
-    #mg
-    text = re.sub(r"0mg\b", "0 mg", text)
-    text = re.sub(r"1mg\b", "1 mg", text)
-    text = re.sub(r"2mg\b", "2 mg", text)
-    text = re.sub(r"3mg\b", "3 mg", text)
-    text = re.sub(r"4mg\b", "4 mg", text)
-    text = re.sub(r"5mg\b", "5 mg", text)
-    text = re.sub(r"6mg\b", "6 mg", text)
-    text = re.sub(r"7mg\b", "7 mg", text)
-    text = re.sub(r"8mg\b", "8 mg", text)
-    text = re.sub(r"9mg\b", "9 mg", text)
-    
-    #mL
-    text = re.sub(r"\bml\b", "mL", text)
-    text = re.sub(r"\bmls\b", "mL", text)
-    
-    text = re.sub(r"0ml\b", "0 mL", text)
-    text = re.sub(r"1ml\b", "1 mL", text)
-    text = re.sub(r"2ml\b", "2 mL", text)
-    text = re.sub(r"3ml\b", "3 mL", text)
-    text = re.sub(r"4ml\b", "4 mL", text)
-    text = re.sub(r"5ml\b", "5 mL", text)
-    text = re.sub(r"6ml\b", "6 mL", text)
-    text = re.sub(r"7ml\b", "7 mL", text)
-    text = re.sub(r"8ml\b", "8 mL", text)
-    text = re.sub(r"9ml\b", "9 mL", text)
-    
-    #mmol
-    text = re.sub(r"0mmol\b", "0 mmol", text)
-    text = re.sub(r"1mmol\b", "1 mmol", text)
-    text = re.sub(r"2mmol\b", "2 mmol", text)
-    text = re.sub(r"3mmol\b", "3 mmol", text)
-    text = re.sub(r"4mmol\b", "4 mmol", text)
-    text = re.sub(r"5mmol\b", "5 mmol", text)
-    text = re.sub(r"6mmol\b", "6 mmol", text)
-    text = re.sub(r"7mmol\b", "7 mmol", text)
-    text = re.sub(r"8mmol\b", "8 mmol", text)
-    text = re.sub(r"9mmol\b", "9 mmol", text)
-    text = re.sub(r"\bmmols\b", "mmol", text)
-    text = re.sub(r"0mmols\b", "0 mmol", text)
-    text = re.sub(r"1mmols\b", "1 mmol", text)
-    text = re.sub(r"2mmols\b", "2 mmol", text)
-    text = re.sub(r"3mmols\b", "3 mmol", text)
-    text = re.sub(r"4mmols\b", "4 mmol", text)
-    text = re.sub(r"5mmols\b", "5 mmol", text)
-    text = re.sub(r"6mmols\b", "6 mmol", text)
-    text = re.sub(r"7mmols\b", "7 mmol", text)
-    text = re.sub(r"8mmols\b", "8 mmol", text)
-    text = re.sub(r"9mmols\b", "9 mmol", text)
-    
-    #oz.
-    text = re.sub(r"\boz(\.|\b)", "oz.", text)
-    text = re.sub(r"\bozs(\.|\b)", "oz.", text)
-    text = re.sub(r"\bounce\b", "oz.", text)
-    
-    text = re.sub(r"0oz(\.|\b)", "0 oz.", text)
-    text = re.sub(r"1oz(\.|\b)", "1 oz.", text)
-    text = re.sub(r"2oz(\.|\b)", "2 oz.", text)
-    text = re.sub(r"3oz(\.|\b)", "3 oz.", text)
-    text = re.sub(r"4oz(\.|\b)", "4 oz.", text)
-    text = re.sub(r"5oz(\.|\b)", "5 oz.", text)
-    text = re.sub(r"6oz(\.|\b)", "6 oz.", text)
-    text = re.sub(r"7oz(\.|\b)", "7 oz.", text)
-    text = re.sub(r"8oz(\.|\b)", "8 oz.", text)
-    text = re.sub(r"9oz(\.|\b)", "9 oz.", text)
-    
-    #pt.
-    text = re.sub(r"\bpt(\.|\b)", "pt.", text)
-    
-    text = re.sub(r"0pt(\.|\b)", "0 pt.", text)
-    text = re.sub(r"1pt(\.|\b)", "1 pt.", text)
-    text = re.sub(r"2pt(\.|\b)", "2 pt.", text)
-    text = re.sub(r"3pt(\.|\b)", "3 pt.", text)
-    text = re.sub(r"4pt(\.|\b)", "4 pt.", text)
-    text = re.sub(r"5pt(\.|\b)", "5 pt.", text)
-    text = re.sub(r"6pt(\.|\b)", "6 pt.", text)
-    text = re.sub(r"7pt(\.|\b)", "7 pt.", text)
-    text = re.sub(r"8pt(\.|\b)", "8 pt.", text)
-    text = re.sub(r"9pt(\.|\b)", "9 pt.", text)
-    text = re.sub(r"0pnt(\.|\b)", "0 pt.", text)
-    text = re.sub(r"1pnt(\.|\b)", "1 pt.", text)
-    text = re.sub(r"2pnt(\.|\b)", "2 pt.", text)
-    text = re.sub(r"3pnt(\.|\b)", "3 pt.", text)
-    text = re.sub(r"4pnt(\.|\b)", "4 pt.", text)
-    text = re.sub(r"5pnt(\.|\b)", "5 pt.", text)
-    text = re.sub(r"6pnt(\.|\b)", "6 pt.", text)
-    text = re.sub(r"7pnt(\.|\b)", "7 pt.", text)
-    text = re.sub(r"8pnt(\.|\b)", "8 pt.", text)
-    text = re.sub(r"9pnt(\.|\b)", "9 pt.", text)
-    
-    #PSI
-    text = re.sub(r"\bpsi\b", "PSI", text)
-    
-    #qt.
-    text = re.sub(r"\bqt(\.|\b)", "qt.", text)
-    text = re.sub(r"\bquart\b", "qt.", text)
-    
-    text = re.sub(r"0qt(\.|\b)", "0 qt.", text)
-    text = re.sub(r"1qt(\.|\b)", "1 qt.", text)
-    text = re.sub(r"2qt(\.|\b)", "2 qt.", text)
-    text = re.sub(r"3qt(\.|\b)", "3 qt.", text)
-    text = re.sub(r"4qt(\.|\b)", "4 qt.", text)
-    text = re.sub(r"5qt(\.|\b)", "5 qt.", text)
-    text = re.sub(r"6qt(\.|\b)", "6 qt.", text)
-    text = re.sub(r"7qt(\.|\b)", "7 qt.", text)
-    text = re.sub(r"8qt(\.|\b)", "8 qt.", text)
-    text = re.sub(r"9qt(\.|\b)", "9 qt.", text)
-    
-    #tablet(s)
-    text = re.sub(r"\btab(\.|\b)", "tablet", text)
-    text = re.sub(r"\btabs(\.|\b)", "tablets", text)
-    
-    text = re.sub(r"0tab\b", "0 tablet", text)
-    text = re.sub(r"1tab\b", "1 tablet", text)
-    text = re.sub(r"2tab\b", "2 tablet", text)
-    text = re.sub(r"3tab\b", "3 tablet", text)
-    text = re.sub(r"4tab\b", "4 tablet", text)
-    text = re.sub(r"5tab\b", "5 tablet", text)
-    text = re.sub(r"6tab\b", "6 tablet", text)
-    text = re.sub(r"7tab\b", "7 tablet", text)
-    text = re.sub(r"8tab\b", "8 tablet", text)
-    text = re.sub(r"9tab\b", "9 tablet", text)
-    text = re.sub(r"0tabs\b", "0tablets", text)
-    text = re.sub(r"1tabs\b", "1tablets", text)
-    text = re.sub(r"2tabs\b", "2tablets", text)
-    text = re.sub(r"3tabs\b", "3tablets", text)
-    text = re.sub(r"4tabs\b", "4tablets", text)
-    text = re.sub(r"5tabs\b", "5tablets", text)
-    text = re.sub(r"6tabs\b", "6tablets", text)
-    text = re.sub(r"7tabs\b", "7tablets", text)
-    text = re.sub(r"8tabs\b", "8tablets", text)
-    text = re.sub(r"9tabs\b", "9tablets", text)
-    text = re.sub(r"0tablets\b", "0 tablets", text)
-    
-    #UI
-    text = re.sub(r"\bui\b", "UI", text)
-    text = re.sub(r"0ui\b", "0 UI", text)
-    text = re.sub(r"1ui\b", "1 UI", text)
-    text = re.sub(r"2ui\b", "2 UI", text)
-    text = re.sub(r"3ui\b", "3 UI", text)
-    text = re.sub(r"4ui\b", "4 UI", text)
-    text = re.sub(r"5ui\b", "5 UI", text)
-    text = re.sub(r"6ui\b", "6 UI", text)
-    text = re.sub(r"7ui\b", "7 UI", text)
-    text = re.sub(r"8ui\b", "8 UI", text)
-    text = re.sub(r"9ui\b", "9 UI", text)
-    text = re.sub(r"\bu\.i(\.|\b)", "UI", text)
-    text = re.sub(r"0u\.i\.\b", "0 UI", text)
-    text = re.sub(r"1u\.i\.\b", "1 UI", text)
-    text = re.sub(r"2u\.i\.\b", "2 UI", text)
-    text = re.sub(r"3u\.i\.\b", "3 UI", text)
-    text = re.sub(r"4u\.i\.\b", "4 UI", text)
-    text = re.sub(r"5u\.i\.\b", "5 UI", text)
-    text = re.sub(r"6u\.i\.\b", "6 UI", text)
-    text = re.sub(r"7u\.i\.\b", "7 UI", text)
-    text = re.sub(r"8u\.i\.\b", "8 UI", text)
-    text = re.sub(r"9u\.i\.\b", "9 UI", text)
-    
-    #units
-    text = re.sub(r"0u\b", "0 units", text)
-    text = re.sub(r"0units\b", "0 units", text)
-    text = re.sub(r"1units\b", "1 units", text)
-    text = re.sub(r"2units\b", "2 units", text)
-    text = re.sub(r"3units\b", "3 units", text)
-    text = re.sub(r"4units\b", "4 units", text)
-    text = re.sub(r"5units\b", "5 units", text)
-    text = re.sub(r"6units\b", "6 units", text)
-    text = re.sub(r"7units\b", "7 units", text)
-    text = re.sub(r"8units\b", "8 units", text)
-    text = re.sub(r"9units\b", "9 units", text)
-    text = re.sub(r"0unit\b", "0 unit", text)
-    text = re.sub(r"1unit\b", "1 unit", text)
-    text = re.sub(r"2unit\b", "2 unit", text)
-    text = re.sub(r"3unit\b", "3 unit", text)
-    text = re.sub(r"4unit\b", "4 unit", text)
-    text = re.sub(r"5unit\b", "5 unit", text)
-    text = re.sub(r"6unit\b", "6 unit", text)
-    text = re.sub(r"7unit\b", "7 unit", text)
-    text = re.sub(r"8unit\b", "8 unit", text)
-    text = re.sub(r"9unit\b", "9 unit", text)
-    
-    
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    #0
-    text = re.sub(r"^.$", "", text)
-    text = re.sub(r"^.0", "0.0", text)
-    text = re.sub(r"^.1", "0.1", text)
-    text = re.sub(r"^.2", "0.2", text)
-    text = re.sub(r"^.3", "0.3", text)
-    text = re.sub(r"^.4", "0.4", text)
-    text = re.sub(r"^.5", "0.5", text)
-    text = re.sub(r"^.6", "0.6", text)
-    text = re.sub(r"^.7", "0.7", text)
-    text = re.sub(r"^.8", "0.8", text)
-    text = re.sub(r"^.9", "0.9", text)
-    text = re.sub(r"\.\.", ".", text)
-    text = re.sub(r"\b1mifep\.", "1 mifepristone", text)
-    text = re.sub(r"\b10amp/10tab\b", "10 ampoules/10 tablets", text)
-    text = re.sub(r"\b10ampx1 mL\b", "10 ampoules x 1 mL", text)
-    text = re.sub(r"\b10clips (100 imp)\b", "10 clipes (100 imp)", text)
-    text = re.sub(r"\b10clips (100imp)\b", "10 clips (100 imp)", text)
-    text = re.sub(r"\b10cones\b", "10 cones", text)
-    text = re.sub(r"\b10m\si\.u\b", "10 million IU", text)
-    text = re.sub(r"\b10mlvial\b", "10 mL vial", text)
-    text = re.sub(r"\b10pck\b", "10 pack", text)
-    text = re.sub(r"\b10pouches\b", "10 pouches", text)
-    text = re.sub(r"\b10sup\b", "10 suppositories", text)
-    text = re.sub(r"\b10vials\b", "10 vials", text)
-    text = re.sub(r"\b12mgfluoc acet\b", "12 mg fluocinolone acetate", text)
-    text = re.sub(r"\b30mlpump\b", "30 mL pump", text)
-    text = re.sub(r"\b30mltube\b", "30 mL tube", text)
-    
-    #A
-    text = re.sub(r"\badminstered\b", "administered", text)
-    text = re.sub(r"\balchol\b", "alcohol", text)
-    text = re.sub(r"0allergan\b", "0 Allergan", text)
-    text = re.sub(r"\ba\.s\.a\b", "ASA", text)
-    text = re.sub(r"\basa\b", "ASA", text)
-    
-    #B
-    text = re.sub(r"\bb\b", "B", text)
-    text = re.sub(r"\bb\.p\.\b", "BP", text)
-    text = re.sub(r"\bbp\b", "BP", text)
-    text = re.sub(r"\bbacterio static \b", "bacteriostatic ", text)
-    text = re.sub(r"\bblspk\b", "blister pack", text)
-    text = re.sub(r"\bblstr\b", "blister pack", text)
-    text = re.sub(r"\bblisterpack\b", "blister pack", text)
-    text = re.sub(r"\bboc\b", "boceprevir", text)
-    text = re.sub(r"\bboite\b", u"bo\u00EEte", text)
-    text = re.sub(r"\bbol(\.|\b)", "boluses", text)
-    text = re.sub(r"\bbott\b", "bottle", text)
-    text = re.sub(r"\bbottl\b", "bottle", text)
-    text = re.sub(r"\bbottlte\b", "bottle", text)
-    text = re.sub(r"\bbufffer\b", "buffer", text)
-    text = re.sub(r"\bbtl\b", "bottle", text)
-    text = re.sub(r"\bbtls\b", "bottles", text)
-    text = re.sub(r"\bbtle\b", "bottle", text)
-    text = re.sub(r"\bbx\b", "box", text)
-    text = re.sub(r"\bbxes\b", "boxes", text)
-    text = re.sub(r"\bbxs\b", "boxes", text)
-    
-    #C
-    text = re.sub(r"\bc\b", "C", text)
-    text = re.sub(r"\bcapl(\.|\b)", "caplets", text)
-    text = re.sub(r"\bcapsulse\b", "capsules", text)
-    text = re.sub(r"\bcapusles\b", "capsules", text)
-    text = re.sub(r"\bcartns\b", "cartons", text)
-    text = re.sub(r"\bcaverject\b", "Caverject", text)
-    text = re.sub(r"\bcip\b", "CIP", text)
-    text = re.sub(r"\bcomprimes\b", u"comprim\u00E9s", text)
-    text = re.sub(r"\bcomprime\b", u"comprim\u00E9", text)
-    text = re.sub(r"\bconcertrate\b", "concentrate", text)
-    text = re.sub(r"\bcontinous\b", "continuous", text)
-    text = re.sub(r"\bcrtn\b", "carton", text)
-    text = re.sub(r"\bcrtns\b", "cartons", text)
-    text = re.sub(r"\bcs\b", "case", text)
-    text = re.sub(r"\bcse\b", "case", text)
-    text = re.sub(r"\bcst\b", "CST", text)
-    text = re.sub(r"\bcwy\b", "CWY", text)
-    text = re.sub(r"\bcyl\.", "cylinder", text)
-    
-    #D
-    text = re.sub(r"\bdiclofenace\b", "diclofenac", text)
-    text = re.sub(r"\bdil\b", "diluent", text)
-    text = re.sub(r"\bdiluant\b", "diluent", text)
-    text = re.sub(r"\bdin\b", "DIN", text)
-    text = re.sub(r"\bdins\b", "DIN", text)
-    text = re.sub(r"\bdispensor\b", "dispenser", text)
-    text = re.sub(r"\bdna\b", "DNA", text)
-    text = re.sub(r"\bdos\b", "dose", text)
-    text = re.sub(r"\bds\b", "dose", text)
-    
-    #E
-    text = re.sub(r"\bea\b", "each", text)
-    text = re.sub(r"\belizir\b", "elixir", text)
-    text = re.sub(r"\bepr\b", "EPR", text)
-    text = re.sub(r"\bextentabs\b", "Extentabs", text)
-    
-    #F
-    text = re.sub(r"\bfd\s&\sc\b", "FD&C", text)
-    text = re.sub(r"\bffu\b", "FFU", text)
-    text = re.sub(r"\bflextouch\b", "FlexTouch", text)
-    text = re.sub(r"\bforil\b", "foil", text)
-    
-    #G
-    text = re.sub(r"\bgm\b", "g", text)
-    text = re.sub(r"\bgoquick\b", "GoQuick", text)
-    text = re.sub(r"\bgroupe\sessaim\b", "Groupe Essaim", text)
-    
-    #H
-    text = re.sub(r"\bhandihaler\b", "HandiHaler", text)
-    text = re.sub(r"\bhcl\b", "HCl", text)
-    text = re.sub(r"\bhdpe\b", "HDPE", text)
-    text = re.sub(r"\bhfsh\b", "HFSH", text)
-    text = re.sub(r"\bhlh\b", "HLH", text)
-    text = re.sub(r"\bhpde\b", "HDPE", text)
-    
-    #I
-    text = re.sub(r"\bi\.m(\.|\b)", "IM", text)
-    text = re.sub(r"\bi\.v\.", "IV", text)
-    text = re.sub(r"\bia\b", "IA", text)
-    text = re.sub(r"\bim\b", "IM", text)
-    text = re.sub(r"\binc(\.|\b)", "Inc.", text)
-    text = re.sub(r"\bincartons\b", "in cartons", text)
-    text = re.sub(r"\binf(\.|\b)", "infusion", text)
-    text = re.sub(r"\binsrt\b", "insert", text)
-    text = re.sub(r"\binj(\.|\b)", "injection", text)
-    text = re.sub(r"\biosan\b", "Iosan", text)
-    text = re.sub(r"\bir\b", "IR", text)
-    text = re.sub(r"\biu\b", "IU", text)
-    text = re.sub(r"\biv\b", "IV", text)
-    
-    #J
-    
-    #K
-    text = re.sub(r"\bkwikpen\b", "KwikPen", text)
-    
-    #L
-    text = re.sub(r"\bliq(\.|\b)", "liquid", text)
-    text = re.sub(r"\bliquid\scont\b", "liquid concentrate", text)
-    text = re.sub(r"\bloz(\.|\b)", "lozenge", text)
-    
-    #M
-    text = re.sub(r"\bmcneil\b", "McNeil", text)
-    text = re.sub(r"\bmisop\.", "misoprostol", text)
-    text = re.sub(r"\bminiquick\b", "MiniQuick", text)
-    text = re.sub(r"\bmlsyringes\b", "mL syringes", text)
-    text = re.sub(r"\bmultiv\.", "multivitamin", text)
-    
-    #N
-    text = re.sub(r"\bnhp\b", "NHP", text)
-    text = re.sub(r"\bnightime\b", "nighttime", text)
-    text = re.sub(r"\bnigth\b", "night", text)
-    
-    #O
-    text = re.sub(r"\boint\b", "ointment", text)
-    text = re.sub(r"\bonabotulinumtoxina\b", "onabotulinumtoxinA", text)
-    text = re.sub(r"\bOpticlik\b", "OptiClik", text)
-    text = re.sub(r"\bOptiset\b", "OptiSet", text)
-    
-    #P
-    text = re.sub(r"\bpackg\b", "package", text)
-    text = re.sub(r"\bpck\b", "pack", text)
-    text = re.sub(r"\bpfs\b", "PFS", text)
-    text = re.sub(r"\bpkgs\b", "packages", text)
-    text = re.sub(r"\bperact\b", "Peract", text)
-    text = re.sub(r"\bpharmachoice\b", "PharmaChoice", text)
-    text = re.sub(r"\bpharmasave\b", "Pharmasave", text)
-    text = re.sub(r"\bpolynebs\b", "Polynebs", text)
-    text = re.sub(r"\bprepodyne\b", "Prepodyne", text)
-    text = re.sub(r"\bprice\swatchers\b", "Private Watchers", text)
-    text = re.sub(r"\bprivate\slabel\b", "Private Label", text)
-    text = re.sub(r"\bprovidone\b", "povidone", text)
-    text = re.sub(r"\bpws\b", "powder", text)
-    text = re.sub(r"\bpwr\b", "powder", text)
-    
-    #Q
-    
-    #R
-    text = re.sub(r"\brasberry\b", "raspberry", text)
-    text = re.sub(r"\brbv\b", "ribavirin", text)
-    text = re.sub(r"\breconst\.", "reconstituted", text)
-    text = re.sub(r"\breconstitutn\b", "reconstitution", text)
-    text = re.sub(r"\bredipen\b", "Redipen", text)
-    text = re.sub(r"\brosey\b", "Rosey", text)
-    text = re.sub(r"\brexall\b", "Rexall", text)
-    
-    #S
-    text = re.sub(r"\bs\.c\.", "SC", text)
-    text = re.sub(r"\bsafeway\b", "Safeway", text)
-    text = re.sub(r"\bsc\b", "SC", text)
-    text = re.sub(r"\bshm b\b", "shampoo bottle", text)
-    text = re.sub(r"\bsmartpack\b", "SmartPak", text)
-    text = re.sub(r"\bsmartpak\b", "SmartPak", text)
-    text = re.sub(r"\bsobey's\b", "Sobey's", text)
-    text = re.sub(r"\bsofgels\b", "Softgels", text)
-    text = re.sub(r"\bsoftgels\b", "Softgels", text)
-    text = re.sub(r"\bsolostar\b", "SoloSTAR", text)
-    text = re.sub(r"\bspf\b", "SPF", text)
-    text = re.sub(r"\bspf2", "SPF 2", text)
-    text = re.sub(r"\bsrc\b", "sustained-release capsule", text)
-    text = re.sub(r"\bstandrdzd \b", "standardized", text)
-    text = re.sub(r"\bstndcat\b", "standardized cat", text)
-    text = re.sub(r"\bster(\.|\b)", "Sterinebs", text)
-    text = re.sub(r"\bsterinebs\b", "Sterinebs", text)
-    text = re.sub(r"\bstri\b", "strip", text)
-    text = re.sub(r"\bsunfresh\b", "Sunfresh", text)
-    
-    #T
-    text = re.sub(r"\tedd's\b", "Tedd's", text)
-    
-    #U
-    text = re.sub(r"\bu\.s\.", "U.S.", text)
-    text = re.sub(r"\budderwash\b", "udder wash", text)
-    text = re.sub(r"\bu/d\b", "unit dose", text)
-    text = re.sub(r"\bu/dose\b", "unit dose", text)
-    text = re.sub(r"\bu\.d\.", "unit dose", text)
-    text = re.sub(r"\bud\b", "unit dose", text)
-    text = re.sub(r"\bunds\b", "unit dose", text)
-    text = re.sub(r"\bunidose\b", "Unidose", text)
-    text = re.sub(r"\buniprix", "Uniprix", text)
-    text = re.sub(r"\buntds\b", "unit dose", text)
-    text = re.sub(r"\bupc\b", "UPC", text)
-    text = re.sub(r"\bus\b", "US", text)
-    text = re.sub(r"\bUSfl\.", "US fl.", text)
-    text = re.sub(r"\busp\b", "USP", text)
-    text = re.sub(r"\buvar\b", "UVAR", text)
-    
-    #V
-    text = re.sub(r"\bvit\.", "vitamin", text)
-    text = re.sub(r"\bvl\b", "vial", text)
-    
-    #W
-    text = re.sub(r"\bw10 make\b", "W10 make", text)
-    text = re.sub(r"\bw15 make\b", "W15 make", text)
-    text = re.sub(r"\bw20 make\b", "W20 make", text)
-    text = re.sub(r"\bw25 make\b", "W25 make", text)
-    text = re.sub(r"\bw30 make\b", "W30 make", text)
-    text = re.sub(r"\bw40 make\b", "W40 make", text)
-    text = re.sub(r"\bw45 make\b", "W45 make", text)
-    text = re.sub(r"\bw50 make\b", "W50 make", text)
-    text = re.sub(r"\bw60 make\b", "W60 make", text)
-    text = re.sub(r"\bwebber\svitamin\snaturals\b", "Webber Vitamin Naturals", text)
-    text = re.sub(r"\bwfi\b", "WFI", text)
-    text = re.sub(r"\bwinrhosd\b", "WinRho SD", text)
-    
-    #X
-    text = re.sub(r"\bxts\b", "XTS", text)
-    
-    #Y
-    text = re.sub(r"\byrs\b", "years", text)
-    
-    #Z
-    
-    #String Replacements        text = text.replace("", "")
-    text = text.replace("3.3us ", "3.3 US")
-    text = text.replace("antihemoph.factor (recomb.)", "antihemophilic factor (recombinant)")
-    text = text.replace("100&500,(", "100 & 500, (")
-    text = text.replace("conc.&human", "concentrated & human")
-    text = text.replace("fl. .", "fl. ")
-    text = text.replace("landmark medical systems inc", "Landmark Medical Systems Inc.")
-    text = text.replace("method.single", "method. single")
-    text = text.replace("mL.preservative", "mL. preservative")
-    text = text.replace("mp pharmacies", "MP Pharmacies")
-    text = text.replace("prescription plus", "Prescription Plus")
-    text = text.replace("Prescription Plus century complete", "Prescription Plus Century Complete")
-    text = text.replace("Prescription Plus century plus", "Prescription Plus Century Plus")
-    text = text.replace("pricewatchers century silver]", "Price Watchers Century Silver")
-    text = text.replace("prof samp ", "professional sample")
-    text = text.replace("recomb.antihemoph.factor", "recombinant antihemophilic factor")
-    text = text.replace("thrombateiiipw", "thrombate III powder")
-    text = text.replace("value brand century complete", "Value Brand Century Compete")
-    text = text.replace("value brand century plus tablet", "Value Brand Century Plus tablet")
-    text = text.replace("value brand century premium", "Value Brand Century Premium")
-    text = text.replace("value brand century silver", "Value Brand Century Silver")
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
+    text = DESCRIPTOR_RULESET.apply(text)
+
     return text
 
 def parseDIN(text):
@@ -4184,776 +688,9 @@ def parseDosage(text):
 
 def parseIngredient(text):
     """Formats the ingredient for drug products."""
-    
-    text = text.lower()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Space Parenthesis, Commas, %
-    text = re.sub(r"a\(", "a (", text)
-    text = re.sub(r"b\(", "b (", text)
-    text = re.sub(r"c\(", "c (", text)
-    text = re.sub(r"d\(", "d (", text)
-    text = re.sub(r"e\(", "e (", text)
-    text = re.sub(r"f\(", "f (", text)
-    text = re.sub(r"g\(", "g (", text)
-    text = re.sub(r"h\(", "h (", text)
-    text = re.sub(r"i\(", "i (", text)
-    text = re.sub(r"j\(", "j (", text)
-    text = re.sub(r"k\(", "k (", text)
-    text = re.sub(r"l\(", "l (", text)
-    text = re.sub(r"m\(", "m (", text)
-    text = re.sub(r"n\(", "n (", text)
-    text = re.sub(r"o\(", "o (", text)
-    text = re.sub(r"p\(", "p (", text)
-    text = re.sub(r"q\(", "q (", text)
-    text = re.sub(r"r\(", "r (", text)
-    text = re.sub(r"s\(", "s (", text)
-    text = re.sub(r"t\(", "t (", text)
-    text = re.sub(r"u\(", "u (", text)
-    text = re.sub(r"v\(", "v (", text)
-    text = re.sub(r"w\(", "w (", text)
-    text = re.sub(r"x\(", "x (", text)
-    text = re.sub(r"y\(", "y (", text)
-    text = re.sub(r"z\(", "z (", text)
-    text = re.sub(r"0\(", "0 (", text)
-    text = re.sub(r"1\(", "1 (", text)
-    text = re.sub(r"2\(", "2 (", text)
-    text = re.sub(r"3\(", "3 (", text)
-    text = re.sub(r"4\(", "4 (", text)
-    text = re.sub(r"5\(", "5 (", text)
-    text = re.sub(r"6\(", "6 (", text)
-    text = re.sub(r"7\(", "7 (", text)
-    text = re.sub(r"8\(", "8 (", text)
-    text = re.sub(r"9\(", "9 (", text)
-    text = re.sub(r"\%\(", "% (", text)
-    text = re.sub(r"\s*-\(\b", " (", text)
-    text = re.sub(r"\)-", ") -", text)
-    text = re.sub(r"\.\(\b", ". (", text)
-    
-    text = re.sub(r"\)a", ") a", text)
-    text = re.sub(r"\)b", ") b", text)
-    text = re.sub(r"\)c", ") c", text)
-    text = re.sub(r"\)d", ") d", text)
-    text = re.sub(r"\)e", ") e", text)
-    text = re.sub(r"\)f", ") f", text)
-    text = re.sub(r"\)g", ") g", text)
-    text = re.sub(r"\)h", ") h", text)
-    text = re.sub(r"\)i", ") i", text)
-    text = re.sub(r"\)j", ") j", text)
-    text = re.sub(r"\)k", ") k", text)
-    text = re.sub(r"\)l", ") l", text)
-    text = re.sub(r"\)m", ") m", text)
-    text = re.sub(r"\)n", ") n", text)
-    text = re.sub(r"\)o", ") o", text)
-    text = re.sub(r"\)p", ") p", text)
-    text = re.sub(r"\)q", ") q", text)
-    text = re.sub(r"\)r", ") r", text)
-    text = re.sub(r"\)s", ") s", text)
-    text = re.sub(r"\)t", ") t", text)
-    text = re.sub(r"\)u", ") u", text)
-    text = re.sub(r"\)v", ") v", text)
-    text = re.sub(r"\)w", ") w", text)
-    text = re.sub(r"\)x", ") x", text)
-    text = re.sub(r"\)y", ") y", text)
-    text = re.sub(r"\)z", ") z", text)
-    text = re.sub(r"\)0", ") 0", text)
-    text = re.sub(r"\)1", ") 1", text)
-    text = re.sub(r"\)2", ") 2", text)
-    text = re.sub(r"\)3", ") 3", text)
-    text = re.sub(r"\)4", ") 4", text)
-    text = re.sub(r"\)5", ") 5", text)
-    text = re.sub(r"\)6", ") 6", text)
-    text = re.sub(r"\)7", ") 7", text)
-    text = re.sub(r"\)8", ") 8", text)
-    text = re.sub(r"\)9", ") 9", text)
-    
-    text = re.sub(r",a", ", a", text)
-    text = re.sub(r",b", ", b", text)
-    text = re.sub(r",c", ", c", text)
-    text = re.sub(r",d", ", d", text)
-    text = re.sub(r",e", ", e", text)
-    text = re.sub(r",f", ", f", text)
-    text = re.sub(r",g", ", g", text)
-    text = re.sub(r",h", ", h", text)
-    text = re.sub(r",i", ", i", text)
-    text = re.sub(r",j", ", j", text)
-    text = re.sub(r",k", ", k", text)
-    text = re.sub(r",l", ", l", text)
-    text = re.sub(r",m", ", m", text)
-    text = re.sub(r",n", ", n", text)
-    text = re.sub(r",o", ", o", text)
-    text = re.sub(r",p", ", p", text)
-    text = re.sub(r",q", ", q", text)
-    text = re.sub(r",r", ", r", text)
-    text = re.sub(r",s", ", s", text)
-    text = re.sub(r",t", ", t", text)
-    text = re.sub(r",u", ", u", text)
-    text = re.sub(r",v", ", v", text)
-    text = re.sub(r",w", ", w", text)
-    text = re.sub(r",x", ", x", text)
-    text = re.sub(r",y", ", y", text)
-    text = re.sub(r",z", ", z", text)
-    text = re.sub(r",0", ", 0", text)
-    text = re.sub(r",1", ", 1", text)
-    text = re.sub(r",2", ", 2", text)
-    text = re.sub(r",3", ", 3", text)
-    text = re.sub(r",4", ", 4", text)
-    text = re.sub(r",5", ", 5", text)
-    text = re.sub(r",6", ", 6", text)
-    text = re.sub(r",7", ", 7", text)
-    text = re.sub(r",8", ", 8", text)
-    text = re.sub(r",9", ", 9", text)
-    
-    #Captilize Single Letters
-    text = re.sub(r"\ba\b", "A", text)
-    text = re.sub(r"\bb\b", "B", text)
-    text = re.sub(r"\bc\b", "C", text)
-    text = re.sub(r"\bd\b", "D", text)
-    text = re.sub(r"\be\b", "E", text)
-    text = re.sub(r"\bf\b", "F", text)
-    text = re.sub(r"\bg\b", "G", text)
-    text = re.sub(r"\bh\b", "H", text)
-    text = re.sub(r"\bi\b", "I", text)
-    text = re.sub(r"\bj\b", "J", text)
-    text = re.sub(r"\bk\b", "K", text)
-    text = re.sub(r"\bl\b", "L", text)
-    text = re.sub(r"\bm\b", "M", text)
-    text = re.sub(r"\bn\b", "N", text)
-    text = re.sub(r"\bo\b", "O", text)
-    text = re.sub(r"\bp\b", "P", text)
-    text = re.sub(r"\bq\b", "Q", text)
-    text = re.sub(r"\br\b", "R", text)
-    text = re.sub(r"\bs\b", "S", text)
-    text = re.sub(r"\bt\b", "T", text)
-    text = re.sub(r"\bu\b", "U", text)
-    text = re.sub(r"\bv\b", "V", text)
-    text = re.sub(r"\bw\b", "W", text)
-    text = re.sub(r"\bx\b", "X", text)
-    text = re.sub(r"\by\b", "Y", text)
-    text = re.sub(r"\bz\b", "Z", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    #0
-    text = re.sub(r"'S\b", "'s", text)
-    text = re.sub(r"\b18f\b", " 18F", text)
-    text = re.sub(r"\b103-hgr\b", "103-HgR", text)
-    text = re.sub(r"\b153sm\b", "153Sm", text)
-
-    #A
-    text = re.sub(r"\bcalifornia\b", "California", text)
-    text = re.sub(r"\bnew\scaledonia\b", "New Caledonia", text)
-    text = re.sub(r"\bpanama\b", "A/Panama", text)
-    text = re.sub(r"\babobotulinumtoxina\b", "abobotulinumtoxinA", text)
-    text = re.sub(r"\bacalypha\b", "Acalypha", text)
-    text = re.sub(r"\bachillea\b", "Achillea", text)
-    text = re.sub(r"\bactaea\b", "Actaea", text)
-    text = re.sub(r"\bacth\b", "ACTH", text)
-    text = re.sub(r"\badenophora\b", "Adenophora", text)
-    text = re.sub(r"\badonis\b", "Adonis", text)
-    text = re.sub(r"\baesculus\b", "Aesculus", text)
-    text = re.sub(r"\baethusa\b", "Aethusa", text)
-    text = re.sub(r"\bagaricus\b", "Agaricus", text)
-    text = re.sub(r"\bagastache\b", "Agastache", text)
-    text = re.sub(r"\bagave\b", "Agave", text)
-    text = re.sub(r"\bagrimonia\b", "Agrimonia", text)
-    text = re.sub(r"\bagrostemma\b", "Agrostemma", text)
-    text = re.sub(r"\balchemilla\b", "Alchemilla", text)
-    text = re.sub(r"\balcloxa\b", "Alcloxa", text)
-    text = re.sub(r"\baletris\b", "Aletris", text)
-    text = re.sub(r"\balisma\b", "Alisma", text)
-    text = re.sub(r"\balkoxypolyethoxyethanol\b", "alkoxy polyethoxyethanol", text)
-    text = re.sub(r"\balloxanum\b", "Alloxanum", text)
-    text = re.sub(r"\ballylisothiocyanate\b", "allyl isothiocyanate", text)
-    text = re.sub(r"\balnus\b", "Alnus", text)
-    text = re.sub(r"\balismatis\b", "Alismatis", text)
-    text = re.sub(r"\balstonia\b", "Alstonia", text)
-    text = re.sub(r"\baminoacid\b", "amino acid", text)
-    text = re.sub(r"\bammi\b", "Ammi", text)
-    text = re.sub(r"\banacardium\b", "Anacardium", text)
-    text = re.sub(r"\banagallis\b", "Anagallis", text)
-    text = re.sub(r"\banatherum\b", "Anatherum", text)
-    text = re.sub(r"\banchusa\b", "Anchusa", text)
-    text = re.sub(r"\banemarrhena\b", "Anemarrhena", text)
-    text = re.sub(r"\banemopsis\b", "Anemopsis", text)
-    text = re.sub(r"\bankara\b", "Ankara", text)
-    text = re.sub(r"\bapocynum\b", "Apocynum", text)
-    text = re.sub(r"\baquilaria\b", "Aquilaria", text)
-    text = re.sub(r"\bargemone\b", "Argemone", text)
-    text = re.sub(r"\baristolochia\b", "Aristolochia", text)
-    text = re.sub(r"\barsanilic\b", "Arsanilic", text)
-    text = re.sub(r"\bartemisia\b", "Artemisia", text)
-    text = re.sub(r"\basarum\b", "Asarum", text)
-    text = re.sub(r"\basclepias\b", "Asclepias", text)
-    text = re.sub(r"\basperula\b", "Asperula", text)
-    text = re.sub(r"\baspidosperma\b", "Aspidosperma", text)
-    text = re.sub(r"\bastacus\b", "Astacus", text)
-    text = re.sub(r"\basterias\b", "Asterias", text)
-    text = re.sub(r"\batractylodis\b", "Atractylodes", text)
-    text = re.sub(r"\battenuat\.", "attenuated", text)
-    
-    #B
-    text = re.sub(r"\bb-cyclodextrin\b", "beta-cyclodextrin", text)
-    text = re.sub(r"\bb1a\b", "B1a", text)
-    text = re.sub(r"\bb1\b", "B1", text)
-    text = re.sub(r"\bb2\b", "B2", text)
-    text = re.sub(r"\bb3\b", "B3", text)
-    text = re.sub(r"\bb6\b", "B6", text)
-    text = re.sub(r"\bb12\b", "B12", text)
-    text = re.sub(r"\bballota\b", "Ballota", text)
-    text = re.sub(r"\bbaptisia\b", "Baptisia", text)
-    text = re.sub(r"\bbattey\b", "Battey", text)
-    text = re.sub(r"\bbavarian\b", "Bavarian", text)
-    text = re.sub(r"\bbcg\b", "BCG", text)
-    text = re.sub(r"\bbdd\b", " BDD", text)
-    text = re.sub(r"\bbetaglucanase\b", "beta glucanase", text)
-    text = re.sub(r"\bbetanaphthol\b", "bet-naphthol", text)
-    text = re.sub(r"\bbetula\b", "Betula", text)
-    text = re.sub(r"\bbifidobacterium\b", "Bifidobacterium", text)
-    text = re.sub(r"\bbioallethrin\b", "Bioallethrin", text)
-    text = re.sub(r"\bblackroot\b", "black root", text)
-    text = re.sub(r"\bblatta\b", "Blatta", text)
-    text = re.sub(r"\bbombyx\b", "Bombyx", text)
-    text = re.sub(r"\bborago\b", "Borago", text)
-    text = re.sub(r"\bboswellia\b", "Boswellia", text)
-    text = re.sub(r"\bbr\b", "BR", text)
-    text = re.sub(r"\bbrayera\b", "Brayera", text)
-    text = re.sub(r"\bbrongniart\b", " Brongniart", text)
-    text = re.sub(r"\bbromus\b", "Bromus", text)
-    text = re.sub(r"\bbryonia\b", "Bryonia", text)
-    text = re.sub(r"\bbupleurum\b", "Bupleurum", text)
-    text = re.sub(r"\bbuxus\b", "Buxus", text)
-    
-    #C
-    text = re.sub(r"\bc9-c15\b", "C9-C15", text)
-    text = re.sub(r"\bcajeput\b", "Cajeput", text)
-    text = re.sub(r"\bcalluna\b", "Calluna", text)
-    text = re.sub(r"\bcalmette\b", "Calmette", text)
-    text = re.sub(r"\bcalotropis\b", "Calotropis", text)
-    text = re.sub(r"\bcaltha\b", "Caltha", text)
-    text = re.sub(r"\bcalumba\b", "Calumba", text)
-    text = re.sub(r"\bcanada\b", "Canada", text)
-    text = re.sub(r"\bcanadian\b", "Canadian", text)
-    text = re.sub(r"\bcaprylycollagenic\b", "caprylyl collagenic", text)
-    text = re.sub(r"\bcarpinus\b", "Carpinus", text)
-    text = re.sub(r"\bcarya\b", "Carya", text)
-    text = re.sub(r"\bcastanea\b", "Castanea", text)
-    text = re.sub(r"\bcastoreum\b", "Castoreum", text)
-    text = re.sub(r"\bcaulophyllum\b", "Caulophyllum", text)
-    text = re.sub(r"\b-cd3\b", "-CD3", text)
-    text = re.sub(r"\bcedrus\b", "Cedrus", text)
-    text = re.sub(r"\bcentaurea\b", "Centaurea", text)
-    text = re.sub(r"\bcentaurium\b", "Centaurium", text)
-    text = re.sub(r"\bcentella\b", "Centella", text)
-    text = re.sub(r"\bcentipeda\b", "Centipeda", text)
-    text = re.sub(r"\bceratostigma\b", "Ceratostigma", text)
-    text = re.sub(r"\bcetraria\b", "Cetraria", text)
-    text = re.sub(r"\bchelidonium\b", "Chelidonium", text)
-    text = re.sub(r"\bchimaphila\b", "Chimaphila", text)
-    text = re.sub(r"\bchinese\b", "Chinese", text)
-    text = re.sub(r"\bchl(\.|\b)", "chloride", text)
-    text = re.sub(r"\bchlori(\.|\b)", "chloride", text)
-    text = re.sub(r"\bchloramine\sT\.", "chloramine-T", text)
-    text = re.sub(r"\bcicer\b", "Cicer", text)
-    text = re.sub(r"\bcichorium\b", "Cichorium", text)
-    text = re.sub(r"\bcicuta\b", "Cicuta", text)
-    text = re.sub(r"\bcig\b", "CIG", text)
-    text = re.sub(r"\bcimex\b", "Cimex", text)
-    text = re.sub(r"\bcimicifuga\b", "Cimicifuga", text)
-    text = re.sub(r"\bcinnamomum\b", "Cinnamomum", text)
-    text = re.sub(r"\bcitrullus\b", "Citrullus", text)
-    text = re.sub(r"\bcnicus\b", "Cnicus", text)
-    text = re.sub(r"\bcnidium\b", "Cnidium", text)
-    text = re.sub(r"\bco\s57\b", "(Co-57)", text)
-    text = re.sub(r"\bcoccinella\b", "Coccinella", text)
-    text = re.sub(r"\bcodonopsitis\b", "Codonopsitis", text)
-    text = re.sub(r"\bcollinsonia\b", "Collinsonia", text)
-    text = re.sub(r"\bcolocasia\b", "Colocasia", text)
-    text = re.sub(r"\bcombretum\b", "Combretum", text)
-    text = re.sub(r"\bcomocladia\b", "Comocladia", text)
-    text = re.sub(r"\bconjug(\.|\b)", "conjugated", text)
-    text = re.sub(r"\bconnaught\b", "Connaught", text)
-    text = re.sub(r"\bconvallaria\b", "Convallaria", text)
-    text = re.sub(r"\bcoriandrum\b", "Coriandrum", text)
-    text = re.sub(r"\bcornus\b", "Cornus", text)
-    text = re.sub(r"\bcorylus\b", "Corylus", text)
-    text = re.sub(r"\bcorynebacterium\b", "Corynebacterium", text)
-    text = re.sub(r"\bcr51\b", "(Cr-51)", text)
-    text = re.sub(r"\bcrm-197\b", "CRM-197", text)
-    text = re.sub(r"\bcucurbita\b", "Cucurbita", text)
-    text = re.sub(r"\bcummin\b", "cumin", text)
-    text = re.sub(r"\bcurculigo\b", "Curculigo", text)
-    text = re.sub(r"\bcvd\b", " CVD", text)
-    text = re.sub(r"\bcynara\b", "Cynara", text)
-    text = re.sub(r"\bcyperus\b", "Cyperus", text)
-    text = re.sub(r"\bcytisus\b", "Cytisus", text)
-    
-    #D
-    text = re.sub(r"\bD\.D\.V\.P\.", "DDVP", text)
-    text = re.sub(r"\bd2\b", "D2", text)
-    text = re.sub(r"\bd3\b", "D3", text)
-    text = re.sub(r"\bdaphne\b", "Daphne", text)
-    text = re.sub(r"\bdc\b", "DC", text)
-    text = re.sub(r"\bdea-\b", "DEA-", text)
-    text = re.sub(r"\bdelphininum\b", "Delphininum", text)
-    text = re.sub(r"\bdermatophagoides\b", "Dermatophagoides", text)
-    text = re.sub(r"\bdicentra\b", "Dicentra", text)
-    text = re.sub(r"\bdichloracetic\b", "dichloroacetic", text)
-    text = re.sub(r"\bdictamnus\b", "Dictamnus", text)
-    text = re.sub(r"\bdioscorea\b", "Dioscorea", text)
-    text = re.sub(r"\bdirca\b", "Dirca", text)
-    text = re.sub(r"\bdiphenyloxide\b", "diphenyl oxide", text)
-    text = re.sub(r"\bdl\b", "DL-isoleucine", text)
-    text = re.sub(r"\bdna\b", " DNA", text)
-    text = re.sub(r"\bdolichovespula\b", "Dolichovespula", text)
-    text = re.sub(r"\bdrosera\b", "Drosera", text)
-    text = re.sub(r"\bduboisia\b", "Duboisia", text)
-    text = re.sub(r"\bdulse\b", "Dulse", text)
-    text = re.sub(r"\bdunaliella\b", "Dunaliella", text)
-    
-    #E
-    text = re.sub(r"\be1 tor\b", "E1 Tor", text)
-    text = re.sub(r"\bedmonston\b", "Edmonston", text)
-    text = re.sub(r"\bedta\b", "EDTA", text)
-    text = re.sub(r"\belaeis\b", "Elaeis", text)
-    text = re.sub(r"\benglish\b", "English", text)
-    text = re.sub(r"\bepigaea\b", "Epigaea", text)
-    text = re.sub(r"\bepilobium\b", "Epilobium", text)
-    text = re.sub(r"\beranthis\b", "Eranthis", text)
-    text = re.sub(r"\berechtites\b", "Erechtites", text)
-    text = re.sub(r"\berica\b", "Erica", text)
-    text = re.sub(r"\beriobotrya\b", "Eriobotrya", text)
-    text = re.sub(r"\beriodictyon\b", "Eriodictyon", text)
-    text = re.sub(r"\berodium\b", "Erodium", text)
-    text = re.sub(r"\beschscholtzia\b", "Eschscholtzia", text)
-    text = re.sub(r"\beucommiae\b", "Eucommiae", text)
-    text = re.sub(r"\beugenia\b", "Eugenia", text)
-    text = re.sub(r"\beuphorbium\b", "Euphorbium", text)
-    text = re.sub(r"\beuphrasia\b", "Euphrasia", text)
-    
-    #F
-    text = re.sub(r"\bfagus\b", "Fagus", text)
-    text = re.sub(r"\bfc\b", " Fc", text)
-    text = re.sub(r"\bferronyl\b", "Ferronyl", text)
-    text = re.sub(r"\bfhbp\b", "fHbp", text)
-    text = re.sub(r"\bficus\b", "Ficus", text)
-    text = re.sub(r"\bfilipendula\b", "Filipendula", text)
-    text = re.sub(r"\bfim\b", "Fim", text)
-    text = re.sub(r"\bfluoride\sF\s18\b", "fluoride (F-18)", text)
-    text = re.sub(r"\bfoeniculum\b", "Foeniculum", text)
-    text = re.sub(r"\bfraxinus\b", "Fraxinus", text)
-    text = re.sub(r"\bfritillaria\b", "Fritillaria", text)
-    text = re.sub(r"\bfsh\b", "FSH", text)
-    text = re.sub(r"\bfumaria\b", "Fumaria", text)
-    
-    #G
-    text = re.sub(r"\bga\s67\b", "(Ga-67)", text)
-    text = re.sub(r"\bgalanthus\b", "Galanthus", text)
-    text = re.sub(r"\bgalega\b", "Galega", text)
-    text = re.sub(r"\bgalphimia\b", "Galphimia", text)
-    text = re.sub(r"\bganoderma\b", "Ganoderma", text)
-    text = re.sub(r"\bgenista\b", "Genista", text)
-    text = re.sub(r"\bgentiana\b", "Gentiana", text)
-    text = re.sub(r"\bgentianella\b", "Gentianella", text)
-    text = re.sub(r"\bgerman\b", "German", text)
-    text = re.sub(r"\bgly(\.|\b)", "glycine", text)
-    text = re.sub(r"\bglycyrrhiza\b", "Glycyrrhiza", text)
-    text = re.sub(r"\bgnrh\b", "GnRH", text)
-    text = re.sub(r"\bgratiola\b", "Gratiola", text)
-    text = re.sub(r"\bguerin\b", "Guerin", text)
-    text = re.sub(r"\bgymnocladus\b", "Gymnocladus", text)
-    
-    #H
-    text = re.sub(r"\bh1n1\b", "H1N1", text)
-    text = re.sub(r"\bh3n2\b", "H3N2", text)
-    text = re.sub(r"\bh5n1\b", "H5N1", text)
-    text = re.sub(r"\bhahnemann\b", "Hahnemann", text)
-    text = re.sub(r"\bharpagophytum\b", "Harpagophytum", text)
-    text = re.sub(r"\bhecla\b", "Hecla", text)
-    text = re.sub(r"\bhelianthemum\b", "Helianthemum", text)
-    text = re.sub(r"\bheliotropium\b", "Heliotropium", text)
-    text = re.sub(r"\bhelleborus\b", "Helleborus", text)
-    text = re.sub(r"\bheloderma\b", "Heloderma", text)
-    text = re.sub(r"\bheracleum\b", "Heracleum", text)
-    text = re.sub(r"\bherniaria\b", "Herniaria", text)
-    text = re.sub(r"\bhieracium\b", "Hieracium", text)
-    text = re.sub(r"\bhogfennel\b", "hog fennel", text)
-    text = re.sub(r"\bholarrhena\b", "Holarrhena", text)
-    text = re.sub(r"\bhomarus\b", "Homarus", text)
-    text = re.sub(r"\bhong kong\b", "Hong Kong", text)
-    text = re.sub(r"\bhottonia\b", "Hottonia", text)
-    text = re.sub(r"\bhumulus\b", "Humulus", text)
-    text = re.sub(r"\bhvp\b", " HVP", text)
-    text = re.sub(r"\bhydrastis\b", "Hydrastis", text)
-    text = re.sub(r"\hydrochlor    \b", "hydrochloride", text)
-    text = re.sub(r"\bhydrocotyle\b", "Hydrocotyle", text)
-    text = re.sub(r"\bhydrophyllum\b", "Hydrophyllum", text)
-    text = re.sub(r"\bhyoscyamus\b", "Hyoscyamus", text)
-    
-    #I
-    text = re.sub(r"\biberis\b", "Iberis", text)
-    text = re.sub(r"\bii\b", "II", text)
-    text = re.sub(r"\biii\b", "III", text)
-    text = re.sub(r"\bincobotulinumtoxina\b", "incobotulinumtoxinA", text)
-    text = re.sub(r"\bin 111\b", "(In-111)", text)
-    text = re.sub(r"\biodide\s131\sI\b", "iodide (I-131)", text)
-    text = re.sub(r"\binaba\b", "Inaba", text)
-    text = re.sub(r"\binula\b", "Inula", text)
-    text = re.sub(r"\bisatis\b", "Isatis", text)
-    text = re.sub(r"\bitalian\b", "Italian", text)
-    text = re.sub(r"\biv\b", "IV", text)
-    text = re.sub(r"\bix\b", "IX", text)
-    
-    #J
-    text = re.sub(r"\bjamaica\b", "Jamaica", text)
-    text = re.sub(r"\bjapanese\b", "Japanese", text)
-    text = re.sub(r"\bjatropha\b", "Jatropha", text)
-    text = re.sub(r"\bjeryl\slynn\b", "Jeryl Lynn", text)
-    text = re.sub(r"\bjonesia\b", "Jonesia", text)
-    text = re.sub(r"\bjuglans\b", "Juglans", text)
-    text = re.sub(r"\bjune\b", "June", text)
-    text = re.sub(r"\bjuniperus\b", "Juniperus", text)
-    
-    #K
-    text = re.sub(r"\bk1\b", "K1", text)
-    text = re.sub(r"\bkentucky\b", "Kentucky", text)
-    text = re.sub(r"\bklebsiella\b", "Klebsiella", text)
-    
-    #L
-    text = re.sub(r"\bl1\b", "L1 protein", text)
-    text = re.sub(r"\blacerta\b", "Lacerta", text)
-    text = re.sub(r"\blachesis\b", "Lachesis", text)
-    text = re.sub(r"\bladyslipper\b", "lady slipper", text)
-    text = re.sub(r"\blarix\b", "Larix", text)
-    text = re.sub(r"\blathyrus\b", "Lathyrus", text)
-    text = re.sub(r"\blatrodectus\b", "Latrodectus", text)
-    text = re.sub(r"\blaureth\b", "Laureth", text)
-    text = re.sub(r"\blavandula\b", "Lavandula", text)
-    text = re.sub(r"\bledum\b", "Ledum", text)
-    text = re.sub(r"\blemna\b", "Lemna", text)
-    text = re.sub(r"\blepidium\b", "Lepidium", text)
-    text = re.sub(r"\bliatris\b", "Liatris", text)
-    text = re.sub(r"\bligustrum\b", "Ligustrum", text)
-    text = re.sub(r"\blinaria\b", "Linaria", text)
-    text = re.sub(r"\blithospermum\b", "Lithospermum", text)
-    text = re.sub(r"\blonicera\b", "Lonicera", text)
-    text = re.sub(r"\blonicerae\b", "Lonicerae", text)
-    text = re.sub(r"\blopatherum\b", "Lophatherum", text)
-    text = re.sub(r"\blophophytum\b", "Lophophytum", text)
-    text = re.sub(r"\blovage\b", "Lovage", text)
-    text = re.sub(r"\blysimachia\b", "Lysimachia", text)
-    
-    #M
-    text = re.sub(r"\bmahoney\b", "Mahoney", text)
-    text = re.sub(r"\bmalabar\b", "Malabar", text)
-    text = re.sub(r"\bmandragora\b", "Mandragora", text)
-    text = re.sub(r"\bmarsdenia\b", "Marsdenia", text)
-    text = re.sub(r"\bmct\b", "MCT", text)
-    text = re.sub(r"\bmef1\b", "M.E.F.1", text)
-    text = re.sub(r"\bmelilotus\b", "Melilotus", text)
-    text = re.sub(r"\bmelissa\b", "Melissa", text)
-    text = re.sub(r"\bmentha\b", "Mentha", text)
-    text = re.sub(r"\bmenthyl\b", "Methyl", text)
-    text = re.sub(r"\bmenyanthes\b", "Menyanthes", text)
-    text = re.sub(r"\bmethug-csf\b", "metHuG-CSF", text)
-    text = re.sub(r"\bmimulus\b", "Mimulus", text)
-    text = re.sub(r"\bmomordica\b", "Momordica", text)
-    text = re.sub(r"\bmontreal\b", "Montreal", text)
-    text = re.sub(r"\bmoroctocog\b", "Moroctocog", text)
-    text = re.sub(r"\bmygale\b", "Mygale", text)
-    text = re.sub(r"\bmyristica\b", "Myristica", text)
-    text = re.sub(r"\bmyroxylon\b", "Myroxylon", text)
-    text = re.sub(r"\bmyrtus\b", "Myrtus", text)
-    
-    #N
-    text = re.sub(r"-N, N-", "-N,N-", text)
-    text = re.sub(r"\bnz98\b", "NZ98", text)
-    text = re.sub(r"\bnada protein\b", "NadA", text)
-    text = re.sub(r"\bneisseria\b", "Neisseria", text)
-    text = re.sub(r"\bnh4cl\b", "NH4Cl", text)
-    text = re.sub(r"\bnhba\b", "NHBA", text)
-    text = re.sub(r"\bniaouli\b", "Niaouli", text)
-    text = re.sub(r"\bnon pollen\b", "non-pollen", text)
-    text = re.sub(r"\bnordic\b", "Nordic", text)
-    text = re.sub(r"\bnph\b", "NPH", text)
-    text = re.sub(r"\bnuphar\b", "Nuphar", text)
-    
-    #O
-    text = re.sub(r"\bocimum\b", "Ocimum", text)
-    text = re.sub(r"\boenothera\b", "Oenothera", text)
-    text = re.sub(r"\bofsh\b", "oFSH", text)
-    text = re.sub(r"\bogawa\b", "Ogawa", text)
-    text = re.sub(r"\boka/merck\b", "Oka/Merck", text)
-    text = re.sub(r"\bolea\b", "Olea", text)
-    text = re.sub(r"\bonabotulinumtoxina\b", "onabotulinumtoxinA", text)
-    text = re.sub(r"\bononis\b", "Ononis", text)
-    text = re.sub(r"\bonopordum\b", "Onopordum", text)
-    text = re.sub(r"\bophiopogon\b", "Ophiopogon", text)
-    text = re.sub(r"\boreodaphne\b", "Oreodaphne", text)
-    text = re.sub(r"\boriganum\b", "Origanum", text)
-    text = re.sub(r"\borl-trival\b", "oral trivalent", text)
-    text = re.sub(r"\bornithogalum\b", "Ornithogalum", text)
-    text = re.sub(r"\borthosiphon\b", "Orthosiphon", text)
-    text = re.sub(r"\bospa\b", " OspA", text)
-    text = re.sub(r"\boxydendrum\b", "Oxydendrum", text)
-    text = re.sub(r"\boxyurus\b", "Oxyurus", text)
-    
-    #P
-    text = re.sub(r"\bpaeonia\b", "Paeonia", text)
-    text = re.sub(r"\bpassiflora\b", "Passiflora", text)
-    text = re.sub(r"\bpediculus\b", "Pediculus", text)
-    text = re.sub(r"\bperuvian\b", "Peruvian", text)
-    text = re.sub(r"\bphleum\b", "Phleum", text)
-    text = re.sub(r"\bphloridzinum\b", "Phloridzinum", text)
-    text = re.sub(r"\bphosph(\.|\b)", "phosphate", text)
-    text = re.sub(r"\bpilocarpus\b", "Pilocarpus", text)
-    text = re.sub(r"\bpimpinella\b", "Pimpinella", text)
-    text = re.sub(r"\bpinus\b", "Pinus", text)
-    text = re.sub(r"\bplasmafibronectin\b", "plasma fibronectin", text)
-    text = re.sub(r"\bplatanus\b", "Platanus", text)
-    text = re.sub(r"\bplectranthus\b", "Plectranthus", text)
-    text = re.sub(r"\bpmsg\b", "PMSG", text)
-    text = re.sub(r"\bpoliovirus type I\b", "poliovirus type 1", text)
-    text = re.sub(r"\bpoliovirus type II\b", "poliovirus type 2", text)
-    text = re.sub(r"\bpoliovirus type III\b", "poliovirus type 3", text)
-    text = re.sub(r"\bpolysacc\.", "polysaccharide", text)
-    text = re.sub(r"\bpolysaccharid", "polysaccharide", text)
-    text = re.sub(r"\bpolistes\b", "Polistes", text)
-    text = re.sub(r"\bpolygonum\b", "Polygonum", text)
-    text = re.sub(r"\bpolytar\b", "Polytar", text)
-    text = re.sub(r"\bpopulus\b", "Populus", text)
-    text = re.sub(r"\bporia\b", "Poria", text)
-    text = re.sub(r"\bpotentilla\b", "Potentilla", text)
-    text = re.sub(r"\bppg-12-peg\b", "PPG-12-PEG", text)
-    text = re.sub(r"\bpratence\b", "pratense", text)
-    text = re.sub(r"\bprot(\.|\b)", "protein", text)
-    text = re.sub(r"\bprotein\sprotein\b", "protein", text)
-    text = re.sub(r"\bprp\b", "PRP", text)
-    text = re.sub(r"\bprunus\b", "Prunus", text)
-    text = re.sub(r"\bptelea\b", "Ptelea" , text)
-    text = re.sub(r"\bpueraria\b", "Pueraria", text)
-    text = re.sub(r"\bPueraria L.O.\b", "Pueraria lobata", text)
-    text = re.sub(r"\bpulex\b", "Pulex", text)
-    text = re.sub(r"\bpulmo\b", "Pulmo", text)
-    
-    #Q
-    text = re.sub(r"\bq10\b", "Q10", text)
-    text = re.sub(r"\bquassia\b", "Quassia", text)
-    text = re.sub(r"\bquinqueflora\b", "quinquefolia", text)
-    text = re.sub(r"\bquercus\b", "Quercus", text)
-    
-    #R
-    text = re.sub(r"\bra27/3\b", "RA27/3", text)
-    text = re.sub(r"\bradix dispaci\b", "radix dipsaci", text)
-    text = re.sub(r"\brhamnus\b", "Rhamnus", text)
-    text = re.sub(r"\brhizoma\b", "Rhizoma", text)
-    text = re.sub(r"\brhizopus\b", "Rhizopus", text)
-    text = re.sub(r"\brho\sD\b", "Rho(D)", text)
-    text = re.sub(r"\brhpdgf-bb\b", "rhPDGF-BB", text)
-    text = re.sub(r"\bricinus\b", "Ricinus", text)
-    text = re.sub(r"\brimabotulinumtoxinb\b", "rimabotulinumtoxinB", text)
-    text = re.sub(r"\brix4414\b", "RIX4414", text)
-    text = re.sub(r"\brobinia\b", "Robinia", text)
-    text = re.sub(r"\brosa\b", "Rosa", text)
-    text = re.sub(r"\brosmarinus\b", "Rosmarinus", text)
-    text = re.sub(r"\broth\b", "Roth", text)
-    text = re.sub(r"\brubia\b", "Rubia", text)
-    text = re.sub(r"\brubus\b", "Rubus", text)
-    text = re.sub(r"\brumex\b", "Rumex", text)
-    text = re.sub(r"\brussian\b", "Russian", text)
-    text = re.sub(r"\brussula\b", "Russula", text)
-    text = re.sub(r"\bruta\b", "Ruta", text)
-    
-    #S
-    text = re.sub(r"\bsa14-14-2\b", "SA14-14-2", text)
-    text = re.sub(r"\bsalix\b", "Salix", text)
-    text = re.sub(r"\bsalmonella\b", "Salmonella", text)
-    text = re.sub(r"\bsambucus\b", "Sambucus", text)
-    text = re.sub(r"\bsanguinarina\b", "Sanguinarina", text)
-    text = re.sub(r"\bsanicula\b", "Sanicula", text)
-    text = re.sub(r"\bsaponaria\b", "Saponaria", text)
-    text = re.sub(r"\bsatanus\b", "satanas", text)
-    text = re.sub(r"\bsaukett\b", "Saukett", text)
-    text = re.sub(r"\bscleratus\b", "sceleratus", text)
-    text = re.sub(r"\bschinus\b", "Schinus", text)
-    text = re.sub(r"\bschisandra\b", "Schisandra", text)
-    text = re.sub(r"\bschizonepeta\b", "Schizonepeta", text)
-    text = re.sub(r"\bscleranthus\b", "Scleranthus", text)
-    text = re.sub(r"\bscullcap\b", "skullcap", text)
-    text = re.sub(r"\bsempervivum\b", "Sempervivum", text)
-    text = re.sub(r"\bsenecio\b", "Senecio", text)
-    text = re.sub(r"\bserot\.", "serotype", text)
-    text = re.sub(r"\bserotype\s6a\b", "serotype 6A", text)
-    text = re.sub(r"\bserotype\s6b\b", "serotype 6B", text)
-    text = re.sub(r"\bserotype\s7f\b", "serotype 7F", text)
-    text = re.sub(r"\bserotype\s9n\b", "serotype 9N", text)
-    text = re.sub(r"\bserotype\s9v\b", "serotype 9V", text)
-    text = re.sub(r"\bserotype\s10a\b", "serotype 10A", text)
-    text = re.sub(r"\bserotype\s11a\b", "serotype 11A", text)
-    text = re.sub(r"\bserotype\s12f\b", "serotype 12F", text)
-    text = re.sub(r"\bserotype\s15b\b", "serotype 15B", text)
-    text = re.sub(r"\bserotype\s17f\b", "serotype 17F", text)
-    text = re.sub(r"\bserotype\s18c\b", "serotype 18C", text)
-    text = re.sub(r"\bserotype\s19a\b", "serotype 19A", text)
-    text = re.sub(r"\bserotype\s19f\b", "serotype 19F", text)
-    text = re.sub(r"\bserotype\s22f\b", "serotype 22F", text)
-    text = re.sub(r"\bserotype\s23f\b", "serotype 23F", text)
-    text = re.sub(r"\bserotype\s33f\b", "serotype 33F", text)
-    text = re.sub(r"\bsiberian\b", "Siberian", text)
-    text = re.sub(r"\bsiler\b", "Siler", text)
-    text = re.sub(r"\bsilphium\b", "Silphium", text)
-    text = re.sub(r"\bsolomon\b", "Solomon", text)
-    text = re.sub(r"\bsp\b", "SP", text)
-    text = re.sub(r"\bspigelia\b", "Spigelia", text)
-    text = re.sub(r"\bspilanthes\b", "Spilanthes", text)
-    text = re.sub(r"\bspirea\b", "Spirea", text)
-    text = re.sub(r"\bspp(\.|\b)", "spp.", text)
-    text = re.sub(r"\bsr\b", " Sr", text)
-    text = re.sub(r"\bsterculia\b", "Sterculia", text)
-    text = re.sub(r"\bstillingia\b", "Stillingia", text)
-    text = re.sub(r"\bstrophanthus\b", "Strophanthus", text)
-    
-    #T
-    text = re.sub(r"\btanacetum\b", "Tanacetum", text)
-    text = re.sub(r"\btaraxacum\b", "Taraxacum", text)
-    text = re.sub(r"\btarentula\b", "Tarentula", text)
-    text = re.sub(r"\btaxus\b", "Taxus", text)
-    text = re.sub(r"\btc\s99m\b", "(Tc-99m)", text)
-    text = re.sub(r"\bteucrium\b", "Teucrium", text)
-    text = re.sub(r"\bthaspium\b", "Thaspium", text)
-    text = re.sub(r"\bthea\b", "Thea", text)
-    text = re.sub(r"\btheridion\b", "Theridion", text)
-    text = re.sub(r"\bti\s201\b", "(Ti-201)", text)
-    text = re.sub(r"\btilia\b", "Tilia", text)
-    text = re.sub(r"\btinctorium\b", "tinctorum", text)
-    text = re.sub(r"\btradescantia\b", "Tradescantia", text)
-    text = re.sub(r"\btrichophyton\b", "Trichophyton", text)
-    text = re.sub(r"\btrifolium\b", "Trifolium", text)
-    text = re.sub(r"\btrihyd(\.|\b)", "trihydrate", text)
-    text = re.sub(r"\btropaeolum\b", "Tropaeolum", text)
-    text = re.sub(r"\btussilago\b", "Tussilago", text)
-    text = re.sub(r"\bty21a\b", "Ty21a", text)
-    text = re.sub(r"\btype g1\b", "type G1", text)
-    text = re.sub(r"\btype g2\b", "type G2", text)
-    text = re.sub(r"\btype g3\b", "type G3", text)
-    text = re.sub(r"\btype g4\b", "type G4", text)
-    text = re.sub(r"\btype p1\b", "type P1", text)
-    
-    
-    #U
-    text = re.sub(r"\bulex\b", "Ulex", text)
-    text = re.sub(r"\bulmoidis\b", "ulmoides", text)
-    text = re.sub(r"\bulmus\b", "Ulmus", text)
-    text = re.sub(r"\burtica\b", "Urtica", text)
-    text = re.sub(r"\busnea\b", "Usnea", text)
-    text = re.sub(r"\bustilago\b", "Ustilago", text)
-    text = re.sub(r"\buva\b", "Uva", text)
-    
-    #V
-    text = re.sub(r"\bvaccinium\b", "Vaccinium", text)
-    text = re.sub(r"\bvaleriana\b", "Valeriana", text)
-    text = re.sub(r"\bverbascum\b", "Verbascum", text)
-    text = re.sub(r"\bvero\b", "Vero", text)
-    text = re.sub(r"\bvespa\b", "Vespa", text)
-    text = re.sub(r"\bvespula\b", "Vespula", text)
-    text = re.sub(r"\bvibrio inaba\b", "Vibrio", text)
-    text = re.sub(r"\bvictoria\b", "Victoria", text)
-    text = re.sub(r"\bvi\b", "VI", text)
-    text = re.sub(r"\bvii\b", "VII", text)
-    text = re.sub(r"\bviii\b", "VIII", text)
-    text = re.sub(r"\bvirola\b", "Virola", text)
-    text = re.sub(r"\bvitex\b", "Vitex", text)
-    text = re.sub(r"\bvitis\b", "Vitis", text)
-    
-    #W
-    text = re.sub(r"\bW\s135\b", "W-135", text)
-    text = re.sub(r"\bwiesbaden\b", "Wiesbaden", text)
-    text = re.sub(r"\bwillebrand\b", "Willebrand", text)
-    text = re.sub(r"\bwistar\b", "Wistar", text)
-    text = re.sub(r"\bwyethia\b", "Wyethia", text)
-    
-    #X
-    text = re.sub(r"\bxanthoxylum\b", "Xanthoxylum", text)
-    text = re.sub(r"\bxenon\s133\sxe\b", "xenon (Xe-133)", text)
-    text = re.sub(r"\bxiii\b", "XIII", text)
-    
-    #Y
-    text = re.sub(r"\byamagata\b", "Yamagata", text)
-    
-    #Z
-    text = re.sub(r"\bzea\b", "Zea", text)
-    text = re.sub(r"\bzingiber\b", "Zingiber", text)
-    text = re.sub(r"\bzizyphus\b", "Zizyphus", text)
-    
-    
-    '''
-    
-    
-    '''
-    
-
-    #String Replacements        text = text.replace("", "")
-    #0
-
-    #A
-
-    #B
-
-    #C
-    text = text.replace("cu (mib) 4]bf4", "Cu(MIB)4]BF4")
-    
-    #D
-
-    #E
-
-    #F
-
-    #G
-    text = text.replace("glycineiodine", "glycine iodine")
-
-    #H
-
-    #I
-    text = text.replace("inact.Japanese encephal virus", "inactivated Japanese encephalitis virus")
-    
-    #J
 
-    #K
-
-    #L
-
-    #M
-
-    #N
-
-    #O
-
-    #P
-
-    #Q
-
-    #R
-
-    #S
-    text = text.replace("sulfonic acid tea slt", "sulfonic acid TEA salt")
-    
-    #T
-
-    #U
-
-    #V
-
-    #W
-
-    #X
-
-    #Y
-
-    #Z
-
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
+    text = text.lower()
+    text = INGREDIENT_RULESET.apply(text)
 
     return text
 
@@ -4961,27 +698,7 @@ def parseProduct(text):
     """Formats drug product category."""
 
     text = text.title()
-
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"\bAnalg\.", "Analgesics", text)
-    text = re.sub(r"\bHiv\b", "HIV", text)
-    text = re.sub(r"\bIv\b", "IV", text)
-    text = re.sub(r"\bLs\b", "LS", text)
-    
-    #String Replacements        text = text.replace("", "")
-    text = text.replace("Dietary Min/Dietary Vit.", "Dietary Mineral/Dietary Vitamin Supplements")
-    text = text.replace("For Prof. Use", "for Professional Use")
-    text = text.replace("Med. Skin Care Prod.", "Medicated Skin Care Products")
-    text = text.replace("Vit. Suppl.", "Vitamin Supplements")
-    text = text.replace("Min. Suppl.", "Mineral Supplements")
-    text = text.replace("Min Supplements", "Mineral Supplements")
-    text = text.replace("Vit. Supplements", "Vitamin Supplements")
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
+    text = PRODUCT_RULESET.apply(text)
 
     return text
 
@@ -4989,224 +706,44 @@ def parseRoute(text):
     """Formats the route of administration for a drug product."""
 
     text = text.lower()
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"\b0-unassigned\b", "unassigned", text)
-    text = re.sub(r"\bhc\b", "HC", text)
-    
-    #String Replacements        text = text.replace("", "")
-    
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
+    text = ROUTE_RULESET.apply(text)
+
     return text
 
 def parseStandard(text):
     """Formats the formulary standard for the drug product."""
 
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"\bMFR\b", "Mfr", text)
-    text = re.sub(r"\bPH\sEUR\b", "Ph Eur", text)
-    
-    #String Replacements        text = text.replace("", "")
-    
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
+    text = STANDARD_RULESET.apply(text)
+
     return text
 
 def parseStreet(text):
     """Formats street number/name."""
 
     text = text.title()
+    text = STREET_RULESET.apply(text)
 
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"0Th\b", "0th", text)
-    text = re.sub(r"1St\b", "1st", text)
-    text = re.sub(r"2Nd\b", "2nd", text)
-    text = re.sub(r"3Rd\b", "3rd", text)
-    text = re.sub(r"4Th\b", "4th", text)
-    text = re.sub(r"5Th\b", "5th", text)
-    text = re.sub(r"6Th\b", "6th", text)
-    text = re.sub(r"7Th\b", "7th", text)
-    text = re.sub(r"8Th\b", "8th", text)
-    text = re.sub(r"9Th\b", "9th", text)
-    text = re.sub(r"10Th\b", "10th", text)
-    text = re.sub(r"11Th\b", "11th", text)
-    text = re.sub(r"12Th\b", "12th", text)
-    text = re.sub(r"13Th\b", "13th", text)
-    
-    text = re.sub(r"\bAve(\.|\b)", "Avenue", text)
-    text = re.sub(r"\bBlvd(\.|\b)", "Boulevard", text)
-    text = re.sub(r"\bBoul(\.|\b)", "Boulevard", text)
-    text = re.sub(r"\bCr(\.|\b)", "Crescent", text)
-    text = re.sub(r"\bDe\sLa\b", "de la", text)
-    text = re.sub(r"\bDes\b", "des", text)
-    text = re.sub(r"\bDna\b", "DNA", text)
-    text = re.sub(r"\bDr(\.|\b)", "Drive", text)
-    text = re.sub(r"\bHwy(\.|\b)", "Highway ", text)
-    text = re.sub(r"\bPl(\.|\b)", "Place", text)
-    text = re.sub(r"\bP\.O\.\b", "PO", text)
-    text = re.sub(r"\bPo\b", "PO Box", text)
-    text = re.sub(r"\bPkwy(\.|\b)", "Parkway", text)
-    text = re.sub(r"\bRd(\.|\b)", "Road", text)
-    text = re.sub(r"\bRr\b", "RR", text)
-    text = re.sub(r"\bRu(\.|\b)", "Rue", text)
-    
-    text = re.sub(r"\bNe\b", "NE", text)
-    text = re.sub(r"\bN\.E\.\b", "NE", text)
-    text = re.sub(r"\bNw\b", "NW", text)
-    text = re.sub(r"\bN\.W\.\b", "NW", text)
-    text = re.sub(r"\bSe\b", "SE ", text)
-    text = re.sub(r"\bS\.E\.\b", "SE", text)
-    text = re.sub(r"\bSt(\.|\b)", "Street", text)
-    text = re.sub(r"\bSw\b", "SW ", text)
-    text = re.sub(r"\bS\.W\.\b", "SW", text)
-    text = re.sub(r"\bN(\.|\b)", "North ", text)
-    text = re.sub(r"E(\.|\b)", "East", text)    
-    text = re.sub(r"S(\.|\b)", "South", text)
-    text = re.sub(r"W(\.|\b)", "West", text)
-    #String Replacements        text = text.replace("", "")
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
     return text
 
 def parseSuite(text):
     """Formats company suite number/name."""
 
     text = text.title()
+    text = SUITE_RULESET.apply(text)
 
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"1St\b", "1st", text)
-    text = re.sub(r"2Nd\b", "2nd", text)
-    text = re.sub(r"3Rd\b", "3rd", text)
-    text = re.sub(r"4Th\b", "4th", text)
-    text = re.sub(r"5Th\b", "5th", text)
-    text = re.sub(r"6Th\b", "6th", text)
-    text = re.sub(r"7Th\b", "7th", text)
-    text = re.sub(r"8Th\b", "8th", text)
-    text = re.sub(r"9Th\b", "9th", text)
-    text = re.sub(r"10Th\b", "10th", text)
-    text = re.sub(r"11Th\b", "11th", text)
-    text = re.sub(r"12Th\b", "12th", text)
-    text = re.sub(r"13Th\b", "13th", text)
-    text = re.sub(r"\bBldg\b", "Building", text)
-    text = re.sub(r"\bComp#\s\b", "Comp #", text)
-    text = re.sub(r"\bCp1\b", "CP1", text)
-    text = re.sub(r"\bDcc\b", "DCC", text)
-    text = re.sub(r"\bSs\b", "SS", text)
-    text = re.sub(r"\bSte\b", "Site", text)
-    text = re.sub(r"\bTa2\b", "TA2", text)
-    text = re.sub(r"\bTa3\b", "TA3", text)
-    text = re.sub(r"\bTa4\b", "TA4", text)
-    text = re.sub(r"\bUnit#\s\b", "Unit #", text)
-
-    #String Replacements        text = text.replace("", "")
-
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
     return text
 
 def parseUnit(text):
     """Formats units of measurements."""
 
     text = text.lower()
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    text = re.sub(r"\bact\b", "actuation", text)
-    text = re.sub(r"\bamp\b", "ampoule", text)
-    text = re.sub(r"\bb\b", "B", text)
-    text = re.sub(r"\bc\b", "C", text)
-    text = re.sub(r"\bcap\b", "capsule", text)
-    text = re.sub(r"\bcc\b", "CC", text)
-    text = re.sub(r"\bccid50\b", "CCID50", text)
-    text = re.sub(r"\bch\b", "CH", text)
-    text = re.sub(r"\bcfu\b", "CFU", text)
-    text = re.sub(r"\bcm\b", "CM", text)
-    text = re.sub(r"\bcmk\b", "CMK", text)
-    text = re.sub(r"\bcylr\b", "cylinder", text)
-    text = re.sub(r"\bd\b", "D", text)
-    text = re.sub(r"\bdh\b", "DH", text)
-    text = re.sub(r"\bea\b", "each", text)
-    text = re.sub(r"\becc\b", "enteric-coated capsule", text)
-    text = re.sub(r"\bect\b", "enteric-coated tablet", text)
-    text = re.sub(r"\bevt\b", "effervescent", text)
-    text = re.sub(r"\bffu\b", "FFU", text)
-    text = re.sub(r"\bgalu\b", "GALU", text)
-    text = re.sub(r"\bgbq\b", "GBq", text)
-    text = re.sub(r"\bimp\b", "implant", text)
-    text = re.sub(r"\bkiu\b", "KIU", text)
-    text = re.sub(r"\bl\b", "L", text)
-    text = re.sub(r"\blf\b", "Lf", text)
-    text = re.sub(r"\bloz\b", "lozenge", text)
-    text = re.sub(r"\bmbq\b", "MBq", text)
-    text = re.sub(r"\bmcci\b", "mcCi", text)
-    text = re.sub(r"\bmci\b", "mCi", text)
-    text = re.sub(r"\bmcl\b", "mcL", text)
-    text = re.sub(r"\bmeq\b", "mEq", text)
-    text = re.sub(r"\bmiu\b", "mIU", text)
-    text = re.sub(r"\bml\b", "mL", text)
-    text = re.sub(r"\bns\b", "nebulizer solution", text)
-    text = re.sub(r"\bpck\b", "pack", text)
-    text = re.sub(r"\bpfu\b", "PFU", text)
-    text = re.sub(r"\bppm\b", "PPM", text)
-    text = re.sub(r"\bslt\b", "sublingual tablet", text)
-    text = re.sub(r"\bsq\b", "sq.", text)
-    text = re.sub(r"\bsrc\b", "sustained-release capsule", text)
-    text = re.sub(r"\bsrd\b", "sustained-release disc", text)
-    text = re.sub(r"\bsrt\b", "sustained-release tablet", text)
-    text = re.sub(r"\bsup\b", "suppository", text)
-    text = re.sub(r"\bsut\b", "suture", text)
-    text = re.sub(r"\btbs\b", "tablespoon", text)
-    text = re.sub(r"\btsp\b", "teaspoon", text)
-    text = re.sub(r"\btcid50\b", "TCID50", text)
-    text = re.sub(r"\btub\b", "TUB", text)
-    text = re.sub(r"\bvtab\b", "vaginal tablet", text)
-    text = re.sub(r"\bwaf\b", "wafer", text)
-    text = re.sub(r"\bx\b", "X", text)
-    text = re.sub(r"\bxmk\b", "XMK", text)
-    
-    #String Replacements        text = text.replace("", "")
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
+    text = UNIT_RULESET.apply(text)
+
     return text
 
 def parseUPC(text):
     """Formats the UPC of a drug product."""
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
-    #Regex Replacements            text = re.sub(r"\b\b", "", text)
-    
-    #String Replacements        text = text.replace("", "")
-    text = text.replace(".", "")
-    text = text.replace("++", "")
-    text = text.replace("2X", "")
-    text = text.replace("-", "")
-    
-    #Removes extra space characters
-    text = re.sub(r"\s{2,}", " ", text)
-    
+
+    text = UPC_RULESET.apply(text)
+
     return text
@@ -0,0 +1,165 @@
+import sys
+from array import array
+
+
+class ParsedTable(object):
+    """Parsed rows of one extract title, stored column by column
+
+    Each column is a single list of strings rather than every row
+    being its own list, and every value is interned so repeated
+    values (e.g. the drug_code shared by all the tables) are only
+    held in memory once. Iterating the table gives each row as a
+    tuple, which is what csv.writer.writerows and
+    cursor.executemany take.
+
+    Columns with few distinct values can be dictionary encoded: the
+    column holds an integer code per row and the distinct values are
+    held once in a value table. Codes are only turned back into
+    values as the rows are iterated. Each table has its own value
+    tables, so codes from two tables can not be compared.
+
+    Rows that are not as wide as the table (e.g. blank lines) are
+    kept as given so they are written back out unchanged.
+
+    The parse workers send back each chunk of parsed rows in a table.
+    A table is only used for that: the encoding is there to make the
+    chunks smaller to send and quicker to unpickle, and the codes are
+    pickled in the smallest array type that holds them (one byte a
+    row for up to 256 values).
+    """
+
+    __slots__ = ("width", "columns", "length", "short", "values",
+                 "encoders")
+
+    def __init__(self, width, encoded=()):
+        self.width = width
+        self.length = 0
+        self.short = {}
+        self.columns = []
+        self.values = {}
+        self.encoders = []
+
+        for i in range(width):
+            if i in encoded:
+                self.columns.append(array("I"))
+                self.values[i] = []
+                self.encoders.append(self.value_encoder(self.values[i]))
+            else:
+                self.columns.append([])
+                self.encoders.append(sys.intern)
+
+    @staticmethod
+    def value_encoder(values):
+        """Returns a function giving the code of a value in values
+
+        Values not in the table yet are added to the end of it.
+        """
+
+        codes = {value: code for code, value in enumerate(values)}
+
+        def encode(value):
+            try:
+                return codes[value]
+            except KeyError:
+                codes[value] = len(values)
+                values.append(sys.intern(value))
+
+                return codes[value]
+
+        return encode
+
+    @staticmethod
+    def code_type(count):
+        """Returns the smallest array type code for count values"""
+        if count <= 0x100:
+            return "B"
+
+        if count <= 0x10000:
+            return "H"
+
+        return "I"
+
+    def __getstate__(self):
+        # The encoders are closures, which can not be pickled
+        columns = [
+            array(self.code_type(len(self.values[i])), column)
+            if i in self.values else column
+            for i, column in enumerate(self.columns)
+        ]
+
+        return (self.width, columns, self.length, self.short,
+                self.values)
+
+    def __setstate__(self, state):
+        (self.width, self.columns, self.length, self.short,
+         self.values) = state
+
+        # More rows may be added, with codes past the smaller type
+        for i in self.values:
+            self.columns[i] = array("I", self.columns[i])
+
+        self.encoders = [
+            self.value_encoder(self.values[i]) if i in self.values
+            else sys.intern
+            for i in range(self.width)
+        ]
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        if not self.short:
+            return zip(*self.decoded_columns())
+
+        return self.iter_rows()
+
+    def decoded_columns(self):
+        """Returns an iterator over the values of each column"""
+        return [
+            map(self.values[i].__getitem__, column) if i in self.values
+            else column
+            for i, column in enumerate(self.columns)
+        ]
+
+    def iter_rows(self):
+        """Yields each row, including those narrower than the table"""
+        for i, row in enumerate(zip(*self.decoded_columns())):
+            yield self.short.get(i, row)
+
+    def append(self, row):
+        """Adds a parsed row, a sequence of strings, to the table"""
+        if len(row) != self.width:
+            self.short[self.length] = tuple(row)
+            row = [""] * self.width
+
+        for column, encode, value in zip(self.columns, self.encoders, row):
+            column.append(encode(value))
+
+        self.length += 1
+
+    def extend(self, rows):
+        """Adds each of rows, sequences of strings, to the table
+
+        Cheaper than appending the rows one at a time, as each column
+        is filled in one go.
+        """
+
+        rows = list(rows)
+        blank = ("",) * self.width
+
+        for i, row in enumerate(rows):
+            if len(row) != self.width:
+                self.short[self.length + i] = tuple(row)
+                rows[i] = blank
+
+        if rows:
+            for i, values in enumerate(zip(*rows)):
+                codes = list(map(self.encoders[i], values))
+
+                if i in self.values:
+                    # Much quicker than extending an array from map
+                    self.columns[i].fromlist(codes)
+                else:
+                    self.columns[i].extend(codes)
+
+        self.length += len(rows)
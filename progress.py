@@ -0,0 +1,166 @@
+import math
+import shutil
+import sys
+import time
+
+# Most times a second a progress bar is redrawn in a terminal
+REDRAWS_PER_SECOND = 10
+
+# Seconds between progress lines when output is not a terminal,
+# e.g. when cron redirects it to a log file
+LOG_INTERVAL = 30
+
+# Widest and narrowest progress bar drawn; the bar is left out if the
+# terminal is too narrow for the narrowest one
+MAX_BAR_WIDTH = 50
+MIN_BAR_WIDTH = 10
+
+
+def format_duration(seconds):
+    """Formats a number of seconds as H:MM:SS"""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return "%d:%02d:%02d" % (hours, minutes, seconds)
+
+
+class ProgressReporter(object):
+    """Shows the progress of a task with its throughput and ETA
+
+    Progress is measured in bytes of input processed, with the rows
+    processed counted alongside. update can be called as often as
+    wanted; in a terminal the bar is only redrawn a few times a
+    second, and when the output is not a terminal a plain line is
+    written every LOG_INTERVAL seconds instead. The terminal line is
+    fitted to the width of the terminal, as a line that wraps can
+    not be redrawn in place.
+    """
+
+    def __init__(self, title, total, stream=None):
+        self.title = title
+        self.total = total
+        self.stream = stream if stream is not None else sys.stdout
+        self.isTerminal = self.stream.isatty()
+
+        if self.isTerminal:
+            self.interval = 1.0 / REDRAWS_PER_SECOND
+
+            # The last column is left empty so the cursor never wraps
+            self.width = shutil.get_terminal_size().columns - 1
+        else:
+            self.interval = LOG_INTERVAL
+
+        self.position = 0
+        self.rows = 0
+        self.started = time.monotonic()
+        self.shown = self.started
+
+    def update(self, position, rows):
+        """Records progress and shows it if it is time to
+
+        Args:
+            position: the bytes of input processed so far
+            rows: the rows processed so far
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        self.position = position
+        self.rows = rows
+        now = time.monotonic()
+
+        if now - self.shown < self.interval:
+            return
+
+        self.shown = now
+
+        if self.isTerminal:
+            # Padded so a shorter line clears the previous one
+            line = self.line(self.status(now))[:self.width]
+            self.stream.write("%s\r" % line.ljust(self.width))
+        else:
+            self.stream.write("%s: %s\n" % (self.title, self.status(now)))
+
+        self.stream.flush()
+
+    def finish(self, rows=None):
+        """Shows the task as complete with its overall throughput
+
+        Args:
+            rows: the total rows processed, if not already given to
+                update
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        if rows is not None:
+            self.rows = rows
+
+        self.position = self.total
+        elapsed = time.monotonic() - self.started
+        rates = self.rates(elapsed)
+
+        summary = "Complete! %s rows in %s (%s)" % (
+            "{:,}".format(self.rows), format_duration(elapsed), rates
+        )
+
+        if self.isTerminal:
+            self.stream.write("%s\n" % self.line(summary).ljust(self.width))
+        else:
+            self.stream.write("%s: %s\n" % (self.title, summary))
+
+        self.stream.flush()
+
+    def line(self, status):
+        """Returns the title, bar and status, fitted to the terminal"""
+        # Titles are lined up unless that leaves no room for the bar
+        for title in (self.title.ljust(23), self.title):
+            barWidth = min(MAX_BAR_WIDTH,
+                           self.width - len(title) - len(status) - 4)
+
+            if barWidth >= MIN_BAR_WIDTH:
+                return "%s [%s] %s" % (title, self.bar(barWidth), status)
+
+        return "%s %s" % (title, status)
+
+    def bar(self, width=MAX_BAR_WIDTH):
+        """Returns the bar of the progress so far"""
+        filled = math.floor(width * self.fraction())
+
+        return "#" * filled + " " * (width - filled)
+
+    def fraction(self):
+        """Returns the fraction of the task done, from 0 to 1"""
+        if self.total <= 0:
+            return 1.0
+
+        return min(float(self.position) / self.total, 1.0)
+
+    def rates(self, elapsed):
+        """Formats the rows and megabytes processed per second"""
+        elapsed = max(elapsed, 1e-9)
+
+        return "%s rows/s, %.1f MB/s" % (
+            "{:,}".format(int(self.rows / elapsed)),
+            self.position / elapsed / 1e6
+        )
+
+    def status(self, now):
+        """Formats the percentage done, throughput and time left"""
+        elapsed = now - self.started
+        status = "%6.2f%%  %s" % (100.0 * self.fraction(),
+                                  self.rates(elapsed))
+
+        if self.position > 0:
+            remaining = (self.total - self.position) * elapsed / self.position
+            status += "  ETA %s" % format_duration(remaining)
+
+        return status
@@ -0,0 +1,1707 @@
+import heapq
+import os
+import re
+import time
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+# Location of the rule tables and their compiled rule sets
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules")
+CACHE_DIR = os.path.join(RULES_DIR, ".cache")
+
+# Rule kinds
+REGEX = "regex"
+LITERAL = "literal"
+
+# Pass types
+SUB_PASS = 0
+REPLACE_PASS = 1
+STAGE_PASS = 2
+TOKEN_PASS = 3
+SPACE_PASS = 4
+
+# A regex pattern made only of plain characters and escaped symbols
+# matches exactly the same text as the equivalent str.replace call
+LITERAL_PATTERN = re.compile(r"(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])+\Z")
+
+# Runs of literal rules shorter than this are cheaper to apply one
+# str.replace at a time than to scan with an automaton
+MIN_STAGE_RULES = 8
+
+# Runs of single character rules shorter than this are left to the
+# literal stage rather than folded into a character class
+MIN_FAMILY_RULES = 4
+
+# Rule sets with fewer passes than this run every pass, as scanning
+# for triggers costs more than it saves
+MIN_TRIGGER_PASSES = 16
+
+# A regex pattern that swaps one whole word for another, e.g. \bCns\b
+WORD_PATTERN = re.compile(r"\\b(\w+)\\b\Z")
+WORD_CHARS = re.compile(r"\w+")
+
+# The rule every rule table starts and ends with, which collapses
+# runs of whitespace
+SPACE_RUN_PATTERN = r"\s{2,}"
+
+# Fused kind of a regex rule compile_rules applies as a word lookup
+WORD = "word"
+
+# How far back compile_rules looks for a rule of the same fused kind
+# when moving a rule up past rules it does not depend on
+REORDER_WINDOW = 32
+
+# Characters matched by \s, filled in the first time it is needed
+space_chars = None
+
+
+def literal_text(pattern):
+    """Returns the literal text matched by a regex pattern
+
+    Args:
+        pattern: the regex pattern to check
+
+    Returns:
+        The unescaped text the pattern matches, or None if the
+        pattern uses any regex syntax beyond escaped symbols.
+
+    Raises:
+        None.
+    """
+
+    if LITERAL_PATTERN.match(pattern):
+        return re.sub(r"\\(.)", r"\1", pattern, flags=re.DOTALL)
+
+    return None
+
+def word_text(pattern):
+    """Returns the word matched by a whole-word regex pattern
+
+    Args:
+        pattern: the regex pattern to check
+
+    Returns:
+        The word between the two word boundaries, or None if the
+        pattern is not a single whole word.
+
+    Raises:
+        None.
+    """
+
+    match = WORD_PATTERN.match(pattern)
+
+    if match:
+        return match.group(1)
+
+    return None
+
+def can_create(replacement, pattern):
+    """Checks if inserting replacement can create a new pattern match
+
+    A match of pattern that did not exist before a replacement was
+    made has to overlap the inserted text, so either one string
+    contains the other or the end of one lines up with the start of
+    the other. Deleting text can join any characters together.
+
+    Args:
+        replacement: the text inserted by an earlier rule
+        pattern: the text searched for by a later rule
+
+    Returns:
+        True if the replacement can create a match of pattern.
+
+    Raises:
+        None.
+    """
+
+    if replacement == "":
+        return len(pattern) > 1
+
+    if replacement in pattern or pattern in replacement:
+        return True
+
+    for i in range(1, min(len(replacement), len(pattern))):
+        if (replacement.endswith(pattern[:i])
+                or replacement.startswith(pattern[-i:])):
+            return True
+
+    return False
+
+
+def required_literal(pattern):
+    """Returns the longest text every match of a regex pattern contains
+
+    Args:
+        pattern: the regex pattern to check
+
+    Returns:
+        The longest run of literal characters in the top level of
+        the pattern, ignoring zero width assertions such as \\b, or
+        None if the pattern has no required text.
+
+    Raises:
+        None.
+    """
+
+    try:
+        if re.compile(pattern).flags & re.IGNORECASE:
+            return None
+
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return None
+
+    longest = ""
+    run = []
+
+    for op, av in parsed:
+        if op == sre_parse.LITERAL:
+            run.append(chr(av))
+        elif op != sre_parse.AT:
+            longest = max(longest, "".join(run), key=len)
+            run = []
+
+    longest = max(longest, "".join(run), key=len)
+
+    return longest or None
+
+def fused_kind(rule):
+    """Returns how compile_rules fuses a rule with its neighbours
+
+    Args:
+        rule: a (kind, pattern, replacement) tuple
+
+    Returns:
+        Tuple of (kind, text). kind is LITERAL for rules applied as
+        plain text replacements, WORD for whole-word rules and None
+        for rules that get a pass of their own. text is the literal
+        text or word the rule looks for.
+
+    Raises:
+        ValueError: the rule has an unknown kind.
+    """
+
+    kind, pattern, replacement = rule
+
+    if kind == LITERAL:
+        return LITERAL, pattern
+
+    if kind != REGEX:
+        raise ValueError("Unknown rule kind: %s" % kind)
+
+    if "\\" in replacement:
+        return None, None
+
+    text = literal_text(pattern)
+
+    if text is not None:
+        return LITERAL, text
+
+    word = word_text(pattern)
+
+    if word is not None:
+        return WORD, word
+
+    return None, None
+
+
+def is_word_char(char):
+    """Checks if \\b treats a character as part of a word"""
+    return char.isalnum() or char == "_"
+
+def pattern_chars(parsed):
+    """Returns the characters a parsed regex pattern can match
+
+    Args:
+        parsed: the items of a pattern parsed by sre_parse
+
+    Returns:
+        Tuple of (chars, contextual). chars is the set of characters
+        a match can contain, or None if it cannot be worked out.
+        contextual is True if the pattern checks for word boundaries
+        around or inside the match.
+
+    Raises:
+        None.
+    """
+
+    global space_chars
+
+    chars = set()
+    contextual = False
+
+    for op, av in parsed:
+        if op == sre_parse.LITERAL:
+            chars.add(chr(av))
+        elif op == sre_parse.IN:
+            for itemOp, itemAv in av:
+                if itemOp == sre_parse.LITERAL:
+                    chars.add(chr(itemAv))
+                elif (itemOp == sre_parse.RANGE
+                        and itemAv[1] - itemAv[0] < 256):
+                    low, high = itemAv
+                    chars.update(map(chr, range(low, high + 1)))
+                elif (itemOp == sre_parse.CATEGORY
+                        and itemAv == sre_parse.CATEGORY_SPACE):
+                    if space_chars is None:
+                        space_chars = frozenset(
+                            char for char in map(chr, range(0x110000))
+                            if char.isspace()
+                        )
+
+                    chars.update(space_chars)
+                else:
+                    return None, True
+        elif op == sre_parse.AT:
+            if av in (sre_parse.AT_BOUNDARY, sre_parse.AT_NON_BOUNDARY):
+                contextual = True
+            elif av == sre_parse.AT_END:
+                # $ also matches before a newline at the end
+                chars.add("\n")
+            elif av not in (sre_parse.AT_BEGINNING,
+                            sre_parse.AT_BEGINNING_STRING,
+                            sre_parse.AT_END_STRING):
+                return None, True
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            subChars, subContextual = pattern_chars(av[2])
+
+            if subChars is None:
+                return None, True
+
+            chars.update(subChars)
+            contextual = contextual or subContextual
+        elif op == sre_parse.SUBPATTERN and not av[1] and not av[2]:
+            subChars, subContextual = pattern_chars(av[3])
+
+            if subChars is None:
+                return None, True
+
+            chars.update(subChars)
+            contextual = contextual or subContextual
+        elif op == sre_parse.BRANCH:
+            for branch in av[1]:
+                subChars, subContextual = pattern_chars(branch)
+
+                if subChars is None:
+                    return None, True
+
+                chars.update(subChars)
+                contextual = contextual or subContextual
+        else:
+            return None, True
+
+    return chars, contextual
+
+
+class RuleFootprint(object):
+    """The text a rule reads and writes, for checking dependencies
+
+    Attributes:
+        text: the exact text of every match, or None if matches vary
+        chars: set of characters a match can contain, or None if
+            any character may be matched
+        contextual: True if a match depends on whether the
+            characters next to it are word characters
+        replacement: the inserted text, or None if it depends on
+            the match
+    """
+
+    def __init__(self, text, chars, contextual, replacement):
+        self.text = text
+        self.chars = chars
+        self.contextual = contextual
+        self.replacement = replacement
+
+    def keeps_boundaries(self):
+        """Checks if the rule never changes a word boundary next to it
+
+        The first and last characters of the inserted text must be
+        word characters exactly when the first and last characters
+        of the replaced text were.
+        """
+
+        if not self.replacement:
+            return False
+
+        if self.text is not None:
+            text = self.text
+            replacement = self.replacement
+
+            return (
+                is_word_char(text[0]) == is_word_char(replacement[0])
+                and is_word_char(text[-1]) == is_word_char(replacement[-1])
+            )
+
+        if self.chars is None:
+            return False
+
+        wordness = set(
+            is_word_char(char) for char in self.chars | set(self.replacement)
+        )
+
+        return len(wordness) == 1
+
+def rule_footprint(rule):
+    """Returns the RuleFootprint of a (kind, pattern, replacement) rule"""
+    kind, pattern, replacement = rule
+
+    if kind == LITERAL:
+        if pattern == "":
+            return RuleFootprint(None, None, False, replacement)
+
+        return RuleFootprint(pattern, set(pattern), False, replacement)
+
+    if "\\" in replacement:
+        replacement = None
+
+    try:
+        if re.compile(pattern).flags & re.IGNORECASE:
+            return RuleFootprint(None, None, True, replacement)
+
+        parsed = sre_parse.parse(pattern)
+    except re.error:
+        return RuleFootprint(None, None, True, replacement)
+
+    # A pattern that can match nothing inserts at every position
+    if parsed.getwidth()[0] == 0:
+        return RuleFootprint(None, None, True, replacement)
+
+    chars, contextual = pattern_chars(parsed)
+
+    # Literal text between optional word boundaries, e.g. \bHmg-Coa\b
+    items = list(parsed)
+    boundary = (sre_parse.AT, sre_parse.AT_BOUNDARY)
+
+    if items and items[0] == boundary:
+        items = items[1:]
+
+    if items and items[-1] == boundary:
+        items = items[:-1]
+
+    if items and all(op == sre_parse.LITERAL for op, av in items):
+        text = "".join(chr(av) for op, av in items)
+    else:
+        text = None
+
+    return RuleFootprint(text, chars, contextual, replacement)
+
+def rule_conflict(first, second):
+    """Returns why two rules cannot swap places
+
+    Two rules give the same result in either order when neither can
+    create, destroy or resize a match of the other. This holds when
+    their matches can never overlap, neither inserts text the other
+    can match, and neither changes a word boundary the other checks.
+
+    Args:
+        first: the RuleFootprint of the earlier rule
+        second: the RuleFootprint of the later rule
+
+    Returns:
+        None if the rules can swap places, otherwise "unknown" if a
+        rule could not be analysed, "overlap" if a match of one rule
+        can overlap a match of the other, "creates" if one rule can
+        insert text the other matches, or "boundary" if one rule can
+        change a word boundary next to a match of the other.
+
+    Raises:
+        None.
+    """
+
+    if (first.chars is None or second.chars is None
+            or first.replacement is None or second.replacement is None):
+        return "unknown"
+
+    if first.text is not None and second.text is not None:
+        # Two texts overlap in the same cases an inserted text can
+        # create a match
+        if can_create(first.text, second.text):
+            return "overlap"
+
+        if (can_create(first.replacement, second.text)
+                or can_create(second.replacement, first.text)):
+            return "creates"
+    else:
+        if first.chars & second.chars:
+            return "overlap"
+
+        if (first.replacement == "" or second.replacement == ""
+                or second.chars.intersection(first.replacement)
+                or first.chars.intersection(second.replacement)):
+            return "creates"
+
+    if ((second.contextual and not first.keeps_boundaries())
+            or (first.contextual and not second.keeps_boundaries())):
+        return "boundary"
+
+    return None
+
+def dependency_graph(rules):
+    """Finds every pair of rules whose order matters
+
+    Args:
+        rules: list of (kind, pattern, replacement) tuples in order
+
+    Returns:
+        List of (earlier, later, reason) edges, where earlier and
+        later are 1-based rule positions and reason is the
+        rule_conflict reason the later rule must stay after the
+        earlier one.
+
+    Raises:
+        None.
+    """
+
+    footprints = [rule_footprint(rule) for rule in rules]
+    edges = []
+
+    for later, laterFootprint in enumerate(footprints):
+        for earlier in range(later):
+            reason = rule_conflict(footprints[earlier], laterFootprint)
+
+            if reason is not None:
+                edges.append((earlier + 1, later + 1, reason))
+
+    return edges
+
+def reorder_rules(rules):
+    """Moves rules up next to earlier rules they can be fused with
+
+    A literal or whole-word rule is moved up to just after the
+    closest earlier rule of the same fused kind, within
+    REORDER_WINDOW rules, when rule_conflict shows it can swap
+    places with every rule it moves past. The rules then form
+    longer runs for compile_rules to fuse, and the result of
+    applying them is unchanged.
+
+    Args:
+        rules: list of (kind, pattern, replacement) tuples in order
+
+    Returns:
+        The reordered list of rules.
+
+    Raises:
+        ValueError: a rule has an unknown kind.
+    """
+
+    kinds = [fused_kind(rule)[0] for rule in rules]
+    footprints = [rule_footprint(rule) for rule in rules]
+    order = []
+
+    for index, kind in enumerate(kinds):
+        position = len(order)
+
+        if kind is not None:
+            stop = max(len(order) - REORDER_WINDOW, 0)
+
+            for back in range(len(order) - 1, stop - 1, -1):
+                earlier = order[back]
+
+                if kinds[earlier] == kind:
+                    position = back + 1
+                    break
+
+                if rule_conflict(footprints[earlier],
+                                 footprints[index]) is not None:
+                    break
+
+        order.insert(position, index)
+
+    return [rules[index] for index in order]
+
+
+class TriggerIndex(object):
+    """Finds which triggers a replacement can create in one lookup
+
+    Gives the same answers as calling can_create for every trigger,
+    using indexes of the triggers and of their prefixes and
+    suffixes.
+    """
+
+    def __init__(self, triggers):
+        self.triggers = list(triggers)
+        self.exact = {}
+        self.prefixes = {}
+        self.suffixes = {}
+
+        for index, trigger in enumerate(self.triggers):
+            self.exact.setdefault(trigger, set()).add(index)
+
+            for i in range(1, len(trigger)):
+                self.prefixes.setdefault(trigger[:i], set()).add(index)
+                self.suffixes.setdefault(trigger[-i:], set()).add(index)
+
+    def creatable(self, replacement):
+        """Returns the indices of the triggers replacement can create."""
+        if replacement == "":
+            return set(
+                index for index, trigger in enumerate(self.triggers)
+                if len(trigger) > 1
+            )
+
+        found = set(
+            index for index, trigger in enumerate(self.triggers)
+            if replacement in trigger
+        )
+
+        for start in range(len(replacement)):
+            for end in range(start + 1, len(replacement) + 1):
+                found.update(self.exact.get(replacement[start:end], ()))
+
+        for i in range(1, len(replacement)):
+            found.update(self.prefixes.get(replacement[-i:], ()))
+            found.update(self.suffixes.get(replacement[:i], ()))
+
+        return found
+
+
+class Automaton(object):
+    """Aho-Corasick automaton that finds a set of strings in one scan"""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        goto = [{}]
+        output = [set()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append(set())
+                    goto[state][char] = len(goto) - 1
+
+                state = goto[state][char]
+
+            output[state].add(index)
+
+        # Breadth first pass to set the fail links and merge outputs
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+
+        for state in queue:
+            for char, nextState in goto[state].items():
+                queue.append(nextState)
+                failState = fail[state]
+
+                while failState and char not in goto[failState]:
+                    failState = fail[failState]
+
+                if state and char in goto[failState]:
+                    fail[nextState] = goto[failState][char]
+
+                output[nextState] |= output[fail[nextState]]
+
+        self.goto = goto
+        self.fail = fail
+        self.output = [tuple(sorted(found)) for found in output]
+
+        # Transitions are resolved through the fail links on first use
+        # and then cached, so scanning costs one lookup per character
+        self.delta = [dict(state) for state in goto]
+
+    def step(self, state, char):
+        """Returns and caches the automaton transition for char."""
+        fromState = state
+
+        while state and char not in self.goto[state]:
+            state = self.fail[state]
+
+        nextState = self.goto[state].get(char, 0)
+        self.delta[fromState][char] = nextState
+
+        return nextState
+
+    def find(self, text):
+        """Returns the indices of every pattern found in text."""
+        delta = self.delta
+        output = self.output
+        found = set(output[0])
+        state = 0
+
+        for char in text:
+            nextState = delta[state].get(char)
+
+            if nextState is None:
+                nextState = self.step(state, char)
+
+            state = nextState
+
+            if output[state]:
+                found.update(output[state])
+
+        return found
+
+
+class LiteralStage(object):
+    """Applies a run of str.replace rules with one scan of the text
+
+    An Aho-Corasick automaton built from the run finds which rules
+    match the incoming text. Only those rules are applied, in their
+    original order, along with any later rule whose pattern could
+    have been created by a replacement that was made.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+
+        # Later rules each rule's replacement can create a match for
+        self.creates = []
+
+        for i, (pattern, replacement) in enumerate(self.rules):
+            self.creates.append(tuple(
+                j for j in range(i + 1, len(self.rules))
+                if can_create(replacement, self.rules[j][0])
+            ))
+
+        self.automaton = Automaton(
+            pattern for pattern, replacement in self.rules
+        )
+
+    def apply(self, text):
+        """Applies the matching rules of the stage to text."""
+        found = self.automaton.find(text)
+
+        if not found:
+            return text
+
+        rules = self.rules
+        creates = self.creates
+        pending = list(found)
+        heapq.heapify(pending)
+
+        while pending:
+            index = heapq.heappop(pending)
+            pattern, replacement = rules[index]
+
+            if pattern in text:
+                text = text.replace(pattern, replacement)
+
+                for later in creates[index]:
+                    if later not in found:
+                        found.add(later)
+                        heapq.heappush(pending, later)
+
+        return text
+
+
+class WordLookup(dict):
+    """Maps the words of a fused word pass to their replacements"""
+
+    def __init__(self, lookup):
+        dict.__init__(self, lookup)
+
+        # Longest words first so the scan tries them first
+        alternation = "|".join(sorted(lookup, key=len, reverse=True))
+        self.sub = re.compile(r"\b(?:%s)\b" % alternation).sub
+
+    def __call__(self, match):
+        return self[match.group()]
+
+    def apply(self, text):
+        """Replaces every whole word of text found in the lookup
+
+        Column values are usually one word, or a few words separated
+        by spaces, which splitting on spaces gives directly. Text with
+        any other separator is scanned with the alternation of the
+        words instead.
+        """
+
+        if text.isalnum():
+            return self.get(text, text)
+
+        if not text.replace(" ", "").isalnum():
+            return self.sub(self, text)
+
+        get = self.get
+        words = text.split(" ")
+        replaced = [get(word, word) for word in words]
+
+        # The same string is returned when nothing changed, which
+        # RuleSet.apply relies on
+        if replaced == words:
+            return text
+
+        return " ".join(replaced)
+
+
+class SpaceCollapse(object):
+    """Applies a \\s{2,} rule, skipping text it cannot match
+
+    Printable text holds no whitespace other than the space, so it
+    only matches when it holds two spaces in a row.
+    """
+
+    def __init__(self, replacement):
+        self.sub = re.compile(SPACE_RUN_PATTERN).sub
+        self.replacement = replacement
+
+    def apply(self, text):
+        if "  " not in text and text.isprintable():
+            return text
+
+        return self.sub(self.replacement, text)
+
+
+def compile_words(words):
+    """Fuses a run of whole-word rules into dictionary lookup passes
+
+    A whole-word rule only ever matches a complete run of word
+    characters, and its replacement cannot merge with the words
+    around it. Looking each word of the text up in a dict is
+    therefore the same as applying the run in order, unless a
+    replacement contains a word a later rule looks for. Such a rule
+    starts a new pass.
+
+    Args:
+        words: list of (word, replacement) tuples in rule order
+
+    Returns:
+        List of TOKEN_PASS passes, each holding a WordLookup. A pass
+        for a single word has the word as its trigger.
+
+    Raises:
+        None.
+    """
+
+    passes = []
+    groups = []
+    lookup = {}
+    created = set()
+
+    for word, replacement in words:
+        if word in created:
+            groups.append(lookup)
+            lookup = {}
+            created = set()
+
+        # A repeated word only matches again if an earlier
+        # replacement recreated it, which starts a new pass above
+        lookup.setdefault(word, replacement)
+        created.update(WORD_CHARS.findall(replacement))
+
+    groups.append(lookup)
+
+    for lookup in groups:
+        trigger = next(iter(lookup)) if len(lookup) == 1 else None
+        passes.append((TOKEN_PASS, trigger, WordLookup(lookup), None))
+
+    return passes
+
+def family_signatures(pattern, replacement):
+    """Returns the character families a literal rule can belong to
+
+    A family is a set of rules that each insert the same text
+    between one varying character and the same fixed text, such as
+    a( -> a (, b( -> b ( or )A -> ) A, )B -> ) B.
+
+    Args:
+        pattern: the literal text of the rule
+        replacement: the replacement text of the rule
+
+    Returns:
+        List of (signature, char) tuples, where signature is a
+        (side, fixed, inserted) tuple and char is the varying
+        character of the rule.
+
+    Raises:
+        None.
+    """
+
+    signatures = []
+
+    if len(pattern) < 2 or len(replacement) <= len(pattern):
+        return signatures
+
+    fixed = pattern[1:]
+    inserted = replacement[1:len(replacement) - len(fixed)]
+
+    if replacement == pattern[0] + inserted + fixed:
+        signatures.append((("before", fixed, inserted), pattern[0]))
+
+    fixed = pattern[:-1]
+    inserted = replacement[len(fixed):-1]
+
+    if replacement == fixed + inserted + pattern[-1]:
+        signatures.append((("after", fixed, inserted), pattern[-1]))
+
+    return signatures
+
+def compile_family(signature, chars):
+    """Compiles a family of single character rules into one pass
+
+    The rules of a family never overlap or create matches for each
+    other, as long as the varying characters do not appear in the
+    fixed or inserted text, so they can be applied as one character
+    class substitution. The pass is skipped when the fixed text is
+    not in the string.
+
+    Args:
+        signature: the (side, fixed, inserted) family signature
+        chars: the varying characters of the family, in rule order
+
+    Returns:
+        A SUB_PASS pass.
+
+    Raises:
+        None.
+    """
+
+    side, fixed, inserted = signature
+    charClass = "[%s]" % "".join(re.escape(char) for char in chars)
+
+    # Backslashes in the fixed or inserted text must not be read as
+    # template escapes
+    fixedText = fixed.replace("\\", "\\\\")
+    insertedText = inserted.replace("\\", "\\\\")
+
+    if side == "before":
+        pattern = re.compile("(%s)%s" % (charClass, re.escape(fixed)))
+        template = r"\g<1>" + insertedText + fixedText
+    else:
+        pattern = re.compile("%s(%s)" % (re.escape(fixed), charClass))
+        template = fixedText + insertedText + r"\g<1>"
+
+    return (SUB_PASS, fixed, pattern.sub, template)
+
+def find_families(literals):
+    """Splits a run of literal rules into literal runs and families
+
+    Args:
+        literals: list of (pattern, replacement) tuples
+
+    Returns:
+        List of (signature, items) segments in rule order. Literal
+        runs have a signature of None and items of (pattern,
+        replacement) tuples; families have their signature and items
+        of varying characters.
+
+    Raises:
+        None.
+    """
+
+    segments = []
+    run = []
+    family = None
+    chars = []
+
+    def close_family():
+        if family is None:
+            return
+
+        if len(chars) >= MIN_FAMILY_RULES:
+            if run:
+                segments.append((None, list(run)))
+                del run[:]
+
+            segments.append((family, list(chars)))
+        else:
+            side, fixed, inserted = family
+
+            for char in chars:
+                if side == "before":
+                    run.append((char + fixed, char + inserted + fixed))
+                else:
+                    run.append((fixed + char, fixed + inserted + char))
+
+    for index, (pattern, replacement) in enumerate(literals):
+        signatures = family_signatures(pattern, replacement)
+        matched = False
+
+        for signature, char in signatures:
+            if (signature == family and char not in chars
+                    and char not in signature[1] + signature[2]):
+                chars.append(char)
+                matched = True
+                break
+
+        if matched:
+            continue
+
+        close_family()
+        family = None
+        chars = []
+
+        # Start a new family on the signature the next rule shares
+        if index + 1 < len(literals):
+            following = [
+                signature for signature, char
+                in family_signatures(*literals[index + 1])
+            ]
+        else:
+            following = []
+
+        for signature, char in signatures:
+            if (signature in following
+                    and char not in signature[1] + signature[2]):
+                family = signature
+                chars = [char]
+                break
+        else:
+            run.append((pattern, replacement))
+
+    close_family()
+
+    if run:
+        segments.append((None, run))
+
+    return segments
+
+def compile_literals(literals):
+    """Compiles a run of literal rules into passes
+
+    Args:
+        literals: list of (pattern, replacement) tuples
+
+    Returns:
+        List of passes. Character families found by find_families
+        get one pass each; the rest are applied by a LiteralStage or,
+        for short runs, one REPLACE_PASS per rule.
+
+    Raises:
+        None.
+    """
+
+    passes = []
+
+    for signature, items in find_families(literals):
+        if signature is not None:
+            passes.append(compile_family(signature, items))
+        elif len(items) >= MIN_STAGE_RULES:
+            passes.append((STAGE_PASS, None, LiteralStage(items), None))
+        else:
+            for pattern, replacement in items:
+                passes.append((REPLACE_PASS, None, pattern, replacement))
+
+    return passes
+
+def compile_rules(rules):
+    """Compiles an ordered list of rules into substitution passes
+
+    Args:
+        rules: list of (kind, pattern, replacement) tuples
+
+    Returns:
+        List of (passType, trigger, first, second) passes. A pass
+        with a trigger is skipped when the trigger text is not in
+        the string. A SUB_PASS holds the bound sub method of the
+        compiled pattern and the replacement. A REPLACE_PASS holds
+        the text to find and its replacement. A STAGE_PASS holds a
+        LiteralStage for a run of consecutive literal rules, a
+        TOKEN_PASS a WordLookup for a run of whole-word rules and a
+        SPACE_PASS a SpaceCollapse for a whitespace rule. Regex
+        rules that only match literal text and have a plain
+        replacement are demoted to literal rules and compiled by
+        compile_literals, and runs of whole-word regex rules are
+        fused by compile_words. reorder_rules first moves rules
+        together where the dependency analysis allows it.
+
+    Raises:
+        ValueError: a rule has an unknown kind.
+    """
+
+    passes = []
+    literals = []
+    words = []
+
+    def flush():
+        if literals:
+            passes.extend(compile_literals(literals))
+
+        if words:
+            passes.extend(compile_words(words))
+
+        del literals[:]
+        del words[:]
+
+    for rule in reorder_rules(rules):
+        kind, text = fused_kind(rule)
+
+        if kind == LITERAL:
+            if words:
+                flush()
+
+            literals.append((text, rule[2]))
+        elif kind == WORD:
+            if literals:
+                flush()
+
+            words.append((text, rule[2]))
+        elif rule[1] == SPACE_RUN_PATTERN and "\\" not in rule[2]:
+            flush()
+            passes.append((SPACE_PASS, None, SpaceCollapse(rule[2]), None))
+        else:
+            flush()
+            passes.append(
+                (SUB_PASS, None, re.compile(rule[1]).sub, rule[2])
+            )
+
+    flush()
+
+    return passes
+
+
+def pass_triggers(compiledPass):
+    """Returns the texts a pass needs and the texts it can insert
+
+    Args:
+        compiledPass: a pass from compile_rules
+
+    Returns:
+        Tuple of (triggers, inserted). triggers is a list of texts
+        at least one of which must be in the string for the pass to
+        change it, or None if the pass must always run. inserted is
+        a list of the texts the pass can insert, or None if the
+        inserted text depends on the match.
+
+    Raises:
+        None.
+    """
+
+    passType, trigger, first, second = compiledPass
+
+    if passType == REPLACE_PASS:
+        return [first], [second]
+
+    if passType == STAGE_PASS:
+        return (
+            [pattern for pattern, replacement in first.rules],
+            [replacement for pattern, replacement in first.rules]
+        )
+
+    if passType == TOKEN_PASS:
+        return list(first), list(first.values())
+
+    if passType == SPACE_PASS:
+        return None, [first.replacement]
+
+    if trigger is not None:
+        triggers = [trigger]
+    else:
+        literal = required_literal(first.__self__.pattern)
+        triggers = [literal] if literal is not None else None
+
+    if isinstance(second, str) and "\\" not in second:
+        return triggers, [second]
+
+    return triggers, None
+
+
+class RuleSet(object):
+    """An ordered list of normalization rules compiled once
+
+    Applying the rule set gives the same output as running each
+    rule as its own re.sub or str.replace statement, in order.
+
+    Each pass is indexed by the trigger texts it needs. One scan of
+    the string finds which triggers are present, and only the passes
+    for those triggers, plus passes with no trigger, are run. When a
+    pass changes the string, passes for any trigger its replacement
+    could have created are run as well.
+    """
+
+    def __init__(self, rules, name=None, digest=None):
+        self.name = name
+        self.digest = digest
+        self.rules = list(rules)
+        self.passes = compile_rules(self.rules)
+        self.index_triggers()
+
+        # Per rule [hits, matches, seconds], filled while profiling
+        self.calls = 0
+        self.stats = [[0, 0, 0.0] for rule in self.rules]
+
+        # Unfused pass per rule, compiled when first needed
+        self.rulePasses = None
+
+        # apply function from a generated module, if one is in use
+        self.generated = None
+
+    def index_triggers(self):
+        """Builds the trigger automaton and pass indexes."""
+        if len(self.passes) < MIN_TRIGGER_PASSES:
+            self.automaton = None
+            return
+
+        triggers = []
+        triggerIds = {}
+        triggerPasses = []
+        passInserts = []
+        self.alwaysRun = []
+
+        for index, compiledPass in enumerate(self.passes):
+            passTriggers, inserted = pass_triggers(compiledPass)
+            passInserts.append(inserted)
+
+            if passTriggers is None:
+                self.alwaysRun.append(index)
+                continue
+
+            for trigger in passTriggers:
+                if trigger not in triggerIds:
+                    triggerIds[trigger] = len(triggers)
+                    triggers.append(trigger)
+                    triggerPasses.append([])
+
+                triggerPasses[triggerIds[trigger]].append(index)
+
+        # Triggers each pass can create, or None to rescan the string
+        triggerIndex = TriggerIndex(triggers)
+        self.creates = []
+
+        for inserted in passInserts:
+            if inserted is None:
+                self.creates.append(None)
+                continue
+
+            created = set()
+
+            for text in set(inserted):
+                created.update(triggerIndex.creatable(text))
+
+            self.creates.append(tuple(sorted(created)))
+
+        self.automaton = Automaton(triggers)
+        self.triggerPasses = [tuple(passes) for passes in triggerPasses]
+
+    def enable_profiling(self):
+        """Records the matches and run time of every rule
+
+        While profiling, apply runs each rule as its own unfused
+        pass so matches and time can be counted per rule. The output
+        is unchanged.
+        """
+
+        self.calls = 0
+        self.stats = [[0, 0, 0.0] for rule in self.rules]
+        self.compile_rule_passes()
+
+        # Replacing the method keeps the normal apply free of checks
+        self.apply = self.apply_profiled
+
+    def compile_rule_passes(self):
+        """Compiles every rule as its own unfused pass, once."""
+        if self.rulePasses is not None:
+            return
+
+        self.rulePasses = []
+
+        for kind, pattern, replacement in self.rules:
+            if kind == REGEX:
+                self.rulePasses.append(
+                    (True, re.compile(pattern).subn, replacement)
+                )
+            else:
+                self.rulePasses.append((False, pattern, replacement))
+
+    def disable_profiling(self):
+        """Stops recording and switches back to the compiled passes."""
+        self.reset_apply()
+
+    def reset_apply(self):
+        """Switches apply back to the generated module or the passes."""
+        self.__dict__.pop("apply", None)
+
+        if self.generated is not None:
+            self.apply = self.generated
+
+    def use_generated(self, function):
+        """Applies the rules with a function built by a generated module
+
+        Args:
+            function: the apply function returned by the build
+                function of the module generate_source wrote for
+                this rule set
+
+        Returns:
+            None.
+
+        Raises:
+            None.
+        """
+
+        self.generated = function
+        self.apply = function
+
+    def apply_profiled(self, text):
+        """Runs every rule over text, recording matches and time."""
+        self.calls += 1
+        clock = time.perf_counter
+
+        for (isRegex, first, second), stats in zip(self.rulePasses,
+                                                   self.stats):
+            start = clock()
+
+            if isRegex:
+                text, count = first(second, text)
+            else:
+                count = text.count(first)
+
+                if count:
+                    text = text.replace(first, second)
+
+            stats[2] += clock() - start
+
+            if count:
+                stats[0] += 1
+                stats[1] += count
+
+        return text
+
+    def profile(self):
+        """Returns the recorded statistics for every rule
+
+        Returns:
+            List of dicts with the position, kind, pattern and
+            replacement of each rule, the number of calls, the
+            number of calls the rule matched in (hits), the total
+            number of substitutions (matches) and the time spent.
+        """
+
+        rows = []
+
+        for position, (rule, stats) in enumerate(zip(self.rules,
+                                                     self.stats), 1):
+            kind, pattern, replacement = rule
+            hits, matches, seconds = stats
+
+            rows.append({
+                "ruleset": self.name,
+                "position": position,
+                "kind": kind,
+                "pattern": pattern,
+                "replacement": replacement,
+                "calls": self.calls,
+                "hits": hits,
+                "matches": matches,
+                "seconds": seconds,
+            })
+
+        return rows
+
+    def apply_sequential(self, text):
+        """Runs every rule over text as its own substitution
+
+        This is how the rules were applied before they were compiled
+        into passes, and is the reference the passes are checked
+        against.
+        """
+
+        self.compile_rule_passes()
+
+        for isRegex, first, second in self.rulePasses:
+            if isRegex:
+                text = first(second, text)[0]
+            elif first in text:
+                text = text.replace(first, second)
+
+        return text
+
+    def apply_all(self, text):
+        """Runs every pass over text and returns the result."""
+        for passType, trigger, first, second in self.passes:
+            if trigger is not None and trigger not in text:
+                continue
+
+            if passType is SUB_PASS:
+                text = first(second, text)
+            elif passType is REPLACE_PASS:
+                if first in text:
+                    text = text.replace(first, second)
+            else:
+                text = first.apply(text)
+
+        return text
+
+    def apply(self, text):
+        """Runs the passes triggered by text and returns the result."""
+        if self.automaton is None:
+            return self.apply_all(text)
+
+        passes = self.passes
+        creates = self.creates
+        triggerPasses = self.triggerPasses
+
+        found = self.automaton.find(text)
+        pending = set(self.alwaysRun)
+
+        for trigger in found:
+            pending.update(triggerPasses[trigger])
+
+        queued = set(pending)
+        pending = list(pending)
+        heapq.heapify(pending)
+
+        while pending:
+            index = heapq.heappop(pending)
+            passType, trigger, first, second = passes[index]
+
+            if trigger is not None and trigger not in text:
+                continue
+
+            before = text
+
+            if passType is SUB_PASS:
+                text = first(second, text)
+            elif passType is REPLACE_PASS:
+                if first in text:
+                    text = text.replace(first, second)
+            else:
+                text = first.apply(text)
+
+            if text is before:
+                continue
+
+            # Queue later passes for triggers the change may have made
+            if creates[index] is None:
+                newTriggers = self.automaton.find(text) - found
+            else:
+                newTriggers = [
+                    created for created in creates[index]
+                    if created not in found
+                ]
+
+            for created in newTriggers:
+                found.add(created)
+
+                for later in triggerPasses[created]:
+                    if later > index and later not in queued:
+                        queued.add(later)
+                        heapq.heappush(pending, later)
+
+        return text
+
+
+def generate_source(ruleset):
+    """Writes the passes of a rule set out as a Python module
+
+    The module unrolls RuleSet.apply for the rule set: each pass
+    becomes its own statements, guarded by a check for the triggers
+    found in the string, so no time is spent on looking up and
+    dispatching passes. Literal replacements and trigger checks are
+    written inline; stages, word lookups, whitespace passes and
+    regex substitutions call the objects compiled for the rule set.
+
+    The module records the rule set's digest and has a build
+    function that takes the RuleSet and returns the apply function.
+
+    Args:
+        ruleset: the RuleSet to generate the module for
+
+    Returns:
+        The source of the module.
+
+    Raises:
+        None.
+    """
+
+    lines = [
+        '"""Generated from rules/%s.csv by generate_rules.py"""' % (
+            ruleset.name
+        ),
+        "",
+        "DIGEST = %r" % ruleset.digest,
+        "",
+        "",
+        "def build(ruleset):",
+        "    passes = ruleset.passes",
+    ]
+
+    indexed = ruleset.automaton is not None
+    passTriggers = {}
+
+    if indexed:
+        lines.append("    find = ruleset.automaton.find")
+
+        for trigger, passes in enumerate(ruleset.triggerPasses):
+            for index in passes:
+                passTriggers.setdefault(index, []).append(trigger)
+
+    body = []
+
+    for index, (passType, trigger, first, second) in enumerate(
+            ruleset.passes):
+        indent = "    "
+        body.append("")
+        body.append("        # Pass %s" % index)
+
+        # Passes are skipped when none of their triggers are found
+        if indexed and index not in ruleset.alwaysRun:
+            triggers = passTriggers.get(index, [])
+
+            if len(triggers) == 1:
+                body.append("        if %s in found:" % triggers[0])
+            else:
+                lines.append("    triggers%s = frozenset(%r)" % (
+                    index, triggers
+                ))
+                body.append(
+                    "        if not found.isdisjoint(triggers%s):" % index
+                )
+
+            indent += "    "
+
+        if trigger is not None:
+            body.append("    %sif %r in text:" % (indent, trigger))
+            indent += "    "
+
+        # Triggers the pass can create are added to those found
+        update = None
+
+        if indexed and ruleset.creates[index] is None:
+            update = "found |= find(text)"
+        elif indexed and ruleset.creates[index]:
+            lines.append("    creates%s = ruleset.creates[%s]" % (
+                index, index
+            ))
+            update = "found.update(creates%s)" % index
+
+        if passType == REPLACE_PASS:
+            body.append("    %sif %r in text:" % (indent, first))
+            body.append("    %s    text = text.replace(%r, %r)" % (
+                indent, first, second
+            ))
+
+            if update is not None:
+                body.append("    %s    %s" % (indent, update))
+
+            continue
+
+        if passType == SUB_PASS:
+            lines.append("    sub%s = passes[%s][2]" % (index, index))
+            call = "sub%s(%r, text)" % (index, second)
+        else:
+            lines.append("    apply%s = passes[%s][2].apply" % (
+                index, index
+            ))
+            call = "apply%s(text)" % index
+
+        if update is None:
+            body.append("    %stext = %s" % (indent, call))
+        else:
+            body.append("    %schanged = %s" % (indent, call))
+            body.append("    %sif changed is not text:" % indent)
+            body.append("    %s    text = changed" % indent)
+            body.append("    %s    %s" % (indent, update))
+
+    lines.append("")
+    lines.append("    def apply(text):")
+
+    if indexed:
+        lines.append("        found = find(text)")
+
+    lines.extend(body)
+    lines.append("")
+    lines.append("        return text")
+    lines.append("")
+    lines.append("    return apply")
+
+    return "\n".join(lines) + "\n"
+
+def temporary_path(path):
+    """Returns a path to write a cache file to before moving it to path
+
+    The file is named after this process and keeps the extension of
+    path, so it can be imported or unpickled before it is moved into
+    place with os.replace.
+    """
+
+    root, extension = os.path.splitext(path)
+
+    return "%s.%s.tmp%s" % (root, os.getpid(), extension)
+
+def generated_path(ruleset, cacheDir=CACHE_DIR):
+    """Returns the path of the generated module for a rule set"""
+    return os.path.join(
+        cacheDir, "%s-%s.py" % (ruleset.name, ruleset.digest)
+    )
+
+def load_generated(ruleset, path):
+    """Imports a generated module and builds its apply function
+
+    Args:
+        ruleset: the RuleSet the module was generated for
+        path: the path of the module
+
+    Returns:
+        The apply function, or None if the module is missing or was
+        generated for another version of the rule set.
+
+    Raises:
+        None.
+    """
+
+    if not os.path.exists(path):
+        return None
+
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "generated_%s" % ruleset.name, path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    if module.DIGEST != ruleset.digest:
+        return None
+
+    return module.build(ruleset)
+
+
+def read_rules(path):
+    """Reads a rule table from a .csv file
+
+    Rule tables have order, kind, pattern and replacement columns.
+    Blank lines and lines starting with # are ignored.
+
+    Args:
+        path: the path of the rule table
+
+    Returns:
+        List of (kind, pattern, replacement) tuples sorted by order.
+
+    Raises:
+        ValueError: a rule has an unknown kind.
+    """
+
+    import csv
+
+    with open(path, "r", encoding="utf-8", newline="") as ruleFile:
+        lines = [
+            line for line in ruleFile
+            if line.strip() and not line.startswith("#")
+        ]
+
+    rows = csv.DictReader(lines, delimiter=",", quotechar='"')
+    rules = []
+
+    for row in rows:
+        if row["kind"] not in (REGEX, LITERAL):
+            raise ValueError(
+                "Unknown rule kind in %s: %s" % (path, row["kind"])
+            )
+
+        rules.append((
+            int(row["order"]), row["kind"], row["pattern"],
+            row["replacement"]
+        ))
+
+    rules.sort(key=lambda rule: rule[0])
+
+    return [rule[1:] for rule in rules]
+
+def ruleset_digest(path):
+    """Returns the hash of a rule table and the rule compiler"""
+    import hashlib
+
+    digest = hashlib.sha1()
+
+    with open(path, "rb") as ruleFile:
+        digest.update(ruleFile.read())
+
+    # A change to the compiler also changes the compiled form
+    with open(os.path.abspath(__file__), "rb") as compilerFile:
+        digest.update(compilerFile.read())
+
+    return digest.hexdigest()
+
+def load_ruleset(name, rulesDir=RULES_DIR, cacheDir=CACHE_DIR):
+    """Loads a compiled rule set, compiling and caching it if needed
+
+    Compiled rule sets are cached in cacheDir, keyed by the hash of
+    the rule table, so the rules are only analysed again when the
+    table or the compiler changes. If generate_rules.py has written
+    a module for this version of the rule set, the rule set applies
+    its rules with that module.
+
+    Args:
+        name: the rule table name, e.g. "brand" for rules/brand.csv
+        rulesDir: the folder holding the rule tables
+        cacheDir: the folder holding the compiled rule sets
+
+    Returns:
+        The RuleSet for the rule table.
+
+    Raises:
+        ValueError: a rule has an unknown kind.
+    """
+
+    import pickle
+
+    path = os.path.join(rulesDir, "%s.csv" % name)
+    digest = ruleset_digest(path)
+    cachePath = os.path.join(cacheDir, "%s-%s.pickle" % (name, digest))
+
+    try:
+        with open(cachePath, "rb") as cacheFile:
+            ruleset = pickle.load(cacheFile)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        ruleset = None
+
+    if ruleset is None:
+        ruleset = RuleSet(read_rules(path), name=name, digest=digest)
+        cache_ruleset(ruleset, cachePath, cacheDir)
+
+    generated = load_generated(ruleset, generated_path(ruleset, cacheDir))
+
+    if generated is not None:
+        ruleset.use_generated(generated)
+
+    return ruleset
+
+def cache_ruleset(ruleset, cachePath, cacheDir):
+    """Saves a compiled rule set and removes older versions of it"""
+    import pickle
+
+    prefix = "%s-" % ruleset.name
+    current = "%s%s." % (prefix, ruleset.digest)
+
+    # The cache is only an optimization, so a read-only or full disk
+    # just means compiling the rules again next time
+    try:
+        if not os.path.exists(cacheDir):
+            os.makedirs(cacheDir)
+
+        # Other processes loading the rule set at the same time only
+        # ever see the whole file
+        temporary = temporary_path(cachePath)
+
+        with open(temporary, "wb") as cacheFile:
+            pickle.dump(ruleset, cacheFile, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary, cachePath)
+
+        # Remove rule sets compiled or generated from older versions
+        # of the table
+        for fileName in os.listdir(cacheDir):
+            if fileName.startswith(prefix) and not fileName.startswith(
+                    current):
+                os.remove(os.path.join(cacheDir, fileName))
+    except OSError:
+        pass
+
+class LazyRuleSet(object):
+    """A rule set that is only loaded the first time it is used
+
+    The first lookup of any RuleSet attribute, e.g. the first call to
+    apply, loads the rule set with load_ruleset. The object then
+    becomes that RuleSet, so later calls cost the same as on a rule
+    set loaded up front and references to it stay valid.
+    """
+
+    def __init__(self, name, rulesDir=RULES_DIR, cacheDir=CACHE_DIR):
+        self.name = name
+        self.rulesDir = rulesDir
+        self.cacheDir = cacheDir
+
+    def __getattr__(self, attribute):
+        ruleset = load_ruleset(self.name, self.rulesDir, self.cacheDir)
+
+        self.__dict__ = ruleset.__dict__
+        self.__class__ = ruleset.__class__
+
+        return getattr(self, attribute)
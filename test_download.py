@@ -0,0 +1,186 @@
+"""Tests download_zip against a local HTTP server, so no network is used
+
+    Run with: python -m unittest test_download
+"""
+
+import hashlib
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from urllib import error
+
+from download import download_zip, load_download_state, save_download_state
+
+
+class ZipHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the server's files, answering conditional requests
+
+    The server's files attribute maps paths to their contents. If its
+    sendValidators attribute is False no ETag or Last-Modified header
+    is sent, so only the content hash shows the file is unchanged.
+    If its cutOff attribute is True the connection is closed before
+    the whole file is sent.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+
+        data = self.server.files[self.path]
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+
+        if not self.server.sendValidators:
+            etag = None
+        elif self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified",
+                             "Mon, 02 Jan 2017 00:00:00 GMT")
+
+        if self.server.cutOff:
+            self.send_header("Content-Length", str(len(data) + 100))
+        else:
+            self.send_header("Content-Length", str(len(data)))
+
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DownloadZipTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.HTTPServer(("127.0.0.1", 0), ZipHandler)
+        self.server.files = {"/allfiles.zip": b"first extract"}
+        self.server.sendValidators = True
+        self.server.cutOff = False
+        self.server.requests = []
+
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+        self.url = "http://127.0.0.1:%s/allfiles.zip" % (
+            self.server.server_address[1]
+        )
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.folder)
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_first_download_is_saved(self):
+        details, changed = download_zip(self.url, self.path("a.zip"), {})
+
+        self.assertTrue(changed)
+        self.assertEqual(details["path"], self.path("a.zip"))
+        self.assertEqual(details["sha256"],
+                         hashlib.sha256(b"first extract").hexdigest())
+        self.assertIsNotNone(details["etag"])
+        self.assertEqual(self.read(details["path"]), b"first extract")
+        self.assertEqual(os.listdir(self.folder), ["a.zip"])
+
+    def test_not_modified_keeps_last_file(self):
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+        details, changed = download_zip(
+            self.url, self.path("b.zip"), {}, first
+        )
+
+        self.assertFalse(changed)
+        self.assertEqual(details, first)
+        self.assertEqual(self.server.requests[-1]["If-None-Match"],
+                         first["etag"])
+        self.assertFalse(os.path.exists(self.path("b.zip")))
+
+    def test_same_hash_keeps_last_file(self):
+        self.server.sendValidators = False
+
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+        details, changed = download_zip(
+            self.url, self.path("b.zip"), {}, first
+        )
+
+        self.assertFalse(changed)
+        self.assertEqual(details["path"], first["path"])
+        self.assertEqual(os.listdir(self.folder), ["a.zip"])
+
+    def test_changed_file_is_downloaded(self):
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+        self.server.files["/allfiles.zip"] = b"second extract"
+
+        details, changed = download_zip(
+            self.url, self.path("a.zip"), {}, first
+        )
+
+        self.assertTrue(changed)
+        self.assertNotEqual(details["etag"], first["etag"])
+        self.assertEqual(self.read(self.path("a.zip")), b"second extract")
+
+    def test_missing_last_file_is_downloaded_again(self):
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+        os.remove(first["path"])
+
+        details, changed = download_zip(
+            self.url, self.path("b.zip"), {}, first
+        )
+
+        self.assertTrue(changed)
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+        self.assertEqual(self.read(details["path"]), b"first extract")
+
+    def test_failed_download_keeps_last_file(self):
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+
+        with self.assertRaises(error.HTTPError):
+            download_zip(self.url + ".missing", self.path("a.zip"), {},
+                         first)
+
+        self.assertEqual(self.read(self.path("a.zip")), b"first extract")
+        self.assertEqual(os.listdir(self.folder), ["a.zip"])
+
+    def test_interrupted_download_keeps_last_file(self):
+        first, _ = download_zip(self.url, self.path("a.zip"), {})
+        self.server.files["/allfiles.zip"] = b"second extract"
+        self.server.cutOff = True
+
+        with self.assertRaises(error.ContentTooShortError):
+            download_zip(self.url, self.path("a.zip"), {}, first)
+
+        self.assertEqual(self.read(self.path("a.zip")), b"first extract")
+        self.assertEqual(os.listdir(self.folder), ["a.zip"])
+
+    def test_state_is_saved_and_loaded(self):
+        statePath = self.path("download_state.json")
+
+        self.assertEqual(load_download_state(statePath), {})
+
+        details, _ = download_zip(self.url, self.path("a.zip"), {})
+        save_download_state(statePath, {"allfiles.zip": details})
+
+        self.assertEqual(load_download_state(statePath),
+                         {"allfiles.zip": details})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests NormalizationStore against a store in a temporary folder
+
+    Run with: python -m unittest test_normalization_store
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from normalization_store import NormalizationStore
+
+
+class NormalizationStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "store.db")
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def normalizer(self, text):
+        self.calls.append(text)
+
+        return text.title()
+
+    def run_store(self, digest, values, readOnly=False):
+        """Normalizes values through a store, then closes it"""
+        store = NormalizationStore(self.path, readOnly=readOnly)
+        lookup = store.wrap("parseBrand", digest, self.normalizer)
+        results = [lookup(value) for value in values]
+        store.close()
+
+        return results
+
+    def stored_rows(self):
+        conn = sqlite3.connect(self.path)
+        rows = conn.execute(
+            "SELECT normalizer, digest, raw, normalized FROM normalized"
+        ).fetchall()
+        conn.close()
+
+        return sorted(rows)
+
+    def test_values_are_saved_and_looked_up(self):
+        self.assertEqual(self.run_store("a", ["ONE", "TWO", "ONE"]),
+                         ["One", "Two", "One"])
+        self.assertEqual(self.calls, ["ONE", "TWO"])
+
+        self.assertEqual(self.run_store("a", ["TWO", "ONE"]),
+                         ["Two", "One"])
+        self.assertEqual(self.calls, ["ONE", "TWO"])
+        self.assertEqual(self.stored_rows(), [
+            ("parseBrand", "a", "ONE", "One"),
+            ("parseBrand", "a", "TWO", "Two"),
+        ])
+
+    def test_changed_digest_drops_stored_values(self):
+        self.run_store("a", ["ONE", "TWO"])
+
+        self.assertEqual(self.run_store("b", ["ONE"]), ["One"])
+        self.assertEqual(self.calls, ["ONE", "TWO", "ONE"])
+        self.assertEqual(self.stored_rows(), [
+            ("parseBrand", "b", "ONE", "One"),
+        ])
+
+    def test_read_only_store_hands_new_values_back(self):
+        self.run_store("a", ["ONE"])
+
+        worker = NormalizationStore(self.path, readOnly=True)
+        lookup = worker.wrap("parseBrand", "a", self.normalizer)
+
+        self.assertEqual([lookup("ONE"), lookup("TWO")], ["One", "Two"])
+        self.assertEqual(self.calls, ["ONE", "TWO"])
+
+        added = worker.take_added()
+        worker.close()
+
+        self.assertEqual(added, [("parseBrand", "a", "TWO", "Two")])
+        self.assertEqual(worker.take_added(), [])
+
+        # Only the store that opened the database for writing saves
+        store = NormalizationStore(self.path)
+        store.wrap("parseBrand", "a", self.normalizer)
+        store.add(added + [("parseBrand", "old", "SIX", "Six")])
+        store.close()
+
+        self.assertEqual(self.stored_rows(), [
+            ("parseBrand", "a", "ONE", "One"),
+            ("parseBrand", "a", "TWO", "Two"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
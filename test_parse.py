@@ -0,0 +1,71 @@
+"""Tests parse_extract_columns against the row by row parse
+
+    Run with: python -m unittest test_parse
+"""
+
+import unittest
+
+from parse import get_row_transform, parse_extract_columns
+
+
+EXTRACTS = {
+    "drug.txt": [
+        ["1", "CAT IV", "HUMAN", "00012345", "TYLENOL (EXTRA STRENGTH)",
+         "TAB", "N", "1", "1", "01-JAN-2001", "0100000001"],
+        ["2", "CAT IV", "HUMAN", "00012346", "ADVIL LIQUI-GELS",
+         "", "N", "2", "1", "15-FEB-2010", "0100000002"],
+        ["3", "CAT IV", "VETERINARY", "00012347", "TYLENOL (EXTRA STRENGTH)",
+         "TAB", "N", "3", "1", "01-JAN-2001", "0100000001"],
+    ],
+    "ingred_ap.txt": [
+        ["1", "101", "ACETAMINOPHEN", "", "500", "MG", "", "1", "N",
+         "TAB", ""],
+        ["2", "102", "IBUPROFEN", "", "200", "MG", "", "", "N", "", ""],
+        ["3", "101", "ACETAMINOPHEN", "", "80", "MG", "", "1", "N",
+         "ML", ""],
+    ],
+    "route.txt": [
+        ["1", "1", "ORAL"],
+        ["2", "2", "TOPICAL"],
+        ["3", "1", "ORAL"],
+    ],
+    "status_ia.txt": [
+        ["1", "Y", "MARKETED", "01-JAN-2001"],
+        ["2", "N", "CANCELLED POST MARKET", "15-FEB-2010"],
+    ],
+}
+
+
+class ParseExtractColumnsTest(unittest.TestCase):
+    def rows_by_row(self, file):
+        transform = get_row_transform(file)
+
+        return [transform(list(row)) for row in EXTRACTS[file]]
+
+    def rows_by_column(self, title, file):
+        columns = [list(column) for column in zip(*EXTRACTS[file])]
+        parsed = parse_extract_columns(title, columns)
+
+        return [list(row) for row in zip(*parsed)]
+
+    def test_titles_match_row_transform(self):
+        for file in EXTRACTS:
+            title = file.split(".")[0].split("_")[0]
+
+            with self.subTest(title=title):
+                self.assertEqual(self.rows_by_column(title, file),
+                                 self.rows_by_row(file))
+
+    def test_file_names_match_row_transform(self):
+        for file in EXTRACTS:
+            with self.subTest(file=file):
+                self.assertEqual(self.rows_by_column(file, file),
+                                 self.rows_by_row(file))
+
+    def test_unknown_title_raises(self):
+        with self.assertRaises(KeyError):
+            parse_extract_columns("unknown", [["1"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests ParsedTable's storage, decoding and pickling of parsed rows
+
+    Run with: python -m unittest test_parsed_table
+"""
+
+import pickle
+import unittest
+
+from parsed_table import ParsedTable
+
+
+ROWS = [
+    ["1", "oral", "Tablet"],
+    ["1", "topical", "Cream"],
+    ["2", "oral", "Capsule"],
+    ["3", "oral", "Tablet"],
+]
+
+
+class ParsedTableTest(unittest.TestCase):
+    def table(self, rows, encoded=(1,)):
+        table = ParsedTable(3, encoded)
+        table.extend(rows)
+
+        return table
+
+    def test_rows_are_decoded(self):
+        table = self.table(ROWS)
+
+        self.assertEqual(len(table), 4)
+        self.assertEqual(list(table), [tuple(row) for row in ROWS])
+        self.assertEqual(table.values[1], ["oral", "topical"])
+        self.assertEqual(list(table.columns[1]), [0, 1, 0, 0])
+
+    def test_extend_matches_append(self):
+        appended = ParsedTable(3, (1,))
+
+        for row in ROWS:
+            appended.append(row)
+
+        self.assertEqual(list(appended), list(self.table(ROWS)))
+
+    def test_short_rows_are_kept_as_given(self):
+        rows = ROWS[:2] + [["9"], []] + ROWS[2:]
+        table = self.table(rows[:3])
+        table.extend(rows[3:])
+
+        self.assertEqual(len(table), 6)
+        self.assertEqual(list(table), [tuple(row) for row in rows])
+
+    def test_pickled_table_gives_the_same_rows(self):
+        table = self.table(ROWS + [["4"]])
+        unpickled = pickle.loads(pickle.dumps(table, 4))
+
+        self.assertEqual(list(unpickled), list(table))
+        self.assertEqual(unpickled.values, table.values)
+
+    def test_codes_are_pickled_in_the_smallest_type(self):
+        small = self.table(ROWS)
+        large = self.table([["1", str(i), ""] for i in range(300)])
+
+        self.assertEqual(small.__getstate__()[1][1].typecode, "B")
+        self.assertEqual(large.__getstate__()[1][1].typecode, "H")
+
+    def test_unpickled_table_takes_more_values(self):
+        unpickled = pickle.loads(pickle.dumps(self.table(ROWS), 4))
+        rows = [["5", str(i), ""] for i in range(300)]
+        unpickled.extend(rows)
+
+        self.assertEqual(len(unpickled), 304)
+        self.assertEqual(list(unpickled)[4:],
+                         [tuple(row) for row in rows])
+
+
+if __name__ == "__main__":
+    unittest.main()
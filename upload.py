@@ -77,12 +77,17 @@ def generate_query(name):
     
     return output
 
-def upload_to_table(cur, name, data):
-    """Truncates old table and uploads new table data"""
-    # Truncate old data from table
-    query = "TRUNCATE dpd_%s" % name
+def delete_rows(cur, name):
+    """Removes the old data from a table in the current transaction
+
+    Unlike TRUNCATE, which MySQL commits straight away, a DELETE is 
+    rolled back with the rest of the transaction, so the old data is 
+    kept if the new data is never committed.
+    """
+    query = "DELETE FROM dpd_%s" % name
     cur.execute(query)
 
-    # Upload new data to table
+def insert_rows(cur, name, data):
+    """Uploads rows of new data to a table"""
     query = generate_query(name)
     cur.executemany(query, data)
\ No newline at end of file